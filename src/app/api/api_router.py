@@ -11,7 +11,7 @@ se registran los routers de cada dominio/documento.
 Decisiones clave:
 - El prefijo global de la API se define en settings.API_PREFIX
 - Todas las rutas pasan por el middleware de seguridad
-- Las rutas públicas se declaran en settings.PUBLIC_PATHS
+- La política de acceso de cada endpoint se declara en settings.ROUTE_POLICIES
 - Este archivo debe reflejar TODOS los documentos existentes del sistema
 
 Referencia normativa:
@@ -71,8 +71,21 @@ from src.app.api.routers.cash_accounts_router import cash_accounts_router
 from src.app.api.routers.cash_transfer_notes_router import cash_transfer_notes_router
 
 # SISTEMA
-# Operaciones técnicas del sistema (backup, restore, etc.)
+# Operaciones técnicas del sistema (backup, restore, diagnóstico, etc.)
 from src.app.api.routers.backup_router import backup_router
+from src.app.api.routers.admin_router import admin_router
+
+# SINCRONIZACIÓN
+# Delta sync para réplicas locales del frontend
+from src.app.api.routers.sync_router import sync_router
+
+# EVENTOS EN TIEMPO REAL
+# Stream SSE de cambios de stock, cash y estados de documentos
+from src.app.api.routers.events_router import events_router
+
+# INFORMES
+# Agregados de solo lectura sobre la réplica de informes
+from src.app.api.routers.reports_router import reports_router
 
 # ============================================================
 # BLUEPRINTS
@@ -118,5 +131,15 @@ api_router.register_blueprint(cash_transfer_notes_router, url_prefix="/cash_tran
 
 # SISTEMA
 api_router.register_blueprint(backup_router, url_prefix="/backup")
+api_router.register_blueprint(admin_router, url_prefix="/admin")
+
+# SINCRONIZACIÓN
+api_router.register_blueprint(sync_router, url_prefix="/sync")
+
+# EVENTOS EN TIEMPO REAL
+api_router.register_blueprint(events_router, url_prefix="/events")
+
+# INFORMES
+api_router.register_blueprint(reports_router, url_prefix="/reports")
 
 # /src/app/api/api_router.py
@@ -27,5 +27,12 @@ from .cash_transfer_notes_router import cash_transfer_notes_router
 
 # SISTEMA
 from .backup_router import backup_router
+from .admin_router import admin_router
+
+# SINCRONIZACIÓN
+from .sync_router import sync_router
+
+# EVENTOS EN TIEMPO REAL
+from .events_router import events_router
 
 # /src/app/api/routers/__init__.py
@@ -0,0 +1,13 @@
+# /src/app/api/routers/admin_router.py
+from flask import Blueprint
+from src.app.controllers.admin_controller import admin_controller
+
+admin_router = Blueprint("admin", __name__)
+
+admin_router.get("/cache")(admin_controller.cache_stats)
+admin_router.get("/audit")(admin_controller.audit)
+admin_router.get("/slow_queries")(admin_controller.slow_queries)
+admin_router.get("/traces")(admin_controller.traces)
+admin_router.get("/profiles")(admin_controller.profiles)
+admin_router.get("/profiles/<name>")(admin_controller.download_profile)
+# /src/app/api/routers/admin_router.py
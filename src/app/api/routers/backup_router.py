@@ -6,4 +6,13 @@ backup_router = Blueprint("backup", __name__)
 
 backup_router.get("")(backup_controller.export_backup)
 backup_router.post("")(backup_controller.restore_backup)
+backup_router.get("/dump")(backup_controller.export_dump)
+backup_router.get("/status")(backup_controller.backup_status)
+backup_router.get("/schedule")(backup_controller.schedule_status)
+backup_router.post("/incremental")(backup_controller.create_incremental)
+backup_router.get("/incremental")(backup_controller.incremental_manifest)
+backup_router.post("/incremental/verify")(backup_controller.verify_incremental)
+backup_router.post("/incremental/restore")(backup_controller.restore_incremental)
+backup_router.post("/ndjson")(backup_controller.export_ndjson)
+backup_router.post("/ndjson/import")(backup_controller.import_ndjson)
 # /src/app/api/routers/backup_router.py
\ No newline at end of file
@@ -9,6 +9,8 @@ Responsabilidad:
 - Conectar HTTP con controllers
 
 IMPORTANTE:
+- GET (colección y registro) admite peticiones condicionales
+  (If-None-Match / If-Modified-Since) y responde 304 si no hay cambios.
 - DELETE realiza un *soft delete* (no elimina registros de la base de datos).
 - RESTORE reactiva un registro previamente eliminado lógicamente.
 """
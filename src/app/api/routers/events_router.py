@@ -0,0 +1,8 @@
+# /src/app/api/routers/events_router.py
+from flask import Blueprint
+from src.app.controllers.events_controller import events_controller
+
+events_router = Blueprint("events", __name__)
+
+events_router.get("")(events_controller.stream)
+# /src/app/api/routers/events_router.py
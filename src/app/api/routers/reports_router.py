@@ -0,0 +1,11 @@
+# /src/app/api/routers/reports_router.py
+from flask import Blueprint
+from src.app.controllers.reports_controller import reports_controller
+
+reports_router = Blueprint("reports", __name__)
+
+reports_router.get("/sales")(reports_controller.sales)
+reports_router.get("/purchases")(reports_controller.purchases)
+reports_router.get("/stock")(reports_controller.stock)
+reports_router.get("/replica")(reports_controller.replica)
+# /src/app/api/routers/reports_router.py
@@ -0,0 +1,8 @@
+# /src/app/api/routers/sync_router.py
+from flask import Blueprint
+from src.app.controllers.sync_controller import sync_controller
+
+sync_router = Blueprint("sync", __name__)
+
+sync_router.get("")(sync_controller.get_changes)
+# /src/app/api/routers/sync_router.py
@@ -1,26 +1,25 @@
 # /src/app/backups/create_backup.py 
 import os
-import shutil
 from datetime import datetime, timezone
 
-# Ruta fija según architecture_v2.0
-database_path = "src/app/db/database.db"
-BACKUP_DIR = "backups"
+from src.app.backups.online_backup import online_backup
+from src.app.core.config.settings import settings
 
-# Best practice: copia segura timestamp + creación del directorio
+BACKUP_DIR = settings.BACKUP_DIR
 
-def create_backup():
-    os.makedirs(BACKUP_DIR, exist_ok=True)
+# Best practice: copia online consistente (API de backup de SQLite, incluye
+# el WAL) con timestamp + creación del directorio. Nunca copia del fichero
+# en uso (shutil.copy2 puede producir una copia corrupta bajo escritura).
 
-    if not os.path.exists(database_path):
+def create_backup():
+    if not os.path.exists(online_backup.source_path):
         return None
 
     timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
     backup_path = os.path.join(BACKUP_DIR, f"database_{timestamp}.db")
 
-    shutil.copy2(database_path, backup_path)
-    return backup_path
+    return online_backup.run(backup_path)["target"]
 
 if __name__ == "__main__":
     print(create_backup())
-# /src/app/backups/create_backup.py 
\ No newline at end of file
+# /src/app/backups/create_backup.py 
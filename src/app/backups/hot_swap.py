@@ -0,0 +1,265 @@
+# /src/app/backups/hot_swap.py
+"""
+Hot swap — v3.0
+
+Restauración de una copia binaria (fichero SQLite) sustituyendo en
+caliente el fichero de la base de datos.
+
+Fases (solo la 4 deja la API sin servicio):
+1. Validación del fichero candidato (cabecera SQLite, integrity_check,
+   tablas del modelo): sin afectar al servicio.
+2. Solo lectura (db.gate): las escrituras responden 503; lo escrito a
+   partir de aquí se perdería al sustituir el fichero.
+3. Copia de seguridad previa (backup online) y preparación del fichero
+   nuevo junto al actual (<db>.swap, mismo sistema de ficheros).
+4. Mantenimiento: requests nuevos → 503, conexiones nuevas en espera;
+   drenaje de las conexiones en uso (BACKUP_SWAP_DRAIN_TIMEOUT_MS);
+   cierre del pool, acceso exclusivo al fichero vivo, os.replace
+   (atómico) y verificación del fichero nuevo con una conexión real.
+5. Reapertura e invalidación de todas las cachés.
+
+El engine, su pool y SessionLocal no se recrean: la ruta no cambia, así
+que tras engine.pool.dispose() el pool abre las conexiones nuevas sobre
+el fichero nuevo. (engine.dispose() crearía otro pool y las conexiones
+de los hilos en espera seguirían abiertas en el anterior.)
+
+Si algo falla después del rename se vuelve a la copia previa con el
+mismo procedimiento. Si el drenaje agota el tiempo no se toca nada.
+
+IMPORTANTE:
+- Solo el proceso que restaura drena sus conexiones. Si otro proceso
+  (p. ej. otro worker de gunicorn) tiene la base de datos abierta, sus
+  escrituras irían al fichero sustituido: la sustitución se rechaza
+  (409) y hay que usar el restore SQL (transaccional).
+- Acceso exclusivo: salir de WAL (`journal_mode=DELETE`) solo es
+  posible sin otras conexiones, de ningún proceso; después
+  `BEGIN EXCLUSIVE` impide abrir lecturas hasta el rename.
+- La duración de la fase 4 se devuelve como `unavailable_ms`.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+
+from src.app.backups.online_backup import online_backup
+from src.app.core.cache import invalidation
+from src.app.core.cache.change_tracker import change_tracker
+from src.app.core.config.database import db_session, engine
+from src.app.core.config.settings import settings
+from src.app.core.exceptions import BadRequestException, ConflictException, ServiceUnavailableException
+from src.app.core.logging import get_logger
+from src.app.db.base import Base
+from src.app.db.gate import database_gate
+
+logger = get_logger(__name__)
+
+SQLITE_MAGIC = b"SQLite format 3\x00"
+
+
+def is_sqlite_file(path: str) -> bool:
+    """
+    True si el fichero empieza por la cabecera de SQLite.
+    """
+    with open(path, "rb") as handle:
+        return handle.read(len(SQLITE_MAGIC)) == SQLITE_MAGIC
+
+
+def validate_database(path: str) -> None:
+    """
+    Comprueba que el fichero es una base de datos íntegra de esta app.
+
+    :raises BadRequestException: si no lo es.
+    """
+    if not is_sqlite_file(path):
+        raise BadRequestException("Invalid database file")
+
+    try:
+        conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        try:
+            integrity = [row[0] for row in conn.execute("PRAGMA integrity_check")]
+            tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        finally:
+            conn.close()
+    except sqlite3.Error as exc:
+        raise BadRequestException(f"Invalid database file: {exc}")
+
+    if integrity != ["ok"]:
+        raise BadRequestException(f"Database integrity check failed: {'; '.join(integrity[:5])}")
+
+    missing = set(Base.metadata.tables) - tables
+    if missing:
+        raise BadRequestException(f"Database file is missing tables: {', '.join(sorted(missing))}")
+
+
+class DatabaseSwapper:
+    """
+    Sustitución en caliente del fichero de la base de datos.
+    """
+
+    def __init__(self, database_path: str):
+        self.database_path = database_path
+        self._lock = threading.Lock()
+
+    def swap(self, candidate_path: str) -> dict:
+        """
+        Sustituye la base de datos por `candidate_path`.
+
+        :return: resumen con la duración de cada fase y `unavailable_ms`.
+        :raises BadRequestException: fichero no válido (no se toca nada).
+        :raises ConflictException: ya hay una sustitución en curso u otro
+                                   proceso tiene la base de datos abierta.
+        :raises ServiceUnavailableException: las conexiones no drenan a tiempo.
+        """
+        if not self._lock.acquire(blocking=False):
+            raise ConflictException("A database restore is already running")
+        try:
+            return self._swap(candidate_path)
+        finally:
+            self._lock.release()
+
+    def _swap(self, candidate_path: str) -> dict:
+        started = time.perf_counter()
+        validate_database(candidate_path)
+        validate_ms = _ms(started)
+
+        staged_path = self.database_path + ".swap"
+        tag = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+        safety_path = os.path.join(settings.BACKUP_DIR, f"pre_restore_{tag}.db")
+
+        database_gate.read_only()
+        unavailable_started = None
+        swapped = False
+        try:
+            prepare_started = time.perf_counter()
+            online_backup.run(safety_path)
+            _stage(candidate_path, staged_path)
+            prepare_ms = _ms(prepare_started)
+
+            # La sesión de este request no debe contar como conexión activa
+            db_session.remove()
+
+            unavailable_started = time.perf_counter()
+            database_gate.maintenance()
+            if not database_gate.drain(settings.BACKUP_SWAP_DRAIN_TIMEOUT_MS / 1000):
+                raise ServiceUnavailableException(
+                    f"Database restore aborted: {database_gate.active} connections still in use",
+                    retry_after=1,
+                )
+            drain_ms = _ms(unavailable_started)
+
+            self._replace(staged_path)
+            swapped = True
+            try:
+                _check_live_database()
+            except Exception:
+                logger.exception("Swapped database failed verification, rolling back")
+                _stage(safety_path, staged_path)
+                self._replace(staged_path)
+                raise
+
+        finally:
+            if os.path.exists(staged_path):
+                os.remove(staged_path)
+            database_gate.open(swapped=swapped)
+            unavailable_ms = _ms(unavailable_started) if unavailable_started else 0.0
+
+        # Todo lo cacheado pertenece al fichero anterior
+        invalidation.notify(Base.metadata.tables)
+
+        result = {
+            "mode": "swap",
+            "safety_backup": safety_path,
+            "size_bytes": os.path.getsize(self.database_path),
+            "validate_ms": validate_ms,
+            "prepare_ms": prepare_ms,
+            "drain_ms": drain_ms,
+            "unavailable_ms": unavailable_ms,
+            "duration_ms": _ms(started),
+        }
+        logger.info(f"Database hot swap completed: {result}")
+        return result
+
+    def _replace(self, staged_path: str) -> None:
+        """
+        Cierra todas las conexiones del proceso y renombra el fichero.
+        """
+        change_tracker.reset()
+        engine.pool.dispose()
+
+        exclusive = self._lock_exclusive()
+        try:
+            # WAL / SHM del fichero anterior: no deben aplicarse al nuevo
+            for suffix in ("-wal", "-shm"):
+                if os.path.exists(self.database_path + suffix):
+                    os.remove(self.database_path + suffix)
+
+            os.replace(staged_path, self.database_path)
+        except Exception:
+            _release_exclusive(exclusive)
+            raise
+        # Conexión al fichero anterior (ya sin nombre)
+        exclusive.close()
+
+    def _lock_exclusive(self) -> sqlite3.Connection:
+        """
+        Conexión con acceso exclusivo al fichero vivo.
+
+        :raises ConflictException: otro proceso tiene la base de datos abierta.
+        """
+        conn = sqlite3.connect(self.database_path, timeout=0, isolation_level=None)
+        try:
+            # Salir de WAL exige ser la única conexión de cualquier proceso
+            conn.execute("PRAGMA journal_mode=DELETE")
+            conn.execute("BEGIN EXCLUSIVE")
+        except sqlite3.OperationalError:
+            _release_exclusive(conn)
+            raise ConflictException(
+                "Database is open in other processes: binary restore refused, use the SQL restore"
+            )
+        return conn
+
+
+def _stage(source_path: str, staged_path: str) -> None:
+    """
+    Copia el fichero junto a la base de datos (rename atómico posterior).
+    """
+    with open(source_path, "rb") as source, open(staged_path, "wb") as target:
+        shutil.copyfileobj(source, target, 1024 * 1024)
+        target.flush()
+        os.fsync(target.fileno())
+
+
+def _release_exclusive(conn: sqlite3.Connection) -> None:
+    """
+    Libera el acceso exclusivo sin sustituir el fichero (vuelve a WAL).
+    """
+    try:
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+        conn.execute("PRAGMA journal_mode=WAL")
+    except sqlite3.Error as exc:
+        logger.warning(f"Could not restore WAL mode on the live database: {exc}")
+    finally:
+        conn.close()
+
+
+def _check_live_database() -> None:
+    with engine.connect() as conn:
+        conn.exec_driver_sql("SELECT COUNT(*) FROM sqlite_master").scalar()
+
+
+def _ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 1)
+
+
+# ------------------------------------------------------------
+# INSTANCIA EXPORTADA (OBLIGATORIA)
+# ------------------------------------------------------------
+database_swapper = DatabaseSwapper(engine.url.database)
+
+# /src/app/backups/hot_swap.py
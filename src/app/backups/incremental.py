@@ -0,0 +1,449 @@
+# /src/app/backups/incremental.py
+"""
+Incremental backups — v3.0
+
+Cadena de backups: una copia completa (base) + incrementos que solo
+contienen lo que ha cambiado desde el eslabón anterior.
+
+Qué ha cambiado (core.cache.change_tracker):
+- change_log guarda la secuencia de la última escritura de cada tabla:
+  solo se visitan las tablas cuya secuencia ha avanzado.
+- Cada fila lleva `change_seq`: se copian las filas con
+  change_seq > secuencia del eslabón anterior (altas, cambios, soft
+  delete y restore).
+- Para borrados físicos se guarda además la lista de ids vigentes.
+- change_log (no lleva change_seq propio, una fila por tabla) se copia
+  siempre completa.
+
+Formato:
+- Base: copia online (backups.online_backup), fichero SQLite.
+- Incremento: fichero SQLite pequeño con una tabla por tabla cambiada
+  (mismas columnas) y `_ids_<tabla>`. Se genera con ATTACH dentro de
+  UNA transacción de lectura: foto consistente, sin bloquear escritores.
+- manifest.json (BACKUP_DIR/incremental): eslabones en orden, con
+  secuencia, sha256 del fichero y digests de su contenido: tablas
+  completas en la base; en cada incremento, solo las filas copiadas y
+  las listas de ids (nunca se recorre una tabla completa para digerirla).
+
+Replay:
+- Copia de la base + aplicación de cada incremento con
+  INSERT OR REPLACE / DELETE ... NOT IN (todo dentro de SQLite).
+- verify(): reconstruye la cadena en un fichero temporal comprobando
+  cada eslabón al aplicarlo: la base con sus digests completos y, tras
+  cada incremento, las filas con change_seq posterior al eslabón
+  anterior y los ids vigentes contra los digests del incremento. Los
+  recorridos de tablas completas solo ocurren aquí.
+- stage(): reconstruye y verifica la cadena en un fichero que el
+  servicio instala con la sustitución en caliente (backups.hot_swap).
+
+IMPORTANTE:
+- Las columnas escritas en diferido (security.user_activity) no generan
+  change_seq: se excluyen de los digests y pueden ir por detrás hasta
+  que la fila vuelva a cambiar.
+- Tras un restore la cadena se corta (require_base): el siguiente
+  eslabón es siempre una base nueva.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+
+from src.app.backups.online_backup import online_backup
+from src.app.core.config.settings import settings
+from src.app.core.exceptions import BadRequestException, ConflictException
+from src.app.core.logging import get_logger
+from src.app.core.utils.datetime_utils import dt_to_iso_z
+from src.app.models.change_log import ChangeLog
+
+logger = get_logger(__name__)
+
+MANIFEST_NAME = "manifest.json"
+
+# Tablas sin change_seq fiable: siempre completas en cada incremento
+_ALWAYS_FULL = {ChangeLog.__tablename__}
+
+# Columnas write-behind (sin change_seq): fuera de la verificación
+_UNTRACKED_COLUMNS = {"users": {"last_login", "last_seen"}}
+
+_IDS_PREFIX = "_ids_"
+
+
+# ============================================================
+# HELPERS
+# ============================================================
+
+def _now_tag() -> str:
+    return datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S_%f")
+
+
+def _file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for block in iter(lambda: handle.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _tables(conn: sqlite3.Connection, schema: str = "main") -> list[str]:
+    return [
+        row[0] for row in conn.execute(
+            f"SELECT name FROM {schema}.sqlite_master"
+            " WHERE type = 'table' AND name NOT LIKE 'sqlite_%' ORDER BY name"
+        )
+    ]
+
+
+def _columns(conn: sqlite3.Connection, table: str, schema: str = "main") -> list[str]:
+    return [row[1] for row in conn.execute(f'PRAGMA {schema}.table_info("{table}")')]
+
+
+def _global_seq(conn: sqlite3.Connection) -> int:
+    row = conn.execute(
+        "SELECT seq FROM change_log WHERE table_name = ?", (ChangeLog.GLOBAL_KEY,)
+    ).fetchone()
+    return row[0] if row else 0
+
+
+def _rows_digest(conn: sqlite3.Connection, table: str, schema: str = "main", where: str = "", params: tuple = ()) -> str:
+    """
+    SHA-256 de las filas de una tabla (ordenadas por id), sin las columnas
+    no rastreadas. `where` limita las filas digeridas.
+    """
+    skip = _UNTRACKED_COLUMNS.get(table, set())
+    columns = ", ".join(f'"{c}"' for c in _columns(conn, table, schema) if c not in skip)
+    digest = hashlib.sha256()
+    for row in conn.execute(f'SELECT {columns} FROM {schema}."{table}" {where} ORDER BY id', params):
+        digest.update(repr(row).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def table_digests(conn: sqlite3.Connection, schema: str = "main") -> dict[str, str]:
+    """
+    SHA-256 del contenido de cada tabla de `schema`.
+    """
+    return {table: _rows_digest(conn, table, schema) for table in _tables(conn, schema)}
+
+
+def _link_digests(conn: sqlite3.Connection, entry: dict) -> dict[str, str]:
+    """
+    Digests de la BD reconstruida comparables con los de un incremento:
+    filas con change_seq > from_seq e ids vigentes de cada tabla delta,
+    tabla entera en las copiadas completas.
+    """
+    digests = {}
+    for table, info in entry["tables"].items():
+        if info["mode"] == "full":
+            digests[table] = _rows_digest(conn, table)
+            continue
+        digests[table] = _rows_digest(conn, table, where="WHERE change_seq > ?", params=(entry["from_seq"],))
+        digest = hashlib.sha256()
+        for row in conn.execute(f'SELECT id FROM main."{table}" ORDER BY id'):
+            digest.update(repr(row).encode("utf-8"))
+        digests[f"{_IDS_PREFIX}{table}"] = digest.hexdigest()
+    return digests
+
+
+# ============================================================
+# CADENA DE BACKUPS
+# ============================================================
+
+class IncrementalBackups:
+    """
+    Gestión de la cadena base + incrementos y de su manifest.
+    """
+
+    def __init__(self, source_path: str):
+        self.source_path = source_path
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------
+    # MANIFEST
+    # ------------------------------------------------------------
+    @property
+    def directory(self) -> str:
+        return os.path.join(settings.BACKUP_DIR, "incremental")
+
+    def manifest(self) -> dict:
+        """
+        Manifest de la cadena actual (cadena vacía si no hay base).
+        """
+        path = os.path.join(self.directory, MANIFEST_NAME)
+        if not os.path.exists(path):
+            return {"version": 1, "chain": []}
+        with open(path, encoding="utf-8") as handle:
+            return json.load(handle)
+
+    def _save_manifest(self, manifest: dict) -> None:
+        path = os.path.join(self.directory, MANIFEST_NAME)
+        with open(path + ".part", "w", encoding="utf-8") as handle:
+            json.dump(manifest, handle, indent=2)
+        os.replace(path + ".part", path)
+
+    def require_base(self) -> None:
+        """
+        La base de datos ha sido restaurada: sus secuencias ya no continúan
+        la cadena, así que el siguiente eslabón será una base nueva.
+        """
+        manifest = self.manifest()
+        if manifest["chain"]:
+            manifest["requires_base"] = True
+            self._save_manifest(manifest)
+
+    # ------------------------------------------------------------
+    # CREACIÓN
+    # ------------------------------------------------------------
+    def create(self, full: bool = False) -> dict:
+        """
+        Añade un eslabón: base si no hay cadena (o `full`), si no incremento.
+
+        :return: entrada del manifest creada.
+        :raises ConflictException: si ya hay un backup incremental en curso.
+        """
+        if not self._lock.acquire(blocking=False):
+            raise ConflictException("An incremental backup is already running")
+
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            manifest = self.manifest()
+            if full or not manifest["chain"] or manifest.get("requires_base"):
+                return self._create_base()
+            return self._create_increment(manifest)
+        finally:
+            self._lock.release()
+
+    def _create_base(self) -> dict:
+        started = time.perf_counter()
+        filename = f"base_{_now_tag()}.db"
+        path = os.path.join(self.directory, filename)
+        online_backup.run(path)
+
+        conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        try:
+            seq = _global_seq(conn)
+            digests = table_digests(conn)
+        finally:
+            conn.close()
+
+        entry = {
+            "type": "base",
+            "file": filename,
+            "seq": seq,
+            "created_at": dt_to_iso_z(datetime.now(timezone.utc)),
+            "size_bytes": os.path.getsize(path),
+            "sha256": _file_sha256(path),
+            "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+            "digests": digests,
+        }
+        # Una base nueva inicia una cadena nueva
+        self._save_manifest({"version": 1, "chain": [entry]})
+        logger.info(f"Incremental chain started: {filename} (seq {seq})")
+        return entry
+
+    def _create_increment(self, manifest: dict) -> dict:
+        started = time.perf_counter()
+        since = manifest["chain"][-1]["seq"]
+        filename = f"inc_{_now_tag()}.db"
+        path = os.path.join(self.directory, filename)
+        partial = path + ".part"
+
+        conn = sqlite3.connect(self.source_path, timeout=5, isolation_level=None)
+        # Sin escrituras desde el último eslabón: nada que copiar ni leer
+        if _global_seq(conn) == since:
+            conn.close()
+            return {"type": "increment", "skipped": True, "seq": since}
+
+        try:
+            conn.execute("ATTACH DATABASE ? AS inc", (partial,))
+            conn.execute("BEGIN")
+
+            seq = _global_seq(conn)
+            changed = {
+                name for name, _ in conn.execute(
+                    "SELECT table_name, seq FROM change_log WHERE seq > ?", (since,)
+                )
+            }
+
+            tables: dict[str, dict] = {}
+            if seq != since:
+                for table in _tables(conn):
+                    if table in _ALWAYS_FULL:
+                        conn.execute(f'CREATE TABLE inc."{table}" AS SELECT * FROM main."{table}"')
+                        mode = "full"
+                    elif table in changed:
+                        conn.execute(
+                            f'CREATE TABLE inc."{table}" AS SELECT * FROM main."{table}" WHERE change_seq > ?',
+                            (since,),
+                        )
+                        conn.execute(
+                            f'CREATE TABLE inc."{_IDS_PREFIX}{table}" AS SELECT id FROM main."{table}"'
+                        )
+                        mode = "delta"
+                    else:
+                        continue
+                    rows = conn.execute(f'SELECT COUNT(*) FROM inc."{table}"').fetchone()[0]
+                    tables[table] = {"mode": mode, "rows": rows}
+
+            # Solo lo copiado al incremento: filas delta e ids
+            digests = table_digests(conn, "inc")
+            conn.execute("COMMIT")
+            conn.execute("DETACH DATABASE inc")
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            if os.path.exists(partial):
+                os.remove(partial)
+            raise
+        finally:
+            conn.close()
+
+        if seq == since:
+            os.remove(partial)
+            return {"type": "increment", "skipped": True, "seq": seq}
+
+        os.replace(partial, path)
+        entry = {
+            "type": "increment",
+            "file": filename,
+            "from_seq": since,
+            "seq": seq,
+            "created_at": dt_to_iso_z(datetime.now(timezone.utc)),
+            "size_bytes": os.path.getsize(path),
+            "sha256": _file_sha256(path),
+            "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+            "tables": tables,
+            "digests": digests,
+        }
+        manifest["chain"].append(entry)
+        self._save_manifest(manifest)
+        logger.info(
+            f"Incremental backup: {filename} (seq {since} → {seq}, "
+            f"{sum(t['rows'] for t in tables.values())} rows, {entry['size_bytes']} bytes)"
+        )
+        return entry
+
+    # ------------------------------------------------------------
+    # REPLAY Y VERIFICACIÓN
+    # ------------------------------------------------------------
+    def replay(self, target_path: str, manifest: dict | None = None, check: bool = False) -> tuple[dict, list[str]]:
+        """
+        Reconstruye la cadena (base + incrementos) en `target_path`.
+
+        Con `check`, compara cada eslabón recién aplicado con sus digests.
+
+        :return: (último eslabón aplicado, digests que no coinciden como
+                 "<tabla>@<fichero>").
+        :raises BadRequestException: cadena vacía o fichero alterado.
+        """
+        manifest = manifest or self.manifest()
+        chain = manifest["chain"]
+        if not chain:
+            raise BadRequestException("No incremental backup chain")
+
+        for entry in chain:
+            path = os.path.join(self.directory, entry["file"])
+            if not os.path.exists(path) or _file_sha256(path) != entry["sha256"]:
+                raise BadRequestException(f"Backup chain file missing or altered: {entry['file']}")
+
+        shutil.copyfile(os.path.join(self.directory, chain[0]["file"]), target_path)
+
+        mismatched: list[str] = []
+        conn = sqlite3.connect(target_path, isolation_level=None)
+        try:
+            conn.execute("PRAGMA foreign_keys=OFF")
+            if check:
+                mismatched += _mismatches(chain[0], table_digests(conn))
+            for entry in chain[1:]:
+                self._apply(conn, os.path.join(self.directory, entry["file"]), entry["tables"])
+                if check:
+                    mismatched += _mismatches(entry, _link_digests(conn, entry))
+        finally:
+            conn.close()
+
+        return chain[-1], mismatched
+
+    @staticmethod
+    def _apply(conn: sqlite3.Connection, path: str, tables: dict) -> None:
+        conn.execute("ATTACH DATABASE ? AS inc", (path,))
+        try:
+            conn.execute("BEGIN")
+            for table, info in tables.items():
+                columns = ", ".join(f'"{c}"' for c in _columns(conn, table, "inc"))
+                if info["mode"] == "full":
+                    conn.execute(f'DELETE FROM main."{table}"')
+                else:
+                    conn.execute(
+                        f'DELETE FROM main."{table}" WHERE id NOT IN '
+                        f'(SELECT id FROM inc."{_IDS_PREFIX}{table}")'
+                    )
+                conn.execute(
+                    f'INSERT OR REPLACE INTO main."{table}" ({columns}) SELECT {columns} FROM inc."{table}"'
+                )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.execute("DETACH DATABASE inc")
+
+    def verify(self) -> dict:
+        """
+        Reconstruye la cadena en un temporal comprobando cada eslabón.
+        """
+        started = time.perf_counter()
+        manifest = self.manifest()
+
+        with tempfile.TemporaryDirectory(prefix="chain_verify_") as tmp:
+            last, mismatched = self.replay(os.path.join(tmp, "replay.db"), manifest, check=True)
+
+        if mismatched:
+            logger.error(f"Incremental chain verification failed: {', '.join(mismatched)}")
+
+        return {
+            "ok": not mismatched,
+            "seq": last["seq"],
+            "links": len(manifest["chain"]),
+            "mismatched_tables": mismatched,
+            "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+        }
+
+    # ------------------------------------------------------------
+    # RESTORE
+    # ------------------------------------------------------------
+    def stage(self, target_path: str) -> dict:
+        """
+        Reconstruye y verifica la cadena en `target_path`, lista para
+        instalarse con la sustitución en caliente.
+
+        :return: último eslabón de la cadena.
+        :raises BadRequestException: fichero alterado o cadena que no
+                                     reproduce sus digests.
+        """
+        last, mismatched = self.replay(target_path, check=True)
+        if mismatched:
+            logger.error(f"Incremental chain restore refused: {', '.join(mismatched)}")
+            raise BadRequestException("Backup chain does not verify")
+        return last
+
+
+def _mismatches(entry: dict, digests: dict[str, str]) -> list[str]:
+    expected = entry["digests"]
+    return sorted(
+        f"{name}@{entry['file']}" for name in set(expected) | set(digests)
+        if expected.get(name) != digests.get(name)
+    )
+
+
+# ------------------------------------------------------------
+# INSTANCIA EXPORTADA (OBLIGATORIA)
+# ------------------------------------------------------------
+incremental_backups = IncrementalBackups(online_backup.source_path)
+
+# /src/app/backups/incremental.py
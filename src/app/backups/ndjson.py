@@ -0,0 +1,364 @@
+# /src/app/backups/ndjson.py
+"""
+NDJSON export / import — v3.0
+
+Export lógico portable (JSON, no SQL) para migrar datos entre entornos.
+
+Formato (un directorio por export):
+
+    manifest.json          formato, versión, tablas en orden de FK
+    products.ndjson        una fila por línea: {"id": 1, "name": ...}
+    ...
+
+- Todas las tablas registradas en db.base (Base.metadata), en orden de
+  foreign keys. Los valores son los almacenados en SQLite (números,
+  texto, fechas como texto): el import no depende de zonas horarias ni
+  de la precisión de Decimal.
+- manifest.json guarda columnas, filas y sha256 de cada fichero.
+
+Export:
+- Una transacción de lectura (foto consistente, no bloquea escritores).
+- Lectura en streaming con yield_per: memoria constante.
+
+Import:
+- Se verifican los sha256 de todos los ficheros antes de tocar nada.
+- Cada fichero se trocea en bloques de líneas que se parsean y validan
+  (json.loads, columnas, tipos, NULL, longitud, enums) en un pool de
+  PROCESOS (BACKUP_NDJSON_WORKERS): el parseo no compite por el GIL.
+  Los procesos se crean con "forkserver" (o "spawn"), nunca con fork:
+  el proceso de la API ya tiene hilos y un fork con un lock tomado
+  (logging, pool de SQLAlchemy, sqlite) puede bloquear al hijo.
+- Un único escritor (backups.sql_restore.load_rows) inserta por lotes,
+  en orden de FK y en UNA transacción: todo o nada.
+- Bloques en vuelo acotados: la memoria no depende del tamaño del export.
+
+Ambos sentidos devuelven filas/s.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import multiprocessing
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timezone
+from itertools import islice
+from typing import Iterator
+
+from sqlalchemy import Boolean, Date, DateTime, Enum, Integer, Numeric, String, text
+
+from src.app.backups.sql_restore import load_rows
+from src.app.core.config.database import engine
+from src.app.core.config.settings import settings
+from src.app.core.exceptions import BadRequestException
+from src.app.core.logging import get_logger
+from src.app.core.utils.datetime_utils import dt_to_iso_z
+from src.app.db.base import Base
+
+logger = get_logger(__name__)
+
+FORMAT_NAME = "demearizoil-ndjson"
+FORMAT_VERSION = 1
+MANIFEST_NAME = "manifest.json"
+
+# Procesos sin fork (ver cabecera): _parse_chunk y sus specs se serializan
+_MP_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+
+# ============================================================
+# EXPORT
+# ============================================================
+
+def export_ndjson(directory: str, batch_rows: int = 5000) -> dict:
+    """
+    Exporta todas las tablas del modelo a `directory` (se crea).
+
+    :param directory: directorio destino (un fichero por tabla).
+    :param batch_rows: filas por lote (yield_per).
+    :return: resumen (tablas, filas, bytes, duración, filas/s).
+    """
+    started = time.perf_counter()
+    os.makedirs(directory, exist_ok=True)
+    entries = []
+
+    with engine.connect() as conn, conn.begin():
+        # La foto de la transacción se fija con la primera lectura
+        stream = conn.execution_options(yield_per=batch_rows)
+
+        for table in Base.metadata.sorted_tables:
+            filename = f"{table.name}.ndjson"
+            digest = hashlib.sha256()
+            rows = 0
+
+            result = stream.execute(text(f'SELECT * FROM "{table.name}"'))
+            columns = list(result.keys())
+
+            with open(os.path.join(directory, filename), "wb") as handle:
+                for partition in result.partitions():
+                    data = "".join(
+                        json.dumps(dict(zip(columns, row)), ensure_ascii=False, separators=(",", ":")) + "\n"
+                        for row in partition
+                    ).encode("utf-8")
+                    digest.update(data)
+                    handle.write(data)
+                    rows += len(partition)
+
+            entries.append({
+                "name": table.name,
+                "file": filename,
+                "columns": columns,
+                "rows": rows,
+                "sha256": digest.hexdigest(),
+            })
+
+    manifest = {
+        "format": FORMAT_NAME,
+        "version": FORMAT_VERSION,
+        "created_at": dt_to_iso_z(datetime.now(timezone.utc)),
+        "tables": entries,
+    }
+    with open(os.path.join(directory, MANIFEST_NAME), "w", encoding="utf-8") as handle:
+        json.dump(manifest, handle, indent=2)
+
+    result = _summary(
+        started,
+        tables=len(entries),
+        rows=sum(entry["rows"] for entry in entries),
+        size_bytes=sum(os.path.getsize(os.path.join(directory, e["file"])) for e in entries),
+    )
+    logger.info(f"NDJSON export completed: {directory} {result}")
+    return result
+
+
+# ============================================================
+# VALIDACIÓN (PROCESOS DEL POOL)
+# ============================================================
+
+def _column_spec(column) -> tuple:
+    """
+    Descripción serializable de una columna para los procesos del pool:
+    (nombre, tipo, admite NULL, parámetro: longitud o valores del enum).
+    """
+    kind, extra = "any", None
+    column_type = column.type
+    if isinstance(column_type, Enum):
+        kind, extra = "enum", frozenset(column_type.enums)
+    elif isinstance(column_type, Boolean):
+        kind = "bool"
+    elif isinstance(column_type, Integer):
+        kind = "int"
+    elif isinstance(column_type, Numeric):
+        kind = "number"
+    elif isinstance(column_type, DateTime):
+        kind = "datetime"
+    elif isinstance(column_type, Date):
+        kind = "date"
+    elif isinstance(column_type, String):
+        kind, extra = "str", column_type.length
+
+    nullable = column.nullable or (column.primary_key and kind == "int")
+    return column.name, kind, nullable, extra
+
+
+def _check_value(value, kind: str, extra):
+    """
+    Valida un valor JSON contra el tipo de su columna; devuelve el valor
+    a insertar.
+
+    :raises ValueError: si no es válido.
+    """
+    if kind == "int":
+        if type(value) is not int:
+            raise ValueError("integer expected")
+    elif kind == "bool":
+        if value not in (0, 1) or type(value) is float:
+            raise ValueError("boolean expected")
+        return int(value)
+    elif kind == "number":
+        if type(value) not in (int, float):
+            raise ValueError("number expected")
+    elif kind == "enum":
+        if value not in extra:
+            raise ValueError(f"unknown value {value!r}")
+    elif kind in ("str", "datetime", "date"):
+        if type(value) is not str:
+            raise ValueError("text expected")
+        if kind == "str" and extra and len(value) > extra:
+            raise ValueError(f"longer than {extra}")
+        if kind == "datetime":
+            datetime.fromisoformat(value)
+        elif kind == "date":
+            date.fromisoformat(value)
+    return value
+
+
+def _parse_chunk(specs: tuple, first_line: int, lines: list[bytes]) -> list[tuple]:
+    """
+    Parsea y valida un bloque de líneas (se ejecuta en el pool).
+
+    :return: filas como tuplas en el orden de `specs`.
+    :raises ValueError: con el número de línea de la primera fila inválida.
+    """
+    names = {spec[0] for spec in specs}
+    rows = []
+    for number, line in enumerate(lines, start=first_line):
+        try:
+            record = json.loads(line)
+            if type(record) is not dict:
+                raise ValueError("JSON object expected")
+            unknown = record.keys() - names
+            if unknown:
+                raise ValueError(f"unknown columns {', '.join(sorted(unknown))}")
+
+            row = []
+            for name, kind, nullable, extra in specs:
+                value = record.get(name)
+                if value is None:
+                    if not nullable:
+                        raise ValueError(f"{name}: NULL not allowed")
+                    row.append(None)
+                    continue
+                try:
+                    row.append(_check_value(value, kind, extra))
+                except ValueError as exc:
+                    raise ValueError(f"{name}: {exc}") from None
+            rows.append(tuple(row))
+        except ValueError as exc:
+            raise ValueError(f"line {number}: {exc}") from None
+    return rows
+
+
+# ============================================================
+# IMPORT
+# ============================================================
+
+def import_ndjson(directory: str, batch_rows: int = 5000, workers: int = 2) -> dict:
+    """
+    Importa un export NDJSON sustituyendo el contenido de sus tablas.
+
+    :param directory: directorio del export (con manifest.json).
+    :param batch_rows: líneas por bloque de parseo y filas por executemany.
+    :param workers: procesos de parseo.
+    :return: resumen (tablas, filas, duración, filas/s, workers).
+    :raises BadRequestException: export inválido (no se aplica nada).
+    """
+    started = time.perf_counter()
+    tables = _read_manifest(directory)
+
+    for entry in tables:
+        if _file_sha256(os.path.join(directory, entry["file"])) != entry["sha256"]:
+            raise BadRequestException(f"NDJSON export file altered: {entry['file']}")
+
+    workers = max(1, workers)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=_MP_CONTEXT) as pool:
+        result = load_rows(_parsed_rows(pool, directory, tables, batch_rows, workers * 2), batch_rows)
+
+    result = _summary(started, tables=result["tables"], rows=result["rows"], workers=workers)
+    logger.info(f"NDJSON import completed: {directory} {result}")
+    return result
+
+
+def _read_manifest(directory: str) -> list[dict]:
+    """
+    Tablas del export en orden de FK, validadas contra el modelo.
+    """
+    path = os.path.join(directory, MANIFEST_NAME)
+    try:
+        with open(path, encoding="utf-8") as handle:
+            manifest = json.load(handle)
+    except (OSError, ValueError):
+        raise BadRequestException("NDJSON export manifest not found or invalid")
+
+    if manifest.get("format") != FORMAT_NAME or manifest.get("version") != FORMAT_VERSION:
+        raise BadRequestException("Unsupported NDJSON export format")
+
+    entries = {entry["name"]: entry for entry in manifest.get("tables", [])}
+    unknown = set(entries) - set(Base.metadata.tables)
+    if unknown:
+        raise BadRequestException(f"Unknown table in backup: {', '.join(sorted(unknown))}")
+
+    for entry in entries.values():
+        if os.path.basename(entry["file"]) != entry["file"]:
+            raise BadRequestException(f"Invalid NDJSON file name: {entry['file']}")
+
+    # Orden de FK del modelo actual, no el del fichero
+    return [entries[t.name] for t in Base.metadata.sorted_tables if t.name in entries]
+
+
+def _parsed_rows(pool, directory: str, tables: list[dict], chunk_rows: int, max_in_flight: int) -> Iterator[tuple]:
+    """
+    Alimenta al escritor: envía bloques al pool y entrega sus filas en
+    orden, con un máximo de `max_in_flight` bloques pendientes.
+    """
+    for entry in tables:
+        table = Base.metadata.tables[entry["name"]]
+        specs = tuple(_column_spec(column) for column in table.columns)
+        columns = ", ".join(spec[0] for spec in specs)
+        yield ("table", table.name)
+
+        pending: deque = deque()
+
+        def _next_rows():
+            first_line, future = pending.popleft()
+            try:
+                return future.result()
+            except ValueError as exc:
+                raise BadRequestException(f"Invalid row in {entry['file']} {exc}")
+
+        with open(os.path.join(directory, entry["file"]), "rb") as handle:
+            line_number = 1
+            while True:
+                lines = list(islice(handle, chunk_rows))
+                if not lines:
+                    break
+                pending.append((line_number, pool.submit(_parse_chunk, specs, line_number, lines)))
+                line_number += len(lines)
+                if len(pending) >= max_in_flight:
+                    yield ("rows", table.name, columns, _next_rows())
+
+        while pending:
+            yield ("rows", table.name, columns, _next_rows())
+
+
+def _file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    try:
+        with open(path, "rb") as handle:
+            for block in iter(lambda: handle.read(1024 * 1024), b""):
+                digest.update(block)
+    except OSError:
+        raise BadRequestException(f"NDJSON export file missing: {os.path.basename(path)}")
+    return digest.hexdigest()
+
+
+def _summary(started: float, **values) -> dict:
+    seconds = time.perf_counter() - started
+    rows = values["rows"]
+    return {
+        **values,
+        "duration_ms": round(seconds * 1000, 1),
+        "rows_per_second": int(rows / seconds) if seconds else rows,
+    }
+
+
+# ============================================================
+# CLI (migración entre entornos)
+# ============================================================
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3 or sys.argv[1] not in ("export", "import"):
+        print("Usage: python -m src.app.backups.ndjson export|import <directory>")
+        sys.exit(1)
+
+    if sys.argv[1] == "export":
+        print(export_ndjson(sys.argv[2], settings.BACKUP_NDJSON_BATCH_ROWS))
+    else:
+        print(import_ndjson(sys.argv[2], settings.BACKUP_NDJSON_BATCH_ROWS, settings.BACKUP_NDJSON_WORKERS))
+
+# /src/app/backups/ndjson.py
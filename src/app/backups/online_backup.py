@@ -0,0 +1,225 @@
+# /src/app/backups/online_backup.py
+"""
+Online backup — v3.0
+
+Copia consistente de la base de datos en caliente con la API de backup
+nativa de SQLite (sqlite3.Connection.backup).
+
+Funcionamiento:
+- La copia avanza por pasos de BACKUP_PAGES_PER_STEP páginas.
+- Entre pasos se duerme BACKUP_STEP_SLEEP_MS: el bloqueo de lectura
+  solo dura lo que tarda en copiarse un paso (milisegundos) y los
+  escritores progresan entre pasos (con WAL ni siquiera esperan).
+- Si OTRA conexión escribe durante la copia, SQLite reinicia la copia
+  desde el principio (se cuenta en `restarts`): el resultado es siempre
+  una foto consistente, incluido el contenido del WAL.
+- Con escrituras constantes la copia por pasos podría no terminar
+  nunca: superados BACKUP_MAX_RESTARTS reinicios se copia en un solo
+  paso (pages=-1, un único bloqueo de lectura). `method` indica el
+  camino usado: "stepped" o "single_step".
+- Se escribe en un fichero temporal (.part), se pasa a journal DELETE
+  (fichero único y portable), se ejecuta PRAGMA integrity_check y solo
+  entonces se renombra al destino final (os.replace, atómico).
+
+Progreso:
+- status() devuelve el estado de la copia en curso o de la última.
+
+IMPORTANTE:
+- Una sola copia a la vez por proceso (409 si ya hay una en curso).
+- Este módulo NO conoce HTTP: lo usan BackupService y los scripts.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Callable
+
+from src.app.core.config.database import engine
+from src.app.core.config.settings import settings
+from src.app.core.exceptions import ConflictException, ServerErrorException
+from src.app.core.logging import get_logger
+from src.app.core.utils.datetime_utils import dt_to_iso_z
+
+logger = get_logger(__name__)
+
+METHOD_STEPPED = "stepped"
+METHOD_SINGLE_STEP = "single_step"
+
+
+class _RestartLimitExceeded(Exception):
+    """
+    La copia por pasos ha superado BACKUP_MAX_RESTARTS reinicios.
+    """
+
+
+def stepped_copy(
+    source: sqlite3.Connection,
+    target: sqlite3.Connection,
+    pages_per_step: int,
+    step_sleep_ms: int,
+    on_step: Callable[[dict], None] | None = None,
+) -> dict:
+    """
+    Copia `source` en `target` por pasos, con pausa entre pasos.
+
+    Cada reinicio (otra conexión escribió) se cuenta; superado
+    BACKUP_MAX_RESTARTS se termina con una copia en un solo paso.
+
+    :param on_step: callback tras cada paso (recibe el progreso).
+    :return: progreso final (pages_total, pages_copied, steps,
+             restarts, method).
+    """
+    state = {"pages_total": 0, "pages_copied": 0, "steps": 0, "restarts": 0, "method": METHOD_STEPPED}
+
+    def _step(status: int, remaining: int, total: int) -> None:
+        copied = total - remaining
+        if state["steps"] and copied <= state["pages_copied"]:
+            # Sin avance: otra conexión escribió y SQLite reinició la copia
+            state["restarts"] += 1
+            if state["restarts"] > settings.BACKUP_MAX_RESTARTS:
+                raise _RestartLimitExceeded()
+        state.update(pages_total=total, pages_copied=copied, steps=state["steps"] + 1)
+
+        if on_step:
+            on_step(state)
+        if remaining and step_sleep_ms:
+            time.sleep(step_sleep_ms / 1000)
+
+    try:
+        source.backup(target, pages=max(1, pages_per_step), progress=_step)
+    except _RestartLimitExceeded:
+        logger.warning(
+            f"Online backup restarted {state['restarts']} times under concurrent writes; "
+            "falling back to a single-step copy"
+        )
+        source.backup(target, pages=-1)
+        state.update(pages_copied=state["pages_total"], method=METHOD_SINGLE_STEP)
+    return state
+
+
+class OnlineBackup:
+    """
+    Backup incremental por páginas de un fichero SQLite en uso.
+    """
+
+    def __init__(self, source_path: str, pages_per_step: int, step_sleep_ms: int):
+        self.source_path = source_path
+        self.pages_per_step = max(1, pages_per_step)
+        self.step_sleep_ms = max(0, step_sleep_ms)
+
+        self._lock = threading.Lock()
+        self._status: dict = {"state": "idle"}
+
+    # ------------------------------------------------------------
+    # EJECUCIÓN
+    # ------------------------------------------------------------
+    def run(self, target_path: str, on_step: Callable[[dict], None] | None = None) -> dict:
+        """
+        Copia la base de datos a `target_path`.
+
+        :param target_path: fichero destino (se crea el directorio).
+        :param on_step: callback opcional tras cada paso (recibe el progreso).
+        :return: resumen de la copia (páginas, pasos, reinicios, duración...).
+        :raises ConflictException: si ya hay una copia en curso.
+        :raises ServerErrorException: si la copia falla o no es íntegra.
+        """
+        if not self._lock.acquire(blocking=False):
+            raise ConflictException("A backup is already running")
+
+        try:
+            return self._run(target_path, on_step)
+        finally:
+            self._lock.release()
+
+    def _run(self, target_path: str, on_step: Callable[[dict], None] | None) -> dict:
+        os.makedirs(os.path.dirname(os.path.abspath(target_path)), exist_ok=True)
+        partial_path = target_path + ".part"
+
+        started = time.perf_counter()
+        progress = {
+            "state": "running",
+            "target": target_path,
+            "started_at": dt_to_iso_z(datetime.now(timezone.utc)),
+            "pages_total": 0,
+            "pages_copied": 0,
+            "steps": 0,
+            "restarts": 0,
+            "method": METHOD_STEPPED,
+        }
+        self._status = progress
+        last_logged = [0]
+
+        def _step(state: dict) -> None:
+            progress.update(state)
+            copied, total = state["pages_copied"], state["pages_total"]
+
+            percent = copied * 100 // total if total else 100
+            if percent >= last_logged[0] + 10:
+                last_logged[0] = percent - percent % 10
+                logger.info(f"Online backup {percent}% ({copied}/{total} pages)")
+
+            if on_step:
+                on_step(dict(progress))
+
+        try:
+            source = sqlite3.connect(f"file:{self.source_path}?mode=ro", uri=True, timeout=5)
+            target = sqlite3.connect(partial_path)
+            try:
+                progress.update(stepped_copy(source, target, self.pages_per_step, self.step_sleep_ms, _step))
+                target.execute("PRAGMA journal_mode=DELETE")
+                integrity = [row[0] for row in target.execute("PRAGMA integrity_check")]
+            finally:
+                target.close()
+                source.close()
+
+            if integrity != ["ok"]:
+                raise ServerErrorException(f"Backup integrity check failed: {'; '.join(integrity[:5])}")
+
+            os.replace(partial_path, target_path)
+
+        except Exception as exc:
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+            progress.update(state="failed", error=str(exc))
+            logger.error(f"Online backup failed: {exc}")
+            if isinstance(exc, ServerErrorException):
+                raise
+            raise ServerErrorException(f"Backup failed: {exc}")
+
+        progress.update(
+            state="completed",
+            integrity="ok",
+            size_bytes=os.path.getsize(target_path),
+            duration_ms=round((time.perf_counter() - started) * 1000, 1),
+        )
+        logger.info(
+            f"Online backup completed: {target_path} "
+            f"({progress['size_bytes']} bytes, {progress['steps']} steps, "
+            f"{progress['restarts']} restarts, {progress['method']}, {progress['duration_ms']} ms)"
+        )
+        return dict(progress)
+
+    # ------------------------------------------------------------
+    # PROGRESO
+    # ------------------------------------------------------------
+    def status(self) -> dict:
+        """
+        Estado de la copia en curso o de la última ejecutada.
+        """
+        return dict(self._status)
+
+
+# ------------------------------------------------------------
+# INSTANCIA EXPORTADA (OBLIGATORIA)
+# ------------------------------------------------------------
+online_backup = OnlineBackup(
+    engine.url.database,
+    pages_per_step=settings.BACKUP_PAGES_PER_STEP,
+    step_sleep_ms=settings.BACKUP_STEP_SLEEP_MS,
+)
+
+# /src/app/backups/online_backup.py
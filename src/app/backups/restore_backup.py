@@ -1,43 +1,23 @@
 # /src/app/backups/restore_backup.py 
 import os
-import shutil
-from src.app.backups.create_backup import create_backup
-from src.app.core.config.database import engine
-from sqlalchemy import create_engine
+import sys
 
-# Rutas obligatorias según architecture_v2.0
-database_path = "src/app/db/database.db"
+from src.app.backups.hot_swap import database_swapper
 
-# Best practice: validación estricta + atomicidad
+# Best practice: validación estricta + atomicidad. La sustitución del
+# fichero se hace en caliente (backups.hot_swap): copia previa, drenaje de
+# conexiones, os.replace atómico y verificación, sin recrear el engine.
 
 def restore_backup(uploaded_file_path: str):
     if not os.path.exists(uploaded_file_path):
         raise FileNotFoundError("Uploaded DB file not found")
 
-    # Validar que sea un archivo SQLite
-    if not uploaded_file_path.endswith(".db"):
-        raise ValueError("Invalid database file")
-
-    # Crear backup previo obligatorio
-    old_backup = create_backup()
-
-    try:
-        # Cerrar engine actual
-        engine.dispose()
-
-        # Reemplazar DB
-        shutil.copy2(uploaded_file_path, database_path)
-
-        # Reiniciar engine
-        from src.app.core.config.database import engine as new_engine
-        return {"status": "ok", "backup": old_backup}
-
-    except Exception as e:
-        # Revertir en caso de error
-        if old_backup and os.path.exists(old_backup):
-            shutil.copy2(old_backup, database_path)
-        raise e
+    result = database_swapper.swap(uploaded_file_path)
+    return {"status": "ok", "backup": result["safety_backup"], **result}
 
 if __name__ == "__main__":
-    print("Use this module through the API upload endpoint.")
-# /src/app/backups/restore_backup.py 
\ No newline at end of file
+    if len(sys.argv) != 2:
+        print("Usage: python -m src.app.backups.restore_backup <database.db>")
+        sys.exit(1)
+    print(restore_backup(sys.argv[1]))
+# /src/app/backups/restore_backup.py 
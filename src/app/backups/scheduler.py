@@ -0,0 +1,435 @@
+# /src/app/backups/scheduler.py
+"""
+Backup scheduler — v3.0
+
+Backups online periódicos en segundo plano, dentro del propio proceso.
+
+Programación:
+- settings.BACKUP_SCHEDULE: expresión cron de 5 campos en hora UTC
+  (minuto hora día mes día_semana), p. ej. "0 * * * *" = cada hora.
+- Soporta "*", listas "1,15", rangos "1-5" y pasos "*/15" / "0-30/10".
+- Vacía = scheduler desactivado (por defecto).
+
+Cada ejecución (hilo "backup-scheduler", nunca en un request):
+1. Copia online (backups.online_backup) a BACKUP_DIR/scheduled.
+2. Compresión gzip en un pool de PROCESOS (BACKUP_COMPRESS_WORKERS):
+   la compresión no compite por el GIL con los hilos de la API.
+   Los procesos se crean con "forkserver" (o "spawn"), nunca con
+   fork: el proceso ya tiene hilos (API, write-behind, réplica) y un
+   fork con un lock tomado (logging, pool de SQLAlchemy, sqlite)
+   puede bloquear al hijo.
+3. Retención abuelo-padre-hijo: se conserva la copia más reciente de
+   cada una de las últimas N horas / días / semanas
+   (BACKUP_KEEP_HOURLY / DAILY / WEEKLY); el resto se elimina.
+4. Log con duración de cada fase y tamaños (original y comprimido).
+
+IMPORTANTE:
+- Solo se gestionan los ficheros de BACKUP_DIR/scheduled: las copias
+  manuales (/api/backup) no entran en la retención.
+- Con varios procesos (p. ej. gunicorn con N workers) activar el
+  scheduler en UNO solo: cada proceso tiene su propio scheduler.
+"""
+
+from __future__ import annotations
+
+import gzip
+import multiprocessing
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+from src.app.backups.online_backup import online_backup
+from src.app.core.config.settings import settings
+from src.app.core.exceptions import ConflictException
+from src.app.core.logging import get_logger
+from src.app.core.utils.datetime_utils import dt_to_iso_z
+
+logger = get_logger(__name__)
+
+# Procesos sin fork (ver cabecera): el worker es una función de módulo
+_MP_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+# Microsegundos en el nombre: dos ejecuciones en el mismo segundo no se pisan
+_FILENAME_FORMAT = "database_%Y%m%d_%H%M%S_%f.db.gz"
+# Nombres anteriores (resolución de segundos): siguen en la retención
+_LEGACY_FILENAME_FORMAT = "database_%Y%m%d_%H%M%S.db.gz"
+
+# Horizonte máximo de búsqueda de la siguiente ejecución
+_MAX_LOOKAHEAD = timedelta(days=366 * 5)
+
+
+# ============================================================
+# EXPRESIONES CRON
+# ============================================================
+
+class CronExpression:
+    """
+    Expresión cron de 5 campos (minuto, hora, día, mes, día de la semana).
+
+    Día de la semana: 0-6 desde el domingo (7 también es domingo).
+    Si día y día de la semana están restringidos a la vez, basta con
+    que coincida uno de los dos (semántica de cron clásico).
+    """
+
+    _FIELDS = (
+        ("minute", 0, 59),
+        ("hour", 0, 23),
+        ("day", 1, 31),
+        ("month", 1, 12),
+        ("weekday", 0, 7),
+    )
+
+    def __init__(self, expression: str):
+        """
+        :raises ValueError: si la expresión no es válida.
+        """
+        parts = expression.split()
+        if len(parts) != len(self._FIELDS):
+            raise ValueError(f"Cron expression must have 5 fields: {expression!r}")
+
+        self.expression = expression
+        values = {}
+        for part, (name, low, high) in zip(parts, self._FIELDS):
+            values[name] = self._parse_field(part, name, low, high)
+
+        self.minutes = values["minute"]
+        self.hours = values["hour"]
+        self.days = values["day"]
+        self.months = values["month"]
+        self.weekdays = {0 if day == 7 else day for day in values["weekday"]}
+        self._any_day = parts[2] == "*"
+        self._any_weekday = parts[4] == "*"
+
+    @staticmethod
+    def _parse_field(part: str, name: str, low: int, high: int) -> set[int]:
+        result: set[int] = set()
+        for item in part.split(","):
+            value_range, _, step_text = item.partition("/")
+            try:
+                step = int(step_text) if step_text else 1
+                if value_range == "*":
+                    start, end = low, high
+                elif "-" in value_range:
+                    start, end = (int(v) for v in value_range.split("-", 1))
+                else:
+                    start = int(value_range)
+                    end = high if step_text else start
+            except ValueError:
+                raise ValueError(f"Invalid cron {name} field: {part!r}") from None
+
+            if step < 1 or start < low or end > high or start > end:
+                raise ValueError(f"Invalid cron {name} field: {part!r}")
+            result.update(range(start, end + 1, step))
+        return result
+
+    def _day_matches(self, moment: datetime) -> bool:
+        day_ok = moment.day in self.days
+        weekday_ok = (moment.weekday() + 1) % 7 in self.weekdays
+        if self._any_day or self._any_weekday:
+            return day_ok and weekday_ok
+        return day_ok or weekday_ok
+
+    def matches(self, moment: datetime) -> bool:
+        return (
+            moment.minute in self.minutes
+            and moment.hour in self.hours
+            and moment.month in self.months
+            and self._day_matches(moment)
+        )
+
+    def next_after(self, moment: datetime) -> datetime:
+        """
+        Primer minuto estrictamente posterior a `moment` que cumple la
+        expresión. Salta días y horas completos que no pueden coincidir.
+
+        :raises ValueError: si no hay ninguno (p. ej. "0 0 31 2 *").
+        """
+        candidate = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = moment + _MAX_LOOKAHEAD
+
+        while candidate <= limit:
+            if candidate.month not in self.months or not self._day_matches(candidate):
+                candidate = candidate.replace(hour=0, minute=0) + timedelta(days=1)
+            elif candidate.hour not in self.hours:
+                candidate = candidate.replace(minute=0) + timedelta(hours=1)
+            elif candidate.minute not in self.minutes:
+                candidate += timedelta(minutes=1)
+            else:
+                return candidate
+
+        raise ValueError(f"Cron expression never fires: {self.expression!r}")
+
+
+# ============================================================
+# COMPRESIÓN (PROCESO HIJO) Y RETENCIÓN
+# ============================================================
+
+def _compress_file(source_path: str, target_path: str, level: int) -> int:
+    """
+    gzip de un fichero (se ejecuta en el pool de procesos).
+
+    :return: tamaño del fichero comprimido.
+    """
+    partial_path = target_path + ".part"
+    with open(source_path, "rb") as source, gzip.open(partial_path, "wb", compresslevel=level) as target:
+        shutil.copyfileobj(source, target, 1024 * 1024)
+    os.replace(partial_path, target_path)
+    return os.path.getsize(target_path)
+
+
+def retained_backups(created: dict[str, datetime], hourly: int, daily: int, weekly: int) -> set[str]:
+    """
+    Ficheros a conservar: el más reciente de cada una de las últimas
+    `hourly` horas, `daily` días y `weekly` semanas (ISO) con copia.
+
+    :param created: fichero → fecha de creación.
+    :return: nombres de los ficheros que se conservan.
+    """
+    keep: set[str] = set()
+    newest_first = sorted(created, key=created.get, reverse=True)
+
+    for limit, bucket in (
+        (hourly, lambda dt: (dt.date(), dt.hour)),
+        (daily, lambda dt: dt.date()),
+        (weekly, lambda dt: dt.isocalendar()[:2]),
+    ):
+        seen = set()
+        for name in newest_first:
+            if len(seen) >= limit:
+                break
+            key = bucket(created[name])
+            if key not in seen:
+                seen.add(key)
+                keep.add(name)
+
+    return keep
+
+
+# ============================================================
+# SCHEDULER
+# ============================================================
+
+class BackupScheduler:
+    """
+    Hilo de fondo que lanza backups según una expresión cron.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._executor: ProcessPoolExecutor | None = None
+        self._cron: CronExpression | None = None
+        self._next_run: datetime | None = None
+
+        self.runs = 0
+        self.failures = 0
+        self.last_run: dict | None = None
+
+    @property
+    def directory(self) -> str:
+        return os.path.join(settings.BACKUP_DIR, "scheduled")
+
+    # ------------------------------------------------------------
+    # CICLO DE VIDA
+    # ------------------------------------------------------------
+    def start(self) -> bool:
+        """
+        Arranca el hilo si hay BACKUP_SCHEDULE (idempotente).
+
+        :return: True si el scheduler queda activo.
+        :raises ValueError: si la expresión cron no es válida o nunca se
+                            cumple (falla al arrancar, no en el hilo).
+        """
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return True
+            if not settings.BACKUP_SCHEDULE.strip():
+                return False
+
+            cron = CronExpression(settings.BACKUP_SCHEDULE)
+            self._next_run = cron.next_after(datetime.now(timezone.utc))
+            self._cron = cron
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="backup-scheduler", daemon=True)
+            self._thread.start()
+
+        logger.info(f"Backup scheduler started ({settings.BACKUP_SCHEDULE!r} UTC)")
+        return True
+
+    def stop(self, timeout: float | None = None) -> None:
+        """
+        Detiene el hilo (espera a que termine la copia en curso) y el pool.
+        """
+        self._stop.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        with self._lock:
+            self._thread = None
+            self._next_run = None
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            now = datetime.now(timezone.utc)
+            try:
+                self._next_run = self._cron.next_after(now)
+            except ValueError:
+                # start() ya la ha validado: no debería ocurrir, pero nunca en silencio
+                logger.exception("Backup scheduler stopped: no next run")
+                self._next_run = None
+                return
+            if self._stop.wait((self._next_run - now).total_seconds()):
+                break
+            try:
+                self.run_once()
+            except Exception:
+                # Ya registrado en run_once; el scheduler sigue vivo
+                pass
+
+    # ------------------------------------------------------------
+    # EJECUCIÓN
+    # ------------------------------------------------------------
+    def run_once(self, now: datetime | None = None) -> dict | None:
+        """
+        Copia + compresión + retención.
+
+        :param now: instante de la copia (nombre del fichero).
+        :return: resumen de la ejecución, o None si había otra copia en curso.
+        """
+        now = now or datetime.now(timezone.utc)
+        os.makedirs(self.directory, exist_ok=True)
+        target = os.path.join(self.directory, now.strftime(_FILENAME_FORMAT))
+        raw_path = target[: -len(".gz")]
+        started = time.perf_counter()
+
+        try:
+            try:
+                backup = online_backup.run(raw_path)
+            except ConflictException:
+                logger.warning("Scheduled backup skipped: another backup is running")
+                return None
+            backup_ms = round((time.perf_counter() - started) * 1000, 1)
+
+            compress_started = time.perf_counter()
+            try:
+                size_gzip = self._pool().submit(
+                    _compress_file, raw_path, target, settings.BACKUP_COMPRESS_LEVEL
+                ).result()
+            finally:
+                os.remove(raw_path)
+            compress_ms = round((time.perf_counter() - compress_started) * 1000, 1)
+
+            removed = self.apply_retention()
+
+        except Exception as exc:
+            self.failures += 1
+            self.last_run = {
+                "state": "failed",
+                "started_at": dt_to_iso_z(now),
+                "error": str(exc),
+            }
+            logger.exception("Scheduled backup failed")
+            raise
+
+        self.runs += 1
+        self.last_run = {
+            "state": "completed",
+            "started_at": dt_to_iso_z(now),
+            "file": os.path.basename(target),
+            "size_bytes": backup["size_bytes"],
+            "size_gzip_bytes": size_gzip,
+            "backup_ms": backup_ms,
+            "compress_ms": compress_ms,
+            "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+            "removed": removed,
+        }
+        logger.info(
+            f"Scheduled backup: {self.last_run['file']} "
+            f"({backup['size_bytes']} → {size_gzip} bytes, backup {backup_ms} ms, "
+            f"gzip {compress_ms} ms, total {self.last_run['duration_ms']} ms, "
+            f"{len(removed)} expired)"
+        )
+        return dict(self.last_run)
+
+    def _pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=max(1, settings.BACKUP_COMPRESS_WORKERS),
+                    mp_context=_MP_CONTEXT,
+                )
+            return self._executor
+
+    # ------------------------------------------------------------
+    # RETENCIÓN
+    # ------------------------------------------------------------
+    def backups(self) -> dict[str, datetime]:
+        """
+        Copias programadas existentes: fichero → fecha (del nombre).
+        """
+        if not os.path.isdir(self.directory):
+            return {}
+        created = {}
+        for name in os.listdir(self.directory):
+            for name_format in (_FILENAME_FORMAT, _LEGACY_FILENAME_FORMAT):
+                try:
+                    created[name] = datetime.strptime(name, name_format).replace(tzinfo=timezone.utc)
+                    break
+                except ValueError:
+                    continue
+        return created
+
+    def apply_retention(self) -> list[str]:
+        """
+        Elimina las copias fuera de la política de retención.
+
+        :return: ficheros eliminados.
+        """
+        created = self.backups()
+        keep = retained_backups(
+            created,
+            hourly=settings.BACKUP_KEEP_HOURLY,
+            daily=settings.BACKUP_KEEP_DAILY,
+            weekly=settings.BACKUP_KEEP_WEEKLY,
+        )
+        removed = sorted(set(created) - keep)
+        for name in removed:
+            os.remove(os.path.join(self.directory, name))
+        return removed
+
+    # ------------------------------------------------------------
+    # ESTADO
+    # ------------------------------------------------------------
+    def status(self) -> dict:
+        running = self._thread is not None and self._thread.is_alive()
+        return {
+            "enabled": running,
+            "schedule": settings.BACKUP_SCHEDULE or None,
+            "next_run": dt_to_iso_z(self._next_run) if running and self._next_run else None,
+            "runs": self.runs,
+            "failures": self.failures,
+            "last_run": self.last_run,
+            "retained": sorted(self.backups(), reverse=True),
+            "retention": {
+                "hourly": settings.BACKUP_KEEP_HOURLY,
+                "daily": settings.BACKUP_KEEP_DAILY,
+                "weekly": settings.BACKUP_KEEP_WEEKLY,
+            },
+        }
+
+
+# ------------------------------------------------------------
+# INSTANCIA EXPORTADA (OBLIGATORIA)
+# ------------------------------------------------------------
+backup_scheduler = BackupScheduler()
+
+# /src/app/backups/scheduler.py
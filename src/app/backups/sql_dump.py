@@ -0,0 +1,166 @@
+# /src/app/backups/sql_dump.py
+"""
+SQL dump — v3.0
+
+Dump lógico de la base de datos en streaming, comprimido con gzip.
+
+Formato (texto UTF-8, una sentencia por línea):
+
+    -- DemeArizOil SQL dump v1
+    -- created_at: 2025-01-31T10:00:00Z
+    -- TABLE products
+    INSERT INTO products (id, name, ...) VALUES (1, 'Aceite', ...);
+    ...
+    -- sha256: <hex>
+
+- Las tablas van en orden de foreign keys (Base.metadata).
+- La última línea (trailer) es el SHA-256 de TODO lo anterior: el
+  restore puede verificar el fichero completo antes de aplicarlo.
+
+Rendimiento:
+- Una sola transacción de lectura sobre una conexión propia: foto
+  consistente de todas las tablas; con WAL no bloquea a los escritores.
+- Lectura por lotes (fetchmany) y compresión incremental (zlib): la
+  memoria es constante con independencia del tamaño de la base.
+- La cabecera se emite (y se comprime) de inmediato: la descarga
+  empieza antes de leer ninguna tabla.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import time
+import zlib
+from contextlib import closing
+from datetime import datetime, timezone
+from typing import Iterator
+
+from src.app.core.logging import get_logger
+from src.app.core.utils.datetime_utils import dt_to_iso_z
+from src.app.db.base import Base
+
+logger = get_logger(__name__)
+
+DUMP_HEADER = "-- DemeArizOil SQL dump v1"
+TABLE_PREFIX = "-- TABLE "
+CHECKSUM_PREFIX = "-- sha256: "
+
+# gzip (cabecera + CRC32) en lugar de deflate "crudo"
+_GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+
+# ============================================================
+# SERIALIZACIÓN DE VALORES
+# ============================================================
+
+def sql_literal(value) -> str:
+    """
+    Literal SQL de un valor devuelto por sqlite3.
+    """
+    if value is None:
+        return "NULL"
+    if isinstance(value, (int, float)):
+        return repr(value)
+    if isinstance(value, bytes):
+        return f"X'{value.hex()}'"
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def _ordered_tables(conn: sqlite3.Connection) -> list[str]:
+    """
+    Tablas existentes, en orden de foreign keys (las desconocidas al final).
+    """
+    existing = {
+        row[0] for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'"
+        )
+    }
+    ordered = [table.name for table in Base.metadata.sorted_tables if table.name in existing]
+    return ordered + sorted(existing - set(ordered))
+
+
+# ============================================================
+# DUMP
+# ============================================================
+
+def dump_sql(database_path: str, batch_rows: int = 1000) -> Iterator[str]:
+    """
+    Genera el dump como fragmentos de texto (sin comprimir).
+
+    :param database_path: fichero SQLite de origen.
+    :param batch_rows: filas leídas por lote.
+    """
+    conn = sqlite3.connect(f"file:{database_path}?mode=ro", uri=True, timeout=5)
+    try:
+        yield f"{DUMP_HEADER}\n-- created_at: {dt_to_iso_z(datetime.now(timezone.utc))}\n"
+
+        # La foto se fija con la primera lectura y se mantiene hasta el final
+        conn.execute("BEGIN")
+
+        for table in _ordered_tables(conn):
+            cursor = conn.execute(f'SELECT * FROM "{table}"')
+            columns = ", ".join(col[0] for col in cursor.description)
+            prefix = f"INSERT INTO {table} ({columns}) VALUES ("
+
+            yield f"{TABLE_PREFIX}{table}\n"
+            while True:
+                rows = cursor.fetchmany(batch_rows)
+                if not rows:
+                    break
+                yield "".join(
+                    prefix + ", ".join(map(sql_literal, row)) + ");\n"
+                    for row in rows
+                )
+
+        conn.rollback()
+    finally:
+        conn.close()
+
+
+def gzip_dump(database_path: str, batch_rows: int = 1000, chunk_bytes: int = 64 * 1024) -> Iterator[bytes]:
+    """
+    Dump comprimido con gzip, en bloques, con trailer de checksum.
+
+    :param database_path: fichero SQLite de origen.
+    :param batch_rows: filas leídas por lote.
+    :param chunk_bytes: tamaño aproximado de texto acumulado por bloque.
+    """
+    started = time.perf_counter()
+    compressor = zlib.compressobj(6, zlib.DEFLATED, _GZIP_WBITS)
+    digest = hashlib.sha256()
+    raw_bytes = 0
+    sent_bytes = 0
+    pending: list[bytes] = []
+    pending_size = 0
+
+    # closing: si el cliente corta la descarga se libera la conexión
+    with closing(dump_sql(database_path, batch_rows)) as parts:
+        for index, text in enumerate(parts):
+            data = text.encode("utf-8")
+            digest.update(data)
+            raw_bytes += len(data)
+            pending.append(data)
+            pending_size += len(data)
+
+            # Primer bloque (cabecera) inmediato; el resto, por tamaño
+            if index == 0 or pending_size >= chunk_bytes:
+                out = compressor.compress(b"".join(pending))
+                if index == 0:
+                    out += compressor.flush(zlib.Z_SYNC_FLUSH)
+                pending, pending_size = [], 0
+                if out:
+                    sent_bytes += len(out)
+                    yield out
+
+    trailer = f"{CHECKSUM_PREFIX}{digest.hexdigest()}\n".encode("utf-8")
+    out = compressor.compress(b"".join(pending) + trailer) + compressor.flush()
+    sent_bytes += len(out)
+    yield out
+
+    logger.info(
+        f"SQL dump streamed: {raw_bytes} bytes raw, {sent_bytes} bytes gzip, "
+        f"{round((time.perf_counter() - started) * 1000, 1)} ms"
+    )
+
+# /src/app/backups/sql_dump.py
@@ -0,0 +1,344 @@
+# /src/app/backups/sql_restore.py
+"""
+SQL restore — v3.0
+
+Restauración de un dump SQL (backups.sql_dump) desde fichero, en
+streaming y con inserciones por lotes.
+
+Entrada:
+- Fichero en disco, gzip (detectado por cabecera) o texto plano.
+- Se lee línea a línea: la memoria no depende del tamaño del dump.
+
+Parser:
+- Una sentencia `INSERT INTO t (cols) VALUES (...);` por línea; si un
+  valor contiene saltos de línea, la sentencia continúa en las líneas
+  siguientes (los ';' y ')' dentro de literales no la cortan).
+- Los valores se convierten a parámetros Python (NULL, números, texto,
+  X'..'): nada del dump se ejecuta como SQL salvo nombres de tabla y
+  columna ya validados contra el schema.
+- `-- sha256: <hex>` (trailer) se verifica contra lo leído.
+
+Aplicación (UNA transacción: todo o nada):
+- Pragmas relajados durante la carga (foreign_keys OFF, synchronous OFF,
+  caché amplia); se restauran al terminar.
+- Cada tabla del dump se vacía y se recarga con executemany por lotes.
+- Los índices secundarios se eliminan antes y se recrean al final
+  (una construcción ordenada en lugar de millones de inserciones).
+- Las filas de change_log del dump se ignoran: las secuencias vivas se
+  conservan y cada tabla restaurada recibe una nueva, por encima de la
+  global actual, en la misma transacción. Las secuencias nunca
+  retroceden y las cachés de este y de otros procesos se invalidan.
+- Cada fila restaurada recibe esa secuencia en `change_seq` y se anota
+  como secuencia de restore (change_log): los cursores de sync
+  anteriores reciben `reset` y los incrementales copian lo restaurado.
+- El escritor (load_rows) es común con el import NDJSON (backups.ndjson).
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import re
+import sqlite3
+import time
+from typing import Iterator
+
+from sqlalchemy.exc import DBAPIError
+
+from src.app.backups.sql_dump import CHECKSUM_PREFIX, TABLE_PREFIX
+from src.app.core.cache import invalidation
+from src.app.core.cache.change_tracker import bump_tables, record_restore
+from src.app.core.config.database import engine
+from src.app.core.exceptions import BadRequestException
+from src.app.core.logging import get_logger
+from src.app.models.change_log import ChangeLog
+
+logger = get_logger(__name__)
+
+_GZIP_MAGIC = b"\x1f\x8b"
+
+_VALUE = r"(?:NULL|'(?:[^']|'')*'|[xX]'[0-9a-fA-F]*'|[-+]?[0-9][0-9.eE+-]*)"
+_VALUE_RE = re.compile(_VALUE)
+_INSERT_RE = re.compile(r"INSERT INTO (\w+) \((\w+(?:, \w+)*)\) VALUES \((.*)\);\s*", re.S)
+
+_IGNORED = {"BEGIN TRANSACTION;", "BEGIN;", "COMMIT;"}
+
+_RELAXED_PRAGMAS = {
+    "foreign_keys": "OFF",
+    "synchronous": "OFF",
+    "cache_size": "-65536",
+    "temp_store": "MEMORY",
+}
+
+
+# ============================================================
+# PARSER
+# ============================================================
+
+def _convert(token: str):
+    """
+    Literal SQL del dump → valor Python.
+    """
+    first = token[0]
+    if first == "'":
+        return token[1:-1].replace("''", "'") if "''" in token else token[1:-1]
+    if first == "N":
+        return None
+    if first in "xX":
+        return bytes.fromhex(token[2:-1])
+    if "." in token or "e" in token or "E" in token:
+        return float(token)
+    return int(token)
+
+
+def _parse_values(values: str) -> tuple | None:
+    """
+    Lista de literales → tupla de valores; None si la lista no está
+    completa (literal con saltos de línea que sigue en otra línea).
+    """
+    tokens = _VALUE_RE.findall(values)
+    # Los literales separados por ", " deben reconstruir el texto exacto
+    if ", ".join(tokens) != values:
+        return None
+    return tuple(map(_convert, tokens))
+
+
+def _open_lines(path: str) -> Iterator[bytes]:
+    with open(path, "rb") as probe:
+        compressed = probe.read(2) == _GZIP_MAGIC
+
+    handle = gzip.open(path, "rb") if compressed else open(path, "rb")
+    with handle:
+        try:
+            yield from handle
+        except (EOFError, gzip.BadGzipFile, OSError) as exc:
+            raise BadRequestException(f"Corrupted or truncated backup file: {exc}")
+
+
+def parse_dump(path: str) -> Iterator[tuple]:
+    """
+    Recorre el dump y emite:
+    - ("table", name) al empezar cada tabla
+    - ("row", table, columns, values) por cada INSERT
+
+    Al final verifica el trailer de checksum (si existe).
+
+    :raises BadRequestException: sentencia no soportada o checksum erróneo.
+    """
+    digest = hashlib.sha256()
+    pending = ""
+    checksum = None
+
+    for raw in _open_lines(path):
+        line = raw.decode("utf-8")
+
+        if not pending and line.startswith(CHECKSUM_PREFIX):
+            checksum = line[len(CHECKSUM_PREFIX):].strip()
+            continue
+        if checksum is not None:
+            raise BadRequestException("Unexpected content after checksum trailer")
+
+        digest.update(raw)
+
+        if pending:
+            pending += line
+        else:
+            stripped = line.strip()
+            if not stripped or stripped in _IGNORED:
+                continue
+            if stripped.startswith(TABLE_PREFIX.strip()):
+                yield ("table", stripped[len(TABLE_PREFIX):].strip())
+                continue
+            if stripped.startswith("--"):
+                continue
+            if not stripped.startswith("INSERT INTO "):
+                raise BadRequestException(f"Unsupported statement in backup: {stripped[:60]}")
+            pending = line
+
+        match = _INSERT_RE.fullmatch(pending)
+        values = _parse_values(match.group(3)) if match else None
+        if values is None:
+            # Literal con saltos de línea: la sentencia sigue en otra línea
+            continue
+
+        yield ("row", match.group(1), match.group(2), values)
+        pending = ""
+
+    if pending:
+        raise BadRequestException("Truncated statement at end of backup")
+
+    if checksum is None:
+        logger.warning("SQL restore: backup without checksum trailer")
+    elif checksum != digest.hexdigest():
+        raise BadRequestException("Backup checksum mismatch")
+
+
+# ============================================================
+# RESTORE
+# ============================================================
+
+def restore_sql(path: str, batch_rows: int = 5000) -> dict:
+    """
+    Restaura un dump en una única transacción.
+
+    :param path: fichero del dump (gzip o texto).
+    :param batch_rows: filas por executemany.
+    :return: resumen (tablas, filas, duración, filas/s).
+    :raises BadRequestException: dump inválido (no se aplica nada).
+    """
+    result = load_rows(parse_dump(path), batch_rows)
+    logger.info(f"SQL restore completed: {result}")
+    return result
+
+
+def load_rows(items: Iterator[tuple], batch_rows: int = 5000) -> dict:
+    """
+    Escritor único: aplica una secuencia de tablas y filas en UNA
+    transacción (lo usan el restore SQL y el import NDJSON).
+
+    :param items: ("table", name), ("row", table, columns, values) o
+                  ("rows", table, columns, [values, ...]); `columns` es
+                  "col1, col2, ..." (nombres validados contra el schema).
+    :param batch_rows: filas por executemany.
+    :return: resumen (tablas, filas, duración, filas/s).
+    :raises BadRequestException: contenido inválido (no se aplica nada).
+    """
+    started = time.perf_counter()
+    rows_total = 0
+    tables: list[str] = []
+    # Sección en curso (change_log incluida, aunque no se cargue)
+    seen: list[str] = []
+
+    with engine.connect() as conn:
+        previous = {
+            name: conn.exec_driver_sql(f"PRAGMA {name}").scalar()
+            for name in _RELAXED_PRAGMAS
+        }
+        for name, value in _RELAXED_PRAGMAS.items():
+            conn.exec_driver_sql(f"PRAGMA {name}={value}")
+        # Cierra el autobegin de SQLAlchemy (los PRAGMA no abren transacción)
+        conn.commit()
+
+        try:
+            with conn.begin():
+                # Transacción explícita: también cubre el DDL de índices
+                # (el driver solo abre transacción implícita ante DML)
+                conn.exec_driver_sql("BEGIN IMMEDIATE")
+                schema = _schema(conn)
+                indexes: list[str] = []
+                batch: list[tuple] = []
+                statement = None
+
+                def _flush():
+                    if batch:
+                        conn.exec_driver_sql(statement, batch)
+                        batch.clear()
+
+                for item in items:
+                    if item[0] == "table":
+                        _flush()
+                        table = item[1]
+                        if table not in schema:
+                            raise BadRequestException(f"Unknown table in backup: {table}")
+                        if table in seen:
+                            raise BadRequestException(f"Duplicated table in backup: {table}")
+                        seen.append(table)
+                        statement = None
+                        if table == ChangeLog.__tablename__:
+                            # Secuencias del dump: retrocederían el contador global
+                            continue
+                        tables.append(table)
+                        indexes += _drop_indexes(conn, table)
+                        conn.exec_driver_sql(f'DELETE FROM "{table}"')
+                        continue
+
+                    kind, table, columns, values = item
+                    if not seen or table != seen[-1]:
+                        raise BadRequestException(f"Row outside its table section: {table}")
+                    if table == ChangeLog.__tablename__:
+                        continue
+
+                    rows = values if kind == "rows" else (values,)
+                    if not rows:
+                        continue
+
+                    if statement is None or not statement.startswith(f'INSERT INTO "{table}" ({columns})'):
+                        _flush()
+                        unknown = set(columns.split(", ")) - schema[table]
+                        if unknown:
+                            raise BadRequestException(f"Unknown columns in backup for {table}: {', '.join(sorted(unknown))}")
+                        statement = (
+                            f'INSERT INTO "{table}" ({columns}) VALUES '
+                            f'({", ".join("?" for _ in rows[0])})'
+                        )
+
+                    batch.extend(rows)
+                    rows_total += len(rows)
+                    if len(batch) >= batch_rows:
+                        _flush()
+
+                _flush()
+
+                if tables:
+                    seq = bump_tables(conn, set(tables))
+                    # Antes de recrear los índices (incluido el de change_seq)
+                    for table in tables:
+                        if "change_seq" in schema[table]:
+                            conn.exec_driver_sql(f'UPDATE "{table}" SET change_seq = ?', (seq,))
+                    record_restore(conn, seq)
+
+                for ddl in indexes:
+                    conn.exec_driver_sql(ddl)
+
+        except DBAPIError as exc:
+            raise BadRequestException(f"Invalid backup content: {exc.orig}")
+        except sqlite3.Error as exc:
+            raise BadRequestException(f"Invalid backup content: {exc}")
+        finally:
+            for name, value in previous.items():
+                conn.exec_driver_sql(f"PRAGMA {name}={value}")
+            conn.commit()
+
+    if tables:
+        invalidation.notify(tables)
+
+    seconds = time.perf_counter() - started
+    return {
+        "tables": len(tables),
+        "rows": rows_total,
+        "duration_ms": round(seconds * 1000, 1),
+        "rows_per_second": int(rows_total / seconds) if seconds else rows_total,
+    }
+
+
+def _schema(conn) -> dict[str, set[str]]:
+    """
+    Columnas de cada tabla existente.
+    """
+    names = [
+        row[0] for row in conn.exec_driver_sql(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'"
+        )
+    ]
+    return {
+        name: {row[1] for row in conn.exec_driver_sql(f'PRAGMA table_info("{name}")')}
+        for name in names
+    }
+
+
+def _drop_indexes(conn, table: str) -> list[str]:
+    """
+    Elimina los índices secundarios de una tabla y devuelve su DDL.
+
+    Los índices automáticos (PRIMARY KEY / UNIQUE) no tienen SQL y se
+    mantienen: garantizan la integridad durante la carga.
+    """
+    rows = conn.exec_driver_sql(
+        "SELECT name, sql FROM sqlite_master WHERE type = 'index' AND tbl_name = ? AND sql IS NOT NULL",
+        (table,),
+    ).fetchall()
+    for name, _ in rows:
+        conn.exec_driver_sql(f'DROP INDEX "{name}"')
+    return [sql for _, sql in rows]
+
+# /src/app/backups/sql_restore.py
@@ -0,0 +1,3 @@
+# /src/app/benchmarks/__init__.py
+# Benchmarks de rendimiento (scripts ejecutables con python -m)
+# /src/app/benchmarks/__init__.py
@@ -0,0 +1,148 @@
+# /src/app/benchmarks/login_throughput.py
+"""
+Benchmark: throughput de login por coste de bcrypt — v3.0
+
+Mide, para cada valor de BCRYPT_ROUNDS:
+- logins/s con N clientes concurrentes contra POST /api/auth/login
+- latencia p50 / p95 del login
+- latencia p50 de un request autenticado (GET /api/auth/me) lanzado
+  DURANTE la avalancha de logins (el pool de bcrypt debe protegerlo)
+- logins rechazados con 503 (cola del pool llena)
+
+Uso:
+    python -m src.app.benchmarks.login_throughput --costs 4,8,10,12 --logins 40 --concurrency 8
+
+IMPORTANTE:
+- Usa una base de datos temporal; NO toca database.db.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# La base de datos temporal debe fijarse ANTES de importar la app
+_TMP_DIR = tempfile.mkdtemp(prefix="demearizoil_bench_")
+os.environ["DATABASE_PATH"] = os.path.join(_TMP_DIR, "bench.db")
+
+from src.app.core.config.database import db_session  # noqa: E402
+from src.app.core.config.settings import settings  # noqa: E402
+from src.app.init_data import init_data  # noqa: E402
+from src.app.main import create_app  # noqa: E402
+from src.app.models.user import User  # noqa: E402
+from src.app.security.password import hash_password  # noqa: E402
+
+USERNAME = "admin"
+PASSWORD = "admin123"
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct))]
+
+
+def _set_cost(cost: int) -> None:
+    """
+    Fija el coste y regenera el hash del admin con ese coste.
+    """
+    settings.BCRYPT_ROUNDS = cost
+    user = db_session.query(User).filter_by(username=USERNAME).one()
+    user.hash_password = hash_password(PASSWORD, rounds=cost)
+    db_session.commit()
+    db_session.remove()
+
+
+def run_cost(app, cost: int, logins: int, concurrency: int) -> dict:
+    """
+    Ejecuta la avalancha de logins para un coste y devuelve las métricas.
+    """
+    _set_cost(cost)
+
+    client = app.test_client()
+    token = client.post("/api/auth/login", json={"username": USERNAME, "password": PASSWORD}).get_json()["access_token"]
+
+    login_times: list[float] = []
+    me_times: list[float] = []
+    rejected = 0
+    lock = threading.Lock()
+    storm_done = threading.Event()
+
+    def login() -> None:
+        nonlocal rejected
+        started = time.perf_counter()
+        resp = app.test_client().post("/api/auth/login", json={"username": USERNAME, "password": PASSWORD})
+        elapsed = time.perf_counter() - started
+        with lock:
+            if resp.status_code == 503:
+                rejected += 1
+            else:
+                login_times.append(elapsed)
+
+    def probe() -> None:
+        probe_client = app.test_client()
+        headers = {"Authorization": f"Bearer {token}"}
+        while not storm_done.is_set():
+            started = time.perf_counter()
+            probe_client.get("/api/auth/me", headers=headers)
+            me_times.append(time.perf_counter() - started)
+            time.sleep(0.01)
+
+    prober = threading.Thread(target=probe, daemon=True)
+    prober.start()
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for _ in range(logins):
+            pool.submit(login)
+    elapsed = time.perf_counter() - started
+
+    storm_done.set()
+    prober.join()
+
+    return {
+        "cost": cost,
+        "logins_per_s": round(len(login_times) / elapsed, 1) if elapsed else 0.0,
+        "login_p50_ms": round(_percentile(login_times, 0.50) * 1000, 1),
+        "login_p95_ms": round(_percentile(login_times, 0.95) * 1000, 1),
+        "me_p50_ms": round(statistics.median(me_times) * 1000, 2) if me_times else 0.0,
+        "rejected_503": rejected,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Login throughput per bcrypt cost")
+    parser.add_argument("--costs", default="4,8,10,12", help="costes bcrypt separados por comas")
+    parser.add_argument("--logins", type=int, default=40, help="logins por coste")
+    parser.add_argument("--concurrency", type=int, default=8, help="clientes concurrentes")
+    args = parser.parse_args()
+
+    app = create_app(testing=True)
+    with app.app_context():
+        init_data()
+
+    print(
+        f"bcrypt workers={settings.BCRYPT_WORKERS} queue={settings.BCRYPT_QUEUE_LIMIT} "
+        f"logins={args.logins} concurrency={args.concurrency}"
+    )
+    print(f"{'cost':>4} {'logins/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'/me p50 ms':>11} {'503':>5}")
+
+    for cost in (int(value) for value in args.costs.split(",")):
+        with app.app_context():
+            result = run_cost(app, cost, args.logins, args.concurrency)
+        print(
+            f"{result['cost']:>4} {result['logins_per_s']:>9} {result['login_p50_ms']:>8} "
+            f"{result['login_p95_ms']:>8} {result['me_p50_ms']:>11} {result['rejected_503']:>5}"
+        )
+
+
+if __name__ == "__main__":
+    main()
+
+# /src/app/benchmarks/login_throughput.py
@@ -0,0 +1,68 @@
+# /src/app/benchmarks/ndjson_throughput.py
+"""
+Benchmark: export / import NDJSON — v3.0
+
+Mide:
+- filas/s del export (yield_per) y del import (backups.ndjson) para N
+  filas sintéticas en `products`
+- el import con 1 proceso de parseo frente a --workers procesos
+
+Uso:
+    python -m src.app.benchmarks.ndjson_throughput --rows 500000 --workers 4
+
+IMPORTANTE:
+- Usa una base de datos temporal; NO toca database.db.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+
+# La base de datos temporal debe fijarse ANTES de importar la app
+_TMP_DIR = tempfile.mkdtemp(prefix="demearizoil_bench_")
+os.environ["DATABASE_PATH"] = os.path.join(_TMP_DIR, "bench.db")
+
+from src.app.backups.ndjson import export_ndjson, import_ndjson  # noqa: E402
+from src.app.core.config.database import engine  # noqa: E402
+from src.app.db.base import Base  # noqa: E402
+
+
+def seed(rows: int) -> None:
+    """
+    Inserta `rows` productos sintéticos.
+    """
+    with engine.begin() as conn:
+        conn.exec_driver_sql(
+            "INSERT INTO products (id, name, unit_measure, is_inventory, cost_average, is_active, created_at, change_seq) "
+            "VALUES (?, ?, 'ud', 1, ?, 1, '2025-01-01 00:00:00', ?)",
+            [(i, f"Producto {i} \"bench\"", i % 97 + 0.5, i) for i in range(1, rows + 1)],
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=500_000)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--batch", type=int, default=5000)
+    args = parser.parse_args()
+
+    Base.metadata.create_all(bind=engine)
+    seed(args.rows)
+
+    directory = os.path.join(_TMP_DIR, "export")
+    exported = export_ndjson(directory, args.batch)
+    single = import_ndjson(directory, args.batch, workers=1)
+    parallel = import_ndjson(directory, args.batch, workers=args.workers)
+
+    print(f"rows              : {exported['rows']}")
+    print(f"export            : {exported['duration_ms'] / 1000:.2f} s ({exported['rows_per_second']} rows/s, {exported['size_bytes']} bytes)")
+    print(f"import 1 worker   : {single['duration_ms'] / 1000:.2f} s ({single['rows_per_second']} rows/s)")
+    print(f"import {args.workers} workers  : {parallel['duration_ms'] / 1000:.2f} s ({parallel['rows_per_second']} rows/s)")
+
+
+if __name__ == "__main__":
+    main()
+
+# /src/app/benchmarks/ndjson_throughput.py
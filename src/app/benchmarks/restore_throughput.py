@@ -0,0 +1,100 @@
+# /src/app/benchmarks/restore_throughput.py
+"""
+Benchmark: restore de dump SQL — v3.0
+
+Mide:
+- filas/s del restore por lotes (backups.sql_restore) para un dump
+  sintético de N filas en `products`
+- comparación con la ejecución sentencia a sentencia (una
+  connection.execute por INSERT, como el restore anterior)
+
+Uso:
+    python -m src.app.benchmarks.restore_throughput --rows 1000000
+
+IMPORTANTE:
+- Usa una base de datos temporal; NO toca database.db.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import hashlib
+import os
+import tempfile
+import time
+
+# La base de datos temporal debe fijarse ANTES de importar la app
+_TMP_DIR = tempfile.mkdtemp(prefix="demearizoil_bench_")
+os.environ["DATABASE_PATH"] = os.path.join(_TMP_DIR, "bench.db")
+
+from sqlalchemy import text  # noqa: E402
+
+from src.app.backups.sql_dump import CHECKSUM_PREFIX, DUMP_HEADER, TABLE_PREFIX  # noqa: E402
+from src.app.backups.sql_restore import restore_sql  # noqa: E402
+from src.app.core.config.database import engine  # noqa: E402
+from src.app.db.base import Base  # noqa: E402
+
+_COLUMNS = "id, name, unit_measure, is_inventory, cost_average, is_active, created_at, change_seq"
+
+
+def _statement(i: int) -> str:
+    return (
+        f"INSERT INTO products ({_COLUMNS}) VALUES "
+        f"({i}, 'Producto {i}; ''bench''', 'ud', 1, {i % 97 + 0.5}, 1, '2025-01-01 00:00:00', {i});\n"
+    )
+
+
+def write_dump(path: str, rows: int) -> None:
+    """
+    Genera un dump gzip con `rows` productos y trailer de checksum.
+    """
+    digest = hashlib.sha256()
+    with gzip.open(path, "wb", compresslevel=1) as out:
+        def emit(line: str) -> None:
+            data = line.encode("utf-8")
+            digest.update(data)
+            out.write(data)
+
+        emit(f"{DUMP_HEADER}\n")
+        emit(f"{TABLE_PREFIX}products\n")
+        for i in range(1, rows + 1):
+            emit(_statement(i))
+        out.write(f"{CHECKSUM_PREFIX}{digest.hexdigest()}\n".encode("utf-8"))
+
+
+def run_row_by_row(rows: int) -> float:
+    """
+    Referencia: un execute por sentencia (muestra de `rows` filas).
+    """
+    started = time.perf_counter()
+    with engine.begin() as conn:
+        conn.execute(text("DELETE FROM products"))
+        for i in range(1, rows + 1):
+            conn.execute(text(_statement(i).rstrip().rstrip(";")))
+    return rows / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--sample", type=int, default=20_000, help="filas para la referencia sentencia a sentencia")
+    args = parser.parse_args()
+
+    Base.metadata.create_all(bind=engine)
+    path = os.path.join(_TMP_DIR, "bench.sql.gz")
+    write_dump(path, args.rows)
+
+    result = restore_sql(path)
+    baseline = run_row_by_row(args.sample)
+
+    print(f"rows            : {result['rows']}")
+    print(f"batched restore : {result['duration_ms'] / 1000:.2f} s ({result['rows_per_second']} rows/s)")
+    print(f"row by row      : {int(baseline)} rows/s (sample {args.sample})")
+    print(f"estimated 1-by-1: {result['rows'] / baseline:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
+
+# /src/app/benchmarks/restore_throughput.py
@@ -0,0 +1,139 @@
+# /src/app/controllers/admin_controller.py
+"""
+AdminController — v3.0
+
+Controller de administración técnica del sistema.
+
+Responsabilidad:
+- Exponer endpoints de diagnóstico (solo administradores)
+- Delegar en AdminService
+
+IMPORTANTE:
+- Las excepciones se gestionan en core.exceptions.handlers
+"""
+
+import os
+
+from flask import request, send_file
+
+from src.app.controllers.base_controller import BaseController
+from src.app.core.exceptions import BadRequestException
+from src.app.services.admin_service import admin_service
+
+AUDIT_DEFAULT_LIMIT = 100
+AUDIT_MAX_LIMIT = 1000
+SLOW_QUERIES_DEFAULT_LIMIT = 20
+SLOW_QUERIES_MAX_LIMIT = 500
+TRACES_DEFAULT_LIMIT = 20
+TRACES_MAX_LIMIT = 200
+PROFILES_DEFAULT_LIMIT = 50
+PROFILES_MAX_LIMIT = 500
+
+
+class AdminController(BaseController):
+    """
+    Controller de administración (endpoints especiales).
+    """
+
+    service = admin_service
+
+    # ------------------------------------------------------------
+    # ENDPOINTS ESPECÍFICOS
+    # ------------------------------------------------------------
+    def cache_stats(self):
+        """
+        Devuelve los contadores de las cachés (aciertos, fallos, ratio).
+        """
+        return self.response_ok(self.service.get_cache_stats())
+
+    def audit(self):
+        """
+        GET /admin/audit?user_id=&method=&path=&status=&since=&until=&limit=
+
+        `path` filtra por prefijo. Más recientes primero.
+        """
+        limit = self._int_arg("limit")
+        if limit is None:
+            limit = AUDIT_DEFAULT_LIMIT
+        if not 1 <= limit <= AUDIT_MAX_LIMIT:
+            raise BadRequestException(f"limit must be between 1 and {AUDIT_MAX_LIMIT}")
+
+        data = self.service.get_audit(
+            user_id=self._int_arg("user_id"),
+            method=request.args.get("method") or None,
+            path=request.args.get("path") or None,
+            status=self._int_arg("status"),
+            since=self._datetime_arg("since"),
+            until=self._datetime_arg("until"),
+            limit=limit,
+        )
+        return self.response_ok(data)
+
+    def slow_queries(self):
+        """
+        GET /admin/slow_queries?limit=
+
+        Sentencias lentas por tiempo total (mayor primero).
+        """
+        limit = self._int_arg("limit")
+        if limit is None:
+            limit = SLOW_QUERIES_DEFAULT_LIMIT
+        if not 1 <= limit <= SLOW_QUERIES_MAX_LIMIT:
+            raise BadRequestException(f"limit must be between 1 and {SLOW_QUERIES_MAX_LIMIT}")
+
+        return self.response_ok(self.service.get_slow_queries(limit))
+
+    def traces(self):
+        """
+        GET /admin/traces?trace_id=&min_ms=&limit=
+
+        Trazas recientes (más recientes primero) con todos sus spans.
+        """
+        limit = self._int_arg("limit")
+        if limit is None:
+            limit = TRACES_DEFAULT_LIMIT
+        if not 1 <= limit <= TRACES_MAX_LIMIT:
+            raise BadRequestException(f"limit must be between 1 and {TRACES_MAX_LIMIT}")
+
+        data = self.service.get_traces(
+            limit=limit,
+            trace_id=request.args.get("trace_id") or None,
+            min_ms=self._int_arg("min_ms"),
+        )
+        return self.response_ok(data)
+
+    def profiles(self):
+        """
+        GET /admin/profiles?limit=
+
+        Perfiles de requests guardados (más recientes primero).
+        """
+        limit = self._int_arg("limit")
+        if limit is None:
+            limit = PROFILES_DEFAULT_LIMIT
+        if not 1 <= limit <= PROFILES_MAX_LIMIT:
+            raise BadRequestException(f"limit must be between 1 and {PROFILES_MAX_LIMIT}")
+
+        return self.response_ok(self.service.get_profiles(limit))
+
+    def download_profile(self, name: str):
+        """
+        GET /admin/profiles/<name>
+
+        Descarga un fichero de perfil (.pstats o .folded).
+        """
+        path = self.service.get_profile_path(name)
+        return send_file(
+            os.path.abspath(path),
+            as_attachment=True,
+            download_name=name,
+            mimetype="application/octet-stream",
+        )
+
+
+# ------------------------------------------------------------
+# INSTANCIA EXPORTADA (OBLIGATORIA)
+# ------------------------------------------------------------
+admin_controller = AdminController()
+
+# /src/app/controllers/admin_controller.py
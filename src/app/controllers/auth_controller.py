@@ -22,6 +22,7 @@ from src.app.controllers.base_controller import BaseController
 from src.app.services.auth_service import auth_service
 from src.app.core.logging import get_logger
 from src.app.core.exceptions.base import BadRequestException
+from src.app.security.middleware import get_client_ip
 
 logger = get_logger(__name__)
 
@@ -63,6 +64,7 @@ class AuthController(BaseController):
         Raises:
             BadRequestException: Si el body no existe.
             UnauthorizedException: Si las credenciales son inválidas.
+            TooManyRequestsException: Demasiados intentos (IP o username).
         """
 
         logger.info("Login request received")
@@ -74,6 +76,7 @@ class AuthController(BaseController):
         result = self.service.authenticate(
             data.get("username"),
             data.get("password"),
+            client_ip=get_client_ip(),
         )
 
         return self.response_ok(
@@ -12,7 +12,9 @@ IMPORTANTE:
 - Las excepciones se gestionan en core.exceptions.handlers
 """
 
-from flask import send_file, request
+import os
+
+from flask import Response, send_file, request
 from src.app.controllers.base_controller import BaseController
 from src.app.services.backup_service import backup_service
 from src.app.core.logging import get_logger
@@ -35,12 +37,28 @@ class BackupController(BaseController):
         logger.info("Exporting database backup")
         database_path = self.service.export_database()
         return send_file(
-            database_path,
+            os.path.abspath(database_path),
             as_attachment=True,
             download_name="backup.sqlite3",
             mimetype="application/octet-stream",
         )
 
+    def export_dump(self):
+        """
+        Dump SQL comprimido (gzip) en streaming, con trailer sha256.
+        """
+        logger.info("Streaming SQL dump")
+        filename, chunks = self.service.export_stream()
+        return Response(
+            chunks,
+            mimetype="application/gzip",
+            headers={
+                "Content-Disposition": f"attachment; filename={filename}",
+                "Cache-Control": "no-store",
+                "X-Accel-Buffering": "no",
+            },
+        )
+
     def restore_backup(self):
         logger.info("Restoring database backup")
         if "file" not in request.files:
@@ -49,6 +67,53 @@ class BackupController(BaseController):
         result = self.service.restore_database(uploaded_file)
         return self.response_ok(result)
 
+    def create_incremental(self):
+        """
+        POST /backup/incremental?full=true|false
+        """
+        full = request.args.get("full", "false").lower() == "true"
+        return self.response_created(self.service.create_incremental(full=full))
+
+    def incremental_manifest(self):
+        return self.response_ok(self.service.incremental_manifest())
+
+    def verify_incremental(self):
+        return self.response_ok(self.service.verify_incremental())
+
+    def restore_incremental(self):
+        """
+        POST /backup/incremental/restore → base + incrementos (hot swap)
+        """
+        logger.info("Restoring incremental backup chain")
+        return self.response_ok(self.service.restore_incremental())
+
+    def export_ndjson(self):
+        """
+        POST /backup/ndjson → export NDJSON en BACKUP_DIR
+        """
+        logger.info("Exporting NDJSON dataset")
+        return self.response_created(self.service.export_ndjson())
+
+    def import_ndjson(self):
+        """
+        POST /backup/ndjson/import {"export": "<nombre>"}
+        """
+        data = self.parse_json(required=True)
+        logger.info(f"Importing NDJSON dataset {data.get('export')!r}")
+        return self.response_ok(self.service.import_ndjson(data.get("export")))
+
+    def backup_status(self):
+        """
+        Progreso de la copia online en curso (o de la última).
+        """
+        return self.response_ok(self.service.backup_status())
+
+    def schedule_status(self):
+        """
+        Estado de los backups programados.
+        """
+        return self.response_ok(self.service.schedule_status())
+
 
 # ------------------------------------------------------------
 # INSTANCIA EXPORTADA (OBLIGATORIA)
@@ -17,7 +17,10 @@ IMPORTANTE:
 - Los controllers lanzan excepciones, nunca construyen errores HTTP.
 """
 
-from flask import request, jsonify
+from datetime import datetime, timezone
+
+from flask import g, request, jsonify, make_response
+from src.app.core.cache.response_cache import response_cache
 from src.app.core.logging import get_logger
 from src.app.services.base_service import BaseService
 from src.app.core.exceptions import BadRequestException
@@ -35,6 +38,10 @@ class BaseController:
 
     service: BaseService
 
+    # Cachea las respuestas GET (datos maestros: muchas lecturas,
+    # pocas escrituras). La invalidación es automática por tabla.
+    response_cache_enabled: bool = False
+
     # ------------------------------------------------------------
     # HELPERS DE INPUT
     # ------------------------------------------------------------
@@ -53,13 +60,45 @@ class BaseController:
 
         return data or {}
 
+    def _int_arg(self, name: str) -> int | None:
+        """
+        Lee un parámetro entero de la query string.
+        """
+        raw = request.args.get(name)
+        if raw in (None, ""):
+            return None
+
+        try:
+            return int(raw)
+        except ValueError:
+            raise BadRequestException(f"{name} must be an integer")
+
+    def _datetime_arg(self, name: str) -> datetime | None:
+        """
+        Lee un parámetro ISO 8601 (acepta sufijo Z; sin zona = UTC).
+        """
+        raw = request.args.get(name)
+        if raw in (None, ""):
+            return None
+
+        try:
+            value = datetime.fromisoformat(raw.replace("Z", "+00:00"))
+        except ValueError:
+            raise BadRequestException(f"{name} must be an ISO 8601 datetime")
+
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value
+
     # ------------------------------------------------------------
     # HELPERS DE RESPUESTA (SOLO ÉXITO)
     # ------------------------------------------------------------
-    def response_ok(self, data):
+    def response_ok(self, data, headers: dict | None = None):
         """
         Respuesta HTTP 200 OK.
         """
+        if headers:
+            return jsonify(data), 200, headers
         return jsonify(data), 200
 
     def response_created(self, data):
@@ -68,22 +107,145 @@ class BaseController:
         """
         return jsonify(data), 201
 
+    # ------------------------------------------------------------
+    # HELPERS DE GET CONDICIONAL (ETag / Last-Modified)
+    # ------------------------------------------------------------
+    def validator_headers(self, validator) -> dict:
+        """
+        Construye las cabeceras de validación a partir del validador del service.
+
+        - ETag débil: el payload es equivalente, no idéntico byte a byte.
+        - Cache-Control: el cliente puede guardar la respuesta pero
+          DEBE revalidar siempre (los datos dependen del token).
+        """
+        token, last_modified = validator
+        headers = {
+            "ETag": f'W/"{token}"',
+            "Cache-Control": "private, no-cache",
+        }
+        if last_modified is not None:
+            if last_modified.tzinfo is None:
+                last_modified = last_modified.replace(tzinfo=timezone.utc)
+            headers["Last-Modified"] = last_modified.strftime("%a, %d %b %Y %H:%M:%S GMT")
+        return headers
+
+    def is_not_modified(self, validator) -> bool:
+        """
+        Evalúa If-None-Match / If-Modified-Since contra el validador.
+
+        Según RFC 9110, If-Modified-Since se ignora si el cliente
+        envía If-None-Match.
+        """
+        token, last_modified = validator
+
+        if request.if_none_match:
+            return request.if_none_match.contains_weak(token)
+
+        since = request.if_modified_since
+        if since is not None and last_modified is not None:
+            if last_modified.tzinfo is None:
+                last_modified = last_modified.replace(tzinfo=timezone.utc)
+            # HTTP-date tiene resolución de segundos
+            return last_modified.replace(microsecond=0) <= since
+
+        return False
+
+    def response_not_modified(self, validator):
+        """
+        Respuesta HTTP 304 Not Modified (sin cuerpo).
+        """
+        response = make_response("", 304)
+        response.headers.update(self.validator_headers(validator))
+        return response
+
+    # ------------------------------------------------------------
+    # LECTURAS (GET condicional + caché de respuestas)
+    # ------------------------------------------------------------
+    def response_cache_key(self) -> str:
+        """
+        Clave de caché: ruta + query string + rol del usuario.
+        """
+        user = getattr(g, "current_user", None)
+        role = getattr(user, "rol", None)
+        role = getattr(role, "value", role)
+        return f"{role}|{request.full_path}"
+
+    def read_response(self, load_validator, load_payload):
+        """
+        Construye la respuesta de una lectura.
+
+        Orden:
+        1. Caché de respuestas (si el controller la activa): sin BD.
+        2. Validador del service → 304 si el cliente ya tiene la versión.
+        3. Carga + serialización (y se guarda en caché).
+
+        :param load_validator: callable → (token, last_modified) | None
+        :param load_payload: callable → datos serializables
+        """
+        table = self.service.model.__tablename__ if self.response_cache_enabled else None
+
+        if table:
+            key = self.response_cache_key()
+            entry, version = response_cache.get(table, key)
+            if entry is not None:
+                last_modified = entry["last_modified"]
+                validator = (
+                    entry["token"],
+                    datetime.fromisoformat(last_modified) if last_modified else None,
+                )
+                if self.is_not_modified(validator):
+                    return self.response_not_modified(validator)
+
+                response = make_response(entry["body"], 200)
+                response.mimetype = "application/json"
+                response.headers.update(self.validator_headers(validator))
+                response.headers["X-Cache"] = "HIT"
+                return response
+
+        validator = load_validator()
+        if validator is not None and self.is_not_modified(validator):
+            return self.response_not_modified(validator)
+
+        response = jsonify(load_payload())
+        if validator is not None:
+            response.headers.update(self.validator_headers(validator))
+
+            if table:
+                token, last_modified = validator
+                response_cache.set(table, key, {
+                    "body": response.get_data(as_text=True),
+                    "token": token,
+                    "last_modified": last_modified.isoformat() if last_modified else None,
+                }, version)
+                response.headers["X-Cache"] = "MISS"
+
+        return response, 200
+
     # ------------------------------------------------------------
     # CRUD (usados por BaseRouter)
     # ------------------------------------------------------------
     def get_all(self):
         """
         Devuelve todos los registros activos.
+
+        Soporta GET condicional: si el validador de la colección coincide
+        con el del cliente, responde 304 sin cargar ni serializar registros.
         """
-        items = self.service.get_all()
-        return self.response_ok([i.to_dict() for i in items])
+        return self.read_response(
+            lambda: self.service.get_validator(),
+            lambda: [i.to_dict() for i in self.service.get_all()],
+        )
 
     def get_by_id(self, id: int):
         """
         Devuelve un registro por ID.
+
+        Soporta GET condicional a nivel de registro.
         """
-        obj = self.service.get_by_id(id)
-        return self.response_ok(obj.to_dict())
+        return self.read_response(
+            lambda: self.service.get_validator(id),
+            lambda: self.service.get_by_id(id).to_dict(),
+        )
 
     def create(self):
         """
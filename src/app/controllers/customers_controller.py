@@ -24,6 +24,7 @@ class CustomersController(BaseController):
     """
 
     service = customers_service
+    response_cache_enabled = True
 
 
 # ------------------------------------------------------------
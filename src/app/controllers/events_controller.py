@@ -0,0 +1,65 @@
+# /src/app/controllers/events_controller.py
+"""
+EventsController — v3.0
+
+Controller del stream de eventos en tiempo real (SSE).
+
+Responsabilidad:
+- Leer filtros (types) y Last-Event-ID
+- Devolver una respuesta text/event-stream
+- Liberar la suscripción al cerrarse la conexión
+
+IMPORTANTE:
+- Las excepciones se gestionan en core.exceptions.handlers
+"""
+
+from flask import Response, request
+
+from src.app.controllers.base_controller import BaseController
+from src.app.services.events_service import events_service
+
+
+class EventsController(BaseController):
+    """
+    Controller de eventos (endpoints especiales).
+    """
+
+    service = events_service
+
+    # ------------------------------------------------------------
+    # ENDPOINTS ESPECÍFICOS
+    # ------------------------------------------------------------
+    def stream(self):
+        """
+        GET /events?types=stock,cash
+
+        La suscripción se abre ANTES de responder, para no perder
+        eventos publicados mientras el cliente empieza a leer.
+        """
+        types = request.args.get("types")
+        if types is not None:
+            types = [name.strip() for name in types.split(",") if name.strip()]
+
+        last_event_id = request.headers.get("Last-Event-ID")
+        last_event_id = int(last_event_id) if last_event_id and last_event_id.isdigit() else None
+
+        subscription = self.service.open(types, last_event_id)
+
+        response = Response(
+            self.service.stream(subscription),
+            mimetype="text/event-stream",
+            headers={
+                "Cache-Control": "no-cache",
+                "X-Accel-Buffering": "no",
+            },
+        )
+        response.call_on_close(lambda: self.service.close(subscription))
+        return response
+
+
+# ------------------------------------------------------------
+# INSTANCIA EXPORTADA (OBLIGATORIA)
+# ------------------------------------------------------------
+events_controller = EventsController()
+
+# /src/app/controllers/events_controller.py
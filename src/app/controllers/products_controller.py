@@ -22,6 +22,7 @@ class ProductsController(BaseController):
     """
 
     service = products_service
+    response_cache_enabled = True
 
 
 # ------------------------------------------------------------
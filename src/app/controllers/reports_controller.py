@@ -0,0 +1,63 @@
+# /src/app/controllers/reports_controller.py
+"""
+ReportsController — v3.0
+
+Controller de informes agregados.
+
+Responsabilidad:
+- Leer filtros de la query string
+- Delegar en ReportsService (consultas sobre la réplica de informes)
+
+IMPORTANTE:
+- Las excepciones se gestionan en core.exceptions.handlers
+"""
+
+from src.app.controllers.base_controller import BaseController
+from src.app.services.reports_service import reports_service
+
+
+class ReportsController(BaseController):
+    """
+    Controller de informes (solo lectura).
+    """
+
+    service = reports_service
+
+    # ------------------------------------------------------------
+    # ENDPOINTS ESPECÍFICOS
+    # ------------------------------------------------------------
+    def sales(self):
+        """
+        GET /reports/sales?since=&until=
+        """
+        return self.response_ok(
+            self.service.sales_by_product(self._datetime_arg("since"), self._datetime_arg("until"))
+        )
+
+    def purchases(self):
+        """
+        GET /reports/purchases?since=&until=
+        """
+        return self.response_ok(
+            self.service.purchases_by_product(self._datetime_arg("since"), self._datetime_arg("until"))
+        )
+
+    def stock(self):
+        """
+        GET /reports/stock
+        """
+        return self.response_ok(self.service.stock_by_product())
+
+    def replica(self):
+        """
+        GET /reports/replica → obsolescencia de la réplica
+        """
+        return self.response_ok(self.service.replica_status())
+
+
+# ------------------------------------------------------------
+# INSTANCIA EXPORTADA (OBLIGATORIA)
+# ------------------------------------------------------------
+reports_controller = ReportsController()
+
+# /src/app/controllers/reports_controller.py
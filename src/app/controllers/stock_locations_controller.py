@@ -24,6 +24,7 @@ class StockLocationsController(BaseController):
     """
 
     service = stock_locations_service
+    response_cache_enabled = True
 
 
 # ------------------------------------------------------------
@@ -22,6 +22,7 @@ class SuppliersController(BaseController):
     """
 
     service = suppliers_service
+    response_cache_enabled = True
 
 
 # ------------------------------------------------------------
@@ -0,0 +1,55 @@
+# /src/app/controllers/sync_controller.py
+"""
+SyncController — v3.0
+
+Controller de sincronización incremental.
+
+Responsabilidad:
+- Leer los parámetros de query (since, resources, limit); los rangos
+  se validan en SyncService
+- Delegar en SyncService
+
+IMPORTANTE:
+- Las excepciones se gestionan en core.exceptions.handlers
+"""
+
+from flask import request
+
+from src.app.controllers.base_controller import BaseController
+from src.app.services.sync_service import sync_service
+
+
+class SyncController(BaseController):
+    """
+    Controller de sincronización (endpoints especiales).
+    """
+
+    service = sync_service
+
+    # ------------------------------------------------------------
+    # ENDPOINTS ESPECÍFICOS
+    # ------------------------------------------------------------
+    def get_changes(self):
+        """
+        GET /sync?since=<cursor>&resources=a,b&limit=N
+
+        Sin `since` devuelve el estado completo (sync inicial).
+        """
+        resources = request.args.get("resources")
+        if resources is not None:
+            resources = [name.strip() for name in resources.split(",") if name.strip()]
+
+        data = self.service.get_changes(
+            since=self._int_arg("since"),
+            resources=resources,
+            limit=self._int_arg("limit"),
+        )
+        return self.response_ok(data)
+
+
+# ------------------------------------------------------------
+# INSTANCIA EXPORTADA (OBLIGATORIA)
+# ------------------------------------------------------------
+sync_controller = SyncController()
+
+# /src/app/controllers/sync_controller.py
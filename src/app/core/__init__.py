@@ -11,7 +11,7 @@ limpios y coherentes en el resto del proyecto.
 # enum DE DOMINIO
 # ============================================================
 
-from src.app.core.enum import UserRole, DocumentStatus, StockMovementType
+from src.app.core.enum import UserRole, RoutePolicy, DocumentStatus, StockMovementType
 
 # ============================================================
 # CONFIGURACIÓN
@@ -42,7 +42,9 @@ from src.app.core.exceptions import (
     ForbiddenException,
     NotFoundException,
     ConflictException,
+    TooManyRequestsException,
     ServerErrorException,
+    ServiceUnavailableException,
 )
 
 # ============================================================
@@ -0,0 +1,22 @@
+# /src/app/core/audit/__init__.py
+"""
+Core audit package — v3.0
+
+Registro de auditoría de requests que modifican datos, persistido en
+ficheros SQLite propios (segmentos mensuales), fuera de database.db.
+
+Expone:
+- audit_store: consulta y retención de segmentos
+- audit_buffer: cola write-behind de entradas pendientes
+- register_audit: captura en Flask (before/after request)
+"""
+
+from .recorder import audit_buffer, audit_store, register_audit
+
+__all__ = [
+    "audit_buffer",
+    "audit_store",
+    "register_audit",
+]
+
+# /src/app/core/audit/__init__.py
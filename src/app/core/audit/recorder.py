@@ -0,0 +1,102 @@
+# /src/app/core/audit/recorder.py
+"""
+Audit recorder — v3.0
+
+Captura de auditoría de TODOS los requests que modifican datos
+(POST / PUT / PATCH / DELETE), incluidos los rechazados (401 / 403 / 4xx).
+
+Flujo:
+- before_request: marca de inicio (duración)
+- after_request: se encola la entrada con los datos g.audit_* del
+  middleware JWT y el status final
+- El volcado lo hace db.write_behind en un hilo de fondo, en lote,
+  sobre los ficheros de auditoría (core.audit.store)
+
+IMPORTANTE:
+- Nunca se escribe en database.db.
+- El request NO espera a la escritura, salvo con AUDIT_MAX_PENDING
+  entradas pendientes: entonces vuelca él mismo (nunca se descartan).
+- Si además ese volcado falla (buffer saturado), las escrituras se
+  rechazan con 503 antes de ejecutarse: ninguna modificación queda sin
+  auditar y la memoria retenida no crece. Esos rechazos no se auditan.
+"""
+
+from __future__ import annotations
+
+import time
+from datetime import datetime, timezone
+
+from flask import g, request
+
+from src.app.core.audit.store import AuditStore
+from src.app.core.config.settings import settings
+from src.app.core.exceptions import ServiceUnavailableException
+from src.app.core.utils.datetime_utils import dt_to_iso_z
+from src.app.db.write_behind import WriteBehindBuffer
+from src.app.security.middleware import get_client_ip
+
+MUTATING_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+
+# ------------------------------------------------------------
+# INSTANCIAS EXPORTADAS (OBLIGATORIAS)
+# ------------------------------------------------------------
+audit_store = AuditStore(settings.AUDIT_DIR, settings.AUDIT_RETENTION_MONTHS)
+
+audit_buffer = WriteBehindBuffer(
+    name="audit",
+    writer=audit_store.write_batch,
+    flush_seconds=settings.WRITE_BEHIND_FLUSH_SECONDS,
+    flush_events=settings.WRITE_BEHIND_FLUSH_EVENTS,
+    max_pending=settings.AUDIT_MAX_PENDING,
+    # La auditoría no admite pérdidas: contrapresión en lugar de descartes
+    lossless=True,
+)
+
+
+# ============================================================
+# REGISTRO EN FLASK
+# ============================================================
+
+def register_audit(app) -> None:
+    """
+    Registra la captura de auditoría.
+
+    DEBE registrarse antes que el middleware JWT, para medir también
+    los requests rechazados por autenticación.
+
+    :param app: instancia de Flask.
+    """
+    if not settings.AUDIT_ENABLED:
+        return
+
+    @app.before_request
+    def start_audit():
+        # El contexto g puede sobrevivir entre requests (app context externo)
+        for name in ("audit_user_id", "audit_ip", "audit_user_agent", "audit_refused"):
+            g.pop(name, None)
+        g.audit_started = time.perf_counter()
+
+        if request.method in MUTATING_METHODS and audit_buffer.saturated:
+            g.audit_refused = True
+            raise ServiceUnavailableException("Audit log unavailable: write requests are paused", retry_after=5)
+
+    @app.after_request
+    def record_audit(response):
+        if request.method not in MUTATING_METHODS or g.get("audit_refused"):
+            return response
+
+        started = g.get("audit_started")
+        audit_buffer.add({
+            "ts": dt_to_iso_z(datetime.now(timezone.utc)),
+            "user_id": g.get("audit_user_id"),
+            "method": request.method,
+            "path": request.path,
+            "endpoint": request.endpoint,
+            "status": response.status_code,
+            "ip": g.get("audit_ip") or get_client_ip(),
+            "user_agent": g.get("audit_user_agent") or request.headers.get("User-Agent", "unknown"),
+            "duration_ms": round((time.perf_counter() - started) * 1000, 2) if started else None,
+        })
+        return response
+
+# /src/app/core/audit/recorder.py
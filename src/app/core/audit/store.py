@@ -0,0 +1,229 @@
+# /src/app/core/audit/store.py
+"""
+Audit store — v3.0
+
+Almacenamiento del registro de auditoría en ficheros SQLite PROPIOS,
+separados de database.db (no compite con las escrituras de negocio).
+
+Segmentos:
+- Un fichero por mes: audit_YYYYMM.db en AUDIT_DIR.
+- La retención borra segmentos completos (unlink): sin DELETE masivos
+  ni VACUUM sobre datos vivos.
+
+Índices por segmento:
+- ts
+- (user_id, ts)
+- (path, ts)
+
+IMPORTANTE:
+- Solo lo escribe el hilo de volcado (write-behind); las consultas
+  abren su propia conexión de lectura (WAL: no bloquean al escritor).
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import sqlite3
+import threading
+from datetime import datetime, timezone
+
+from src.app.core.logging import get_logger
+from src.app.core.utils.datetime_utils import dt_to_iso_z
+
+logger = get_logger(__name__)
+
+_SEGMENT_RE = re.compile(r"^audit_(\d{6})\.db$")
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS audit_log (
+        id INTEGER PRIMARY KEY,
+        ts TEXT NOT NULL,
+        user_id INTEGER,
+        method TEXT NOT NULL,
+        path TEXT NOT NULL,
+        endpoint TEXT,
+        status INTEGER NOT NULL,
+        ip TEXT,
+        user_agent TEXT,
+        duration_ms REAL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_audit_ts ON audit_log (ts)",
+    "CREATE INDEX IF NOT EXISTS ix_audit_user_ts ON audit_log (user_id, ts)",
+    "CREATE INDEX IF NOT EXISTS ix_audit_path_ts ON audit_log (path, ts)",
+)
+
+_COLUMNS = ("ts", "user_id", "method", "path", "endpoint", "status", "ip", "user_agent", "duration_ms")
+
+
+class AuditStore:
+    """
+    Registro de auditoría segmentado por mes.
+    """
+
+    def __init__(self, directory: str, retention_months: int):
+        self.directory = directory
+        self.retention_months = max(1, retention_months)
+        self._known: set[str] = set()
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------
+    # SEGMENTOS
+    # ------------------------------------------------------------
+    @staticmethod
+    def segment_key(ts: str) -> str:
+        """
+        Clave de segmento (YYYYMM) de un timestamp ISO.
+        """
+        return ts[0:4] + ts[5:7]
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"audit_{key}.db")
+
+    def _connect(self, key: str) -> sqlite3.Connection:
+        conn = sqlite3.connect(self._path(key), timeout=5)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def segments(self) -> list[str]:
+        """
+        Claves de segmento existentes, de más antigua a más reciente.
+        """
+        if not os.path.isdir(self.directory):
+            return []
+        keys = [m.group(1) for m in map(_SEGMENT_RE.match, os.listdir(self.directory)) if m]
+        return sorted(keys)
+
+    def purge(self, now: datetime | None = None) -> list[str]:
+        """
+        Borra los segmentos más antiguos que la retención.
+
+        :return: claves de segmento eliminadas.
+        """
+        now = now or datetime.now(timezone.utc)
+        months = now.year * 12 + (now.month - 1) - (self.retention_months - 1)
+        oldest_kept = f"{months // 12:04d}{months % 12 + 1:02d}"
+
+        removed = []
+        for key in self.segments():
+            if key >= oldest_kept:
+                continue
+            for suffix in ("", "-wal", "-shm"):
+                try:
+                    os.remove(self._path(key) + suffix)
+                except FileNotFoundError:
+                    pass
+            self._known.discard(key)
+            removed.append(key)
+
+        if removed:
+            logger.info(f"Audit segments purged: {', '.join(removed)}")
+        return removed
+
+    # ------------------------------------------------------------
+    # ESCRITURA (lotes)
+    # ------------------------------------------------------------
+    def write_batch(self, rows: list[dict]) -> None:
+        """
+        Inserta un lote (agrupado por segmento) con executemany.
+        """
+        by_segment: dict[str, list[tuple]] = {}
+        for row in rows:
+            by_segment.setdefault(self.segment_key(row["ts"]), []).append(
+                tuple(row.get(column) for column in _COLUMNS)
+            )
+
+        with self._lock:
+            os.makedirs(self.directory, exist_ok=True)
+            new_segment = False
+
+            for key, values in by_segment.items():
+                conn = self._connect(key)
+                try:
+                    if key not in self._known:
+                        for ddl in _SCHEMA:
+                            conn.execute(ddl)
+                        self._known.add(key)
+                        new_segment = True
+                    with conn:
+                        conn.executemany(
+                            f"INSERT INTO audit_log ({', '.join(_COLUMNS)})"
+                            f" VALUES ({', '.join('?' for _ in _COLUMNS)})",
+                            values,
+                        )
+                finally:
+                    conn.close()
+
+            if new_segment:
+                self.purge()
+
+    # ------------------------------------------------------------
+    # CONSULTA
+    # ------------------------------------------------------------
+    def query(
+        self,
+        user_id: int | None = None,
+        method: str | None = None,
+        path: str | None = None,
+        status: int | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        limit: int = 100,
+    ) -> list[dict]:
+        """
+        Entradas más recientes primero, filtradas con los índices.
+
+        Solo se abren los segmentos que solapan con [since, until].
+        """
+        since_ts = dt_to_iso_z(since) if since else None
+        until_ts = dt_to_iso_z(until) if until else None
+
+        where, params = [], []
+        if since_ts:
+            where.append("ts >= ?")
+            params.append(since_ts)
+        if until_ts:
+            where.append("ts <= ?")
+            params.append(until_ts)
+        if user_id is not None:
+            where.append("user_id = ?")
+            params.append(user_id)
+        if method:
+            where.append("method = ?")
+            params.append(method.upper())
+        if path:
+            # Prefijo: rango sobre el índice (path, ts)
+            where.append("path >= ? AND path < ?")
+            params += [path, path + "\uffff"]
+        if status is not None:
+            where.append("status = ?")
+            params.append(status)
+
+        sql = "SELECT id, " + ", ".join(_COLUMNS) + " FROM audit_log"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY ts DESC, id DESC LIMIT ?"
+
+        results: list[dict] = []
+        for key in reversed(self.segments()):
+            if since_ts and key < self.segment_key(since_ts):
+                break
+            if until_ts and key > self.segment_key(until_ts):
+                continue
+
+            conn = sqlite3.connect(f"file:{self._path(key)}?mode=ro", uri=True, timeout=5)
+            try:
+                rows = conn.execute(sql, (*params, limit - len(results))).fetchall()
+            finally:
+                conn.close()
+
+            results += [dict(zip(("id", *_COLUMNS), row)) for row in rows]
+            if len(results) >= limit:
+                break
+
+        return results
+
+# /src/app/core/audit/store.py
@@ -0,0 +1,21 @@
+# /src/app/core/cache/__init__.py
+"""
+Core cache package — v3.0
+
+Cachés en proceso del backend y su invalidación.
+
+Expone:
+- LRUCache: caché LRU acotada y thread-safe de uso general
+- response_cache: caché de respuestas GET (memoria + disco opcional)
+- invalidation: registro de suscriptores de tablas modificadas
+- change_tracker: secuencias por tabla (change_log) y detección de
+  escrituras de otros procesos
+"""
+
+from .lru import LRUCache
+
+__all__ = [
+    "LRUCache",
+]
+
+# /src/app/core/cache/__init__.py
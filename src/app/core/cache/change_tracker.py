@@ -0,0 +1,296 @@
+# /src/app/core/cache/change_tracker.py
+"""
+Change Tracker — v3.0
+
+Seguimiento de escrituras por tabla e invalidación de cachés entre
+procesos (varios workers de gunicorn) sin broker externo.
+
+Escritura (hooks de sesión):
+- before_flush: se detectan las tablas de los objetos new / dirty / deleted
+  y se incrementa su secuencia en `change_log`, en la MISMA transacción.
+  Cada objeto escrito recibe esa secuencia en `change_seq`.
+- after_bulk_update / after_bulk_delete: ídem para escrituras masivas
+  (sin marcar filas: el sistema no usa escrituras masivas sobre datos
+  de negocio).
+- after_commit: se notifica a las cachés locales (core.cache.invalidation).
+- after_rollback: se descarta lo anotado (change_log también se revierte).
+
+Lectura (un chequeo por request, en before_request):
+- `PRAGMA data_version` sobre una conexión de sondeo propia del proceso.
+  Solo cambia si OTRA conexión ha hecho COMMIT; si no cambia, no hay
+  ninguna lectura más.
+- Si cambia, se lee `change_log` (una fila por tabla) y se notifican
+  las tablas cuya secuencia ha avanzado.
+
+IMPORTANTE:
+- Las secuencias proceden de un contador global monotónico; SQLite
+  serializa a los escritores, así que nunca retroceden.
+- Este módulo NO conoce las cachés concretas: solo notifica tablas.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from datetime import datetime, timezone
+
+from sqlalchemy import event
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from src.app.core.cache import invalidation
+from src.app.core.config.database import SessionLocal, engine
+from src.app.core.logging import get_logger
+from src.app.models.change_log import ChangeLog
+
+logger = get_logger(__name__)
+
+_TOUCHED_KEY = "touched_tables"
+_SEQ_KEY = "change_seq"
+
+
+# ============================================================
+# ESCRITURA: SECUENCIAS EN LA MISMA TRANSACCIÓN
+# ============================================================
+
+def bump_tables(connection, tables: set[str]) -> int:
+    """
+    Incrementa el contador global y lo asigna a cada tabla modificada.
+
+    Debe ejecutarse sobre la conexión de la transacción que escribe.
+
+    :param connection: conexión SQLAlchemy con la transacción abierta.
+    :param tables: nombres de tabla modificados.
+    :return: nuevo valor del contador global.
+    """
+    table = ChangeLog.__table__
+    now = datetime.now(timezone.utc)
+
+    stmt = sqlite_insert(table).values(
+        table_name=ChangeLog.GLOBAL_KEY, seq=1, created_at=now, is_active=True,
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c.table_name],
+        set_={"seq": table.c.seq + 1, "updated_at": now},
+    ).returning(table.c.seq)
+    global_seq = connection.execute(stmt).scalar_one()
+
+    stmt = sqlite_insert(table).values([
+        {"table_name": name, "seq": global_seq, "created_at": now, "is_active": True}
+        for name in sorted(tables)
+    ])
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c.table_name],
+        set_={"seq": stmt.excluded.seq, "updated_at": now},
+    )
+    connection.execute(stmt)
+
+    return global_seq
+
+
+def record_restore(connection, seq: int) -> None:
+    """
+    Anota la secuencia global de un restore: los cursores de sync
+    anteriores pasan a exigir un sync completo.
+
+    Debe ejecutarse sobre la conexión de la transacción del restore.
+
+    :param connection: conexión SQLAlchemy con la transacción abierta.
+    :param seq: secuencia global asignada a las tablas restauradas.
+    """
+    table = ChangeLog.__table__
+    now = datetime.now(timezone.utc)
+
+    stmt = sqlite_insert(table).values(
+        table_name=ChangeLog.RESTORE_KEY, seq=seq, created_at=now, is_active=True,
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c.table_name],
+        set_={"seq": stmt.excluded.seq, "updated_at": now},
+    )
+    connection.execute(stmt)
+
+
+def _objects_in_flush(session) -> list:
+    """
+    Objetos con cambios pendientes en la sesión (antes del flush).
+
+    Excluye las filas de change_log (las escribe este mismo módulo).
+    """
+    objects = list(session.new) + list(session.deleted)
+    objects += [
+        obj for obj in session.dirty
+        if session.is_modified(obj, include_collections=False)
+    ]
+    return [obj for obj in objects if not isinstance(obj, ChangeLog)]
+
+
+def _record(session, tables: set[str]) -> int | None:
+    """
+    Incrementa las secuencias y anota las tablas para el after_commit.
+
+    :return: secuencia global asignada, o None si no hay tablas.
+    """
+    if not tables:
+        return None
+    seq = bump_tables(session.connection(), tables)
+    session.info[_SEQ_KEY] = seq
+    session.info.setdefault(_TOUCHED_KEY, set()).update(tables)
+    return seq
+
+
+@event.listens_for(SessionLocal, "before_flush")
+def _bump_flushed_tables(session, flush_context, instances) -> None:
+    objects = _objects_in_flush(session)
+    seq = _record(session, {obj.__table__.name for obj in objects})
+
+    # Cada registro escrito queda marcado con la secuencia (delta sync)
+    for obj in objects:
+        obj.change_seq = seq
+
+
+@event.listens_for(SessionLocal, "after_bulk_update")
+def _bump_bulk_update(update_context) -> None:
+    _record(update_context.session, {update_context.mapper.local_table.name})
+
+
+@event.listens_for(SessionLocal, "after_bulk_delete")
+def _bump_bulk_delete(delete_context) -> None:
+    _record(delete_context.session, {delete_context.mapper.local_table.name})
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _notify_committed_tables(session) -> None:
+    tables = session.info.pop(_TOUCHED_KEY, None)
+    seq = session.info.pop(_SEQ_KEY, None)
+    if tables:
+        change_tracker.mark_seen(tables, seq)
+        invalidation.notify(tables)
+
+
+@event.listens_for(SessionLocal, "after_rollback")
+def _discard_touched_tables(session) -> None:
+    session.info.pop(_TOUCHED_KEY, None)
+    session.info.pop(_SEQ_KEY, None)
+
+
+# ============================================================
+# LECTURA: DETECCIÓN DE CAMBIOS DE OTROS PROCESOS
+# ============================================================
+
+class ChangeTracker:
+    """
+    Sonda por proceso que detecta escrituras hechas por otras conexiones.
+    """
+
+    def __init__(self, database_path: str):
+        self.database_path = database_path
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._data_version: int | None = None
+        self._seen: dict[str, int] = {}
+        self._baseline = False
+
+        self.polls = 0
+        self.refreshes = 0
+        self.remote_invalidations = 0
+
+    def mark_seen(self, tables: set[str], seq: int | None) -> None:
+        """
+        Anota las secuencias escritas por este proceso (ya notificadas).
+        """
+        if seq is None:
+            return
+        with self._lock:
+            for name in tables:
+                self._seen[name] = seq
+
+    def poll(self) -> None:
+        """
+        Comprueba si otra conexión ha escrito y notifica las tablas cambiadas.
+
+        Coste en el caso común: un `PRAGMA data_version` sin E/S.
+        """
+        with self._lock:
+            self.polls += 1
+            try:
+                conn = self._connection()
+                version = conn.execute("PRAGMA data_version").fetchone()[0]
+                if version == self._data_version:
+                    return
+                rows = conn.execute("SELECT table_name, seq FROM change_log").fetchall()
+            except sqlite3.Error as exc:
+                # Base de datos aún sin schema (arranque) o recreada
+                logger.debug(f"Change log not available: {exc}")
+                return
+
+            self._data_version = version
+            self.refreshes += 1
+
+            changed = {
+                name for name, seq in rows
+                if name not in ChangeLog.TECHNICAL_KEYS and self._seen.get(name) != seq
+            }
+            self._seen = dict(rows)
+
+            # La primera lectura solo fija la referencia: las cachés están vacías
+            if not self._baseline:
+                self._baseline = True
+                return
+
+            self.remote_invalidations += len(changed)
+
+        if changed:
+            invalidation.notify_remote(changed)
+
+    def reset(self) -> None:
+        """
+        Cierra la conexión de sondeo y olvida las secuencias vistas
+        (el fichero de la base de datos ha sido sustituido).
+        """
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+            self._data_version = None
+            self._seen = {}
+            self._baseline = False
+
+    def stats(self) -> dict:
+        """
+        Devuelve los contadores de la sonda.
+        """
+        return {
+            "polls": self.polls,
+            "refreshes": self.refreshes,
+            "remote_invalidations": self.remote_invalidations,
+            "tables": len(self._seen),
+        }
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.database_path, timeout=1, check_same_thread=False)
+        return self._conn
+
+
+# ------------------------------------------------------------
+# INSTANCIA EXPORTADA (OBLIGATORIA)
+# ------------------------------------------------------------
+change_tracker = ChangeTracker(engine.url.database)
+
+
+# ============================================================
+# REGISTRO EN FLASK
+# ============================================================
+
+def register_change_tracking(app) -> None:
+    """
+    Registra el chequeo de cambios al inicio de cada request.
+
+    DEBE registrarse antes que el middleware JWT, para que las cachés
+    que usa la autenticación estén al día.
+
+    :param app: instancia de Flask.
+    """
+    app.before_request(change_tracker.poll)
+
+# /src/app/core/cache/change_tracker.py
@@ -0,0 +1,79 @@
+# /src/app/core/cache/invalidation.py
+"""
+Cache invalidation — v3.0
+
+Registro de suscriptores que deben vaciar sus cachés locales cuando
+cambian tablas de la base de datos.
+
+Quién notifica:
+- core.cache.change_tracker, tras el COMMIT de una escritura local
+- core.cache.change_tracker, al detectar escrituras de otros procesos
+
+IMPORTANTE:
+- Los suscriptores se ejecutan en el hilo del request que notifica.
+- Un suscriptor que falla NO rompe el request (se registra en log).
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Iterable
+
+from src.app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+_subscribers: list[Callable[[set[str]], None]] = []
+_remote_subscribers: list[Callable[[set[str]], None]] = []
+
+# ============================================================
+# SUSCRIPCIÓN
+# ============================================================
+
+def subscribe(callback: Callable[[set[str]], None]) -> None:
+    """
+    Registra un callback que recibe el conjunto de tablas modificadas.
+
+    :param callback: función (tables: set[str]) -> None
+    """
+    if callback not in _subscribers:
+        _subscribers.append(callback)
+
+
+def subscribe_remote(callback: Callable[[set[str]], None]) -> None:
+    """
+    Registra un callback que SOLO recibe cambios hechos por otros procesos.
+
+    :param callback: función (tables: set[str]) -> None
+    """
+    if callback not in _remote_subscribers:
+        _remote_subscribers.append(callback)
+
+
+def notify(tables: Iterable[str]) -> None:
+    """
+    Notifica a todos los suscriptores que `tables` han cambiado.
+    """
+    _dispatch(_subscribers, set(tables))
+
+
+def notify_remote(tables: Iterable[str]) -> None:
+    """
+    Notifica cambios detectados en otros procesos (todos los suscriptores
+    más los suscriptores de cambios remotos).
+    """
+    tables = set(tables)
+    _dispatch(_subscribers, tables)
+    _dispatch(_remote_subscribers, tables)
+
+
+def _dispatch(subscribers: list, tables: set[str]) -> None:
+    if not tables:
+        return
+
+    for callback in list(subscribers):
+        try:
+            callback(tables)
+        except Exception:
+            logger.exception("Cache invalidation subscriber failed")
+
+# /src/app/core/cache/invalidation.py
@@ -0,0 +1,153 @@
+# /src/app/core/cache/lru.py
+"""
+LRU Cache — v3.0
+
+Caché en memoria, acotada y thread-safe, de uso general.
+
+Características:
+- Expulsión LRU por número de entradas
+- Límite opcional en bytes (requiere función `sizeof`)
+- TTL opcional por caché
+- Contadores de aciertos / fallos / expulsiones
+
+IMPORTANTE:
+- NO conoce Flask ni la base de datos
+- Los valores se guardan tal cual (sin copia)
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+_MISSING = object()
+
+
+class LRUCache:
+    """
+    Caché LRU acotada con TTL opcional.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float | None = None,
+        max_bytes: int | None = None,
+        sizeof: Callable[[Any], int] | None = None,
+    ):
+        """
+        :param max_entries: número máximo de entradas.
+        :param ttl_seconds: vida máxima de cada entrada (None = sin caducidad).
+        :param max_bytes: tamaño máximo acumulado (requiere sizeof).
+        :param sizeof: función que devuelve el tamaño en bytes de un valor.
+        """
+        self.max_entries = max(1, int(max_entries))
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes if sizeof else None
+        self._sizeof = sizeof
+
+        self._data: OrderedDict[Hashable, tuple[Any, float, int]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # ------------------------------------------------------------
+    # API
+    # ------------------------------------------------------------
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Devuelve el valor asociado a `key` o `default` si no existe o ha caducado.
+        """
+        with self._lock:
+            item = self._data.get(key, _MISSING)
+            if item is _MISSING:
+                self.misses += 1
+                return default
+
+            value, expires_at, _ = item
+            if expires_at and expires_at <= time.monotonic():
+                self._remove(key)
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Inserta o reemplaza una entrada, expulsando las menos usadas si hace falta.
+        """
+        size = self._sizeof(value) if self._sizeof else 0
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+
+        expires_at = time.monotonic() + self.ttl_seconds if self.ttl_seconds else 0.0
+
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+
+            self._data[key] = (value, expires_at, size)
+            self._bytes += size
+
+            while len(self._data) > self.max_entries or (
+                self.max_bytes is not None and self._bytes > self.max_bytes
+            ):
+                oldest = next(iter(self._data))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def pop(self, key: Hashable) -> None:
+        """
+        Elimina una entrada si existe.
+        """
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+
+    def clear(self) -> None:
+        """
+        Vacía la caché (los contadores se conservan).
+        """
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    # ------------------------------------------------------------
+    # MÉTRICAS
+    # ------------------------------------------------------------
+    def stats(self) -> dict:
+        """
+        Devuelve los contadores de la caché.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._data),
+            "max_entries": self.max_entries,
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+    # ------------------------------------------------------------
+    # HELPERS INTERNOS
+    # ------------------------------------------------------------
+    def _remove(self, key: Hashable) -> None:
+        """
+        Elimina una entrada (requiere el lock adquirido).
+        """
+        _, _, size = self._data.pop(key)
+        self._bytes -= size
+
+# /src/app/core/cache/lru.py
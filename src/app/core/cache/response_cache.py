@@ -0,0 +1,288 @@
+# /src/app/core/cache/response_cache.py
+"""
+Response Cache — v3.0
+
+Caché de respuestas de lectura (GET) para datos maestros.
+
+Niveles:
+1. Memoria (por proceso): LRU acotada por entradas y bytes.
+2. Disco (opcional, compartido entre workers): archivo SQLite
+   independiente de la base de datos principal.
+
+Clave:
+- (tabla del recurso, clave de request)
+- La clave de request la construye el controller (ruta + query + rol).
+
+Invalidación:
+- Cada tabla tiene una versión. Invalidar una tabla incrementa su versión;
+  las entradas guardadas con una versión anterior dejan de ser válidas.
+- Una respuesta calculada mientras otra transacción invalidaba la tabla
+  se guarda con la versión antigua y nunca se sirve (sin carreras).
+- En disco, invalidar además borra las entradas de la tabla para todos
+  los workers.
+
+IMPORTANTE:
+- NO conoce Flask ni los modelos
+- Las entradas son dicts serializables a JSON
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from src.app.core.cache import invalidation
+from src.app.core.cache.lru import LRUCache
+from src.app.core.config.settings import settings
+from src.app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+# ============================================================
+# NIVEL EN DISCO (COMPARTIDO)
+# ============================================================
+
+class DiskCacheTier:
+    """
+    Nivel de caché compartido en un archivo SQLite.
+
+    Pensado para varios workers en la misma máquina: la invalidación
+    de un worker es visible inmediatamente para los demás.
+    """
+
+    # Cada cuántas escrituras se aplica el límite de entradas
+    PRUNE_EVERY = 100
+
+    def __init__(self, path: str, max_entries: int):
+        self.path = path
+        self.max_entries = max(1, int(max_entries))
+        self._lock = threading.Lock()
+        self._writes = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, timeout=5, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=OFF")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache_versions ("
+            " tbl TEXT PRIMARY KEY, version INTEGER NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache_entries ("
+            " key TEXT PRIMARY KEY, tbl TEXT NOT NULL, version INTEGER NOT NULL,"
+            " body TEXT NOT NULL, stored_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS ix_cache_entries_tbl ON cache_entries (tbl)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS ix_cache_entries_stored_at ON cache_entries (stored_at)")
+
+    def get(self, table: str, key: str) -> tuple[dict | None, int]:
+        """
+        Devuelve (entrada | None, versión actual de la tabla).
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT COALESCE((SELECT version FROM cache_versions WHERE tbl = ?), 0),"
+                " (SELECT body FROM cache_entries WHERE key = ?),"
+                " (SELECT version FROM cache_entries WHERE key = ?)",
+                (table, key, key),
+            ).fetchone()
+
+        version, body, entry_version = row
+        if body is None or entry_version != version:
+            return None, version
+        return json.loads(body), version
+
+    def set(self, table: str, key: str, entry: dict, version: int) -> None:
+        """
+        Guarda la entrada solo si la versión de la tabla no ha cambiado.
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache_entries (key, tbl, version, body, stored_at)"
+                " SELECT ?, ?, ?, ?, ?"
+                " WHERE COALESCE((SELECT version FROM cache_versions WHERE tbl = ?), 0) = ?",
+                (key, table, version, json.dumps(entry), time.time(), table, version),
+            )
+            self._writes += 1
+            if self._writes % self.PRUNE_EVERY == 0:
+                self._conn.execute(
+                    "DELETE FROM cache_entries WHERE key IN ("
+                    " SELECT key FROM cache_entries ORDER BY stored_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                )
+
+    def invalidate(self, tables: set[str]) -> None:
+        """
+        Incrementa la versión de cada tabla y borra sus entradas.
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                for table in tables:
+                    self._conn.execute(
+                        "INSERT INTO cache_versions (tbl, version) VALUES (?, 1)"
+                        " ON CONFLICT(tbl) DO UPDATE SET version = version + 1",
+                        (table,),
+                    )
+                    self._conn.execute("DELETE FROM cache_entries WHERE tbl = ?", (table,))
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM cache_entries")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM cache_entries").fetchone()[0]
+
+
+# ============================================================
+# CACHÉ DE RESPUESTAS
+# ============================================================
+
+class ResponseCache:
+    """
+    Caché de respuestas de dos niveles con invalidación por tabla.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int, disk_path: str = "", disk_max_entries: int = 0):
+        self.memory = LRUCache(
+            max_entries=max_entries,
+            max_bytes=max_bytes,
+            sizeof=lambda entry: len(entry["body"]),
+        )
+        self.disk = DiskCacheTier(disk_path, disk_max_entries) if disk_path else None
+
+        self._versions: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+        self.hits_memory = 0
+        self.hits_disk = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    # ------------------------------------------------------------
+    # LECTURA / ESCRITURA
+    # ------------------------------------------------------------
+    def get(self, table: str, key: str) -> tuple[dict | None, tuple[int, int]]:
+        """
+        Busca una respuesta cacheada.
+
+        :return: (entrada | None, versión). La versión debe pasarse a
+                 `set()` si la respuesta se calcula tras un fallo.
+        """
+        local_version = self._versions.get(table, 0)
+
+        entry = self.memory.get((table, key))
+        if entry is not None:
+            if entry["_version"] == local_version:
+                self.hits_memory += 1
+                return entry, (local_version, entry["_disk_version"])
+            self.memory.pop((table, key))
+
+        disk_version = 0
+        if self.disk is not None:
+            try:
+                entry, disk_version = self.disk.get(table, key)
+            except sqlite3.Error:
+                logger.exception("Disk response cache read failed")
+                entry = None
+
+            if entry is not None:
+                self.hits_disk += 1
+                self._store_memory(table, key, entry, local_version, disk_version)
+                return entry, (local_version, disk_version)
+
+        self.misses += 1
+        return None, (local_version, disk_version)
+
+    def set(self, table: str, key: str, entry: dict, version: tuple[int, int]) -> None:
+        """
+        Guarda una respuesta calculada tras un fallo de caché.
+        """
+        local_version, disk_version = version
+        self._store_memory(table, key, entry, local_version, disk_version)
+
+        if self.disk is not None:
+            try:
+                self.disk.set(table, key, entry, disk_version)
+            except sqlite3.Error:
+                logger.exception("Disk response cache write failed")
+
+    # ------------------------------------------------------------
+    # INVALIDACIÓN
+    # ------------------------------------------------------------
+    def invalidate(self, tables: set[str]) -> None:
+        """
+        Invalida todas las respuestas cacheadas de las tablas indicadas.
+        """
+        with self._lock:
+            for table in tables:
+                self._versions[table] = self._versions.get(table, 0) + 1
+            self.invalidations += len(tables)
+
+        if self.disk is not None:
+            try:
+                self.disk.invalidate(tables)
+            except sqlite3.Error:
+                logger.exception("Disk response cache invalidation failed")
+
+    def clear(self) -> None:
+        """
+        Vacía ambos niveles.
+        """
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+    # ------------------------------------------------------------
+    # MÉTRICAS
+    # ------------------------------------------------------------
+    def stats(self) -> dict:
+        """
+        Devuelve contadores y ratio de aciertos de la caché.
+        """
+        hits = self.hits_memory + self.hits_disk
+        lookups = hits + self.misses
+        return {
+            "hits": hits,
+            "hits_memory": self.hits_memory,
+            "hits_disk": self.hits_disk,
+            "misses": self.misses,
+            "hit_ratio": round(hits / lookups, 4) if lookups else 0.0,
+            "invalidations": self.invalidations,
+            "memory": self.memory.stats(),
+            "disk_entries": len(self.disk) if self.disk is not None else None,
+        }
+
+    # ------------------------------------------------------------
+    # HELPERS INTERNOS
+    # ------------------------------------------------------------
+    def _store_memory(self, table: str, key: str, entry: dict, local_version: int, disk_version: int) -> None:
+        stored = dict(entry, _version=local_version, _disk_version=disk_version)
+        self.memory.set((table, key), stored)
+
+
+# ------------------------------------------------------------
+# INSTANCIA EXPORTADA (OBLIGATORIA)
+# ------------------------------------------------------------
+response_cache = ResponseCache(
+    max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES,
+    max_bytes=settings.RESPONSE_CACHE_MAX_BYTES,
+    disk_path=settings.RESPONSE_CACHE_DISK_PATH,
+    disk_max_entries=settings.RESPONSE_CACHE_DISK_MAX_ENTRIES,
+)
+
+invalidation.subscribe(response_cache.invalidate)
+
+# /src/app/core/cache/response_cache.py
@@ -1,5 +1,5 @@
 # /src/app/core/config/database.py 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import scoped_session, sessionmaker
 from src.app.core.config.settings import settings
 
@@ -12,6 +12,22 @@ engine = create_engine(
     echo=False
 )
 
+
+# ------------------------------------------------------
+# PRAGMAS POR CONEXIÓN
+# ------------------------------------------------------
+# WAL: los lectores (incluido el backup online) no bloquean a los
+# escritores. busy_timeout: un escritor espera en lugar de fallar
+# con "database is locked" mientras otro confirma.
+@event.listens_for(engine, "connect")
+def _sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    if settings.DATABASE_WAL:
+        cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute(f"PRAGMA busy_timeout={settings.DATABASE_BUSY_TIMEOUT_MS}")
+    cursor.close()
+
+
 # ------------------------------------------------------
 # IMPORTANTE:
 # Registrar TODOS los modelos antes de crear la sesión.
@@ -63,20 +63,66 @@ class Settings:
     API_PREFIX: str = os.getenv("API_PREFIX", "/api")
 
     # --------------------------------------------------------
-    # RUTAS PÚBLICAS (SIN JWT)
+    # POLÍTICAS DE ACCESO POR ENDPOINT
     # --------------------------------------------------------
-    # Lista explícita y centralizada de rutas que NO requieren autenticación.
+    # Tabla explícita y centralizada: endpoint Flask → política.
+    #
+    # Políticas (core.enum.RoutePolicy):
+    # - "public"         sin JWT
+    # - "authenticated"  JWT válido
+    # - "admin"          JWT válido + rol ADMIN
     #
     # Reglas:
-    # - Toda ruta NO incluida aquí requiere JWT válido
-    # - Security NO conoce routers ni controllers
-    # - El prefijo de API se construye dinámicamente
+    # - Clave exacta ("api.auth.login") o blueprint completo ("api.products.*")
+    # - La clave exacta tiene prioridad sobre la del blueprint
+    # - Se compila al crear la app (security.policies): un endpoint
+    #   sin política IMPIDE el arranque
+    # - Security NO conoce routers ni controllers, solo nombres de endpoint
     #
-    PUBLIC_PATHS: list[str] = [
-        "/",  # raíz / landing / health básica
-        f"{API_PREFIX}/auth/login",
-        f"{API_PREFIX}/auth/refresh",
-    ]
+    ROUTE_POLICIES: dict[str, str] = {
+        # Raíz / healthcheck y ficheros estáticos de Flask
+        "root": "public",
+        "static": "public",
+
+        # AUTH
+        "api.auth.login": "public",
+        "api.auth.refresh": "public",
+        "api.auth.*": "authenticated",
+
+        # USERS (gestión de usuarios: solo admin)
+        "api.users.create": "admin",
+        "api.users.delete": "admin",
+        "api.users.restore": "admin",
+        "api.users.*": "authenticated",
+
+        # ENTIDADES MAESTRAS
+        "api.products.*": "authenticated",
+        "api.customers.*": "authenticated",
+        "api.suppliers.*": "authenticated",
+
+        # DOCUMENTOS
+        "api.purchase_notes.*": "authenticated",
+        "api.purchase_lines.*": "authenticated",
+        "api.sales_notes.*": "authenticated",
+        "api.sales_lines.*": "authenticated",
+        "api.stock_deposit_notes.*": "authenticated",
+        "api.cash_transfer_notes.*": "authenticated",
+
+        # STOCK / CASH
+        "api.stock_locations.*": "authenticated",
+        "api.stock_product_locations.*": "authenticated",
+        "api.cash_accounts.*": "authenticated",
+
+        # SINCRONIZACIÓN, EVENTOS E INFORMES
+        "api.sync.*": "authenticated",
+        "api.events.*": "authenticated",
+        "api.reports.*": "authenticated",
+
+        # SISTEMA
+        "api.backup.*": "admin",
+        "api.admin.*": "admin",
+        "metrics": "admin",
+    }
 
     # --------------------------------------------------------
     # JWT / AUTH
@@ -96,6 +142,54 @@ class Settings:
         os.getenv("REFRESH_EXPIRE_DAYS", 30)
     )
 
+    # Caché de usuarios autenticados (middleware JWT).
+    # El TTL es la cota máxima de revocación (segundos); 0 = desactivada.
+    AUTH_USER_CACHE_TTL_SECONDS: float = float(
+        os.getenv("AUTH_USER_CACHE_TTL_SECONDS", 30)
+    )
+    AUTH_USER_CACHE_MAX_ENTRIES: int = int(
+        os.getenv("AUTH_USER_CACHE_MAX_ENTRIES", 1024)
+    )
+
+    # Caché de tokens ya verificados (evita HMAC en cada request).
+    # 0 = desactivada. La expiración se comprueba siempre.
+    AUTH_TOKEN_CACHE_MAX_ENTRIES: int = int(
+        os.getenv("AUTH_TOKEN_CACHE_MAX_ENTRIES", 4096)
+    )
+
+    # --------------------------------------------------------
+    # BCRYPT
+    # --------------------------------------------------------
+
+    # Coste de bcrypt (log2 de iteraciones). Al cambiarlo, los hashes
+    # existentes se regeneran en el siguiente login correcto.
+    BCRYPT_ROUNDS: int = int(os.getenv("BCRYPT_ROUNDS", 12))
+
+    # Hilos dedicados a bcrypt y operaciones que pueden esperar turno.
+    # Por encima de workers + cola, el login responde 503 al instante.
+    BCRYPT_WORKERS: int = int(os.getenv("BCRYPT_WORKERS", 2))
+    BCRYPT_QUEUE_LIMIT: int = int(os.getenv("BCRYPT_QUEUE_LIMIT", 16))
+
+    # --------------------------------------------------------
+    # LIMITACIÓN DE LOGIN (TOKEN BUCKET)
+    # --------------------------------------------------------
+
+    # Por IP: ráfaga permitida e intentos sostenidos por minuto
+    LOGIN_RATE_IP_BURST: int = int(os.getenv("LOGIN_RATE_IP_BURST", 20))
+    LOGIN_RATE_IP_PER_MINUTE: float = float(os.getenv("LOGIN_RATE_IP_PER_MINUTE", 30))
+
+    # Por username
+    LOGIN_RATE_USER_BURST: int = int(os.getenv("LOGIN_RATE_USER_BURST", 5))
+    LOGIN_RATE_USER_PER_MINUTE: float = float(os.getenv("LOGIN_RATE_USER_PER_MINUTE", 6))
+
+    # Máximo de claves en memoria por tipo (LRU)
+    LOGIN_THROTTLE_MAX_KEYS: int = int(os.getenv("LOGIN_THROTTLE_MAX_KEYS", 10000))
+
+    # Proxies propios delante de la app (nginx, balanceador...).
+    # 0 = se ignora X-Forwarded-For y la IP es remote_addr; N = IP del
+    # cliente en la posición N de X-Forwarded-For empezando por la derecha.
+    TRUSTED_PROXIES: int = int(os.getenv("TRUSTED_PROXIES", 0))
+
     # --------------------------------------------------------
     # BASE DE DATOS
     # --------------------------------------------------------
@@ -111,6 +205,237 @@ class Settings:
         "src/app/db/database.db",
     )
 
+    # Journal WAL (lectores y backups online sin bloquear escritores)
+    DATABASE_WAL: bool = os.getenv("DATABASE_WAL", "true").lower() == "true"
+
+    # Espera máxima de un escritor ante otra transacción en curso (ms)
+    DATABASE_BUSY_TIMEOUT_MS: int = int(os.getenv("DATABASE_BUSY_TIMEOUT_MS", 5000))
+
+    # --------------------------------------------------------
+    # CACHÉ DE RESPUESTAS (LECTURAS DE DATOS MAESTROS)
+    # --------------------------------------------------------
+
+    # Límite de la caché en memoria (por proceso)
+    RESPONSE_CACHE_MAX_ENTRIES: int = int(
+        os.getenv("RESPONSE_CACHE_MAX_ENTRIES", 512)
+    )
+    RESPONSE_CACHE_MAX_BYTES: int = int(
+        os.getenv("RESPONSE_CACHE_MAX_BYTES", 32 * 1024 * 1024)
+    )
+
+    # Nivel compartido en disco (opcional, para varios workers).
+    # Vacío = desactivado.
+    RESPONSE_CACHE_DISK_PATH: str = os.getenv("RESPONSE_CACHE_DISK_PATH", "")
+    RESPONSE_CACHE_DISK_MAX_ENTRIES: int = int(
+        os.getenv("RESPONSE_CACHE_DISK_MAX_ENTRIES", 5000)
+    )
+
+    # --------------------------------------------------------
+    # ESCRITURAS DIFERIDAS (WRITE-BEHIND)
+    # --------------------------------------------------------
+
+    # Volcado cada N segundos o al acumular M entradas pendientes
+    WRITE_BEHIND_FLUSH_SECONDS: float = float(os.getenv("WRITE_BEHIND_FLUSH_SECONDS", 5))
+    WRITE_BEHIND_FLUSH_EVENTS: int = int(os.getenv("WRITE_BEHIND_FLUSH_EVENTS", 500))
+
+    # Máximo de entradas en memoria por buffer (las más antiguas se descartan)
+    WRITE_BEHIND_MAX_PENDING: int = int(os.getenv("WRITE_BEHIND_MAX_PENDING", 10000))
+
+    # Resolución de users.last_seen (una escritura por usuario y periodo)
+    LAST_SEEN_RESOLUTION_SECONDS: float = float(os.getenv("LAST_SEEN_RESOLUTION_SECONDS", 60))
+
+    # --------------------------------------------------------
+    # BACKUPS (API ONLINE DE SQLITE)
+    # --------------------------------------------------------
+
+    # Directorio de destino de las copias
+    BACKUP_DIR: str = os.getenv("BACKUP_DIR", "backups")
+
+    # Páginas copiadas por paso (bloqueo de lectura por paso)
+    BACKUP_PAGES_PER_STEP: int = int(os.getenv("BACKUP_PAGES_PER_STEP", 256))
+
+    # Pausa entre pasos para dejar progresar a los escritores (ms)
+    BACKUP_STEP_SLEEP_MS: int = int(os.getenv("BACKUP_STEP_SLEEP_MS", 5))
+
+    # Reinicios por escrituras concurrentes antes de copiar en un solo paso
+    BACKUP_MAX_RESTARTS: int = int(os.getenv("BACKUP_MAX_RESTARTS", 20))
+
+    # Filas leídas por lote en el dump SQL en streaming
+    BACKUP_DUMP_BATCH_ROWS: int = int(os.getenv("BACKUP_DUMP_BATCH_ROWS", 1000))
+
+    # Filas por executemany al restaurar un dump SQL
+    BACKUP_RESTORE_BATCH_ROWS: int = int(os.getenv("BACKUP_RESTORE_BATCH_ROWS", 5000))
+
+    # Export / import NDJSON: filas por lote (yield_per, bloques de parseo,
+    # executemany) y procesos de parseo del import
+    BACKUP_NDJSON_BATCH_ROWS: int = int(os.getenv("BACKUP_NDJSON_BATCH_ROWS", 5000))
+    BACKUP_NDJSON_WORKERS: int = int(os.getenv("BACKUP_NDJSON_WORKERS", 2))
+
+    # Restore binario en caliente: espera máxima a que terminen las
+    # conexiones en uso antes de sustituir el fichero (si no, se aborta)
+    BACKUP_SWAP_DRAIN_TIMEOUT_MS: int = int(os.getenv("BACKUP_SWAP_DRAIN_TIMEOUT_MS", 5000))
+
+    # --------------------------------------------------------
+    # BACKUPS PROGRAMADOS (SCHEDULER EN PROCESO)
+    # --------------------------------------------------------
+
+    # Expresión cron en UTC ("0 * * * *" = cada hora). Vacía = desactivado.
+    # Con varios procesos, activarlo solo en uno.
+    BACKUP_SCHEDULE: str = os.getenv("BACKUP_SCHEDULE", "")
+
+    # Procesos de compresión (fuera del GIL de la API) y nivel gzip
+    BACKUP_COMPRESS_WORKERS: int = int(os.getenv("BACKUP_COMPRESS_WORKERS", 1))
+    BACKUP_COMPRESS_LEVEL: int = int(os.getenv("BACKUP_COMPRESS_LEVEL", 6))
+
+    # Retención: la copia más reciente de cada una de las últimas N horas / días / semanas
+    BACKUP_KEEP_HOURLY: int = int(os.getenv("BACKUP_KEEP_HOURLY", 24))
+    BACKUP_KEEP_DAILY: int = int(os.getenv("BACKUP_KEEP_DAILY", 7))
+    BACKUP_KEEP_WEEKLY: int = int(os.getenv("BACKUP_KEEP_WEEKLY", 4))
+
+    # --------------------------------------------------------
+    # RÉPLICA DE INFORMES (COPIA ONLINE DE SOLO LECTURA)
+    # --------------------------------------------------------
+
+    # Fichero de la réplica (":memory:" = en memoria del proceso)
+    REPORT_REPLICA_PATH: str = os.getenv(
+        "REPORT_REPLICA_PATH",
+        os.path.join(os.path.dirname(DATABASE_PATH), "reporting_replica.db"),
+    )
+
+    # Comprobación de cambios y refresco de la réplica (segundos)
+    REPORT_REPLICA_REFRESH_SECONDS: float = float(os.getenv("REPORT_REPLICA_REFRESH_SECONDS", 60))
+
+    # --------------------------------------------------------
+    # AUDITORÍA (FICHEROS PROPIOS, FUERA DE database.db)
+    # --------------------------------------------------------
+
+    AUDIT_ENABLED: bool = os.getenv("AUDIT_ENABLED", "true").lower() == "true"
+
+    # Directorio de segmentos mensuales (audit_YYYYMM.db).
+    # Por defecto, junto a la base de datos principal.
+    AUDIT_DIR: str = os.getenv(
+        "AUDIT_DIR",
+        os.path.join(os.path.dirname(DATABASE_PATH), "audit"),
+    )
+
+    # Meses conservados (incluido el actual)
+    AUDIT_RETENTION_MONTHS: int = int(os.getenv("AUDIT_RETENTION_MONTHS", 12))
+
+    # Entradas pendientes de volcar: al superarse, el request vuelca él
+    # mismo (contrapresión). La auditoría nunca descarta entradas.
+    AUDIT_MAX_PENDING: int = int(os.getenv("AUDIT_MAX_PENDING", 100000))
+
+    # --------------------------------------------------------
+    # MÉTRICAS (/metrics, FORMATO DE EXPOSICIÓN PROMETHEUS)
+    # --------------------------------------------------------
+
+    METRICS_ENABLED: bool = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+
+    # Límites superiores (segundos) de los buckets de latencia
+    METRICS_LATENCY_BUCKETS: tuple[float, ...] = tuple(
+        float(value) for value in os.getenv(
+            "METRICS_LATENCY_BUCKETS",
+            "0.005,0.01,0.025,0.05,0.1,0.25,0.5,1,2.5,5,10",
+        ).split(",")
+    )
+
+    # --------------------------------------------------------
+    # SERVER-TIMING (DESGLOSE POR CAPA EN CADA RESPUESTA)
+    # --------------------------------------------------------
+
+    # Cabecera Server-Timing en TODAS las respuestas
+    SERVER_TIMING_ENABLED: bool = os.getenv("SERVER_TIMING_ENABLED", "false").lower() == "true"
+
+    # Un administrador puede pedirla por request (X-Server-Timing: 1)
+    SERVER_TIMING_ADMIN_HEADER: bool = os.getenv("SERVER_TIMING_ADMIN_HEADER", "true").lower() == "true"
+
+    # --------------------------------------------------------
+    # TRAZAS (SPANS POR CAPA, SIN COLECTOR)
+    # --------------------------------------------------------
+
+    # Desactivado: no se envuelve ninguna capa (coste cero)
+    TRACING_ENABLED: bool = os.getenv("TRACING_ENABLED", "false").lower() == "true"
+
+    # Fracción de requests trazados (0..1); un traceparent entrante
+    # muestreado se respeta siempre
+    TRACING_SAMPLE_RATE: float = float(os.getenv("TRACING_SAMPLE_RATE", 1.0))
+
+    # Trazas recientes en memoria (/api/admin/traces)
+    TRACING_BUFFER_TRACES: int = int(os.getenv("TRACING_BUFFER_TRACES", 200))
+
+    # Spans por traza (los siguientes se descartan y se cuentan)
+    TRACING_MAX_SPANS: int = int(os.getenv("TRACING_MAX_SPANS", 500))
+
+    # Fichero JSONL (un span por línea); "" = solo memoria
+    TRACING_JSONL_PATH: str = os.getenv("TRACING_JSONL_PATH", "")
+
+    # Tamaño máximo del JSONL antes de rotar (se conserva un .1)
+    TRACING_JSONL_MAX_BYTES: int = int(os.getenv("TRACING_JSONL_MAX_BYTES", 10_000_000))
+
+    # --------------------------------------------------------
+    # PERFILADO POR REQUEST (logs/profiles/)
+    # --------------------------------------------------------
+
+    # Un administrador puede perfilar un request (X-Profile: 1)
+    PROFILING_ADMIN_HEADER: bool = os.getenv("PROFILING_ADMIN_HEADER", "true").lower() == "true"
+
+    # Fracción de requests perfilados sin cabecera (0 = ninguno)
+    PROFILING_SAMPLE_RATE: float = float(os.getenv("PROFILING_SAMPLE_RATE", 0.0))
+
+    # Perfilador por defecto: "cprofile" (pstats) o "sampling" (pilas colapsadas)
+    PROFILING_MODE: str = os.getenv("PROFILING_MODE", "cprofile")
+
+    # Intervalo entre muestras del perfilador por muestreo (ms)
+    PROFILING_SAMPLE_INTERVAL_MS: float = float(os.getenv("PROFILING_SAMPLE_INTERVAL_MS", 5))
+
+    # Requests perfilados a la vez (el resto se atiende sin perfilar)
+    PROFILING_MAX_CONCURRENT: int = int(os.getenv("PROFILING_MAX_CONCURRENT", 1))
+
+    # Carpeta de resultados y número de ficheros conservados
+    PROFILING_DIR: str = os.getenv("PROFILING_DIR", os.path.join("logs", "profiles"))
+    PROFILING_MAX_FILES: int = int(os.getenv("PROFILING_MAX_FILES", 200))
+
+    # --------------------------------------------------------
+    # CONSULTAS LENTAS (logs/slow_queries.log)
+    # --------------------------------------------------------
+
+    SLOW_QUERY_ENABLED: bool = os.getenv("SLOW_QUERY_ENABLED", "true").lower() == "true"
+
+    # Duración mínima (ms) para registrar una sentencia como lenta
+    SLOW_QUERY_THRESHOLD_MS: float = float(os.getenv("SLOW_QUERY_THRESHOLD_MS", 200))
+
+    # Sentencias distintas con estadísticas acumuladas (top-N)
+    SLOW_QUERY_MAX_STATEMENTS: int = int(os.getenv("SLOW_QUERY_MAX_STATEMENTS", 500))
+
+    # --------------------------------------------------------
+    # SINCRONIZACIÓN INCREMENTAL (/api/sync)
+    # --------------------------------------------------------
+
+    # Máximo de registros por recurso en una respuesta de sync.
+    # Si se supera, la respuesta indica has_more y el cliente repite.
+    SYNC_MAX_ROWS: int = int(
+        os.getenv("SYNC_MAX_ROWS", 1000)
+    )
+
+    # --------------------------------------------------------
+    # EVENTOS EN TIEMPO REAL (/api/events, SSE)
+    # --------------------------------------------------------
+
+    # Eventos pendientes por cliente; si se supera se descartan los
+    # más antiguos y el cliente recibe un evento "resync".
+    EVENTS_QUEUE_SIZE: int = int(os.getenv("EVENTS_QUEUE_SIZE", 256))
+
+    # Histórico para reanudar con Last-Event-ID
+    EVENTS_HISTORY_SIZE: int = int(os.getenv("EVENTS_HISTORY_SIZE", 1024))
+
+    # Conexiones SSE simultáneas por proceso (cada una ocupa un hilo)
+    EVENTS_MAX_SUBSCRIBERS: int = int(os.getenv("EVENTS_MAX_SUBSCRIBERS", 64))
+
+    # Intervalo de espera (detección de cambios de otros workers)
+    # y de keep-alive hacia el cliente
+    EVENTS_POLL_SECONDS: float = float(os.getenv("EVENTS_POLL_SECONDS", 1))
+    EVENTS_KEEPALIVE_SECONDS: float = float(os.getenv("EVENTS_KEEPALIVE_SECONDS", 15))
+
     # --------------------------------------------------------
     # ENTIDADES DEL SISTEMA (CONSTANCIAS DE NEGOCIO)
     # --------------------------------------------------------
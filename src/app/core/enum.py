@@ -26,6 +26,14 @@ class UserRole(str, Enum):
     USER = "USER"
 
 
+class RoutePolicy(str, Enum):
+    """Política de acceso de un endpoint HTTP (ver security.policies)."""
+
+    PUBLIC = "public"
+    AUTHENTICATED = "authenticated"
+    ADMIN = "admin"
+
+
 class DocumentStatus(str, Enum):
     """Estados de un documento de negocio."""
 
@@ -0,0 +1,19 @@
+# /src/app/core/events/__init__.py
+"""
+Core events package — v3.0
+
+Eventos en tiempo real del backend (pub/sub en proceso).
+
+Expone:
+- event_bus: bus de eventos con buffers acotados por suscriptor
+- stage_event: prepara un evento para publicarlo tras el COMMIT
+"""
+
+from .bus import event_bus, stage_event
+
+__all__ = [
+    "event_bus",
+    "stage_event",
+]
+
+# /src/app/core/events/__init__.py
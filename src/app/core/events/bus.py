@@ -0,0 +1,243 @@
+# /src/app/core/events/bus.py
+"""
+Event bus — v3.0
+
+Pub/sub en proceso para notificar cambios operativos (stock, cash,
+estado de documentos) a clientes conectados por SSE (/api/events).
+
+Diseño:
+- Cada suscriptor tiene un buffer ACOTADO. Un cliente lento nunca
+  bloquea al publicador ni hace crecer la memoria: si su buffer se
+  llena se descartan sus eventos más antiguos y se le marca `overflowed`
+  (el cliente debe resincronizar con /api/sync).
+- Un histórico acotado permite reanudar con `Last-Event-ID` tras una
+  reconexión breve.
+- Los ids de evento son monotónicos por proceso.
+
+IMPORTANTE:
+- `publish()` NO debe llamarse dentro de una transacción abierta: los
+  services preparan los eventos con `stage_event()` y se publican solo
+  tras el COMMIT (ver hooks al final del módulo).
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+from typing import Iterable
+
+from sqlalchemy import event, inspect
+
+from src.app.core.cache import invalidation
+from src.app.core.config.database import SessionLocal
+from src.app.core.config.settings import settings
+
+_STAGED_KEY = "staged_events"
+
+
+# ============================================================
+# SUSCRIPCIÓN
+# ============================================================
+
+class Subscription:
+    """
+    Buffer acotado de eventos de un suscriptor.
+    """
+
+    def __init__(self, max_queue: int, types: set[str] | None = None):
+        self.types = types
+        self._queue: deque[dict] = deque()
+        self._max_queue = max_queue
+        self._cond = threading.Condition()
+
+        self.overflowed = False
+        self.dropped = 0
+
+    def put(self, evt: dict) -> None:
+        """
+        Encola un evento sin bloquear (descarta el más antiguo si está lleno).
+        """
+        if self.types is not None and evt["type"] not in self.types:
+            return
+
+        with self._cond:
+            if len(self._queue) >= self._max_queue:
+                self._queue.popleft()
+                self.overflowed = True
+                self.dropped += 1
+            self._queue.append(evt)
+            self._cond.notify()
+
+    def get(self, timeout: float) -> tuple[list[dict], bool]:
+        """
+        Espera hasta `timeout` segundos y vacía el buffer.
+
+        :return: (eventos, overflowed) — overflowed se rearma al leerlo.
+        """
+        with self._cond:
+            if not self._queue and not self.overflowed:
+                self._cond.wait(timeout)
+
+            events = list(self._queue)
+            self._queue.clear()
+
+            overflowed = self.overflowed
+            self.overflowed = False
+
+        return events, overflowed
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+
+# ============================================================
+# BUS
+# ============================================================
+
+class EventBus:
+    """
+    Bus de eventos en proceso con histórico acotado.
+    """
+
+    def __init__(self, history_size: int):
+        self._lock = threading.Lock()
+        self._subscribers: set[Subscription] = set()
+        self._history: deque[dict] = deque(maxlen=history_size)
+        self._next_id = 1
+
+        self.published = 0
+
+    def publish(self, type: str, data: dict) -> dict:
+        """
+        Publica un evento a todos los suscriptores.
+
+        :param type: tipo de evento (stock, cash, document, ...).
+        :param data: payload serializable a JSON.
+        :return: evento publicado {"id", "type", "data"}.
+        """
+        with self._lock:
+            evt = {"id": self._next_id, "type": type, "data": data}
+            self._next_id += 1
+            self._history.append(evt)
+            self.published += 1
+            subscribers = list(self._subscribers)
+
+        for subscription in subscribers:
+            subscription.put(evt)
+
+        return evt
+
+    def subscribe(
+        self,
+        max_queue: int,
+        types: Iterable[str] | None = None,
+        last_event_id: int | None = None,
+    ) -> Subscription:
+        """
+        Crea una suscripción; con `last_event_id` reenvía lo pendiente.
+
+        Si `last_event_id` ya no está en el histórico, la suscripción
+        nace con `overflowed` (el cliente debe resincronizar).
+        """
+        subscription = Subscription(max_queue, set(types) if types else None)
+
+        with self._lock:
+            if last_event_id is not None and last_event_id < self._next_id - 1:
+                oldest = self._history[0]["id"] if self._history else self._next_id
+                if last_event_id < oldest - 1:
+                    subscription.overflowed = True
+                for evt in self._history:
+                    if evt["id"] > last_event_id:
+                        subscription.put(evt)
+
+            self._subscribers.add(subscription)
+
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """
+        Elimina una suscripción (idempotente).
+        """
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len(self._subscribers)
+
+    def stats(self) -> dict:
+        """
+        Devuelve los contadores del bus.
+        """
+        with self._lock:
+            subscribers = list(self._subscribers)
+        return {
+            "published": self.published,
+            "subscribers": len(subscribers),
+            "queued": sum(len(s) for s in subscribers),
+            "dropped": sum(s.dropped for s in subscribers),
+        }
+
+
+# ------------------------------------------------------------
+# INSTANCIA EXPORTADA (OBLIGATORIA)
+# ------------------------------------------------------------
+event_bus = EventBus(settings.EVENTS_HISTORY_SIZE)
+
+
+# ============================================================
+# PUBLICACIÓN TRAS COMMIT
+# ============================================================
+
+def stage_event(session, type: str, data: dict) -> None:
+    """
+    Prepara un evento para publicarlo cuando la transacción confirme.
+
+    :param session: sesión SQLAlchemy de la transacción en curso.
+    """
+    session.info.setdefault(_STAGED_KEY, []).append((type, data))
+
+
+@event.listens_for(SessionLocal, "before_flush")
+def _stage_status_changes(session, flush_context, instances) -> None:
+    """
+    Detecta cambios de `status` en documentos (p. ej. DRAFT → CONFIRMED).
+    """
+    for obj in session.dirty:
+        state = inspect(obj)
+        if "status" not in state.attrs.keys():
+            continue
+        if state.attrs.status.history.has_changes():
+            stage_event(session, "document", {
+                "resource": obj.__table__.name,
+                "id": obj.id,
+                "status": obj.status,
+            })
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _publish_staged_events(session) -> None:
+    for type, data in session.info.pop(_STAGED_KEY, ()):
+        event_bus.publish(type, data)
+
+
+@event.listens_for(SessionLocal, "after_rollback")
+def _discard_staged_events(session) -> None:
+    session.info.pop(_STAGED_KEY, None)
+
+
+# ============================================================
+# CAMBIOS DE OTROS PROCESOS
+# ============================================================
+
+def _publish_remote_changes(tables: set[str]) -> None:
+    """
+    Los eventos de otros workers no llegan a este bus: se avisa de las
+    tablas cambiadas para que el cliente resincronice con /api/sync.
+    """
+    event_bus.publish("sync", {"tables": sorted(tables)})
+
+
+invalidation.subscribe_remote(_publish_remote_changes)
+
+# /src/app/core/events/bus.py
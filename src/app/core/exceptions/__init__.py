@@ -14,7 +14,9 @@ from .base import (
     ForbiddenException,
     NotFoundException,
     ConflictException,
+    TooManyRequestsException,
     ServerErrorException,
+    ServiceUnavailableException,
 )
 from .handlers import register_exception_handlers
 
@@ -25,7 +27,9 @@ __all__ = [
     "ForbiddenException",
     "NotFoundException",
     "ConflictException",
+    "TooManyRequestsException",
     "ServerErrorException",
+    "ServiceUnavailableException",
     "register_exception_handlers",
 ]
 
@@ -57,8 +57,38 @@ class ConflictException(BaseAppException):
     status_code = 409
 
 
+class TooManyRequestsException(BaseAppException):
+    """429 Too Many Requests (con cabecera Retry-After)."""
+    error_name = "TooManyRequests"
+    status_code = 429
+
+    def __init__(self, message: str = "Too many requests", retry_after: int | None = None):
+        """
+        Args:
+            message: Mensaje seguro para exponer en API.
+            retry_after: Segundos que el cliente debe esperar.
+        """
+        self.retry_after = retry_after
+        super().__init__(message)
+
+
 class ServerErrorException(BaseAppException):
     """500 Server Error."""
     error_name = "ServerError"
     status_code = 500
+
+
+class ServiceUnavailableException(BaseAppException):
+    """503 Service Unavailable (con cabecera Retry-After opcional)."""
+    error_name = "ServiceUnavailable"
+    status_code = 503
+
+    def __init__(self, message: str = "Service unavailable", retry_after: int | None = None):
+        """
+        Args:
+            message: Mensaje seguro para exponer en API.
+            retry_after: Segundos que el cliente debe esperar.
+        """
+        self.retry_after = retry_after
+        super().__init__(message)
 # /src/app/core/exceptions/base.py
@@ -40,7 +40,14 @@ def register_exception_handlers(app) -> None:
         Handler para excepciones controladas del dominio.
         """
         logger.error(f"[{e.status_code}] {e.message}")
-        return jsonify({"error": e.error_name, "message": e.message}), e.status_code
+        response = jsonify({"error": e.error_name, "message": e.message})
+
+        # 429 / 503: indica al cliente cuándo reintentar
+        retry_after = getattr(e, "retry_after", None)
+        if retry_after:
+            response.headers["Retry-After"] = str(retry_after)
+
+        return response, e.status_code
 
     # --------------------------------------------------------
     # Excepciones HTTP estándar (Werkzeug)
@@ -8,16 +8,18 @@ del proyecto, evitando configuraciones duplicadas o dispersas.
 Uso esperado:
 - setup_logging(): se llama UNA vez al arrancar la aplicación.
 - get_logger(__name__): se usa en cualquier módulo para emitir logs.
+- get_dedicated_logger(name, filename): logger con fichero propio.
 """
 
 # ------------------------------------------------------------
 # API pública del módulo logging
 # ------------------------------------------------------------
 
-from .logger import setup_logging, get_logger
+from .logger import setup_logging, get_logger, get_dedicated_logger
 
 __all__ = [
     "setup_logging",
     "get_logger",
+    "get_dedicated_logger",
 ]
 # /src/app/core/logging/__init__.py
\ No newline at end of file
@@ -96,6 +96,31 @@ def setup_logging() -> None:
     # Log exclusivo de errores (ERROR y superiores)
     root_logger.addHandler(_create_handler(EXCEPTIONS_LOG, logging.ERROR))
 
+# ------------------------------------------------------------
+# Loggers con fichero propio (fuera de app.log)
+# ------------------------------------------------------------
+
+def get_dedicated_logger(name: str, filename: str, level: int = logging.INFO) -> logging.Logger:
+    """
+    Devuelve un logger que escribe SOLO en su propio fichero rotado.
+
+    Uso: registros de diagnóstico voluminosos (p. ej. slow_queries.log)
+    que no deben mezclarse con app.log.
+
+    :param name: Nombre del logger.
+    :param filename: Nombre del archivo dentro de LOG_DIR.
+    :param level: Umbral mínimo de severidad.
+    :return: Logger sin propagación al logger raíz.
+    """
+    logger = logging.getLogger(name)
+    logger.setLevel(level)
+    logger.propagate = False
+
+    # Evitar handlers duplicados (por imports repetidos)
+    if not logger.handlers:
+        logger.addHandler(_create_handler(filename, level))
+    return logger
+
 # ------------------------------------------------------------
 # Obtención de loggers lógicos por módulo
 # ------------------------------------------------------------
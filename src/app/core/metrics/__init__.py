@@ -0,0 +1,32 @@
+# /src/app/core/metrics/__init__.py
+"""
+Core metrics package — v3.0
+
+Métricas en proceso (latencia por endpoint, consultas SQL por request)
+expuestas en GET /metrics con el formato de texto de Prometheus.
+
+Expone:
+- metrics_registry: contadores / gauges / histogramas por franjas
+- register_metrics: instrumentación de Flask y endpoint /metrics
+- slow_query_log: sentencias lentas (slow_queries.log y top-N)
+- server_timing / register_server_timing: cabecera Server-Timing por capa
+- request_profiler / register_profiler: perfilado por request (X-Profile)
+"""
+
+from .instrumentation import register_metrics
+from .profiler import register_profiler, request_profiler
+from .registry import metrics_registry
+from .server_timing import register_server_timing, server_timing
+from .slow_queries import slow_query_log
+
+__all__ = [
+    "metrics_registry",
+    "register_metrics",
+    "register_profiler",
+    "register_server_timing",
+    "request_profiler",
+    "server_timing",
+    "slow_query_log",
+]
+
+# /src/app/core/metrics/__init__.py
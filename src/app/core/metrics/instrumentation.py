@@ -0,0 +1,222 @@
+# /src/app/core/metrics/instrumentation.py
+"""
+Request instrumentation — v3.0
+
+Métricas por endpoint de Flask registradas en cada request:
+
+- http_requests_total{endpoint,method,status}
+- http_request_duration_seconds{endpoint,status}      (histograma)
+- http_requests_in_flight{endpoint}                    (gauge)
+- http_response_size_bytes{endpoint,status}           (histograma)
+- db_queries_total{endpoint} / db_query_seconds_total{endpoint}
+- http_request_db_queries{endpoint}                   (consultas por request)
+- http_request_db_seconds{endpoint}                   (tiempo de BD por request)
+
+Consultas:
+- Eventos before_cursor_execute / after_cursor_execute del engine
+  principal (core.config.database). El tiempo se acumula en variables
+  del hilo del request y se publica UNA vez, al terminar el request.
+- Es la ÚNICA medición por sentencia: la misma duración se entrega al
+  slow query log (slow_queries) y a Server-Timing (server_timing).
+- Una sentencia fallida no emite after_cursor_execute: handle_error
+  saca su inicio de la conexión (y la cuenta igualmente).
+- Las consultas fuera de un request (hilos de fondo) cuentan con
+  endpoint="background".
+
+Exposición:
+- GET /metrics (política admin, settings.ROUTE_POLICIES) en formato de
+  texto de Prometheus.
+
+IMPORTANTE:
+- register_metrics(app) se registra el PRIMERO: mide también los
+  requests rechazados por mantenimiento (503) o autenticación.
+- Las peticiones sin endpoint (404 / 405) usan endpoint="unmatched":
+  la ruta nunca se usa como etiqueta (cardinalidad acotada).
+- En respuestas en streaming (SSE) la duración es hasta que Flask
+  entrega la respuesta, no hasta que termina el stream.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+from flask import Response, request
+from sqlalchemy import event
+
+from src.app.core.config.database import engine
+from src.app.core.config.settings import settings
+from src.app.core.metrics.registry import metrics_registry
+from src.app.core.metrics.server_timing import server_timing
+from src.app.core.metrics.slow_queries import slow_query_log
+
+UNMATCHED = "unmatched"
+BACKGROUND = "background"
+
+_QUERY_STARTED_KEY = "metrics_query_started"
+
+SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 500)
+
+# Estado del request en curso (por hilo; g no existe en los eventos del engine)
+_local = threading.local()
+
+
+# ============================================================
+# MÉTRICAS
+# ============================================================
+
+http_requests = metrics_registry.counter(
+    "http_requests_total", "HTTP requests by endpoint, method and status.",
+    ("endpoint", "method", "status"),
+)
+http_latency = metrics_registry.histogram(
+    "http_request_duration_seconds", "HTTP request latency in seconds.",
+    ("endpoint", "status"), settings.METRICS_LATENCY_BUCKETS,
+)
+http_in_flight = metrics_registry.gauge(
+    "http_requests_in_flight", "HTTP requests being processed.",
+    ("endpoint",),
+)
+http_response_size = metrics_registry.histogram(
+    "http_response_size_bytes", "HTTP response body size in bytes.",
+    ("endpoint", "status"), SIZE_BUCKETS,
+)
+db_queries = metrics_registry.counter(
+    "db_queries_total", "SQL statements executed on the main database.",
+    ("endpoint",),
+)
+db_seconds = metrics_registry.counter(
+    "db_query_seconds_total", "Time spent executing SQL statements on the main database.",
+    ("endpoint",),
+)
+request_db_queries = metrics_registry.histogram(
+    "http_request_db_queries", "SQL statements per HTTP request.",
+    ("endpoint",), QUERY_COUNT_BUCKETS,
+)
+request_db_seconds = metrics_registry.histogram(
+    "http_request_db_seconds", "Time spent in SQL per HTTP request.",
+    ("endpoint",), settings.METRICS_LATENCY_BUCKETS,
+)
+
+
+# ============================================================
+# CONSULTAS (EVENTOS DEL ENGINE)
+# ============================================================
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    conn.info.setdefault(_QUERY_STARTED_KEY, []).append(time.perf_counter())
+
+
+def _finish_query(conn) -> float | None:
+    """
+    Saca el inicio de la sentencia y registra su duración (segundos).
+    """
+    stack = conn.info.get(_QUERY_STARTED_KEY)
+    if not stack:
+        return None
+    elapsed = time.perf_counter() - stack.pop()
+
+    if getattr(_local, "active", False):
+        _local.queries += 1
+        _local.db_seconds += elapsed
+    else:
+        db_queries.inc((BACKGROUND,))
+        db_seconds.inc((BACKGROUND,), elapsed)
+
+    server_timing.observe_query(elapsed)
+    return elapsed
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    elapsed = _finish_query(conn)
+    if elapsed is not None:
+        slow_query_log.observe(cursor, statement, parameters, executemany, elapsed)
+
+
+def _handle_error(exception_context) -> None:
+    # Una sentencia fallida no emite after_cursor_execute: sin esto su
+    # inicio quedaría para siempre en la conexión del pool
+    if exception_context.connection is not None:
+        _finish_query(exception_context.connection)
+
+
+event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+event.listen(engine, "handle_error", _handle_error)
+
+
+# ============================================================
+# REQUESTS
+# ============================================================
+
+def _start_request() -> None:
+    endpoint = request.endpoint or UNMATCHED
+    _local.active = True
+    _local.endpoint = endpoint
+    _local.queries = 0
+    _local.db_seconds = 0.0
+    _local.started = time.perf_counter()
+    http_in_flight.inc((endpoint,))
+
+
+def _record_request(response):
+    if not getattr(_local, "active", False):
+        return response
+
+    elapsed = time.perf_counter() - _local.started
+    endpoint = _local.endpoint
+    status = str(response.status_code)
+
+    http_requests.inc((endpoint, request.method, status))
+    http_latency.observe((endpoint, status), elapsed)
+
+    size = response.content_length
+    if size is not None:
+        http_response_size.observe((endpoint, status), size)
+
+    db_queries.inc((endpoint,), _local.queries)
+    db_seconds.inc((endpoint,), _local.db_seconds)
+    request_db_queries.observe((endpoint,), _local.queries)
+    request_db_seconds.observe((endpoint,), _local.db_seconds)
+    return response
+
+
+def _finish_request(exception=None) -> None:
+    # teardown: se ejecuta siempre, también si after_request no llegó a correr
+    if getattr(_local, "active", False):
+        _local.active = False
+        http_in_flight.dec((_local.endpoint,))
+
+
+def metrics_view():
+    """
+    GET /metrics: exposición en formato de texto de Prometheus.
+    """
+    return Response(metrics_registry.render(), content_type=metrics_registry.CONTENT_TYPE)
+
+
+# ============================================================
+# REGISTRO EN FLASK
+# ============================================================
+
+def register_metrics(app) -> None:
+    """
+    Registra la instrumentación de requests y el endpoint /metrics.
+
+    DEBE registrarse antes que cualquier otro before_request.
+
+    :param app: instancia de Flask.
+    """
+    if not settings.METRICS_ENABLED:
+        return
+
+    # Las métricas pertenecen al ciclo de vida de la app
+    metrics_registry.reset()
+
+    app.before_request(_start_request)
+    app.after_request(_record_request)
+    app.teardown_request(_finish_request)
+    app.add_url_rule("/metrics", "metrics", metrics_view, methods=["GET"])
+
+# /src/app/core/metrics/instrumentation.py
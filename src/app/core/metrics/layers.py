@@ -0,0 +1,82 @@
+# /src/app/core/metrics/layers.py
+"""
+Layer instrumentation — v3.0
+
+Recorrido común de las capas de la app para envolverlas con
+temporizadores (Server-Timing) o spans (core.tracing):
+
+- controller: vistas de Flask (métodos de los controllers)
+- service: métodos públicos del service de cada controller
+- stock / cash: StockMovementsService / CashMovementsService
+- serialize: to_dict() de los modelos mapeados
+
+Cada instrumentador pasa `wrap(layer, name, func)`, que devuelve el
+callable envuelto (o `func` si no le interesa esa capa), y un
+`marker` propio que hace la instrumentación idempotente.
+
+IMPORTANTE:
+- Llamar con TODAS las rutas ya registradas.
+- Los services se envuelven en la instancia (singleton): también las
+  llamadas internas self.metodo() pasan por el envoltorio.
+"""
+
+from __future__ import annotations
+
+import inspect
+from typing import Callable
+
+Wrap = Callable[[str, str, Callable], Callable]
+
+
+def instrument_object(obj, layer: str, wrap: Wrap, marker: str) -> None:
+    """
+    Envuelve los métodos públicos de una instancia. Idempotente.
+    """
+    if getattr(obj, marker, None):
+        return
+    cls = type(obj)
+    for name, _ in inspect.getmembers(cls, inspect.isfunction):
+        if name.startswith("_"):
+            continue
+        setattr(obj, name, wrap(layer, f"{cls.__name__}.{name}", getattr(obj, name)))
+    setattr(obj, marker, layer)
+
+
+def instrument_layers(app, wrap: Wrap, marker: str) -> None:
+    """
+    Envuelve vistas, services, movimientos y serialización de modelos.
+    """
+    # Import diferido: los services y modelos importan core
+    from src.app.db.base import Base
+    from src.app.services.cash_movements_service import cash_movements_service
+    from src.app.services.stock_movements_service import stock_movements_service
+
+    instrument_object(stock_movements_service, "stock", wrap, marker)
+    instrument_object(cash_movements_service, "cash", wrap, marker)
+
+    for endpoint, view in list(app.view_functions.items()):
+        if getattr(view, marker, None):
+            continue
+        # Otro instrumentador puede haber envuelto ya la vista
+        controller = getattr(inspect.unwrap(view), "__self__", None)
+        service = getattr(controller, "service", None)
+        if service is not None:
+            instrument_object(service, "service", wrap, marker)
+
+        owner = type(controller).__name__ if controller is not None else "app"
+        wrapped = wrap("controller", f"{owner}.{view.__name__}", view)
+        if wrapped is not view:
+            setattr(wrapped, marker, "controller")
+            app.view_functions[endpoint] = wrapped
+
+    for mapper in Base.registry.mappers:
+        cls = mapper.class_
+        to_dict = cls.__dict__.get("to_dict")
+        if to_dict is None or getattr(to_dict, marker, None):
+            continue
+        wrapped = wrap("serialize", f"{cls.__name__}.to_dict", to_dict)
+        if wrapped is not to_dict:
+            setattr(wrapped, marker, "serialize")
+            cls.to_dict = wrapped
+
+# /src/app/core/metrics/layers.py
@@ -0,0 +1,342 @@
+# /src/app/core/metrics/profiler.py
+"""
+Request profiler — v3.0
+
+Perfilado de requests concretos, para los endpoints que solo son lentos
+con los datos de producción:
+
+- Un administrador lo pide con la cabecera `X-Profile: 1` (perfilador
+  por defecto, PROFILING_MODE) o `X-Profile: cprofile` / `sampling`.
+- PROFILING_SAMPLE_RATE > 0 perfila además esa fracción de requests.
+
+Perfiladores:
+- cprofile: cProfile del hilo del request → <id>.pstats
+  (`python -m pstats`, snakeviz...).
+- sampling: un hilo de fondo lee la pila del hilo del request cada
+  PROFILING_SAMPLE_INTERVAL_MS → <id>.folded (pilas colapsadas,
+  "a;b;c N" por línea, para flamegraph.pl / speedscope). Coste bajo e
+  independiente del número de llamadas.
+
+Los ficheros se guardan en PROFILING_DIR (se conservan los
+PROFILING_MAX_FILES más recientes) y se listan en
+GET /api/admin/profiles. La respuesta perfilada lleva `X-Profile-Id`.
+
+IMPORTANTE:
+- Máximo PROFILING_MAX_CONCURRENT requests perfilados a la vez: el
+  resto se atiende sin perfilar (`X-Profile-Skipped: busy`), para no
+  degradar el throughput.
+- Se registra DESPUÉS del middleware JWT: la cabecera solo se acepta
+  de un administrador ya autenticado. El perfil cubre vista, services,
+  BD y serialización (no la validación del token).
+"""
+
+from __future__ import annotations
+
+import cProfile
+import os
+import random
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import Counter, OrderedDict
+from datetime import datetime, timezone
+
+from flask import g, request
+
+from src.app.core.config.settings import settings
+from src.app.core.enum import UserRole
+
+REQUEST_HEADER = "X-Profile"
+PROFILE_ID_HEADER = "X-Profile-Id"
+SKIPPED_HEADER = "X-Profile-Skipped"
+
+MODE_CPROFILE = "cprofile"
+MODE_SAMPLING = "sampling"
+MODES = (MODE_CPROFILE, MODE_SAMPLING)
+
+# Extensión del fichero de resultados por perfilador
+EXTENSIONS = {MODE_CPROFILE: ".pstats", MODE_SAMPLING: ".folded"}
+
+# Metadatos de request guardados en memoria (por fichero)
+_MAX_METADATA = 1000
+
+_UNSAFE_CHARS = re.compile(r"[^A-Za-z0-9_.-]+")
+
+# Perfil en curso del hilo
+_local = threading.local()
+
+
+# ============================================================
+# PERFILADOR POR MUESTREO
+# ============================================================
+
+class StackSampler:
+    """
+    Muestrea la pila de un hilo desde un hilo de fondo.
+    """
+
+    def __init__(self, thread_id: int, interval: float):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="profile-sampler", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            self.stacks[self._collapse(frame)] += 1
+            self.samples += 1
+
+    @staticmethod
+    def _collapse(frame) -> str:
+        names = []
+        while frame is not None:
+            code = frame.f_code
+            names.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+            frame = frame.f_back
+        return ";".join(reversed(names))
+
+    def dump(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as handle:
+            for stack, count in self.stacks.most_common():
+                handle.write(f"{stack} {count}\n")
+
+
+# ============================================================
+# PERFILADO POR REQUEST
+# ============================================================
+
+class RequestProfiler:
+    """
+    Perfiles por request con límite de concurrencia.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._active = 0
+        self._metadata: OrderedDict[str, dict] = OrderedDict()
+        self.profiled = 0
+        self.rejected = 0
+
+    # ------------------------------------------------------------
+    # CICLO DEL REQUEST
+    # ------------------------------------------------------------
+    def start(self, mode: str) -> bool:
+        """
+        Empieza a perfilar el hilo actual; False si no hay hueco.
+        """
+        with self._lock:
+            if self._active >= settings.PROFILING_MAX_CONCURRENT:
+                self.rejected += 1
+                return False
+            self._active += 1
+
+        if mode == MODE_SAMPLING:
+            profiler = StackSampler(threading.get_ident(), settings.PROFILING_SAMPLE_INTERVAL_MS / 1000)
+            profiler.start()
+        else:
+            profiler = cProfile.Profile()
+            profiler.enable()
+
+        _local.profile = (mode, profiler, time.perf_counter())
+        return True
+
+    @property
+    def active(self) -> bool:
+        return getattr(_local, "profile", None) is not None
+
+    def _finish(self):
+        profile = getattr(_local, "profile", None)
+        _local.profile = None
+        if profile is None:
+            return None
+
+        mode, profiler, started = profile
+        if mode == MODE_SAMPLING:
+            profiler.stop()
+        else:
+            profiler.disable()
+        with self._lock:
+            self._active -= 1
+        return mode, profiler, time.perf_counter() - started
+
+    def stop(self, metadata: dict) -> str | None:
+        """
+        Termina el perfil del hilo y lo escribe; devuelve el nombre del
+        fichero (None si no había perfil).
+        """
+        finished = self._finish()
+        if finished is None:
+            return None
+
+        mode, profiler, seconds = finished
+        created = datetime.now(timezone.utc)
+        label = _UNSAFE_CHARS.sub("_", metadata.get("endpoint") or "unmatched")
+        name = f"{created:%Y%m%dT%H%M%S%f}_{uuid.uuid4().hex[:8]}_{label}{EXTENSIONS[mode]}"
+
+        os.makedirs(settings.PROFILING_DIR, exist_ok=True)
+        path = os.path.join(settings.PROFILING_DIR, name)
+        if mode == MODE_SAMPLING:
+            profiler.dump(path)
+            metadata = {**metadata, "samples": profiler.samples}
+        else:
+            profiler.dump_stats(path)
+
+        with self._lock:
+            self.profiled += 1
+            self._metadata[name] = {**metadata, "duration_ms": round(seconds * 1000, 3)}
+            while len(self._metadata) > _MAX_METADATA:
+                self._metadata.popitem(last=False)
+        self._prune()
+        return name
+
+    def discard(self) -> None:
+        """
+        Termina el perfil del hilo sin escribirlo (request fallido).
+        """
+        self._finish()
+
+    # ------------------------------------------------------------
+    # FICHEROS
+    # ------------------------------------------------------------
+    @staticmethod
+    def _files() -> list[os.DirEntry]:
+        if not os.path.isdir(settings.PROFILING_DIR):
+            return []
+        extensions = tuple(EXTENSIONS.values())
+        with os.scandir(settings.PROFILING_DIR) as entries:
+            files = [entry for entry in entries if entry.is_file() and entry.name.endswith(extensions)]
+        # Los nombres empiezan por la fecha: orden por nombre = cronológico
+        return sorted(files, key=lambda entry: entry.name, reverse=True)
+
+    def _prune(self) -> None:
+        for entry in self._files()[settings.PROFILING_MAX_FILES:]:
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
+
+    def path(self, name: str) -> str | None:
+        """
+        Ruta de un fichero de perfil por nombre (sin rutas); None si no
+        existe o el nombre no es válido.
+        """
+        if not name or os.path.basename(name) != name or not name.endswith(tuple(EXTENSIONS.values())):
+            return None
+        path = os.path.join(settings.PROFILING_DIR, name)
+        return path if os.path.isfile(path) else None
+
+    def list_profiles(self, limit: int) -> dict:
+        """
+        Perfiles guardados, más recientes primero.
+        """
+        files = self._files()
+        profiles = []
+        for entry in files[:limit]:
+            stat = entry.stat()
+            mode = MODE_SAMPLING if entry.name.endswith(EXTENSIONS[MODE_SAMPLING]) else MODE_CPROFILE
+            profiles.append({
+                "name": entry.name,
+                "mode": mode,
+                "size_bytes": stat.st_size,
+                "created_at": datetime.fromtimestamp(stat.st_mtime, timezone.utc).isoformat().replace("+00:00", "Z"),
+                **self._metadata.get(entry.name, {}),
+            })
+        return {**self.stats(), "stored": len(files), "profiles": profiles}
+
+    def stats(self) -> dict:
+        with self._lock:
+            active = self._active
+        return {
+            "admin_header": settings.PROFILING_ADMIN_HEADER,
+            "sample_rate": settings.PROFILING_SAMPLE_RATE,
+            "default_mode": settings.PROFILING_MODE,
+            "max_concurrent": settings.PROFILING_MAX_CONCURRENT,
+            "active": active,
+            "profiled": self.profiled,
+            "rejected": self.rejected,
+        }
+
+
+# ------------------------------------------------------------
+# INSTANCIA EXPORTADA (OBLIGATORIA)
+# ------------------------------------------------------------
+request_profiler = RequestProfiler()
+
+
+# ============================================================
+# REGISTRO EN FLASK
+# ============================================================
+
+def _default_mode() -> str:
+    return settings.PROFILING_MODE if settings.PROFILING_MODE in MODES else MODE_CPROFILE
+
+
+def _requested_mode() -> str | None:
+    """
+    Perfilador pedido para el request actual (None = sin perfil).
+    """
+    value = request.headers.get(REQUEST_HEADER, "").strip().lower()
+    if value and settings.PROFILING_ADMIN_HEADER:
+        user = g.get("current_user")
+        if user is not None and user.rol == UserRole.ADMIN:
+            if value == "1":
+                return _default_mode()
+            if value in MODES:
+                return value
+
+    if settings.PROFILING_SAMPLE_RATE > 0 and random.random() < settings.PROFILING_SAMPLE_RATE:
+        return _default_mode()
+    return None
+
+
+def register_profiler(app) -> None:
+    """
+    Registra el perfilado por request.
+
+    DEBE registrarse DESPUÉS del middleware JWT (identifica al admin).
+
+    :param app: instancia de Flask.
+    """
+    if not (settings.PROFILING_ADMIN_HEADER or settings.PROFILING_SAMPLE_RATE > 0):
+        return
+
+    @app.before_request
+    def start_profile():
+        g.pop("profile_skipped", None)
+        mode = _requested_mode()
+        if mode is not None and not request_profiler.start(mode):
+            g.profile_skipped = True
+
+    @app.after_request
+    def write_profile(response):
+        if g.pop("profile_skipped", False):
+            response.headers[SKIPPED_HEADER] = "busy"
+        name = request_profiler.stop({
+            "method": request.method,
+            "path": request.path,
+            "endpoint": request.endpoint,
+            "status": response.status_code,
+        })
+        if name is not None:
+            response.headers[PROFILE_ID_HEADER] = name
+        return response
+
+    @app.teardown_request
+    def discard_profile(exception=None):
+        request_profiler.discard()
+
+# /src/app/core/metrics/profiler.py
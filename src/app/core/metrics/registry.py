@@ -0,0 +1,243 @@
+# /src/app/core/metrics/registry.py
+"""
+Metrics registry — v3.0
+
+Contadores, gauges e histogramas en proceso con salida en el formato
+de exposición de texto de Prometheus (version 0.0.4).
+
+Contención:
+- Cada métrica reparte sus valores en STRIPES franjas, cada una con su
+  propio lock. Un hilo usa siempre la misma franja (asignada en su
+  primera observación): los hilos de requests concurrentes casi nunca
+  comparten lock y la observación es un incremento en un dict.
+- Solo la exposición (render) recorre todas las franjas y suma.
+
+IMPORTANTE:
+- Las etiquetas se pasan como tupla en el orden de `labelnames`.
+- Los valores de etiqueta deben tener cardinalidad acotada (endpoint,
+  método, status), nunca rutas con ids.
+"""
+
+from __future__ import annotations
+
+import itertools
+import threading
+from bisect import bisect_left
+
+STRIPES = 16
+
+_stripe_ids = itertools.count()
+_local = threading.local()
+
+
+def _stripe_index() -> int:
+    """
+    Franja fija del hilo actual (reparto round-robin entre hilos).
+    """
+    index = getattr(_local, "stripe", None)
+    if index is None:
+        index = _local.stripe = next(_stripe_ids) % STRIPES
+    return index
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: tuple, values: tuple, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    if value == int(value):
+        return str(int(value))
+    return repr(value)
+
+
+class _Stripe:
+    __slots__ = ("lock", "values")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.values: dict = {}
+
+
+class _Metric:
+    """
+    Base de las métricas: valores por etiquetas repartidos en franjas.
+    """
+
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._stripes = [_Stripe() for _ in range(STRIPES)]
+
+    def reset(self) -> None:
+        for stripe in self._stripes:
+            with stripe.lock:
+                stripe.values.clear()
+
+    def _snapshot(self) -> list[dict]:
+        snapshot = []
+        for stripe in self._stripes:
+            with stripe.lock:
+                snapshot.append({key: self._copy(value) for key, value in stripe.values.items()})
+        return snapshot
+
+    @staticmethod
+    def _copy(value):
+        return value
+
+    def _header(self) -> list[str]:
+        return [
+            f"# HELP {self.name} {_escape(self.documentation)}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+
+
+class Counter(_Metric):
+    """
+    Valor que solo crece (requests, consultas, segundos acumulados).
+    """
+
+    kind = "counter"
+
+    def inc(self, labels: tuple = (), amount: float = 1) -> None:
+        stripe = self._stripes[_stripe_index()]
+        with stripe.lock:
+            stripe.values[labels] = stripe.values.get(labels, 0) + amount
+
+    def values(self) -> dict[tuple, float]:
+        """
+        Suma de todas las franjas por etiquetas.
+        """
+        totals: dict[tuple, float] = {}
+        for values in self._snapshot():
+            for labels, value in values.items():
+                totals[labels] = totals.get(labels, 0) + value
+        return totals
+
+    def render(self) -> list[str]:
+        lines = self._header()
+        for labels, value in sorted(self.values().items()):
+            lines.append(f"{self.name}{_labels(self.labelnames, labels)} {_number(value)}")
+        return lines
+
+
+class Gauge(Counter):
+    """
+    Valor que sube y baja (requests en curso).
+    """
+
+    kind = "gauge"
+
+    def dec(self, labels: tuple = (), amount: float = 1) -> None:
+        self.inc(labels, -amount)
+
+
+class Histogram(_Metric):
+    """
+    Distribución por buckets acumulativos (`le`), más suma y cuenta.
+    """
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = (), buckets: tuple = ()):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(float(bound) for bound in buckets))
+
+    def observe(self, labels: tuple, value: float) -> None:
+        # [cuenta por bucket..., cuenta +Inf, suma]; no acumulativo aquí
+        index = bisect_left(self.buckets, value)
+        stripe = self._stripes[_stripe_index()]
+        with stripe.lock:
+            counts = stripe.values.get(labels)
+            if counts is None:
+                counts = stripe.values[labels] = [0] * (len(self.buckets) + 2)
+            counts[index] += 1
+            counts[-1] += value
+
+    @staticmethod
+    def _copy(value):
+        return list(value)
+
+    def values(self) -> dict[tuple, list]:
+        totals: dict[tuple, list] = {}
+        for values in self._snapshot():
+            for labels, counts in values.items():
+                merged = totals.get(labels)
+                if merged is None:
+                    totals[labels] = counts
+                else:
+                    for i, count in enumerate(counts):
+                        merged[i] += count
+        return totals
+
+    def render(self) -> list[str]:
+        lines = self._header()
+        for labels, counts in sorted(self.values().items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else _number(bound)
+                bucket_labels = _labels(self.labelnames, labels, f'le="{le}"')
+                lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+            suffix = _labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{suffix} {_number(round(counts[-1], 6))}")
+            lines.append(f"{self.name}_count{suffix} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Conjunto de métricas del proceso y su exposición en texto.
+    """
+
+    CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(self):
+        self._metrics: dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric already registered: {metric.name}")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: tuple = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: tuple = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: tuple = (), buckets: tuple = ()) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def reset(self) -> None:
+        """
+        Pone a cero todas las métricas (nueva app / tests).
+        """
+        for metric in list(self._metrics.values()):
+            metric.reset()
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for metric in list(self._metrics.values()):
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+# ------------------------------------------------------------
+# INSTANCIA EXPORTADA (OBLIGATORIA)
+# ------------------------------------------------------------
+metrics_registry = MetricsRegistry()
+
+# /src/app/core/metrics/registry.py
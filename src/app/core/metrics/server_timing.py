@@ -0,0 +1,244 @@
+# /src/app/core/metrics/server_timing.py
+"""
+Server-Timing — v3.0
+
+Cabecera `Server-Timing` con el desglose del tiempo de cada request
+por capa, para el trabajo de rendimiento del frontend:
+
+    Server-Timing: auth;dur=0.4, controller;dur=7.9, service;dur=6.8,
+                   stock;dur=2.1, cash;dur=0.9, db;dur=3.2;desc="14 queries",
+                   serialize;dur=0.6, total;dur=9.1
+
+Activación (opt-in):
+- settings.SERVER_TIMING_ENABLED: en todas las respuestas.
+- settings.SERVER_TIMING_ADMIN_HEADER: un administrador lo pide por
+  request con la cabecera `X-Server-Timing: 1`.
+
+Medición (temporizadores por hilo, solo mientras hay un request medido):
+- auth: middleware validate_jwt (security.middleware)
+- controller: vista de Flask (instrument(app) envuelve view_functions)
+- service: métodos públicos del service de cada controller
+- stock / cash: StockMovementsService / CashMovementsService
+- db: duración de cada sentencia del engine principal, medida una sola
+  vez por core.metrics.instrumentation (observe_query)
+- serialize: to_dict() de los modelos y codificación JSON (app.json)
+- total: desde el primer before_request hasta after_request
+
+IMPORTANTE:
+- Las capas se anidan: controller incluye service, service incluye
+  stock / cash / db. Cada nombre cuenta solo su llamada más externa
+  (un service que llama a otro no suma dos veces).
+- Sin request medido, cada llamada envuelta cuesta una lectura de una
+  variable del hilo.
+"""
+
+from __future__ import annotations
+
+import functools
+import threading
+import time
+from contextlib import contextmanager
+
+from flask import g, request
+from flask.json.provider import DefaultJSONProvider
+from src.app.core.config.settings import settings
+from src.app.core.enum import UserRole
+from src.app.core.metrics.layers import instrument_layers
+
+REQUEST_HEADER = "X-Server-Timing"
+RESPONSE_HEADER = "Server-Timing"
+
+# Orden de salida en la cabecera
+LAYERS = ("auth", "controller", "service", "stock", "cash", "db", "serialize")
+
+_INSTRUMENTED = "_server_timing_layer"
+
+# Request medido en curso (por hilo; g no existe en los eventos del engine)
+_local = threading.local()
+
+
+class ServerTiming:
+    """
+    Temporizadores por capa del request en curso.
+    """
+
+    # ------------------------------------------------------------
+    # CICLO DEL REQUEST
+    # ------------------------------------------------------------
+    def start(self) -> None:
+        _local.timings = {}
+        _local.open = set()
+        _local.queries = 0
+        _local.started = time.perf_counter()
+
+    def stop(self) -> dict | None:
+        """
+        Termina la medición; devuelve {capa: segundos} (None si no había).
+        """
+        timings = getattr(_local, "timings", None)
+        if timings is not None:
+            timings["total"] = time.perf_counter() - _local.started
+        _local.timings = None
+        return timings
+
+    @property
+    def active(self) -> bool:
+        return getattr(_local, "timings", None) is not None
+
+    def add(self, layer: str, seconds: float) -> None:
+        timings = getattr(_local, "timings", None)
+        if timings is not None:
+            timings[layer] = timings.get(layer, 0.0) + seconds
+
+    # ------------------------------------------------------------
+    # TEMPORIZADORES
+    # ------------------------------------------------------------
+    def timed(self, layer: str):
+        """
+        Decorador: suma la duración de la llamada a `layer` (solo la
+        llamada más externa de esa capa).
+        """
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                timings = getattr(_local, "timings", None)
+                if timings is None or layer in _local.open:
+                    return func(*args, **kwargs)
+
+                _local.open.add(layer)
+                started = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    _local.open.discard(layer)
+                    timings[layer] = timings.get(layer, 0.0) + time.perf_counter() - started
+
+            return wrapper
+        return decorator
+
+    @contextmanager
+    def timer(self, layer: str):
+        """
+        Igual que timed(), como bloque with.
+        """
+        timings = getattr(_local, "timings", None)
+        if timings is None or layer in _local.open:
+            yield
+            return
+
+        _local.open.add(layer)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            _local.open.discard(layer)
+            timings[layer] = timings.get(layer, 0.0) + time.perf_counter() - started
+
+    # ------------------------------------------------------------
+    # INSTRUMENTACIÓN DE CAPAS EXISTENTES
+    # ------------------------------------------------------------
+    def instrument(self, app) -> None:
+        """
+        Envuelve vistas, services, movimientos y serialización de modelos
+        (core.metrics.layers).
+
+        DEBE llamarse con TODAS las rutas ya registradas.
+        """
+        if not (settings.SERVER_TIMING_ENABLED or settings.SERVER_TIMING_ADMIN_HEADER):
+            return
+        instrument_layers(app, lambda layer, name, func: self.timed(layer)(func), _INSTRUMENTED)
+
+    # ------------------------------------------------------------
+    # CONSULTAS (core.metrics.instrumentation)
+    # ------------------------------------------------------------
+    def observe_query(self, seconds: float) -> None:
+        """
+        Sentencia terminada (o fallida) y su duración en segundos.
+        """
+        if getattr(_local, "timings", None) is not None:
+            self.add("db", seconds)
+            _local.queries += 1
+
+    # ------------------------------------------------------------
+    # CABECERA
+    # ------------------------------------------------------------
+    @staticmethod
+    def format(timings: dict, queries: int) -> str:
+        parts = []
+        for layer in LAYERS + ("total",):
+            if layer not in timings:
+                continue
+            entry = f"{layer};dur={timings[layer] * 1000:.1f}"
+            if layer == "db":
+                entry += f';desc="{queries} queries"'
+            parts.append(entry)
+        return ", ".join(parts)
+
+
+class TimedJSONProvider(DefaultJSONProvider):
+    """
+    Proveedor JSON de Flask que mide la codificación (capa serialize).
+    """
+
+    def dumps(self, obj, **kwargs) -> str:
+        with server_timing.timer("serialize"):
+            return super().dumps(obj, **kwargs)
+
+
+# ------------------------------------------------------------
+# INSTANCIA EXPORTADA (OBLIGATORIA)
+# ------------------------------------------------------------
+server_timing = ServerTiming()
+
+
+# ============================================================
+# REGISTRO EN FLASK
+# ============================================================
+
+def _requested() -> bool:
+    if settings.SERVER_TIMING_ENABLED:
+        return True
+    return settings.SERVER_TIMING_ADMIN_HEADER and request.headers.get(REQUEST_HEADER) == "1"
+
+
+def _allowed() -> bool:
+    if settings.SERVER_TIMING_ENABLED:
+        return True
+    user = g.get("current_user")
+    return user is not None and user.rol == UserRole.ADMIN
+
+
+def register_server_timing(app) -> None:
+    """
+    Registra la medición por request y el proveedor JSON medido.
+
+    DEBE registrarse antes que el middleware JWT (mide validate_jwt).
+    Tras registrar las rutas, llamar a server_timing.instrument(app).
+
+    :param app: instancia de Flask.
+    """
+    if not (settings.SERVER_TIMING_ENABLED or settings.SERVER_TIMING_ADMIN_HEADER):
+        return
+
+    app.json = TimedJSONProvider(app)
+
+    @app.before_request
+    def start_server_timing():
+        # El contexto g puede sobrevivir entre requests (app context externo)
+        g.pop("current_user", None)
+        if _requested():
+            server_timing.start()
+
+    @app.after_request
+    def add_server_timing(response):
+        queries = getattr(_local, "queries", 0)
+        timings = server_timing.stop()
+        if timings is not None and _allowed():
+            response.headers[RESPONSE_HEADER] = server_timing.format(timings, queries)
+        return response
+
+    @app.teardown_request
+    def stop_server_timing(exception=None):
+        server_timing.stop()
+
+# /src/app/core/metrics/server_timing.py
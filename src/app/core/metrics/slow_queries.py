@@ -0,0 +1,239 @@
+# /src/app/core/metrics/slow_queries.py
+"""
+Slow query log — v3.0
+
+Registro de las sentencias SQL del engine principal que superan
+settings.SLOW_QUERY_THRESHOLD_MS.
+
+Por cada ejecución lenta se escribe en logs/slow_queries.log (fichero
+propio y rotado, fuera de app.log):
+- duración, SQL y parámetros REDACTADOS (texto → <str:N>; solo se
+  muestran números, booleanos y NULL)
+- método que la originó (primer frame de services, o de la app)
+- EXPLAIN QUERY PLAN: una sola vez por sentencia distinta
+
+Además se acumulan estadísticas por sentencia (llamadas, tiempo total,
+máximo) para el top-N de GET /api/admin/slow-queries.
+
+Coste:
+- Todas las sentencias: una comparación (la duración la mide una sola
+  vez core.metrics.instrumentation y la entrega a observe()).
+- Solo las lentas: stack walk, redacción, lock y escritura del log.
+
+IMPORTANTE:
+- El plan se obtiene con un cursor propio de la MISMA conexión DBAPI
+  (sin eventos de SQLAlchemy ni transacción nueva).
+- Las estadísticas son por proceso y se limitan a
+  SLOW_QUERY_MAX_STATEMENTS sentencias (se descarta la de menor tiempo).
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import sys
+import threading
+from datetime import datetime, timezone
+
+from src.app.core.config.settings import settings
+from src.app.core.logging import get_dedicated_logger
+from src.app.core.utils.datetime_utils import dt_to_iso_z
+
+SLOW_QUERIES_LOG = "slow_queries.log"
+
+_EXPLAINABLE = ("SELECT", "INSERT", "UPDATE", "DELETE", "WITH", "REPLACE")
+_MAX_CALLER_DEPTH = 60
+
+logger = get_dedicated_logger("slow_queries", SLOW_QUERIES_LOG)
+
+
+# ============================================================
+# HELPERS
+# ============================================================
+
+def _redact_value(value):
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    if isinstance(value, str):
+        return f"<str:{len(value)}>"
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return f"<bytes:{len(value)}>"
+    return f"<{type(value).__name__}>"
+
+
+def redact_parameters(parameters, executemany: bool = False):
+    """
+    Parámetros sin valores de texto (pueden contener datos personales
+    o hashes); con executemany, número de filas y la primera redactada.
+    """
+    if executemany:
+        rows = list(parameters or ())
+        return {"rows": len(rows), "first": redact_parameters(rows[0]) if rows else None}
+    if isinstance(parameters, dict):
+        return {key: _redact_value(value) for key, value in parameters.items()}
+    return [_redact_value(value) for value in (parameters or ())]
+
+
+def _caller() -> str:
+    """
+    Método que originó la sentencia: el primer frame de un service o,
+    si no hay, el primero de la app fuera de la infraestructura.
+    """
+    frame = sys._getframe(2)
+    fallback = None
+    for _ in range(_MAX_CALLER_DEPTH):
+        if frame is None:
+            break
+        module = frame.f_globals.get("__name__", "")
+        if module.startswith("src.app.services."):
+            return f"{module}:{frame.f_code.co_qualname}"
+        if (
+            fallback is None
+            and module.startswith("src.app.")
+            and not module.startswith(("src.app.core.", "src.app.db."))
+        ):
+            fallback = f"{module}:{frame.f_code.co_qualname}"
+        frame = frame.f_back
+    return fallback or "unknown"
+
+
+def _explain(cursor, statement: str, parameters, executemany: bool) -> list[str] | None:
+    """
+    EXPLAIN QUERY PLAN como árbol indentado (None si no aplica).
+    """
+    if not statement.lstrip().upper().startswith(_EXPLAINABLE):
+        return None
+    if executemany:
+        parameters = next(iter(parameters or ()), ())
+
+    try:
+        explain = cursor.connection.cursor()
+        try:
+            rows = explain.execute(f"EXPLAIN QUERY PLAN {statement}", parameters or ()).fetchall()
+        finally:
+            explain.close()
+    except sqlite3.Error as exc:
+        return [f"<unavailable: {exc}>"]
+
+    depth = {0: -1}
+    lines = []
+    for node, parent, _, detail in rows:
+        depth[node] = depth.get(parent, -1) + 1
+        lines.append("  " * depth[node] + detail)
+    return lines
+
+
+# ============================================================
+# REGISTRO
+# ============================================================
+
+class SlowQueryLog:
+    """
+    Estadísticas por sentencia y escritura de slow_queries.log.
+    """
+
+    def __init__(self, max_statements: int):
+        self.max_statements = max_statements
+        self._lock = threading.Lock()
+        self._statements: dict[str, dict] = {}
+        self.recorded = 0
+        self.evicted = 0
+
+    # ------------------------------------------------------------
+    # SENTENCIAS EJECUTADAS (core.metrics.instrumentation)
+    # ------------------------------------------------------------
+    def observe(self, cursor, statement: str, parameters, executemany: bool, elapsed: float) -> None:
+        """
+        Sentencia terminada y su duración en segundos.
+        """
+        elapsed_ms = elapsed * 1000
+        if settings.SLOW_QUERY_ENABLED and elapsed_ms >= settings.SLOW_QUERY_THRESHOLD_MS:
+            self.record(cursor, statement, parameters, executemany, elapsed_ms)
+
+    # ------------------------------------------------------------
+    # SENTENCIAS LENTAS
+    # ------------------------------------------------------------
+    def record(self, cursor, statement: str, parameters, executemany: bool, elapsed_ms: float) -> None:
+        caller = _caller()
+        now = dt_to_iso_z(datetime.now(timezone.utc))
+
+        with self._lock:
+            entry = self._statements.get(statement)
+            first_seen = entry is None
+            if first_seen:
+                self._evict()
+                entry = self._statements[statement] = {
+                    "sql": statement,
+                    "calls": 0,
+                    "total_ms": 0.0,
+                    "max_ms": 0.0,
+                    "plan": None,
+                }
+            entry["calls"] += 1
+            entry["total_ms"] += elapsed_ms
+            entry["max_ms"] = max(entry["max_ms"], elapsed_ms)
+            entry["caller"] = caller
+            entry["last_seen"] = now
+            self.recorded += 1
+
+        message = (
+            f"{elapsed_ms:.1f} ms | {caller} | {' '.join(statement.split())}"
+            f" | params={redact_parameters(parameters, executemany)}"
+        )
+        if first_seen:
+            # Un plan por sentencia distinta (fuera del lock: ejecuta SQL)
+            plan = _explain(cursor, statement, parameters, executemany)
+            entry["plan"] = plan
+            if plan:
+                message += "\n    QUERY PLAN\n" + "\n".join(f"    {line}" for line in plan)
+        logger.warning(message)
+
+    def _evict(self) -> None:
+        if len(self._statements) >= self.max_statements:
+            victim = min(self._statements.values(), key=lambda item: item["total_ms"])
+            del self._statements[victim["sql"]]
+            self.evicted += 1
+
+    # ------------------------------------------------------------
+    # CONSULTA
+    # ------------------------------------------------------------
+    def top(self, limit: int) -> dict:
+        """
+        Sentencias lentas ordenadas por tiempo total (mayor primero).
+        """
+        with self._lock:
+            entries = sorted(self._statements.values(), key=lambda item: item["total_ms"], reverse=True)[:limit]
+            statements = [
+                {
+                    "sql": entry["sql"],
+                    "calls": entry["calls"],
+                    "total_ms": round(entry["total_ms"], 1),
+                    "avg_ms": round(entry["total_ms"] / entry["calls"], 1),
+                    "max_ms": round(entry["max_ms"], 1),
+                    "caller": entry["caller"],
+                    "last_seen": entry["last_seen"],
+                    "plan": entry["plan"],
+                }
+                for entry in entries
+            ]
+            return {
+                "enabled": settings.SLOW_QUERY_ENABLED,
+                "threshold_ms": settings.SLOW_QUERY_THRESHOLD_MS,
+                "recorded": self.recorded,
+                "distinct": len(self._statements),
+                "evicted": self.evicted,
+                "statements": statements,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._statements.clear()
+            self.recorded = 0
+            self.evicted = 0
+
+
+# ------------------------------------------------------------
+# INSTANCIA EXPORTADA (OBLIGATORIA)
+# ------------------------------------------------------------
+slow_query_log = SlowQueryLog(settings.SLOW_QUERY_MAX_STATEMENTS)
+
+# /src/app/core/metrics/slow_queries.py
@@ -0,0 +1,25 @@
+# /src/app/core/tracing/__init__.py
+"""
+Core tracing package — v3.0
+
+Trazas locales por capa (router → controller → service → movimientos
+→ SQL) con el modelo de datos de OpenTelemetry, sin colector.
+
+Expone:
+- tracer: fachada de spans (start_as_current_span, traced)
+- ring_buffer_exporter: trazas recientes (GET /api/admin/traces)
+- register_tracing / instrument_tracing: registro en Flask y capas
+"""
+
+from .exporters import ring_buffer_exporter
+from .instrumentation import instrument_tracing, register_tracing
+from .tracer import tracer
+
+__all__ = [
+    "instrument_tracing",
+    "register_tracing",
+    "ring_buffer_exporter",
+    "tracer",
+]
+
+# /src/app/core/tracing/__init__.py
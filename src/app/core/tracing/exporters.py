@@ -0,0 +1,100 @@
+# /src/app/core/tracing/exporters.py
+"""
+Trace exporters — v3.0
+
+Destinos locales de las trazas (sin colector):
+
+- RingBufferExporter: últimas TRACING_BUFFER_TRACES trazas en memoria,
+  consultables en GET /api/admin/traces.
+- JsonlExporter: un span por línea en TRACING_JSONL_PATH, escrito en
+  lotes por un hilo de fondo (db.write_behind): el request no espera
+  a la E/S. Rota a <fichero>.1 al superar TRACING_JSONL_MAX_BYTES.
+
+El formato de cada span es el de Span.to_dict() (campos del modelo de
+OpenTelemetry: trace_id, span_id, parent_span_id, kind, status...).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from collections import deque
+
+from src.app.core.config.settings import settings
+from src.app.db.write_behind import WriteBehindBuffer
+
+
+class RingBufferExporter:
+    """
+    Trazas recientes en memoria (las más antiguas se descartan).
+    """
+
+    def __init__(self, size: int):
+        self._traces: deque = deque(maxlen=max(1, size))
+
+    def export(self, record: dict) -> None:
+        self._traces.append(record)
+
+    def query(self, limit: int, trace_id: str | None = None, min_ms: float | None = None) -> list[dict]:
+        """
+        Trazas más recientes primero, con filtros opcionales.
+        """
+        result = []
+        for record in reversed(list(self._traces)):
+            if trace_id is not None and record["trace_id"] != trace_id:
+                continue
+            if min_ms is not None and record["duration_ms"] < min_ms:
+                continue
+            result.append(record)
+            if len(result) >= limit:
+                break
+        return result
+
+    def clear(self) -> None:
+        self._traces.clear()
+
+    def stats(self) -> dict:
+        return {"buffered": len(self._traces), "capacity": self._traces.maxlen}
+
+
+class JsonlExporter:
+    """
+    Spans en un fichero JSONL local (volcado en lotes).
+    """
+
+    def __init__(self, path: str, max_bytes: int):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.buffer = WriteBehindBuffer(
+            name="traces",
+            writer=self._write,
+            flush_seconds=settings.WRITE_BEHIND_FLUSH_SECONDS,
+            flush_events=settings.WRITE_BEHIND_FLUSH_EVENTS,
+            max_pending=settings.WRITE_BEHIND_MAX_PENDING,
+        )
+
+    def export(self, record: dict) -> None:
+        for span in record["spans"]:
+            self.buffer.add(span)
+
+    def _write(self, spans: list[dict]) -> None:
+        data = "".join(json.dumps(span, ensure_ascii=False, default=str) + "\n" for span in spans)
+        with self._lock:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            if os.path.exists(self.path) and os.path.getsize(self.path) >= self.max_bytes:
+                os.replace(self.path, self.path + ".1")
+            with open(self.path, "a", encoding="utf-8") as handle:
+                handle.write(data)
+
+    def flush(self) -> int:
+        return self.buffer.flush()
+
+
+# ------------------------------------------------------------
+# INSTANCIA EXPORTADA (OBLIGATORIA)
+# ------------------------------------------------------------
+ring_buffer_exporter = RingBufferExporter(settings.TRACING_BUFFER_TRACES)
+
+# /src/app/core/tracing/exporters.py
@@ -0,0 +1,214 @@
+# /src/app/core/tracing/instrumentation.py
+"""
+Tracing instrumentation — v3.0
+
+Spans por capa de cada request muestreado:
+
+    GET /api/purchase_notes/<int:id>/confirm            SERVER (router)
+    ├── auth.validate_jwt
+    ├── PurchaseNotesController.confirm                  controller
+    │   └── PurchaseNotesService.confirm                 service
+    │       ├── SELECT purchase_notes                    CLIENT (SQL)
+    │       ├── StockMovementsService.apply_movement     movement
+    │       │   └── UPDATE stock_product_locations       CLIENT (SQL)
+    │       └── ...
+
+- Raíz: before_request / teardown_request (atributos http.*, ruta
+  de Flask, no la URL con ids, como nombre).
+- Capas: core.metrics.layers (controller, service, movimientos stock
+  y cash); to_dict() no genera spans.
+- SQL: eventos before/after_cursor_execute y handle_error del engine
+  principal (db.system, db.operation, db.statement).
+- Respuesta: cabecera X-Trace-Id de las trazas muestreadas.
+
+Con TRACING_ENABLED=false no se registra ni se envuelve nada.
+"""
+
+from __future__ import annotations
+
+from flask import request
+from sqlalchemy import event
+
+from src.app.core.config.database import engine
+from src.app.core.config.settings import settings
+from src.app.core.metrics.layers import instrument_layers
+from src.app.core.tracing.exporters import JsonlExporter, ring_buffer_exporter
+from src.app.core.tracing.tracer import (
+    SPAN_KIND_CLIENT,
+    SPAN_KIND_INTERNAL,
+    SPAN_KIND_SERVER,
+    STATUS_ERROR,
+    tracer,
+)
+
+TRACE_ID_HEADER = "X-Trace-Id"
+MAX_STATEMENT_CHARS = 2000
+
+_INSTRUMENTED = "_tracing_layer"
+_SPAN_KEY = "tracing_spans"
+
+# Atributo "layer" de cada span por capa de core.metrics.layers
+_LAYER_NAMES = {
+    "controller": "controller",
+    "service": "service",
+    "stock": "movement",
+    "cash": "movement",
+}
+
+_jsonl_exporters: dict[str, JsonlExporter] = {}
+_sql_listeners = False
+
+
+# ============================================================
+# CAPAS
+# ============================================================
+
+def _wrap_layer(layer: str, name: str, func):
+    span_layer = _LAYER_NAMES.get(layer)
+    if span_layer is None:
+        return func
+    return tracer.traced(name, SPAN_KIND_INTERNAL, {"layer": span_layer})(func)
+
+
+def instrument_tracing(app) -> None:
+    """
+    Envuelve las capas con spans (con TODAS las rutas registradas).
+
+    :param app: instancia de Flask.
+    """
+    if not settings.TRACING_ENABLED:
+        return
+    instrument_layers(app, _wrap_layer, _INSTRUMENTED)
+
+
+# ============================================================
+# SQL (EVENTOS DEL ENGINE)
+# ============================================================
+
+def _table_name(context) -> str | None:
+    """
+    Tabla principal de la sentencia compilada (None en SQL textual).
+    """
+    statement = getattr(getattr(context, "compiled", None), "statement", None)
+    table = getattr(statement, "table", None)
+    if table is None and hasattr(statement, "get_final_froms"):
+        froms = statement.get_final_froms()
+        table = froms[0] if froms else None
+    return getattr(table, "name", None)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if tracer.current_trace_id() is None:
+        return
+    operation = statement.split(None, 1)[0].upper() if statement.strip() else "SQL"
+    table = _table_name(context)
+    span = tracer.start_span(
+        f"{operation} {table}" if table else operation,
+        SPAN_KIND_CLIENT,
+        {
+            "db.system": "sqlite",
+            "db.operation": operation,
+            "db.statement": statement[:MAX_STATEMENT_CHARS],
+            "db.executemany": bool(executemany),
+        },
+    )
+    conn.info.setdefault(_SPAN_KEY, []).append(span)
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    spans = conn.info.get(_SPAN_KEY)
+    if spans:
+        span = spans.pop()
+        if cursor.rowcount is not None and cursor.rowcount >= 0:
+            span.set_attribute("db.rowcount", cursor.rowcount)
+        span.end()
+
+
+def _handle_error(exception_context) -> None:
+    conn = exception_context.connection
+    spans = conn.info.get(_SPAN_KEY) if conn is not None else None
+    if spans:
+        span = spans.pop()
+        span.record_exception(exception_context.original_exception)
+        span.end()
+
+
+def _listen_sql() -> None:
+    global _sql_listeners
+    if _sql_listeners:
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+    _sql_listeners = True
+
+
+# ============================================================
+# REQUESTS
+# ============================================================
+
+def _start_trace() -> None:
+    rule = request.url_rule.rule if request.url_rule is not None else "unmatched"
+    tracer.start_trace(
+        f"{request.method} {rule}",
+        SPAN_KIND_SERVER,
+        {
+            "http.method": request.method,
+            "http.route": rule,
+            "http.target": request.full_path.rstrip("?"),
+            "flask.endpoint": request.endpoint,
+        },
+        traceparent=request.headers.get("traceparent"),
+    )
+
+
+def _finish_response(response):
+    trace_id = tracer.current_trace_id()
+    if trace_id is not None:
+        root = tracer.root_span()
+        root.set_attribute("http.status_code", response.status_code)
+        if response.status_code >= 500:
+            root.set_status(STATUS_ERROR)
+        response.headers[TRACE_ID_HEADER] = trace_id
+    return response
+
+
+def _end_trace(exception=None) -> None:
+    if exception is not None and tracer.current_trace_id() is not None:
+        tracer.root_span().record_exception(exception)
+    tracer.end_trace()
+
+
+# ============================================================
+# REGISTRO EN FLASK
+# ============================================================
+
+def register_tracing(app) -> None:
+    """
+    Registra la traza por request, los spans SQL y los exporters.
+
+    DEBE registrarse antes que el middleware JWT (span de validate_jwt).
+    Tras registrar las rutas, llamar a instrument_tracing(app).
+
+    :param app: instancia de Flask.
+    """
+    if not settings.TRACING_ENABLED:
+        return
+
+    ring_buffer_exporter.clear()
+    exporters = [ring_buffer_exporter]
+
+    path = settings.TRACING_JSONL_PATH
+    if path:
+        if path not in _jsonl_exporters:
+            _jsonl_exporters[path] = JsonlExporter(path, settings.TRACING_JSONL_MAX_BYTES)
+        exporters.append(_jsonl_exporters[path])
+    tracer.set_exporters(exporters)
+
+    _listen_sql()
+
+    app.before_request(_start_trace)
+    app.after_request(_finish_response)
+    app.teardown_request(_end_trace)
+
+# /src/app/core/tracing/instrumentation.py
@@ -0,0 +1,343 @@
+# /src/app/core/tracing/tracer.py
+"""
+Tracer — v3.0
+
+Fachada de trazas con el modelo de datos de OpenTelemetry (trace_id de
+128 bits, span_id de 64 bits, kind, status, atributos, eventos) y una
+API del mismo estilo:
+
+    with tracer.start_as_current_span("PurchaseNotesService.confirm") as span:
+        span.set_attribute("note.id", note_id)
+
+    @tracer.traced("auth.validate_jwt")
+    def validate_jwt(): ...
+
+Contexto:
+- Una traza por request, en variables del hilo (pila de spans activos).
+- Sin traza activa (request no muestreado, hilo de fondo) se devuelve
+  NOOP_SPAN: el coste es una lectura de una variable del hilo.
+- Muestreo en la raíz (TRACING_SAMPLE_RATE). Un `traceparent` W3C
+  entrante continúa su traza y respeta su decisión de muestreo.
+
+Al cerrar la raíz, la traza completa se entrega a los exporters
+(core.tracing.exporters).
+
+IMPORTANTE:
+- Máximo TRACING_MAX_SPANS spans por traza; el resto se cuentan como
+  descartados (dropped_spans).
+"""
+
+from __future__ import annotations
+
+import functools
+import os
+import random
+import re
+import threading
+import time
+from contextlib import contextmanager
+
+from src.app.core.config.settings import settings
+
+SPAN_KIND_SERVER = "SERVER"
+SPAN_KIND_INTERNAL = "INTERNAL"
+SPAN_KIND_CLIENT = "CLIENT"
+
+STATUS_UNSET = "UNSET"
+STATUS_OK = "OK"
+STATUS_ERROR = "ERROR"
+
+_TRACEPARENT = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+
+# Traza en curso del hilo
+_local = threading.local()
+
+
+def _new_id(size: int) -> str:
+    return os.urandom(size).hex()
+
+
+def parse_traceparent(value: str | None) -> tuple[str, str, bool] | None:
+    """
+    Cabecera W3C traceparent → (trace_id, parent_span_id, sampled).
+    """
+    if not value:
+        return None
+    match = _TRACEPARENT.match(value.strip().lower())
+    if match is None:
+        return None
+    trace_id, parent_id, flags = match.groups()
+    if trace_id == "0" * 32 or parent_id == "0" * 16:
+        return None
+    return trace_id, parent_id, bool(int(flags, 16) & 1)
+
+
+class Span:
+    """
+    Span grabado (campos del modelo de OpenTelemetry).
+    """
+
+    __slots__ = (
+        "trace_id", "span_id", "parent_span_id", "name", "kind",
+        "start_ns", "end_ns", "attributes", "status", "status_message", "events",
+    )
+
+    def __init__(self, trace_id: str, parent_span_id: str | None, name: str, kind: str, attributes: dict | None):
+        self.trace_id = trace_id
+        self.span_id = _new_id(8)
+        self.parent_span_id = parent_span_id
+        self.name = name
+        self.kind = kind
+        self.start_ns = time.time_ns()
+        self.end_ns: int | None = None
+        self.attributes = dict(attributes) if attributes else {}
+        self.status = STATUS_UNSET
+        self.status_message: str | None = None
+        self.events: list[dict] = []
+
+    def is_recording(self) -> bool:
+        return self.end_ns is None
+
+    def set_attribute(self, key: str, value) -> None:
+        self.attributes[key] = value
+
+    def set_attributes(self, attributes: dict) -> None:
+        self.attributes.update(attributes)
+
+    def set_status(self, status: str, description: str | None = None) -> None:
+        self.status = status
+        self.status_message = description
+
+    def record_exception(self, exc: BaseException) -> None:
+        self.events.append({
+            "name": "exception",
+            "time_unix_nano": time.time_ns(),
+            "attributes": {
+                "exception.type": type(exc).__name__,
+                "exception.message": str(exc),
+            },
+        })
+        self.set_status(STATUS_ERROR, str(exc))
+
+    def end(self) -> None:
+        if self.end_ns is None:
+            self.end_ns = time.time_ns()
+
+    def to_dict(self) -> dict:
+        end_ns = self.end_ns or time.time_ns()
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_span_id": self.parent_span_id,
+            "name": self.name,
+            "kind": self.kind,
+            "start_time_unix_nano": self.start_ns,
+            "end_time_unix_nano": end_ns,
+            "duration_ms": round((end_ns - self.start_ns) / 1_000_000, 3),
+            "status": {"code": self.status, "message": self.status_message},
+            "attributes": self.attributes,
+            "events": self.events,
+        }
+
+
+class _NoopSpan:
+    """
+    Span sin grabación (traza no muestreada o sin traza).
+    """
+
+    __slots__ = ()
+
+    def is_recording(self) -> bool:
+        return False
+
+    def set_attribute(self, key, value) -> None:
+        pass
+
+    def set_attributes(self, attributes) -> None:
+        pass
+
+    def set_status(self, status, description=None) -> None:
+        pass
+
+    def record_exception(self, exc) -> None:
+        pass
+
+    def end(self) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class _Trace:
+    __slots__ = ("trace_id", "root", "spans", "stack", "dropped")
+
+    def __init__(self, trace_id: str):
+        self.trace_id = trace_id
+        self.root: Span | None = None
+        self.spans: list[Span] = []
+        self.stack: list[Span] = []
+        self.dropped = 0
+
+
+class Tracer:
+    """
+    Creación de spans sobre la traza del hilo y entrega a los exporters.
+    """
+
+    def __init__(self):
+        self._exporters: list = []
+        self.started = 0
+        self.sampled_out = 0
+        self.exported = 0
+
+    def set_exporters(self, exporters: list) -> None:
+        self._exporters = list(exporters)
+
+    # ------------------------------------------------------------
+    # TRAZA (RAÍZ)
+    # ------------------------------------------------------------
+    def start_trace(self, name: str, kind: str = SPAN_KIND_SERVER, attributes: dict | None = None,
+                    traceparent: str | None = None):
+        """
+        Abre la traza del hilo con su span raíz (o NOOP_SPAN si no se
+        muestrea).
+        """
+        _local.trace = None
+        parent = parse_traceparent(traceparent)
+        if parent is not None:
+            trace_id, parent_id, sampled = parent
+        else:
+            trace_id, parent_id = _new_id(16), None
+            sampled = random.random() < settings.TRACING_SAMPLE_RATE
+
+        if not sampled:
+            self.sampled_out += 1
+            return NOOP_SPAN
+
+        self.started += 1
+        trace = _Trace(trace_id)
+        root = Span(trace_id, parent_id, name, kind, attributes)
+        trace.root = root
+        trace.spans.append(root)
+        trace.stack.append(root)
+        _local.trace = trace
+        return root
+
+    def end_trace(self) -> dict | None:
+        """
+        Cierra la traza del hilo y la entrega a los exporters.
+        """
+        trace = getattr(_local, "trace", None)
+        _local.trace = None
+        if trace is None:
+            return None
+
+        for span in trace.spans:
+            span.end()
+        record = self._record(trace)
+        for exporter in self._exporters:
+            exporter.export(record)
+        self.exported += 1
+        return record
+
+    @staticmethod
+    def _record(trace: _Trace) -> dict:
+        root = trace.root
+        spans = [span.to_dict() for span in trace.spans]
+        return {
+            "trace_id": trace.trace_id,
+            "name": root.name,
+            "start_time_unix_nano": root.start_ns,
+            "duration_ms": spans[0]["duration_ms"],
+            "status": root.status,
+            "span_count": len(spans),
+            "dropped_spans": trace.dropped,
+            "spans": spans,
+        }
+
+    def current_trace_id(self) -> str | None:
+        trace = getattr(_local, "trace", None)
+        return trace.trace_id if trace is not None else None
+
+    def root_span(self):
+        trace = getattr(_local, "trace", None)
+        return trace.root if trace is not None else NOOP_SPAN
+
+    # ------------------------------------------------------------
+    # SPANS
+    # ------------------------------------------------------------
+    def start_span(self, name: str, kind: str = SPAN_KIND_INTERNAL, attributes: dict | None = None):
+        """
+        Span hijo del span activo, SIN activarlo (hojas: sentencias SQL).
+        Se cierra con span.end().
+        """
+        trace = getattr(_local, "trace", None)
+        if trace is None:
+            return NOOP_SPAN
+        if len(trace.spans) >= settings.TRACING_MAX_SPANS:
+            trace.dropped += 1
+            return NOOP_SPAN
+
+        span = Span(trace.trace_id, trace.stack[-1].span_id, name, kind, attributes)
+        trace.spans.append(span)
+        return span
+
+    @contextmanager
+    def start_as_current_span(self, name: str, kind: str = SPAN_KIND_INTERNAL, attributes: dict | None = None):
+        """
+        Span hijo del activo, activo dentro del bloque with.
+        """
+        trace = getattr(_local, "trace", None)
+        if trace is None:
+            yield NOOP_SPAN
+            return
+
+        span = self.start_span(name, kind, attributes)
+        if span is NOOP_SPAN:
+            yield span
+            return
+
+        trace.stack.append(span)
+        try:
+            yield span
+        except Exception as exc:
+            span.record_exception(exc)
+            raise
+        finally:
+            trace.stack.pop()
+            span.end()
+
+    def traced(self, name: str, kind: str = SPAN_KIND_INTERNAL, attributes: dict | None = None):
+        """
+        Decorador: un span por llamada (sin traza activa, llamada directa).
+        """
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if getattr(_local, "trace", None) is None:
+                    return func(*args, **kwargs)
+                with self.start_as_current_span(name, kind, attributes):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    # ------------------------------------------------------------
+    # MÉTRICAS
+    # ------------------------------------------------------------
+    def stats(self) -> dict:
+        return {
+            "enabled": settings.TRACING_ENABLED,
+            "sample_rate": settings.TRACING_SAMPLE_RATE,
+            "started": self.started,
+            "sampled_out": self.sampled_out,
+            "exported": self.exported,
+        }
+
+
+# ------------------------------------------------------------
+# INSTANCIA EXPORTADA (OBLIGATORIA)
+# ------------------------------------------------------------
+tracer = Tracer()
+
+# /src/app/core/tracing/tracer.py
@@ -78,4 +78,10 @@ from src.app.models.purchase_note_line import PurchaseNoteLine
 from src.app.models.sales_note import SalesNote
 from src.app.models.sales_note_line import SalesNoteLine
 
+# -----------------
+# TÉCNICAS
+# -----------------
+# Secuencia de cambios por tabla (invalidación de cachés entre procesos)
+from src.app.models.change_log import ChangeLog
+
 # /src/app/db/base.py
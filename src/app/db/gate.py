@@ -0,0 +1,195 @@
+# /src/app/db/gate.py
+"""
+Database gate — v3.0
+
+Control de acceso a la base de datos durante operaciones de
+mantenimiento (sustitución en caliente del fichero, backups.hot_swap).
+
+Estados:
+- open: funcionamiento normal.
+- read_only: los requests de escritura (POST / PUT / PATCH / DELETE)
+  responden 503 al instante; las lecturas siguen funcionando.
+- maintenance: todos los requests nuevos responden 503 (Retry-After) y
+  cualquier hilo que pida una conexión al pool espera a que termine el
+  mantenimiento (salvo el hilo propietario).
+
+Drenaje:
+- Se cuentan las conexiones prestadas por el pool (eventos checkout /
+  checkin del engine): drain() espera a que no quede ninguna.
+- Un hilo que pide conexión en maintenance la cierra ANTES de esperar
+  (una conexión abierta impediría el acceso exclusivo al fichero) y
+  después la descarta (DisconnectionError): el pool abre otra, sobre el
+  fichero nuevo si ha cambiado.
+
+IMPORTANTE:
+- register_database_gate(app) DEBE registrarse antes que cualquier otro
+  before_request que lea la base de datos.
+- El estado es por proceso.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+from flask import request
+from sqlalchemy import event
+from sqlalchemy.exc import DisconnectionError
+
+from src.app.core.config.database import engine
+from src.app.core.exceptions import ServiceUnavailableException
+from src.app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+_SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+_COUNTED_KEY = "gate_counted"
+
+
+class DatabaseGate:
+    """
+    Estado de mantenimiento y contador de conexiones en uso.
+    """
+
+    OPEN = "open"
+    READ_ONLY = "read_only"
+    MAINTENANCE = "maintenance"
+
+    def __init__(self, checkout_wait_seconds: float = 30.0):
+        self.checkout_wait_seconds = checkout_wait_seconds
+
+        self._cond = threading.Condition()
+        self.state = self.OPEN
+        self._owner: int | None = None
+        self._active = 0
+        self.generation = 0
+
+        self.rejected = 0
+        self.waited_checkouts = 0
+
+    # ------------------------------------------------------------
+    # TRANSICIONES
+    # ------------------------------------------------------------
+    def read_only(self) -> None:
+        with self._cond:
+            self.state = self.READ_ONLY
+        logger.warning("Database gate: read-only")
+
+    def maintenance(self) -> None:
+        """
+        Bloquea requests y conexiones nuevas (excepto del hilo actual).
+        """
+        with self._cond:
+            self.state = self.MAINTENANCE
+            self._owner = threading.get_ident()
+        logger.warning("Database gate: maintenance")
+
+    def open(self, swapped: bool = False) -> None:
+        """
+        Reanuda el servicio.
+
+        :param swapped: el fichero de la base de datos ha cambiado
+                        (los hilos en espera descartan su conexión).
+        """
+        with self._cond:
+            if swapped:
+                self.generation += 1
+            self.state = self.OPEN
+            self._owner = None
+            self._cond.notify_all()
+        logger.info("Database gate: open")
+
+    def drain(self, timeout: float) -> bool:
+        """
+        Espera a que no quede ninguna conexión prestada.
+
+        :return: False si se agota `timeout` con conexiones en uso.
+        """
+        with self._cond:
+            return self._cond.wait_for(lambda: self._active == 0, timeout)
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    # ------------------------------------------------------------
+    # REQUESTS
+    # ------------------------------------------------------------
+    def check_request(self) -> None:
+        """
+        before_request: 503 durante el mantenimiento.
+        """
+        state = self.state
+        if state == self.OPEN:
+            return
+        if state == self.READ_ONLY and request.method in _SAFE_METHODS:
+            return
+
+        self.rejected += 1
+        if state == self.MAINTENANCE:
+            raise ServiceUnavailableException("Database maintenance in progress", retry_after=1)
+        raise ServiceUnavailableException("Database is read-only during maintenance", retry_after=1)
+
+    # ------------------------------------------------------------
+    # POOL DE CONEXIONES
+    # ------------------------------------------------------------
+    def on_checkout(self, dbapi_connection, connection_record, connection_proxy) -> None:
+        with self._cond:
+            if self.state == self.MAINTENANCE and self._owner != threading.get_ident():
+                dbapi_connection.close()
+                self.waited_checkouts += 1
+                started = time.perf_counter()
+                resumed = self._cond.wait_for(
+                    lambda: self.state != self.MAINTENANCE, self.checkout_wait_seconds
+                )
+                logger.debug(f"Checkout waited {round((time.perf_counter() - started) * 1000, 1)} ms")
+                if not resumed:
+                    raise ServiceUnavailableException("Database maintenance in progress", retry_after=1)
+                # Conexión ya cerrada: el pool abre otra
+                raise DisconnectionError("Database maintenance finished")
+
+            connection_record.info[_COUNTED_KEY] = True
+            self._active += 1
+
+    def on_checkin(self, dbapi_connection, connection_record) -> None:
+        with self._cond:
+            if connection_record.info.pop(_COUNTED_KEY, False):
+                self._active -= 1
+                self._cond.notify_all()
+
+    # ------------------------------------------------------------
+    # MÉTRICAS
+    # ------------------------------------------------------------
+    def stats(self) -> dict:
+        return {
+            "state": self.state,
+            "active_connections": self._active,
+            "rejected_requests": self.rejected,
+            "waited_checkouts": self.waited_checkouts,
+            "generation": self.generation,
+        }
+
+
+# ------------------------------------------------------------
+# INSTANCIA EXPORTADA (OBLIGATORIA)
+# ------------------------------------------------------------
+database_gate = DatabaseGate()
+
+# Los eventos del pool sobreviven a engine.dispose() (el pool nuevo hereda los listeners)
+event.listen(engine, "checkout", database_gate.on_checkout)
+event.listen(engine, "checkin", database_gate.on_checkin)
+
+
+# ============================================================
+# REGISTRO EN FLASK
+# ============================================================
+
+def register_database_gate(app) -> None:
+    """
+    Registra el control de mantenimiento al inicio de cada request.
+
+    :param app: instancia de Flask.
+    """
+    app.before_request(database_gate.check_request)
+
+# /src/app/db/gate.py
@@ -0,0 +1,392 @@
+# /src/app/db/replica.py
+"""
+Reporting replica — v3.0
+
+Copia de solo lectura de la base de datos para consultas largas
+(informes), refrescada periódicamente con la API de backup online.
+
+Motivo:
+- Un informe largo sobre database.db mantiene abierta una transacción
+  de lectura: con WAL no bloquea a los escritores, pero impide los
+  checkpoints (el WAL crece) y compite por E/S y caché con las
+  confirmaciones de documentos.
+- Sobre la réplica, los escritores nunca esperan a un informe: la única
+  lectura de la base principal es la copia, por pasos cortos.
+
+Funcionamiento:
+- settings.REPORT_REPLICA_PATH: fichero de la réplica, o ":memory:"
+  (base de datos en memoria compartida del proceso).
+- Refresco: copia completa a un destino NUEVO (fichero .next o base en
+  memoria con otro nombre) y cambio atómico (os.replace / puntero).
+  Los informes en curso terminan sobre la copia anterior (aislamiento
+  por snapshot); los nuevos abren la copia nueva.
+- Engine propio (NullPool, conexiones de solo lectura): cada sesión
+  abre la copia vigente al crearse y lleva su obsolescencia
+  (session.info["staleness"]), tomada junto con la conexión.
+- Hilo de fondo: cada REPORT_REPLICA_REFRESH_SECONDS comprueba la
+  secuencia global de change_log y solo copia si ha avanzado.
+- Varios procesos (workers) con la misma réplica en fichero: el
+  refresco se serializa con un lock de fichero (<réplica>.lock) y cada
+  proceso copia a su propio temporal (<réplica>.<pid>.next). Si otro
+  proceso ya dejó una copia al día, se adopta sin volver a copiar.
+- Tras un restore (reset()) se descarta la copia: el siguiente informe
+  espera a una copia nueva en lugar de leer datos anteriores.
+
+Obsolescencia (status()):
+- refreshed_at / age_seconds: antigüedad de la copia.
+- replica_seq / live_seq / behind: secuencias de change_log de la copia
+  y de la base principal (cuántas escrituras le faltan a la réplica).
+
+IMPORTANTE:
+- La réplica es por proceso y SOLO para lectura (PRAGMA query_only).
+- Los datos pueden ir hasta REPORT_REPLICA_REFRESH_SECONDS por detrás.
+"""
+
+from __future__ import annotations
+
+import itertools
+import os
+from contextlib import contextmanager
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+
+from src.app.backups.online_backup import stepped_copy
+from src.app.core.config.database import engine as live_engine
+from src.app.core.config.settings import settings
+from src.app.core.exceptions import ServiceUnavailableException
+from src.app.core.logging import get_logger
+from src.app.core.utils.datetime_utils import dt_to_iso_z
+from src.app.models.change_log import ChangeLog
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - sin lock entre procesos (Windows)
+    fcntl = None
+
+logger = get_logger(__name__)
+
+MEMORY = ":memory:"
+
+_GLOBAL_SEQ_SQL = "SELECT seq FROM change_log WHERE table_name = ?"
+_memory_names = itertools.count(1)
+
+
+def _global_seq(conn) -> int:
+    row = conn.execute(_GLOBAL_SEQ_SQL, (ChangeLog.GLOBAL_KEY,)).fetchone()
+    return row[0] if row else 0
+
+
+def _file_seq(path: str) -> int | None:
+    """
+    Secuencia global de una copia en disco (None si no hay copia legible).
+    """
+    if not os.path.exists(path):
+        return None
+    try:
+        conn = sqlite3.connect(f"file:{os.path.abspath(path)}?mode=ro", uri=True)
+        try:
+            return _global_seq(conn)
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        return None
+
+
+@contextmanager
+def _process_lock(path: str):
+    """
+    Lock exclusivo entre procesos (flock sobre `path`).
+    """
+    if fcntl is None:
+        yield
+        return
+    with open(path, "a") as handle:
+        fcntl.flock(handle, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+class ReportingReplica:
+    """
+    Réplica de solo lectura refrescada con la API de backup online.
+    """
+
+    def __init__(self, source_path: str):
+        self.source_path = source_path
+
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._uri: str | None = None
+        self._keeper: sqlite3.Connection | None = None
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+        self.replica_seq: int | None = None
+        self.refreshed_at: datetime | None = None
+        self.refreshes = 0
+        self.adopted = 0
+        self.skipped = 0
+        self.failures = 0
+        self.last_refresh_ms = 0.0
+        self.last_error: str | None = None
+
+        # Conexión de solo lectura a la copia vigente al abrir la sesión
+        self.engine = create_engine("sqlite://", creator=self._connect, poolclass=NullPool)
+        self.Session = sessionmaker(bind=self.engine, autoflush=False, autocommit=False)
+
+    # ------------------------------------------------------------
+    # LECTURA
+    # ------------------------------------------------------------
+    def _connect(self) -> sqlite3.Connection:
+        uri = self._uri
+        if uri is None:
+            raise ServiceUnavailableException("Reporting replica not ready", retry_after=1)
+        conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        conn.execute("PRAGMA query_only=ON")
+        return conn
+
+    @contextmanager
+    def session(self):
+        """
+        Sesión ORM sobre la réplica (la crea si aún no existe).
+
+        La conexión se abre al entrar, junto con la obsolescencia de esa
+        misma copia (`session.info["staleness"]`): un refresco posterior
+        no cambia ni los datos ni el sello de la sesión.
+        """
+        self.ensure_ready()
+        with self._lock:
+            connection = self.engine.connect()
+            staleness = self.staleness()
+        try:
+            with self.Session(bind=connection) as session:
+                session.info["staleness"] = staleness
+                yield session
+        finally:
+            connection.close()
+
+    def ensure_ready(self) -> None:
+        """
+        Primera copia síncrona (si no hay ninguna) y arranque del hilo.
+        """
+        if self._uri is None:
+            self.refresh(force=True)
+        self._ensure_thread()
+
+    # ------------------------------------------------------------
+    # REFRESCO
+    # ------------------------------------------------------------
+    def refresh(self, force: bool = False) -> bool:
+        """
+        Copia la base principal si ha cambiado desde la última copia.
+
+        :param force: copiar aunque la secuencia no haya avanzado.
+        :return: True si se ha generado una copia nueva.
+        """
+        with self._refresh_lock:
+            live_seq = self.live_seq()
+            if not force and self._uri is not None and live_seq == self.replica_seq:
+                self.skipped += 1
+                return False
+
+            started = time.perf_counter()
+            try:
+                if settings.REPORT_REPLICA_PATH == MEMORY:
+                    seq = self._refresh_memory()
+                else:
+                    seq = self._refresh_file(settings.REPORT_REPLICA_PATH, live_seq)
+            except Exception as exc:
+                self.failures += 1
+                self.last_error = str(exc)
+                logger.exception("Reporting replica refresh failed")
+                if self._uri is None:
+                    raise ServiceUnavailableException("Reporting replica not available", retry_after=1)
+                return False
+
+            self.refreshes += 1
+            self.last_error = None
+            self.last_refresh_ms = round((time.perf_counter() - started) * 1000, 1)
+            logger.debug(f"Reporting replica refreshed (seq {seq}, {self.last_refresh_ms} ms)")
+            return True
+
+    def _copy_into(self, target: sqlite3.Connection) -> int:
+        """
+        Copia online por pasos (mismos parámetros y límite de reinicios
+        que los backups).
+        """
+        source = sqlite3.connect(f"file:{self.source_path}?mode=ro", uri=True, timeout=5)
+        try:
+            stepped_copy(source, target, settings.BACKUP_PAGES_PER_STEP, settings.BACKUP_STEP_SLEEP_MS)
+        finally:
+            source.close()
+        return _global_seq(target)
+
+    def _refresh_file(self, path: str, live_seq: int) -> int:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+        # Un solo proceso copia a la vez; los demás esperan y adoptan
+        with _process_lock(path + ".lock"):
+            seq = _file_seq(path)
+            if seq is None or seq != live_seq:
+                seq = self._copy_file(path)
+            else:
+                self.adopted += 1
+
+        with self._lock:
+            self._uri = f"file:{os.path.abspath(path)}?mode=ro"
+            self._close_keeper()
+            self._stamp(seq)
+        return seq
+
+    def _copy_file(self, path: str) -> int:
+        # Temporal propio del proceso: nunca se pisa con otro worker
+        next_path = f"{path}.{os.getpid()}.next"
+        if os.path.exists(next_path):
+            os.remove(next_path)
+
+        try:
+            target = sqlite3.connect(next_path)
+            try:
+                seq = self._copy_into(target)
+                target.execute("PRAGMA journal_mode=DELETE")
+            finally:
+                target.close()
+
+            # Los lectores en curso conservan la copia anterior (inodo propio)
+            os.replace(next_path, path)
+        except Exception:
+            if os.path.exists(next_path):
+                os.remove(next_path)
+            raise
+        return seq
+
+    def _refresh_memory(self) -> int:
+        uri = f"file:reporting_replica_{os.getpid()}_{next(_memory_names)}?mode=memory&cache=shared"
+        keeper = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        try:
+            seq = self._copy_into(keeper)
+        except Exception:
+            keeper.close()
+            raise
+
+        # La copia anterior vive mientras algún informe la tenga abierta
+        with self._lock:
+            self._close_keeper()
+            self._keeper, self._uri = keeper, uri
+            self._stamp(seq)
+        return seq
+
+    def _stamp(self, seq: int) -> None:
+        # Bajo self._lock, junto con _uri: sesión y sello de la misma copia
+        self.replica_seq = seq
+        self.refreshed_at = datetime.now(timezone.utc)
+
+    def _close_keeper(self) -> None:
+        if self._keeper is not None:
+            self._keeper.close()
+            self._keeper = None
+
+    def live_seq(self) -> int:
+        """
+        Secuencia global de change_log en la base principal.
+        """
+        with live_engine.connect() as conn:
+            seq = conn.exec_driver_sql(_GLOBAL_SEQ_SQL, (ChangeLog.GLOBAL_KEY,)).scalar()
+        return seq or 0
+
+    # ------------------------------------------------------------
+    # HILO DE FONDO
+    # ------------------------------------------------------------
+    def _ensure_thread(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="reporting-replica", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.wait(settings.REPORT_REPLICA_REFRESH_SECONDS):
+            try:
+                self.refresh()
+            except Exception:
+                # Ya registrado en refresh(); se reintenta en el siguiente ciclo
+                pass
+
+    def stop(self) -> None:
+        """
+        Detiene el hilo de refresco y descarta la copia.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self._thread = None
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Descarta la copia vigente (la base de datos ha sido restaurada):
+        el siguiente informe espera a una copia nueva.
+        """
+        with self._refresh_lock, self._lock:
+            self._close_keeper()
+            self._uri = None
+            self.replica_seq = None
+            self.refreshed_at = None
+
+    # ------------------------------------------------------------
+    # OBSOLESCENCIA
+    # ------------------------------------------------------------
+    def status(self) -> dict:
+        live_seq = self.live_seq()
+        age = (
+            round((datetime.now(timezone.utc) - self.refreshed_at).total_seconds(), 3)
+            if self.refreshed_at else None
+        )
+        return {
+            "mode": "memory" if settings.REPORT_REPLICA_PATH == MEMORY else "file",
+            "ready": self._uri is not None,
+            "refreshed_at": dt_to_iso_z(self.refreshed_at),
+            "age_seconds": age,
+            "replica_seq": self.replica_seq,
+            "live_seq": live_seq,
+            "behind": live_seq - self.replica_seq if self.replica_seq is not None else None,
+            "refresh_seconds": settings.REPORT_REPLICA_REFRESH_SECONDS,
+            "refreshes": self.refreshes,
+            "adopted": self.adopted,
+            "skipped": self.skipped,
+            "failures": self.failures,
+            "last_refresh_ms": self.last_refresh_ms,
+            "last_error": self.last_error,
+        }
+
+    def staleness(self) -> dict:
+        """
+        Resumen para acompañar a cada informe.
+        """
+        return {
+            "as_of": dt_to_iso_z(self.refreshed_at),
+            "age_seconds": (
+                round((datetime.now(timezone.utc) - self.refreshed_at).total_seconds(), 3)
+                if self.refreshed_at else None
+            ),
+            "replica_seq": self.replica_seq,
+        }
+
+
+# ------------------------------------------------------------
+# INSTANCIA EXPORTADA (OBLIGATORIA)
+# ------------------------------------------------------------
+reporting_replica = ReportingReplica(live_engine.url.database)
+
+# /src/app/db/replica.py
@@ -0,0 +1,86 @@
+# /src/app/db/schema.py
+"""
+Schema maintenance — v3.0
+
+Ajustes idempotentes del schema sobre bases de datos ya existentes.
+
+Motivo:
+- `Base.metadata.create_all()` solo crea tablas que NO existen.
+- Las columnas e índices declarados después de crear una tabla nunca
+  llegan a una base de datos de producción ya inicializada.
+
+Este módulo:
+- NO crea ni borra tablas
+- NO modifica datos (salvo el DEFAULT de las columnas añadidas)
+- Puede ejecutarse en cada arranque sin efectos secundarios
+"""
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine
+
+from src.app.core.logging import get_logger
+from src.app.db.base import Base
+
+logger = get_logger(__name__)
+
+# ============================================================
+# COLUMNAS
+# ============================================================
+
+def ensure_columns(bind: Engine) -> None:
+    """
+    Añade las columnas declaradas en los modelos que aún no existen.
+
+    Usa `ALTER TABLE ... ADD COLUMN`. Solo se añaden columnas nullable
+    o con `server_default` (restricción de SQLite); las filas existentes
+    reciben ese valor por defecto.
+
+    :param bind: engine sobre el que se aplican las columnas.
+    """
+    inspector = inspect(bind)
+    existing_tables = set(inspector.get_table_names())
+
+    with bind.begin() as connection:
+        for table in Base.metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+
+            existing = {column["name"] for column in inspector.get_columns(table.name)}
+
+            for column in table.columns:
+                if column.name in existing:
+                    continue
+
+                if not column.nullable and column.server_default is None:
+                    logger.warning(
+                        f"Cannot add NOT NULL column {table.name}.{column.name} without server_default"
+                    )
+                    continue
+
+                ddl = f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column.type.compile(bind.dialect)}"
+                if column.server_default is not None:
+                    ddl += f" DEFAULT {column.server_default.arg}"
+                if not column.nullable:
+                    ddl += " NOT NULL"
+
+                connection.execute(text(ddl))
+                logger.info(f"Added column {table.name}.{column.name}")
+
+# ============================================================
+# ÍNDICES
+# ============================================================
+
+def ensure_indexes(bind: Engine) -> None:
+    """
+    Crea los índices declarados en los modelos que aún no existen.
+
+    Usa `CREATE INDEX` con comprobación previa (checkfirst), por lo que
+    en una base de datos al día no ejecuta ninguna escritura.
+
+    :param bind: engine sobre el que se aplican los índices.
+    """
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=bind, checkfirst=True)
+
+# /src/app/db/schema.py
@@ -0,0 +1,279 @@
+# /src/app/db/write_behind.py
+"""
+Write-behind buffer — v3.0
+
+Buffer en memoria para escrituras de baja prioridad (telemetría de
+usuario, auditoría) que se vuelcan en lotes.
+
+Motivo:
+- En SQLite cada transacción de escritura serializa a todos los
+  escritores. Una escritura por request / login es inaceptable.
+
+Diseño:
+- `add()` solo encola (O(1), sin E/S en el hilo del request).
+- Un hilo de fondo vuelca cada `flush_seconds` o al alcanzar
+  `flush_events` pendientes: UNA transacción con `executemany`.
+- Con `key`, las entradas pendientes de la misma clave se fusionan
+  (la última gana): N requests de un usuario → 1 fila escrita.
+- Memoria acotada (`max_pending`): si el volcado no da abasto se
+  descartan las entradas más antiguas y se cuentan.
+- `lossless=True` (auditoría): nunca se descarta. Al llegar a
+  `max_pending`, el `add()` que lo supera vuelca en su propio hilo
+  (contrapresión: ese request espera a la escritura) y un lote fallido
+  vuelve entero a la cola. Si ese volcado falla, `saturated` queda
+  activo: quien encola debe dejar de producir (la auditoría rechaza las
+  escrituras con 503) hasta que un volcado lo escriba todo.
+- Se vuelca en el apagado del proceso (atexit).
+
+IMPORTANTE:
+- Las escrituras NO pasan por la sesión ORM: no generan change_log,
+  ni invalidan cachés, ni aparecen en /api/sync. Solo para datos
+  técnicos que no forman parte del estado de negocio.
+- Si un volcado falla se reintenta en el siguiente ciclo.
+"""
+
+from __future__ import annotations
+
+import atexit
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+from sqlalchemy.engine import Engine
+
+from src.app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+_buffers: list["WriteBehindBuffer"] = []
+
+
+class WriteBehindBuffer:
+    """
+    Cola acotada de parámetros para un statement ejecutado en lotes.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        flush_seconds: float,
+        flush_events: int,
+        max_pending: int,
+        engine: Engine | None = None,
+        statement: Any = None,
+        writer: Callable[[list[dict]], None] | None = None,
+        key: Callable[[dict], Hashable] | None = None,
+        lossless: bool = False,
+    ):
+        """
+        :param name: nombre para logs y métricas.
+        :param flush_seconds: intervalo máximo entre volcados.
+        :param flush_events: pendientes que fuerzan un volcado anticipado.
+        :param max_pending: máximo de entradas en memoria.
+        :param engine: engine destino (puede ser distinto del principal).
+        :param statement: statement SQLAlchemy con bindparams.
+        :param writer: alternativa a engine + statement: función que
+                       escribe un lote completo en su propia transacción.
+        :param key: función de fusión de entradas (None = sin fusión).
+        :param lossless: sin descartes; volcado síncrono al llenarse.
+        """
+        if writer is None and (engine is None or statement is None):
+            raise ValueError("WriteBehindBuffer requires writer or engine + statement")
+
+        self.name = name
+        self.engine = engine
+        self.statement = statement
+        self._writer = writer
+        self.flush_seconds = flush_seconds
+        self.flush_events = max(1, flush_events)
+        self.max_pending = max(1, max_pending)
+        self._key = key
+        self.lossless = lossless
+
+        self._pending: OrderedDict[Hashable, dict] = OrderedDict()
+        self._seq = 0
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread: threading.Thread | None = None
+
+        self.added = 0
+        self.written = 0
+        self.batches = 0
+        self.dropped = 0
+        self.sync_flushes = 0
+        self.errors = 0
+        self.last_flush_ms = 0.0
+
+        _buffers.append(self)
+
+    # ------------------------------------------------------------
+    # ENCOLADO
+    # ------------------------------------------------------------
+    def add(self, params: dict) -> None:
+        """
+        Encola una escritura (no bloquea ni toca la base de datos).
+        """
+        with self._lock:
+            if self._key is not None:
+                key = self._key(params)
+                self._pending.pop(key, None)
+            else:
+                self._seq += 1
+                key = self._seq
+
+            self._pending[key] = params
+            self.added += 1
+
+            if not self.lossless:
+                self._trim()
+            pending = len(self._pending)
+            sync_flush = self.lossless and pending > self.max_pending
+            if sync_flush:
+                self.sync_flushes += 1
+
+        if sync_flush:
+            # Contrapresión: este hilo vuelca en lugar de descartar
+            if not self.flush() and self.saturated:
+                logger.critical(
+                    f"Write-behind buffer saturated ({self.name}): "
+                    f"{len(self._pending)} entries retained, storage failing"
+                )
+            return
+
+        self._ensure_thread()
+        if pending >= self.flush_events:
+            self._wakeup.set()
+
+    def _trim(self) -> None:
+        """
+        Descarta las entradas más antiguas por encima de max_pending
+        (con self._lock tomado; nunca en modo lossless).
+        """
+        while len(self._pending) > self.max_pending:
+            self._pending.popitem(last=False)
+            self.dropped += 1
+
+    @property
+    def saturated(self) -> bool:
+        """
+        Sin pérdidas y por encima de max_pending: el volcado está fallando.
+        """
+        return self.lossless and len(self._pending) > self.max_pending
+
+    # ------------------------------------------------------------
+    # VOLCADO
+    # ------------------------------------------------------------
+    def flush(self) -> int:
+        """
+        Vuelca todo lo pendiente en una única transacción.
+
+        :return: número de filas escritas (0 si no había nada o falló).
+        """
+        with self._flush_lock:
+            with self._lock:
+                if not self._pending:
+                    return 0
+                batch = self._pending
+                self._pending = OrderedDict()
+
+            started = time.perf_counter()
+            try:
+                self._write(list(batch.values()))
+            except Exception:
+                self.errors += 1
+                logger.exception(f"Write-behind flush failed ({self.name})")
+                self._requeue(batch)
+                return 0
+
+            self.last_flush_ms = round((time.perf_counter() - started) * 1000, 2)
+            self.written += len(batch)
+            self.batches += 1
+            return len(batch)
+
+    def _write(self, rows: list[dict]) -> None:
+        if self._writer is not None:
+            self._writer(rows)
+            return
+        with self.engine.begin() as connection:
+            connection.execute(self.statement, rows)
+
+    def _requeue(self, batch: OrderedDict) -> None:
+        """
+        Devuelve un lote fallido a la cola (las entradas nuevas ganan).
+        """
+        with self._lock:
+            # Lote fallido delante, en su orden; lo encolado después detrás
+            requeued = OrderedDict(
+                (key, params) for key, params in batch.items() if key not in self._pending
+            )
+            requeued.update(self._pending)
+            self._pending = requeued
+            if not self.lossless:
+                self._trim()
+
+    # ------------------------------------------------------------
+    # HILO DE FONDO
+    # ------------------------------------------------------------
+    def _ensure_thread(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(
+                target=self._run,
+                name=f"write-behind-{self.name}",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            self._wakeup.wait(self.flush_seconds)
+            self._wakeup.clear()
+            self.flush()
+
+    # ------------------------------------------------------------
+    # MÉTRICAS
+    # ------------------------------------------------------------
+    def stats(self) -> dict:
+        with self._lock:
+            pending = len(self._pending)
+        return {
+            "pending": pending,
+            "added": self.added,
+            "written": self.written,
+            "batches": self.batches,
+            "dropped": self.dropped,
+            "lossless": self.lossless,
+            "sync_flushes": self.sync_flushes,
+            "saturated": self.saturated,
+            "errors": self.errors,
+            "last_flush_ms": self.last_flush_ms,
+        }
+
+
+# ============================================================
+# REGISTRO GLOBAL
+# ============================================================
+
+def flush_all() -> None:
+    """
+    Vuelca todos los buffers (apagado del proceso, tests, restore).
+    """
+    for buffer in list(_buffers):
+        buffer.flush()
+
+
+def buffers_stats() -> dict:
+    """
+    Métricas de todos los buffers, por nombre.
+    """
+    return {buffer.name: buffer.stats() for buffer in _buffers}
+
+
+atexit.register(flush_all)
+
+# /src/app/db/write_behind.py
@@ -20,13 +20,30 @@ from src.app.core import get_logger, setup_logging, register_exception_handlers,
 # Importaciones de base de datos (infraestructura)
 # ------------------------------------------------------------
 from src.app.core.config.database import engine, init_app
+from src.app.core.cache.response_cache import response_cache
+from src.app.security.user_cache import user_cache
+from src.app.security.throttle import login_throttle
+from src.app.core.cache.change_tracker import register_change_tracking
+from src.app.db.gate import register_database_gate
+from src.app.core.metrics import (
+    register_metrics,
+    register_profiler,
+    register_server_timing,
+    server_timing,
+    slow_query_log,
+)
+from src.app.core.tracing import instrument_tracing, register_tracing
+from src.app.core.audit import register_audit
+from src.app.backups.scheduler import backup_scheduler
 from src.app.db.base import Base
+from src.app.db.schema import ensure_columns, ensure_indexes
 
 # ------------------------------------------------------------
 # Importaciones de la capa API y seguridad
 # ------------------------------------------------------------
 from src.app.api.api_router import api_router
 from src.app.security.middleware import jwt_middleware
+from src.app.security.policies import route_policies
 
 # ------------------------------------------------------------
 # Datos iniciales
@@ -69,11 +86,21 @@ def create_app(testing: bool = False) -> Flask:
     # --------------------------------------------------------
     init_app(app)
 
+    # Las cachés en proceso pertenecen al ciclo de vida de la app
+    response_cache.clear()
+    user_cache.clear()
+    login_throttle.reset()
+    slow_query_log.clear()
+
     # --------------------------------------------------------
     # Creación de tablas
     # --------------------------------------------------------
     Base.metadata.create_all(bind=engine)
 
+    # Columnas e índices añadidos tras la creación inicial de las tablas
+    ensure_columns(engine)
+    ensure_indexes(engine)
+
     # --------------------------------------------------------
     # Carga de datos iniciales
     # --------------------------------------------------------
@@ -88,11 +115,46 @@ def create_app(testing: bool = False) -> Flask:
     # --------------------------------------------------------
     register_exception_handlers(app)
 
+    # --------------------------------------------------------
+    # Métricas por endpoint y /metrics (lo primero: mide también los 503/401)
+    # --------------------------------------------------------
+    register_metrics(app)
+
+    # --------------------------------------------------------
+    # Server-Timing por capa (antes que JWT: mide validate_jwt)
+    # --------------------------------------------------------
+    register_server_timing(app)
+
+    # --------------------------------------------------------
+    # Trazas por capa (antes que JWT: span de validate_jwt)
+    # --------------------------------------------------------
+    register_tracing(app)
+
+    # --------------------------------------------------------
+    # Mantenimiento de la base de datos (antes de cualquier lectura)
+    # --------------------------------------------------------
+    register_database_gate(app)
+
+    # --------------------------------------------------------
+    # Invalidación de cachés entre procesos (antes que JWT)
+    # --------------------------------------------------------
+    register_change_tracking(app)
+
+    # --------------------------------------------------------
+    # Auditoría de escrituras (antes que JWT: mide también los 401/403)
+    # --------------------------------------------------------
+    register_audit(app)
+
     # --------------------------------------------------------
     # Registro del middleware de seguridad JWT
     # --------------------------------------------------------
     jwt_middleware(app)
 
+    # --------------------------------------------------------
+    # Perfilado por request (después de JWT: X-Profile solo de admins)
+    # --------------------------------------------------------
+    register_profiler(app)
+
     # --------------------------------------------------------
     # Endpoint raíz (healthcheck)
     # --------------------------------------------------------
@@ -111,6 +173,22 @@ def create_app(testing: bool = False) -> Flask:
     # --------------------------------------------------------
     app.register_blueprint(api_router, url_prefix="/api")
 
+    # --------------------------------------------------------
+    # Políticas de acceso (con TODAS las rutas ya registradas)
+    # --------------------------------------------------------
+    # Un endpoint sin política impide el arranque
+    route_policies.compile(app)
+
+    # Temporizadores de Server-Timing y spans sobre vistas, services y modelos
+    server_timing.instrument(app)
+    instrument_tracing(app)
+
+    # --------------------------------------------------------
+    # Backups programados (hilo de fondo, solo fuera de tests)
+    # --------------------------------------------------------
+    if not testing:
+        backup_scheduler.start()
+
     return app
 
 # ------------------------------------------------------------
@@ -12,7 +12,7 @@ Define:
 TODOS los modelos persistentes heredan de esta clase.
 """
 from datetime import datetime, timezone
-from sqlalchemy import DateTime, Boolean, Integer
+from sqlalchemy import BigInteger, DateTime, Boolean, Integer
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.app.db.base import Base
@@ -30,15 +30,21 @@ class BaseModel(Base):
     # ------------------------------------------------------------
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(timezone.utc))
-    updated_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    # Indexados: MAX() sobre estas columnas alimenta los validadores HTTP
+    # (ETag / Last-Modified) sin recorrer la tabla.
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(timezone.utc), index=True)
+    updated_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True, index=True)
 
-    deleted_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    deleted_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True, index=True)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
 
     created_by: Mapped[int | None] = mapped_column(Integer, nullable=True)
     updated_by: Mapped[int | None] = mapped_column(Integer, nullable=True)
 
+    # Secuencia global (change_log) de la última escritura del registro.
+    # La asignan los hooks de core.cache.change_tracker; alimenta /api/sync.
+    change_seq: Mapped[int] = mapped_column(BigInteger, default=0, server_default="0", nullable=False, index=True)
+
     # ------------------------------------------------------------
     # SERIALIZACIÓN
     # ------------------------------------------------------------
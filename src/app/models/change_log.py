@@ -0,0 +1,64 @@
+# /src/app/models/change_log.py
+"""ChangeLog Model — v3.0
+
+Secuencia de cambios por tabla (tabla técnica).
+
+Notas:
+- Una fila por tabla de negocio + una fila global (`GLOBAL_KEY`).
+- `RESTORE_KEY`: secuencia global del último restore; los cursores de
+  sync anteriores a ella ya no son válidos.
+- `seq` se incrementa en la MISMA transacción que cada escritura,
+  desde los hooks de sesión de core.cache.change_tracker.
+- La fila global es un contador monotónico de toda la base de datos;
+  cada tabla guarda el valor global de su última escritura.
+
+Reglas:
+- Sin lógica de negocio.
+- Nunca se escribe desde services ni controllers.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import BigInteger, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.app.models.base_model import BaseModel
+
+
+class ChangeLog(BaseModel):
+    """Secuencia de cambios por tabla."""
+
+    __tablename__ = "change_log"
+
+    # Clave de la fila con el contador global
+    GLOBAL_KEY = "__all__"
+
+    # Clave de la fila con la secuencia del último restore
+    RESTORE_KEY = "__restore__"
+
+    # Filas que no corresponden a una tabla
+    TECHNICAL_KEYS = (GLOBAL_KEY, RESTORE_KEY)
+
+    # ============================================================
+    # CAMPOS PRINCIPALES
+    # ============================================================
+
+    table_name: Mapped[str] = mapped_column(String(100), unique=True, nullable=False)
+    seq: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+
+    # ============================================================
+    # SERIALIZACIÓN
+    # ============================================================
+
+    def to_dict(self) -> dict:
+        """Serializa la secuencia de cambios.
+
+        Returns:
+            dict: representación serializable de la fila.
+        """
+
+        data = super().to_dict()
+        data.update({"table_name": self.table_name, "seq": self.seq})
+        return data
+
+# /src/app/models/change_log.py
@@ -49,6 +49,7 @@ class User(BaseModel):
 
     hash_password: Mapped[str] = mapped_column(String(255), nullable=False)
     last_login: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    last_seen: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
     password_changed_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
 
     # ============================================================
@@ -63,7 +64,7 @@ class User(BaseModel):
         """
 
         data = super().to_dict()
-        data.update({"username": self.username, "email": self.email, "rol": self.rol, "user_language": self.user_language, "user_theme": self.user_theme, "last_login": dt_to_iso_z(self.last_login), "password_changed_at": dt_to_iso_z(self.password_changed_at)})
+        data.update({"username": self.username, "email": self.email, "rol": self.rol, "user_language": self.user_language, "user_theme": self.user_theme, "last_login": dt_to_iso_z(self.last_login), "last_seen": dt_to_iso_z(self.last_seen), "password_changed_at": dt_to_iso_z(self.password_changed_at)})
         return data
 
 # /src/app/models/user.py
@@ -9,6 +9,7 @@ funcionalidades relacionadas con seguridad, incluyendo:
 
 - Creación y decodificación de tokens JWT
 - Middleware de autenticación JWT para Flask
+- Políticas de acceso por endpoint (public / authenticated / admin)
 - Hashing y verificación de contraseñas
 
 Objetivos:
@@ -41,7 +42,13 @@ from .jwt import (
 # MIDDLEWARE
 # ============================================================
 
-from .middleware import jwt_middleware
+from .middleware import jwt_middleware, get_client_ip
+
+# ============================================================
+# POLÍTICAS DE ACCESO POR ENDPOINT
+# ============================================================
+
+from .policies import route_policies
 
 # ============================================================
 # PASSWORDS
@@ -50,6 +57,7 @@ from .middleware import jwt_middleware
 from .password import (
     hash_password,
     verify_password,
+    needs_rehash,
 )
 
 # ============================================================
@@ -64,10 +72,15 @@ __all__ = [
 
     # Middleware
     "jwt_middleware",
+    "get_client_ip",
+
+    # Políticas de acceso
+    "route_policies",
 
     # Passwords
     "hash_password",
     "verify_password",
+    "needs_rehash",
 ]
 
 # /src/app/security/__init__.py
@@ -7,11 +7,12 @@ en todas las rutas protegidas del backend DemeArizOil.
 
 Responsabilidades principales:
 - Extraer el token JWT del header Authorization
-- Validar firma y expiración
+- Validar firma y expiración (con caché de tokens verificados)
 - Verificar tipo de token (solo access)
-- Cargar el usuario desde base de datos
+- Cargar el usuario (snapshot cacheado, ver security.user_cache)
 - Verificar estado activo del usuario
 - Invalidar tokens tras cambio de contraseña
+- Aplicar la política de acceso del endpoint (security.policies)
 - Inyectar información de seguridad y auditoría en el contexto global (g)
 
 IMPORTANTE:
@@ -26,14 +27,100 @@ Referencia normativa:
 
 from __future__ import annotations
 
+import functools
+import threading
+import time
+
 import jwt
 from flask import g, request
 
-from src.app.core.config.database import db_session
 from src.app.core.config.settings import settings
-from src.app.core.exceptions.base import UnauthorizedException
+from src.app.core.enum import RoutePolicy, UserRole
+from src.app.core.exceptions.base import ForbiddenException, UnauthorizedException
+from src.app.core.metrics.server_timing import server_timing
+from src.app.core.tracing.tracer import tracer
 from src.app.core.utils.datetime_utils import dt_to_iso_z
-from src.app.models.user import User
+from src.app.security.policies import route_policies
+from src.app.security.token_cache import token_cache
+from src.app.security.user_activity import user_activity
+from src.app.security.user_cache import user_cache
+
+
+# ============================================================
+# IP DEL CLIENTE
+# ============================================================
+
+def get_client_ip() -> str:
+    """
+    IP del cliente que origina el request.
+
+    Por defecto, remote_addr: X-Forwarded-For lo controla el cliente y
+    no es fiable (un valor nuevo por intento daría un bucket de login
+    nuevo). Con settings.TRUSTED_PROXIES = N (proxies propios delante de
+    la app), cada proxy añade a la derecha la IP que le conecta: se toma
+    el valor N-ésimo empezando por la derecha (como ProxyFix(x_for=N)).
+    """
+    trusted = settings.TRUSTED_PROXIES
+    if trusted > 0:
+        forwarded = [
+            value.strip()
+            for value in request.headers.get("X-Forwarded-For", "").split(",")
+            if value.strip()
+        ]
+        if len(forwarded) >= trusted:
+            return forwarded[-trusted]
+    return request.remote_addr or "unknown"
+
+
+# ============================================================
+# COSTE DEL MIDDLEWARE
+# ============================================================
+
+class MiddlewareStats:
+    """
+    Contadores del coste por request de validate_jwt.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    def timed(self, func):
+        """
+        Decorador que mide cada ejecución (también las que fallan).
+        """
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.record(time.perf_counter() - started)
+        return wrapper
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self.requests += 1
+            self.total_seconds += seconds
+            if seconds > self.max_seconds:
+                self.max_seconds = seconds
+
+    def stats(self) -> dict:
+        with self._lock:
+            avg = self.total_seconds / self.requests if self.requests else 0.0
+            return {
+                "requests": self.requests,
+                "avg_us": round(avg * 1_000_000, 1),
+                "max_us": round(self.max_seconds * 1_000_000, 1),
+            }
+
+
+# ------------------------------------------------------------
+# INSTANCIA EXPORTADA (OBLIGATORIA)
+# ------------------------------------------------------------
+middleware_stats = MiddlewareStats()
 
 # ============================================================
 # REGISTRO DEL MIDDLEWARE
@@ -54,32 +141,39 @@ def jwt_middleware(app) -> None:
     # BEFORE REQUEST
     # ------------------------------------------------------------
     @app.before_request
+    @middleware_stats.timed
+    @server_timing.timed("auth")
+    @tracer.traced("auth.validate_jwt")
     def validate_jwt():
         """
         Valida el token JWT de acceso para todas las rutas protegidas.
 
         Flujo de validación (orden crítico):
-        1. Comprobar si la ruta es pública
+        1. Política del endpoint (pública → sin validación)
         2. Extraer header Authorization
         3. Validar formato Bearer <token>
-        4. Decodificar JWT (firma + expiración)
+        4. Decodificar JWT (firma + expiración; caché de tokens verificados)
         5. Verificar tipo de token (access)
         6. Extraer user_id (sub)
-        7. Cargar usuario desde base de datos
+        7. Cargar usuario (caché de snapshots o base de datos)
         8. Verificar usuario activo
         9. Comparar password_changed_at (invalidación automática)
         10. Inyectar usuario y datos de auditoría en `g`
+        11. Exigir rol ADMIN si la política es admin
 
         Si cualquiera de los pasos falla:
-        - Se lanza UnauthorizedException
+        - Se lanza UnauthorizedException (o ForbiddenException en el paso 11)
         - La respuesta HTTP la construye el handler global
         """
 
         # --------------------------------------------------------
-        # 1. RUTAS PÚBLICAS
+        # 1. POLÍTICA DEL ENDPOINT
         # --------------------------------------------------------
-        # Las rutas públicas se definen de forma centralizada en settings
-        if request.path in settings.PUBLIC_PATHS:
+        # Tabla compilada al arrancar (settings.ROUTE_POLICIES).
+        # Sin endpoint (404 / 405) no hay nada que proteger: Flask
+        # responde el error de routing sin ejecutar ningún controller.
+        policy = route_policies.get(request.endpoint)
+        if policy is None or policy is RoutePolicy.PUBLIC:
             return None
 
         # --------------------------------------------------------
@@ -99,12 +193,9 @@ def jwt_middleware(app) -> None:
         # --------------------------------------------------------
         # 3. DECODIFICACIÓN DEL TOKEN
         # --------------------------------------------------------
+        # Tokens ya verificados: sin HMAC (la expiración se comprueba igual)
         try:
-            payload = jwt.decode(
-                token,
-                settings.JWT_SECRET_KEY,
-                algorithms=["HS256"],
-            )
+            payload = token_cache.decode(token)
         except jwt.ExpiredSignatureError:
             raise UnauthorizedException("Token has expired")
         except jwt.InvalidTokenError:
@@ -128,13 +219,10 @@ def jwt_middleware(app) -> None:
             raise UnauthorizedException("Invalid token (missing password_changed_at)")
 
         # --------------------------------------------------------
-        # 6. CARGA DEL USUARIO DESDE BD
+        # 6. CARGA DEL USUARIO (CACHÉ / BD)
         # --------------------------------------------------------
-        user = (
-            db_session.query(User)
-            .filter_by(id=user_id, is_active=True)
-            .first()
-        )
+        # Snapshot cacheado (sin SELECT en el caso común)
+        user = user_cache.get(user_id)
 
         if not user:
             raise UnauthorizedException("User not found or inactive")
@@ -157,13 +245,18 @@ def jwt_middleware(app) -> None:
 
         # Datos de auditoría (no persistencia aquí)
         g.audit_user_id = user.id
-        g.audit_ip = (
-            request.headers.get("X-Forwarded-For")
-            or request.remote_addr
-            or "unknown"
-        )
+        g.audit_ip = get_client_ip()
         g.audit_user_agent = request.headers.get("User-Agent", "unknown")
 
+        # last_seen diferido (write-behind, resolución acotada)
+        user_activity.record_seen(user.id)
+
+        # --------------------------------------------------------
+        # 9. ROL REQUERIDO POR EL ENDPOINT
+        # --------------------------------------------------------
+        if policy is RoutePolicy.ADMIN and user.rol != UserRole.ADMIN:
+            raise ForbiddenException("Admin role required")
+
         return None
 
 # /src/app/security/middleware.py
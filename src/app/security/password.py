@@ -8,6 +8,7 @@ en el backend DemeArizOil.
 Responsabilidades de este módulo:
 - Generar hashes seguros de contraseñas
 - Verificar contraseñas en procesos de autenticación
+- Detectar hashes con un coste distinto al configurado (rehash)
 
 Decisiones clave de diseño:
 - Se utiliza bcrypt como algoritmo de hashing
@@ -15,10 +16,18 @@ Decisiones clave de diseño:
 - Este módulo NO accede a base de datos
 - Este módulo NO contiene lógica de negocio
 
+Ejecución de bcrypt:
+- Todo el trabajo bcrypt se ejecuta en un pool de hilos dedicado y
+  ACOTADO (BCRYPT_WORKERS). bcrypt libera el GIL, así que el resto de
+  requests sigue atendiéndose mientras hay logins en curso.
+- Como mucho BCRYPT_QUEUE_LIMIT operaciones pueden esperar turno; por
+  encima se rechaza de inmediato (503) en lugar de acumular requests
+  bloqueados durante una avalancha de logins.
+
 IMPORTANTE:
 - El hashing y la verificación se hacen exclusivamente aquí
 - Ningún otro módulo debe implementar lógica de hashing
-- Los parámetros de seguridad están encapsulados en bcrypt
+- El coste se configura con settings.BCRYPT_ROUNDS
 
 Referencia normativa:
 - security_v3.0.md
@@ -26,37 +35,108 @@ Referencia normativa:
 
 from __future__ import annotations
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, TypeVar
+
 import bcrypt
 
+from src.app.core.config.settings import settings
+from src.app.core.exceptions.base import ServiceUnavailableException
+
+T = TypeVar("T")
+
+# ============================================================
+# POOL DE BCRYPT
+# ============================================================
+
+class BcryptPool:
+    """
+    Pool de hilos acotado con límite de cola para trabajo bcrypt.
+    """
+
+    def __init__(self, workers: int, queue_limit: int):
+        self.workers = max(1, workers)
+        self.capacity = self.workers + max(0, queue_limit)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.workers,
+            thread_name_prefix="bcrypt",
+        )
+        self._slots = threading.BoundedSemaphore(self.capacity)
+        self._lock = threading.Lock()
+
+        self.in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+
+    def run(self, func: Callable[..., T], *args) -> T:
+        """
+        Ejecuta `func(*args)` en el pool y espera el resultado.
+
+        :raises ServiceUnavailableException: pool y cola llenos.
+        """
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            raise ServiceUnavailableException("Authentication service busy, retry later")
+
+        with self._lock:
+            self.in_flight += 1
+        try:
+            return self._executor.submit(func, *args).result()
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+                self.completed += 1
+            self._slots.release()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "capacity": self.capacity,
+                "in_flight": self.in_flight,
+                "completed": self.completed,
+                "rejected": self.rejected,
+            }
+
+
+# ------------------------------------------------------------
+# INSTANCIA EXPORTADA (OBLIGATORIA)
+# ------------------------------------------------------------
+bcrypt_pool = BcryptPool(settings.BCRYPT_WORKERS, settings.BCRYPT_QUEUE_LIMIT)
+
 # ============================================================
 # HASHING DE CONTRASEÑAS
 # ============================================================
 
-def hash_password(password: str) -> str:
+def hash_password(password: str, rounds: int | None = None) -> str:
     """
     Genera un hash seguro de una contraseña usando bcrypt.
 
     Proceso:
     1. Convierte la contraseña a bytes
-    2. Genera un salt seguro automáticamente
-    3. Aplica bcrypt para producir el hash
+    2. Genera un salt seguro con el coste configurado
+    3. Aplica bcrypt (en el pool dedicado) para producir el hash
     4. Devuelve el hash como string UTF-8
 
     Seguridad:
     - bcrypt incorpora salt interno
     - bcrypt es resistente a ataques de fuerza bruta
-    - El coste computacional es configurable vía bcrypt
+    - El coste computacional es settings.BCRYPT_ROUNDS
 
     Args:
         password: contraseña en texto plano introducida por el usuario.
+        rounds: coste bcrypt (por defecto settings.BCRYPT_ROUNDS).
 
     Returns:
         Hash bcrypt serializable como string.
+
+    Raises:
+        ServiceUnavailableException: pool de bcrypt saturado.
     """
-    return bcrypt.hashpw(
-        password.encode(),
-        bcrypt.gensalt(),
-    ).decode()
+    salt = bcrypt.gensalt(rounds=rounds or settings.BCRYPT_ROUNDS)
+    return bcrypt_pool.run(bcrypt.hashpw, password.encode(), salt).decode()
 
 # ============================================================
 # VERIFICACIÓN DE CONTRASEÑAS
@@ -69,7 +149,7 @@ def verify_password(password: str, hashed: str) -> bool:
 
     Proceso:
     1. Convierte inputs a bytes
-    2. Ejecuta bcrypt.checkpw
+    2. Ejecuta bcrypt.checkpw (en el pool dedicado)
     3. Devuelve True o False
 
     Comportamiento defensivo:
@@ -82,14 +162,44 @@ def verify_password(password: str, hashed: str) -> bool:
 
     Returns:
         True si la contraseña es válida; False en cualquier otro caso.
+
+    Raises:
+        ServiceUnavailableException: pool de bcrypt saturado.
     """
     try:
-        return bcrypt.checkpw(
-            password.encode(),
-            hashed.encode(),
-        )
+        password_bytes = password.encode()
+        hashed_bytes = hashed.encode()
+    except Exception:
+        return False
+
+    return bcrypt_pool.run(_checkpw, password_bytes, hashed_bytes)
+
+
+def _checkpw(password: bytes, hashed: bytes) -> bool:
+    try:
+        return bcrypt.checkpw(password, hashed)
     except Exception:
         # Fallo silencioso por seguridad (formato inválido, datos corruptos, etc.)
         return False
 
+# ============================================================
+# REHASH
+# ============================================================
+
+def hash_rounds(hashed: str) -> int | None:
+    """
+    Devuelve el coste de un hash bcrypt ($2b$<coste>$...), o None si no es válido.
+    """
+    parts = hashed.split("$") if hashed else []
+    if len(parts) < 4 or not parts[2].isdigit():
+        return None
+    return int(parts[2])
+
+
+def needs_rehash(hashed: str) -> bool:
+    """
+    Indica si el hash se generó con un coste distinto de settings.BCRYPT_ROUNDS.
+    """
+    return hash_rounds(hashed) != settings.BCRYPT_ROUNDS
+
 # /src/app/security/password.py
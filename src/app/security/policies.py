@@ -0,0 +1,88 @@
+# /src/app/security/policies.py
+"""
+Route policies — v3.0
+
+Tabla de políticas de acceso por endpoint, compilada al crear la app.
+
+Origen:
+- settings.ROUTE_POLICIES (clave exacta o "<blueprint>.*")
+
+Compilación (una vez, en create_app):
+- Se resuelve la política de CADA endpoint registrado en Flask.
+- Un endpoint sin política, o con una política desconocida, impide
+  el arranque (RuntimeError): ninguna ruta queda abierta por omisión.
+
+En cada request (middleware JWT):
+- Una sola búsqueda en dict por request.endpoint.
+
+IMPORTANTE:
+- Los services NO comprueban el rol para decidir el acceso a un
+  endpoint: eso se resuelve aquí, antes de cualquier controller o BD.
+"""
+
+from __future__ import annotations
+
+from src.app.core.config.settings import settings
+from src.app.core.enum import RoutePolicy
+
+
+class RoutePolicyTable:
+    """
+    Política de acceso compilada por endpoint.
+    """
+
+    def __init__(self):
+        self._policies: dict[str, RoutePolicy] = {}
+
+    def compile(self, app, rules: dict[str, str] | None = None) -> dict[str, RoutePolicy]:
+        """
+        Resuelve la política de todos los endpoints registrados en `app`.
+
+        :param app: instancia de Flask con TODAS las rutas registradas.
+        :param rules: tabla de reglas (por defecto, settings.ROUTE_POLICIES).
+        :return: política por endpoint.
+        :raises RuntimeError: si algún endpoint no tiene política válida.
+        """
+        rules = settings.ROUTE_POLICIES if rules is None else rules
+
+        try:
+            parsed = {key: RoutePolicy(value) for key, value in rules.items()}
+        except ValueError as exc:
+            raise RuntimeError(f"Invalid route policy: {exc}") from None
+
+        compiled: dict[str, RoutePolicy] = {}
+        missing: list[str] = []
+
+        for endpoint in app.view_functions:
+            blueprint = endpoint.rsplit(".", 1)[0] if "." in endpoint else None
+            policy = parsed.get(endpoint)
+            if policy is None and blueprint:
+                policy = parsed.get(f"{blueprint}.*")
+
+            if policy is None:
+                missing.append(endpoint)
+            else:
+                compiled[endpoint] = policy
+
+        if missing:
+            raise RuntimeError(
+                "Endpoints without route policy (settings.ROUTE_POLICIES): "
+                + ", ".join(sorted(missing))
+            )
+
+        self._policies = compiled
+        return compiled
+
+    def get(self, endpoint: str | None) -> RoutePolicy | None:
+        """
+        Política compilada de un endpoint (None si no existe la ruta).
+        """
+        return self._policies.get(endpoint)
+
+
+# ------------------------------------------------------------
+# INSTANCIA EXPORTADA (OBLIGATORIA)
+# ------------------------------------------------------------
+route_policies = RoutePolicyTable()
+
+# /src/app/security/policies.py
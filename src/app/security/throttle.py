@@ -0,0 +1,148 @@
+# /src/app/security/throttle.py
+"""
+Login Throttle — v3.0
+
+Limitación de intentos de login (admisión) antes de cualquier bcrypt.
+
+Motivo:
+- /api/auth/login es público y es el endpoint más caro (bcrypt).
+  Un cliente insistente puede saturar el backend.
+
+Diseño:
+- Token bucket por IP y por username (normalizado).
+- Cada intento consume un token de cada bucket; sin tokens → 429
+  con Retry-After, sin tocar la base de datos ni bcrypt.
+- Memoria acotada: como mucho LOGIN_THROTTLE_MAX_KEYS buckets por tipo
+  (LRU). Expulsar un bucket equivale a dejarlo lleno, que es el estado
+  de cualquier clave no vista: nunca bloquea de más.
+
+IMPORTANTE:
+- En proceso: con varios workers el límite efectivo es por worker.
+- La IP sale de get_client_ip() (remote_addr, o X-Forwarded-For solo
+  con TRUSTED_PROXIES).
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections import OrderedDict
+
+from src.app.core.config.settings import settings
+from src.app.core.exceptions.base import TooManyRequestsException
+
+
+# ============================================================
+# TOKEN BUCKET
+# ============================================================
+
+class TokenBucketLimiter:
+    """
+    Conjunto acotado de token buckets indexados por clave.
+    """
+
+    def __init__(self, capacity: float, refill_per_second: float, max_keys: int):
+        self.capacity = float(capacity)
+        self.refill_per_second = float(refill_per_second)
+        self.max_keys = max(1, max_keys)
+
+        # clave → (tokens, instante de la última actualización)
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.allowed = 0
+        self.rejected = 0
+        self.evictions = 0
+
+    def consume(self, key: str) -> float:
+        """
+        Consume un token de `key`.
+
+        :return: 0 si se permite; si no, segundos hasta el próximo token.
+        """
+        now = time.monotonic()
+
+        with self._lock:
+            tokens, updated = self._buckets.pop(key, (self.capacity, now))
+            tokens = min(self.capacity, tokens + (now - updated) * self.refill_per_second)
+
+            if tokens >= 1:
+                tokens -= 1
+                wait = 0.0
+                self.allowed += 1
+            else:
+                wait = (1 - tokens) / self.refill_per_second if self.refill_per_second else math.inf
+                self.rejected += 1
+
+            self._buckets[key] = (tokens, now)
+
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+                self.evictions += 1
+
+        return wait
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "keys": len(self._buckets),
+                "allowed": self.allowed,
+                "rejected": self.rejected,
+                "evictions": self.evictions,
+            }
+
+
+# ============================================================
+# LOGIN
+# ============================================================
+
+class LoginThrottle:
+    """
+    Admisión de intentos de login por IP y por username.
+    """
+
+    def __init__(self):
+        self.by_ip = TokenBucketLimiter(
+            capacity=settings.LOGIN_RATE_IP_BURST,
+            refill_per_second=settings.LOGIN_RATE_IP_PER_MINUTE / 60,
+            max_keys=settings.LOGIN_THROTTLE_MAX_KEYS,
+        )
+        self.by_username = TokenBucketLimiter(
+            capacity=settings.LOGIN_RATE_USER_BURST,
+            refill_per_second=settings.LOGIN_RATE_USER_PER_MINUTE / 60,
+            max_keys=settings.LOGIN_THROTTLE_MAX_KEYS,
+        )
+
+    def check(self, username: str | None, client_ip: str | None) -> None:
+        """
+        Registra un intento de login o lo rechaza.
+
+        :raises TooManyRequestsException: IP o username sin tokens.
+        """
+        wait = self.by_ip.consume(client_ip or "unknown")
+        if not wait:
+            wait = self.by_username.consume((username or "").strip().lower())
+
+        if wait:
+            raise TooManyRequestsException(
+                "Too many login attempts, retry later",
+                retry_after=max(1, math.ceil(wait)),
+            )
+
+    def reset(self) -> None:
+        self.__init__()
+
+    def stats(self) -> dict:
+        return {
+            "by_ip": self.by_ip.stats(),
+            "by_username": self.by_username.stats(),
+        }
+
+
+# ------------------------------------------------------------
+# INSTANCIA EXPORTADA (OBLIGATORIA)
+# ------------------------------------------------------------
+login_throttle = LoginThrottle()
+
+# /src/app/security/throttle.py
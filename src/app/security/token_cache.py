@@ -0,0 +1,82 @@
+# /src/app/security/token_cache.py
+"""
+Verified Token Cache — v3.0
+
+Caché de tokens JWT ya verificados para el middleware.
+
+Motivo:
+- El mismo access token se decodificaba y verificaba (HMAC HS256) en
+  cada request durante toda su vida (60 minutos).
+
+Diseño:
+- Clave: SHA-256 del token (el token nunca se guarda en claro).
+- Valor: payload verificado + su `exp`.
+- Un acierto evita decodificación y verificación de firma, pero la
+  expiración se comprueba SIEMPRE con el reloj actual.
+- LRU acotada; un token solo entra tras pasar `decode_token()`.
+
+IMPORTANTE:
+- El payload devuelto es compartido: solo lectura.
+- La invalidación por cambio de password NO depende de esta caché
+  (el middleware compara password_changed_at en cada request).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from typing import Any
+
+import jwt
+
+from src.app.core.cache import LRUCache
+from src.app.core.config.settings import settings
+from src.app.security.jwt import decode_token
+
+
+class TokenCache:
+    """
+    LRU de payloads JWT verificados.
+    """
+
+    def __init__(self, max_entries: int):
+        self.enabled = max_entries > 0
+        self._cache = LRUCache(max_entries=max(1, max_entries))
+
+    def decode(self, token: str) -> dict[str, Any]:
+        """
+        Devuelve el payload verificado del token.
+
+        :raises jwt.ExpiredSignatureError: token caducado (también en acierto).
+        :raises jwt.InvalidTokenError: firma o formato inválidos.
+        """
+        if not self.enabled:
+            return decode_token(token)
+
+        key = hashlib.sha256(token.encode()).digest()
+
+        cached = self._cache.get(key)
+        if cached is not None:
+            payload, exp = cached
+            if exp is not None and exp <= time.time():
+                self._cache.pop(key)
+                raise jwt.ExpiredSignatureError("Signature has expired")
+            return payload
+
+        payload = decode_token(token)
+        self._cache.set(key, (payload, payload.get("exp")))
+        return payload
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> dict:
+        return {"enabled": self.enabled, **self._cache.stats()}
+
+
+# ------------------------------------------------------------
+# INSTANCIA EXPORTADA (OBLIGATORIA)
+# ------------------------------------------------------------
+token_cache = TokenCache(settings.AUTH_TOKEN_CACHE_MAX_ENTRIES)
+
+# /src/app/security/token_cache.py
@@ -0,0 +1,86 @@
+# /src/app/security/user_activity.py
+"""
+User Activity — v3.0
+
+Registro diferido (write-behind) de la actividad de los usuarios:
+- last_login: en cada login correcto
+- last_seen: en requests autenticados, como mucho una vez por
+  LAST_SEEN_RESOLUTION_SECONDS y usuario
+
+Las escrituras se agrupan por usuario (la última gana) y se vuelcan
+en lote por db.write_behind. Son datos técnicos: no cambian
+updated_at ni generan change_log.
+"""
+
+from __future__ import annotations
+
+import time
+from datetime import datetime, timezone
+
+from sqlalchemy import bindparam, update
+
+from src.app.core.cache import LRUCache
+from src.app.core.config.database import engine
+from src.app.core.config.settings import settings
+from src.app.db.write_behind import WriteBehindBuffer
+from src.app.models.user import User
+
+_users = User.__table__
+
+
+def _buffer(name: str, column: str) -> WriteBehindBuffer:
+    statement = (
+        update(_users)
+        .where(_users.c.id == bindparam("user_id"))
+        .values({column: bindparam("ts")})
+    )
+    return WriteBehindBuffer(
+        name=name,
+        engine=engine,
+        statement=statement,
+        flush_seconds=settings.WRITE_BEHIND_FLUSH_SECONDS,
+        flush_events=settings.WRITE_BEHIND_FLUSH_EVENTS,
+        max_pending=settings.WRITE_BEHIND_MAX_PENDING,
+        key=lambda params: params["user_id"],
+    )
+
+
+class UserActivity:
+    """
+    Actividad de usuarios con persistencia diferida.
+    """
+
+    def __init__(self):
+        self.last_login = _buffer("users.last_login", "last_login")
+        self.last_seen = _buffer("users.last_seen", "last_seen")
+
+        # Último last_seen encolado por usuario (acotado)
+        self._seen_at = LRUCache(max_entries=settings.WRITE_BEHIND_MAX_PENDING)
+
+    def record_login(self, user_id: int) -> None:
+        """
+        Encola last_login = ahora.
+        """
+        now = datetime.now(timezone.utc)
+        self.last_login.add({"user_id": user_id, "ts": now})
+        self.last_seen.add({"user_id": user_id, "ts": now})
+        self._seen_at.set(user_id, time.monotonic())
+
+    def record_seen(self, user_id: int) -> None:
+        """
+        Encola last_seen = ahora, si la marca anterior es antigua.
+        """
+        previous = self._seen_at.get(user_id)
+        if previous is not None and time.monotonic() - previous < settings.LAST_SEEN_RESOLUTION_SECONDS:
+            return
+
+        self._seen_at.set(user_id, time.monotonic())
+        self.last_seen.add({"user_id": user_id, "ts": datetime.now(timezone.utc)})
+
+
+# ------------------------------------------------------------
+# INSTANCIA EXPORTADA (OBLIGATORIA)
+# ------------------------------------------------------------
+user_activity = UserActivity()
+
+# /src/app/security/user_activity.py
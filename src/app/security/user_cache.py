@@ -0,0 +1,144 @@
+# /src/app/security/user_cache.py
+"""
+Authenticated User Cache — v3.0
+
+Caché de usuarios autenticados para el middleware JWT.
+
+Motivo:
+- validate_jwt cargaba el usuario desde BD en CADA request protegido
+  (la consulta más ejecutada del sistema).
+
+Diseño:
+- Se cachea un snapshot inmutable y desacoplado de la sesión
+  (UserSnapshot), nunca el objeto ORM.
+- Clave: id de usuario. Capacidad acotada (LRU) y TTL configurable:
+  el TTL es la cota máxima de revocación aunque fallase la invalidación.
+- Cualquier escritura sobre `users` (update, delete, restore, cambio de
+  password o de rol; local o de otro worker) vacía la caché mediante
+  core.cache.invalidation.
+- Una generación evita guardar un snapshot leído antes de una
+  invalidación concurrente.
+
+IMPORTANTE:
+- Solo usuarios ACTIVOS llegan a la caché.
+- Los services reciben el snapshot en g.current_user: solo lectura.
+"""
+
+from __future__ import annotations
+
+import threading
+
+from src.app.core.cache import LRUCache, invalidation
+from src.app.core.config.database import db_session
+from src.app.core.config.settings import settings
+from src.app.models.user import User
+
+
+# ============================================================
+# SNAPSHOT
+# ============================================================
+
+class UserSnapshot:
+    """
+    Copia inmutable de un usuario activo (sin hash_password).
+    """
+
+    __slots__ = (
+        "id", "username", "email", "rol", "is_active",
+        "password_changed_at", "_data",
+    )
+
+    def __init__(self, user: User):
+        set_ = object.__setattr__
+        set_(self, "id", user.id)
+        set_(self, "username", user.username)
+        set_(self, "email", user.email)
+        set_(self, "rol", user.rol)
+        set_(self, "is_active", user.is_active)
+        set_(self, "password_changed_at", user.password_changed_at)
+        set_(self, "_data", user.to_dict())
+
+    def __setattr__(self, name, value):
+        raise AttributeError("UserSnapshot is read-only")
+
+    def to_dict(self) -> dict:
+        """
+        Misma serialización que User.to_dict().
+        """
+        return dict(self._data)
+
+    def __repr__(self) -> str:
+        return f"<UserSnapshot id={self.id} username={self.username!r} rol={self.rol}>"
+
+
+# ============================================================
+# CACHÉ
+# ============================================================
+
+class UserCache:
+    """
+    Caché acotada de snapshots de usuarios activos.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.enabled = ttl_seconds > 0
+        self._cache = LRUCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+        self._lock = threading.Lock()
+        self._generation = 0
+
+    def get(self, user_id: int) -> UserSnapshot | None:
+        """
+        Devuelve el snapshot del usuario activo, o None si no existe / inactivo.
+        """
+        if self.enabled:
+            snapshot = self._cache.get(user_id)
+            if snapshot is not None:
+                return snapshot
+
+        generation = self._generation
+
+        user = (
+            db_session.query(User)
+            .filter_by(id=user_id, is_active=True)
+            .first()
+        )
+        if not user:
+            return None
+
+        snapshot = UserSnapshot(user)
+
+        if self.enabled:
+            with self._lock:
+                if generation == self._generation:
+                    self._cache.set(user_id, snapshot)
+
+        return snapshot
+
+    def invalidate(self, tables: set[str]) -> None:
+        """
+        Vacía la caché si ha cambiado la tabla de usuarios.
+        """
+        if User.__tablename__ not in tables:
+            return
+        with self._lock:
+            self._generation += 1
+            self._cache.clear()
+
+    def clear(self) -> None:
+        self.invalidate({User.__tablename__})
+
+    def stats(self) -> dict:
+        return {"enabled": self.enabled, **self._cache.stats()}
+
+
+# ------------------------------------------------------------
+# INSTANCIA EXPORTADA (OBLIGATORIA)
+# ------------------------------------------------------------
+user_cache = UserCache(
+    max_entries=settings.AUTH_USER_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.AUTH_USER_CACHE_TTL_SECONDS,
+)
+
+invalidation.subscribe(user_cache.invalidate)
+
+# /src/app/security/user_cache.py
@@ -0,0 +1,133 @@
+# /src/app/services/admin_service.py
+
+"""
+AdminService — v3.0
+
+Servicio técnico para operaciones de administración del sistema.
+
+⚠️ NO es un CRUD
+⚠️ NO tiene modelo
+⚠️ NO contiene lógica de negocio
+
+Responsabilidades:
+- Exponer el estado interno del backend (cachés, contadores,
+  consultas lentas, trazas, perfiles)
+
+El acceso (solo administradores) lo garantiza la política de
+endpoints "api.admin.*" (security.policies), antes de llegar aquí.
+"""
+
+from src.app.core.audit import audit_buffer, audit_store
+from src.app.core.cache.response_cache import response_cache
+from src.app.core.cache.change_tracker import change_tracker
+from src.app.core.events import event_bus
+from src.app.core.exceptions import NotFoundException
+from src.app.core.metrics import request_profiler, slow_query_log
+from src.app.core.tracing import ring_buffer_exporter, tracer
+from src.app.db.write_behind import buffers_stats
+from src.app.security.middleware import middleware_stats
+from src.app.security.password import bcrypt_pool
+from src.app.security.throttle import login_throttle
+from src.app.security.token_cache import token_cache
+from src.app.security.user_cache import user_cache
+
+
+class AdminService:
+    """
+    Servicio de administración técnica.
+    """
+
+    # ------------------------------------------------------------
+    # CACHÉS
+    # ------------------------------------------------------------
+    def get_cache_stats(self) -> dict:
+        """
+        Devuelve los contadores de las cachés en proceso.
+        """
+        return {
+            "response_cache": response_cache.stats(),
+            "change_tracker": change_tracker.stats(),
+            "event_bus": event_bus.stats(),
+            "user_cache": user_cache.stats(),
+            "token_cache": token_cache.stats(),
+            "auth_middleware": middleware_stats.stats(),
+            "bcrypt_pool": bcrypt_pool.stats(),
+            "login_throttle": login_throttle.stats(),
+            "write_behind": buffers_stats(),
+            "alarms": self._alarms(),
+        }
+
+    @staticmethod
+    def _alarms() -> dict:
+        """
+        Indicadores que deben ser siempre 0 / False (auditoría).
+        """
+        return {"audit_dropped": audit_buffer.dropped, "audit_saturated": audit_buffer.saturated}
+
+    # ------------------------------------------------------------
+    # AUDITORÍA
+    # ------------------------------------------------------------
+    def get_audit(self, limit: int, **filters) -> list[dict]:
+        """
+        Consulta el registro de auditoría.
+
+        Se vuelcan antes las entradas pendientes, para que la consulta
+        incluya los requests ya respondidos.
+        """
+        audit_buffer.flush()
+        return audit_store.query(limit=limit, **filters)
+
+    # ------------------------------------------------------------
+    # CONSULTAS LENTAS
+    # ------------------------------------------------------------
+    def get_slow_queries(self, limit: int) -> dict:
+        """
+        Top-N de sentencias lentas por tiempo total, con su plan.
+        """
+        return slow_query_log.top(limit)
+
+    # ------------------------------------------------------------
+    # TRAZAS
+    # ------------------------------------------------------------
+    def get_traces(self, limit: int, trace_id: str | None = None, min_ms: int | None = None) -> dict:
+        """
+        Trazas recientes del buffer en memoria.
+
+        :raises NotFoundException: si se pide un trace_id que no está.
+        """
+        traces = ring_buffer_exporter.query(limit, trace_id=trace_id, min_ms=min_ms)
+        if trace_id is not None and not traces:
+            raise NotFoundException(f"Trace {trace_id} not found")
+        return {
+            **tracer.stats(),
+            **ring_buffer_exporter.stats(),
+            "traces": traces,
+        }
+
+    # ------------------------------------------------------------
+    # PERFILES
+    # ------------------------------------------------------------
+    def get_profiles(self, limit: int) -> dict:
+        """
+        Perfiles guardados en PROFILING_DIR y contadores del perfilador.
+        """
+        return request_profiler.list_profiles(limit)
+
+    def get_profile_path(self, name: str) -> str:
+        """
+        Ruta de un perfil guardado (por nombre, sin rutas).
+
+        :raises NotFoundException: si no existe o el nombre no es válido.
+        """
+        path = request_profiler.path(name)
+        if path is None:
+            raise NotFoundException(f"Profile {name} not found")
+        return path
+
+
+# ------------------------------------------------------------
+# INSTANCIA EXPORTADA (OBLIGATORIA)
+# ------------------------------------------------------------
+admin_service = AdminService()
+
+# /src/app/services/admin_service.py
@@ -19,7 +19,9 @@ Reglas de arquitectura:
 from src.app.core.config.database import db_session
 from src.app.core.exceptions.base import UnauthorizedException
 from src.app.models.user import User
-from src.app.security.password import verify_password
+from src.app.security.password import hash_password, needs_rehash, verify_password
+from src.app.security.throttle import login_throttle
+from src.app.security.user_activity import user_activity
 from src.app.security.jwt import (
     create_access_token,
     create_refresh_token,
@@ -39,21 +41,27 @@ class AuthService:
     # ------------------------------------------------------------
     # LOGIN
     # ------------------------------------------------------------
-    def authenticate(self, username: str, password: str) -> dict:
+    def authenticate(self, username: str, password: str, client_ip: str | None = None) -> dict:
         """
         Autentica un usuario a partir de credenciales.
 
         Flujo:
+        - Limita los intentos por IP y username (antes de BD y bcrypt)
         - Busca el usuario activo por username
         - Verifica la contraseña
+        - Regenera el hash si su coste no es BCRYPT_ROUNDS
+        - Registra last_login (diferido)
         - Emite access_token y refresh_token
 
         Args:
             username (str): Nombre de usuario.
             password (str): Contraseña en texto plano.
+            client_ip (str | None): IP del cliente (limitación de intentos).
 
         Raises:
+            TooManyRequestsException: Si se supera el límite de intentos.
             UnauthorizedException: Si las credenciales son inválidas.
+            ServiceUnavailableException: Si el pool de bcrypt está saturado.
 
         Returns:
             dict:
@@ -64,6 +72,8 @@ class AuthService:
                 }
         """
 
+        login_throttle.check(username, client_ip)
+
         user = (
             db_session.query(User)
             .filter(User.username == username, User.is_active == True)
@@ -76,6 +86,15 @@ class AuthService:
         if not verify_password(password, user.hash_password):
             raise UnauthorizedException("Invalid credentials")
 
+        # Rehash transparente si cambió BCRYPT_ROUNDS.
+        # password_changed_at NO cambia: los tokens vigentes siguen valiendo.
+        if needs_rehash(user.hash_password):
+            user.hash_password = hash_password(password)
+            db_session.commit()
+
+        # last_login diferido (write-behind): sin transacción en el login
+        user_activity.record_login(user.id)
+
         return {
             "access_token": create_access_token(user),
             "refresh_token": create_refresh_token(user),
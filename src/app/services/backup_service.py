@@ -6,28 +6,40 @@ BackupService — v3.0
 Servicio de dominio para backup y restore de la base de datos.
 
 Características:
-- Independiente del motor (SQLite, MariaDB, PostgreSQL, etc.)
-- Basado en dump lógico SQL
-- Acceso restringido a administradores
+- Copia binaria en caliente con la API online de SQLite
+  (backups.online_backup): consistente, sin bloquear escritores
+- Backups incrementales por change_seq (base + cadena, con manifest)
+  y restore de la cadena con la sustitución en caliente
+- Backups programados en segundo plano (backups.scheduler)
+- Dump lógico SQL comprimido en streaming (export_stream) y restore
+  por lotes desde fichero (restore_database)
+- Restore de copias binarias sustituyendo el fichero en caliente
+  (backups.hot_swap: solo lectura, drenaje, rename atómico)
+- Export / import lógico NDJSON para migrar entre entornos
+  (backups.ndjson, parseo en pool de procesos)
+- Acceso restringido a administradores (política "api.backup.*",
+  aplicada por security.policies antes de llegar aquí)
 
-⚠️ NO asume base de datos como archivo
-⚠️ NO usa drivers específicos (sqlite3, mysqldump, etc.)
 ⚠️ NO accede a config interna de core
 """
 
-from flask import g
+import os
+import shutil
+import tempfile
 from datetime import datetime, timezone
-from io import StringIO
+from typing import Iterator
 
-from sqlalchemy import text
+from src.app.backups.hot_swap import database_swapper, is_sqlite_file
+from src.app.backups.incremental import incremental_backups
+from src.app.backups.ndjson import export_ndjson, import_ndjson
+from src.app.backups.online_backup import online_backup
+from src.app.backups.scheduler import backup_scheduler
+from src.app.backups.sql_dump import gzip_dump
+from src.app.backups.sql_restore import restore_sql
+from src.app.core import BadRequestException, NotFoundException, settings
+from src.app.db.replica import reporting_replica
 
-from src.app.core import (
-    ForbiddenException,
-    BadRequestException,
-    ServerErrorException,
-    db_session,
-    settings,
-)
+_UPLOAD_CHUNK_BYTES = 1024 * 1024
 
 
 class BackupService:
@@ -36,110 +48,160 @@ class BackupService:
     """
 
     # ------------------------------------------------------------
-    # HELPERS
+    # BACKUP ONLINE (COPIA BINARIA)
     # ------------------------------------------------------------
-    def _ensure_admin(self) -> None:
+    def create_backup(self) -> dict:
         """
-        Garantiza que el usuario actual es administrador.
+        Copia la base de datos en caliente a BACKUP_DIR.
+
+        Retorna:
+        - resumen de la copia (path, tamaño, pasos, reinicios, duración)
+        """
+        filename = f"database_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}.db"
+        return online_backup.run(os.path.join(settings.BACKUP_DIR, filename))
+
+    def export_database(self) -> str:
+        """
+        Genera una copia online y devuelve su ruta (descarga).
+        """
+        return self.create_backup()["target"]
+
+    def backup_status(self) -> dict:
+        """
+        Progreso de la copia en curso o resultado de la última.
+        """
+        return online_backup.status()
+
+    def schedule_status(self) -> dict:
+        """
+        Estado del scheduler: programación, próxima ejecución, última
+        ejecución y copias conservadas.
         """
-        user = getattr(g, "current_user", None)
-        if not user or user.rol != "admin":
-            raise ForbiddenException("Only admin can perform backup operations")
+        return backup_scheduler.status()
 
     # ------------------------------------------------------------
-    # EXPORT (BACKUP)
+    # BACKUPS INCREMENTALES (BASE + CADENA)
     # ------------------------------------------------------------
-    def export(self) -> dict:
+    def create_incremental(self, full: bool = False) -> dict:
         """
-        Genera un dump lógico de la base de datos.
+        Añade un eslabón a la cadena (base si no existe o si `full`).
+        """
+        return incremental_backups.create(full=full)
+
+    def incremental_manifest(self) -> dict:
+        """
+        Manifest de la cadena actual.
+        """
+        return incremental_backups.manifest()
+
+    def verify_incremental(self) -> dict:
+        """
+        Reconstruye la cadena y la compara con el estado de su último eslabón.
+        """
+        return incremental_backups.verify()
+
+    def restore_incremental(self) -> dict:
+        """
+        Restaura base + incrementos: la cadena se reconstruye y verifica
+        en BACKUP_DIR y se instala con la sustitución en caliente.
 
         Retorna:
-        - dict con filename y contenido SQL
+        - resumen de la sustitución + `seq` y `links` de la cadena
         """
-        self._ensure_admin()
+        os.makedirs(settings.BACKUP_DIR, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=settings.BACKUP_DIR, suffix=".chain", delete=False) as staged:
+            path = staged.name
 
         try:
-            buffer = StringIO()
-            connection = db_session.connection()
-
-            # Obtener todas las tablas visibles
-            tables = connection.execute(
-                text(
-                    """
-                    SELECT table_name
-                    FROM information_schema.tables
-                    WHERE table_schema = DATABASE()
-                    """
-                )
-            ).fetchall()
-
-            for (table_name,) in tables:
-                buffer.write(f"-- TABLE {table_name}\n")
-
-                rows = connection.execute(text(f"SELECT * FROM {table_name}"))
-                columns = rows.keys()
-
-                for row in rows:
-                    values = []
-                    for value in row:
-                        if value is None:
-                            values.append("NULL")
-                        elif isinstance(value, (int, float)):
-                            values.append(str(value))
-                        else:
-                            escaped = str(value).replace("'", "''")
-                            values.append(f"'{escaped}'")
-
-                    cols = ", ".join(columns)
-                    vals = ", ".join(values)
-                    buffer.write(
-                        f"INSERT INTO {table_name} ({cols}) VALUES ({vals});\n"
-                    )
-
-                buffer.write("\n")
-
-            filename = f"backup_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}.sql"
-
-            return {
-                "filename": filename,
-                "content": buffer.getvalue(),
-            }
-
-        except Exception as exc:
-            raise ServerErrorException(f"Backup failed: {str(exc)}")
+            last = incremental_backups.stage(path)
+            result = database_swapper.swap(path)
+        finally:
+            os.remove(path)
+
+        links = len(incremental_backups.manifest()["chain"])
+        incremental_backups.require_base()
+        reporting_replica.reset()
+        return {**result, "seq": last["seq"], "links": links}
 
     # ------------------------------------------------------------
-    # RESTORE
+    # EXPORT (DUMP SQL EN STREAMING)
     # ------------------------------------------------------------
-    def restore(self, sql_content: str) -> None:
+    def export_stream(self) -> tuple[str, Iterator[bytes]]:
         """
-        Restaura la base de datos a partir de un dump SQL.
+        Dump lógico comprimido (gzip) en streaming.
 
-        El contenido SQL debe ser:
-        - texto plano
-        - generado por export()
+        Retorna:
+        - (filename, generador de bloques gzip con trailer sha256)
         """
-        self._ensure_admin()
+        filename = f"backup_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}.sql.gz"
+        return filename, gzip_dump(online_backup.source_path, settings.BACKUP_DUMP_BATCH_ROWS)
 
-        if not sql_content or not isinstance(sql_content, str):
-            raise BadRequestException("Invalid SQL content")
+    # ------------------------------------------------------------
+    # EXPORT / IMPORT NDJSON (MIGRACIÓN ENTRE ENTORNOS)
+    # ------------------------------------------------------------
+    def export_ndjson(self) -> dict:
+        """
+        Exporta todas las tablas a BACKUP_DIR/ndjson_<fecha>/.
 
-        try:
-            connection = db_session.connection()
-            statements = [
-                stmt.strip()
-                for stmt in sql_content.split(";")
-                if stmt.strip()
-            ]
+        Retorna:
+        - nombre del export + resumen (tablas, filas, bytes, filas/s)
+        """
+        name = f"ndjson_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}"
+        result = export_ndjson(os.path.join(settings.BACKUP_DIR, name), settings.BACKUP_NDJSON_BATCH_ROWS)
+        return {"export": name, **result}
+
+    def import_ndjson(self, name: str) -> dict:
+        """
+        Importa un export NDJSON de BACKUP_DIR (por nombre, sin rutas).
 
-            for statement in statements:
-                connection.execute(text(statement))
+        Retorna:
+        - resumen (tablas, filas, filas/s, workers)
+        """
+        if not isinstance(name, str) or not name or name in (".", "..") or os.path.basename(name) != name:
+            raise BadRequestException("Invalid export name")
 
-            db_session.commit()
+        directory = os.path.join(settings.BACKUP_DIR, name)
+        if not os.path.isdir(directory):
+            raise NotFoundException("NDJSON export not found")
 
-        except Exception as exc:
-            db_session.rollback()
-            raise ServerErrorException(f"Restore failed: {str(exc)}")
+        result = import_ndjson(directory, settings.BACKUP_NDJSON_BATCH_ROWS, settings.BACKUP_NDJSON_WORKERS)
+        incremental_backups.require_base()
+        reporting_replica.reset()
+        return result
+
+    # ------------------------------------------------------------
+    # RESTORE (DUMP SQL)
+    # ------------------------------------------------------------
+    def restore_database(self, uploaded_file) -> dict:
+        """
+        Restaura una copia subida: fichero SQLite o dump SQL (gzip o texto).
+
+        La subida se vuelca a disco por bloques. Después:
+        - fichero SQLite → sustitución en caliente (backups.hot_swap)
+        - dump SQL → aplicación en streaming (backups.sql_restore): una
+          sola transacción, todo o nada
+
+        Retorna:
+        - resumen (SQL: tablas, filas, filas/s; SQLite: fases y
+          `unavailable_ms`)
+        """
+        os.makedirs(settings.BACKUP_DIR, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=settings.BACKUP_DIR, suffix=".upload", delete=False) as spool:
+            shutil.copyfileobj(uploaded_file.stream, spool, _UPLOAD_CHUNK_BYTES)
+            path = spool.name
+
+        try:
+            if os.path.getsize(path) == 0:
+                raise BadRequestException("Invalid SQL content")
+            if is_sqlite_file(path):
+                result = database_swapper.swap(path)
+            else:
+                result = restore_sql(path, settings.BACKUP_RESTORE_BATCH_ROWS)
+            incremental_backups.require_base()
+            reporting_replica.reset()
+            return result
+        finally:
+            os.remove(path)
 
 
 # ------------------------------------------------------------
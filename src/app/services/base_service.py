@@ -15,12 +15,15 @@ IMPORTANTE:
 - NO valida reglas de dominio
 """
 
+import hashlib
 from datetime import datetime, timezone
+from sqlalchemy import func, select
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
 from src.app.core.config.database import db_session
 from src.app.core.exceptions import (NotFoundException, BadRequestException, ServerErrorException)
 from src.app.models.base_model import BaseModel
+from src.app.models.change_log import ChangeLog
 
 
 class BaseService:
@@ -40,6 +43,87 @@ class BaseService:
         if self.model is None:
             raise ServerErrorException("Service model not defined")
 
+    # ------------------------------------------------------------
+    # VALIDADORES (GET CONDICIONAL)
+    # ------------------------------------------------------------
+    def get_validator(self, id: int | None = None) -> tuple[str, datetime | None] | None:
+        """
+        Calcula un validador barato del estado de la colección o de un registro.
+
+        Colección (id=None):
+        - MAX(created_at), MAX(updated_at), MAX(deleted_at)
+          (cada MAX es una subconsulta independiente para que SQLite
+          la resuelva con el índice de la columna, sin recorrer la tabla)
+        - Sin COUNT: is_active no tiene índice (recorrería la tabla) y
+          toda alta, baja o borrado ya avanza la secuencia de change_log
+
+        Registro (id):
+        - Lectura por PK de los timestamps del registro
+
+        Ambos incluyen la secuencia de la tabla en change_log, que cubre
+        escrituras cuyo updated_at no avanza (p. ej. movements fechados
+        con la fecha del documento).
+
+        Last-Modified es la hora real de la última escritura en la tabla
+        (change_log), no los timestamps de las filas: updated_at puede
+        llevar la fecha de negocio de un documento (pasada o futura) y
+        daría 304 obsoletos con If-Modified-Since. Solo sin fila en
+        change_log se recurre a los timestamps de las filas.
+
+        NO carga objetos ORM ni serializa nada.
+
+        :return: (token, last_modified) o None si el registro no existe
+                 o no está activo.
+        """
+        self._ensure_model()
+        table = self.model.__table__
+        change_seq = (
+            select(ChangeLog.seq)
+            .where(ChangeLog.table_name == table.name)
+            .scalar_subquery()
+        )
+        change_time = (
+            select(func.coalesce(ChangeLog.updated_at, ChangeLog.created_at))
+            .where(ChangeLog.table_name == table.name)
+            .scalar_subquery()
+        )
+
+        if id is None:
+            row = db_session.execute(
+                select(
+                    select(func.max(table.c.created_at)).scalar_subquery(),
+                    select(func.max(table.c.updated_at)).scalar_subquery(),
+                    select(func.max(table.c.deleted_at)).scalar_subquery(),
+                    change_seq,
+                    change_time,
+                )
+            ).one()
+        else:
+            row = db_session.execute(
+                select(
+                    table.c.id,
+                    table.c.created_at,
+                    table.c.updated_at,
+                    table.c.deleted_at,
+                    change_seq,
+                    change_time,
+                ).where(table.c.id == id, table.c.is_active == True)
+            ).first()
+
+            if row is None:
+                return None
+
+        # Ambas filas terminan en created_at, updated_at, deleted_at, seq, hora
+        last_modified = row[-1]
+        if last_modified is None:
+            timestamps = [ts for ts in row[-5:-2] if ts is not None]
+            last_modified = max(timestamps) if timestamps else None
+
+        raw = "|".join(str(value) for value in (table.name, *row))
+        token = hashlib.sha1(raw.encode()).hexdigest()[:20]
+
+        return token, last_modified
+
     # ------------------------------------------------------------
     # CRUD
     # ------------------------------------------------------------
@@ -146,6 +230,8 @@ class BaseService:
         try:
             obj.is_active = True
             obj.deleted_at = None
+            # updated_at marca la restauración (invalida validadores HTTP)
+            obj.updated_at = datetime.now(timezone.utc)
             db_session.commit()
             return obj
 
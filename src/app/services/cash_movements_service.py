@@ -33,6 +33,9 @@ Casos permitidos:
 Auditoría:
 - updated_at = date (fecha del note que lanza el movement)
 - updated_by = g.current_user.id
+
+Eventos:
+- Cada delta publica un evento "cash" tras el COMMIT (/api/events)
 """
 
 from datetime import datetime
@@ -47,6 +50,7 @@ from src.app.models.cash_transfer_note import CashTransferNote
 
 from src.app.core import BadRequestException, ForbiddenException, db_session
 from src.app.core.config.settings import settings
+from src.app.core.events import stage_event
 
 
 class CashMovementsService:
@@ -183,6 +187,13 @@ class CashMovementsService:
 
         db_session.flush()
 
+        # Notificación en tiempo real (se publica tras el COMMIT)
+        stage_event(db_session(), "cash", {
+            "cash_account_id": account.id,
+            "delta": float(delta),
+            "balance": float(new_balance),
+        })
+
     # ------------------------------------------------------------
     # HELPERS
     # ------------------------------------------------------------
@@ -0,0 +1,113 @@
+# /src/app/services/events_service.py
+
+"""
+EventsService — v3.0
+
+Servicio de eventos en tiempo real (Server-Sent Events).
+
+⚠️ NO es un CRUD
+⚠️ NO tiene modelo
+⚠️ NO accede a base de datos
+
+Responsabilidades:
+- Abrir y cerrar suscripciones al event bus (con límite por proceso)
+- Producir el stream SSE: eventos, keep-alive y avisos de resync
+
+Tipos de evento:
+- stock: delta aplicado sobre una StockProductLocation
+- cash: delta aplicado sobre una CashAccount
+- document: cambio de estado de un documento
+- sync: cambios hechos por otro worker (resincronizar con /api/sync)
+- resync: el cliente ha perdido eventos (buffer lleno)
+"""
+
+import json
+import time
+from typing import Iterator
+
+from src.app.core import BadRequestException, ServiceUnavailableException
+from src.app.core.cache.change_tracker import change_tracker
+from src.app.core.config.settings import settings
+from src.app.core.events import event_bus
+from src.app.core.events.bus import Subscription
+
+
+class EventsService:
+    """
+    Servicio de streaming de eventos.
+    """
+
+    # Tipos que un cliente puede filtrar (?types=stock,cash)
+    event_types = {"stock", "cash", "document", "sync"}
+
+    # ------------------------------------------------------------
+    # SUSCRIPCIÓN
+    # ------------------------------------------------------------
+    def open(self, types: list[str] | None, last_event_id: int | None) -> Subscription:
+        """
+        Abre una suscripción acotada.
+
+        :raises BadRequestException: tipos desconocidos.
+        :raises ServiceUnavailableException: límite de conexiones alcanzado.
+        """
+        if types is not None:
+            unknown = set(types) - self.event_types
+            if unknown:
+                raise BadRequestException(f"Unknown event types: {', '.join(sorted(unknown))}")
+
+        if event_bus.subscriber_count() >= settings.EVENTS_MAX_SUBSCRIBERS:
+            raise ServiceUnavailableException("Too many event stream connections")
+
+        return event_bus.subscribe(
+            max_queue=settings.EVENTS_QUEUE_SIZE,
+            types=types,
+            last_event_id=last_event_id,
+        )
+
+    def close(self, subscription: Subscription) -> None:
+        event_bus.unsubscribe(subscription)
+
+    # ------------------------------------------------------------
+    # STREAM
+    # ------------------------------------------------------------
+    def stream(self, subscription: Subscription) -> Iterator[str]:
+        """
+        Genera el stream SSE de una suscripción (sin fin).
+
+        Entre esperas se comprueba si otro worker ha escrito
+        (change_tracker.poll), lo que genera eventos "sync".
+        """
+        yield f"retry: {int(settings.EVENTS_POLL_SECONDS * 1000) * 3}\n\n"
+
+        last_write = time.monotonic()
+
+        while True:
+            events, overflowed = subscription.get(timeout=settings.EVENTS_POLL_SECONDS)
+
+            if events or overflowed:
+                # Un único chunk por lote: menos escrituras al socket
+                chunk = "event: resync\ndata: {}\n\n" if overflowed else ""
+                chunk += "".join(
+                    f"id: {evt['id']}\n"
+                    f"event: {evt['type']}\n"
+                    f"data: {json.dumps(evt['data'])}\n\n"
+                    for evt in events
+                )
+                last_write = time.monotonic()
+                yield chunk
+                continue
+
+            change_tracker.poll()
+
+            # Comentario SSE: mantiene viva la conexión en proxies
+            if time.monotonic() - last_write >= settings.EVENTS_KEEPALIVE_SECONDS:
+                last_write = time.monotonic()
+                yield ": keep-alive\n\n"
+
+
+# ------------------------------------------------------------
+# INSTANCIA EXPORTADA (OBLIGATORIA)
+# ------------------------------------------------------------
+events_service = EventsService()
+
+# /src/app/services/events_service.py
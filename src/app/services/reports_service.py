@@ -0,0 +1,163 @@
+# /src/app/services/reports_service.py
+
+"""
+ReportsService — v3.0
+
+Informes agregados (ventas, compras, stock) calculados sobre la réplica
+de informes (db.replica), nunca sobre database.db.
+
+⚠️ NO es un CRUD
+⚠️ NO escribe en base de datos
+
+Motivo:
+- Son consultas largas (agregados sobre todas las líneas): sobre la
+  réplica no compiten con las confirmaciones de documentos.
+
+Cada informe incluye la obsolescencia de la copia sobre la que se ha
+calculado (`as_of`, `age_seconds`, `replica_seq`): los datos reflejan
+ese instante.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import distinct, func, select
+
+from src.app.core.enum import DocumentStatus
+from src.app.core.utils.datetime_utils import dt_to_iso_z
+from src.app.db.replica import reporting_replica
+from src.app.models.product import Product
+from src.app.models.purchase_note import PurchaseNote
+from src.app.models.purchase_note_line import PurchaseNoteLine
+from src.app.models.sales_note import SalesNote
+from src.app.models.sales_note_line import SalesNoteLine
+from src.app.models.stock_product_location import StockProductLocation
+
+
+def _number(value, digits: int) -> float:
+    return round(float(value or 0), digits)
+
+
+class ReportsService:
+    """
+    Servicio de informes de solo lectura (réplica).
+    """
+
+    # ------------------------------------------------------------
+    # DOCUMENTOS (VENTAS / COMPRAS)
+    # ------------------------------------------------------------
+    def sales_by_product(self, since: datetime | None = None, until: datetime | None = None) -> dict:
+        """
+        Cantidad e importe vendidos por producto (albaranes confirmados).
+        """
+        return self._documents_by_product(SalesNote, SalesNoteLine, SalesNoteLine.sales_note_id, since, until)
+
+    def purchases_by_product(self, since: datetime | None = None, until: datetime | None = None) -> dict:
+        """
+        Cantidad e importe comprados por producto (albaranes confirmados).
+        """
+        return self._documents_by_product(PurchaseNote, PurchaseNoteLine, PurchaseNoteLine.purchase_note_id, since, until)
+
+    def _documents_by_product(self, note_model, line_model, note_fk, since, until) -> dict:
+        amount = func.sum(line_model.total_price)
+        stmt = (
+            select(
+                Product.id,
+                Product.name,
+                func.sum(line_model.quantity),
+                amount,
+                func.count(distinct(note_model.id)),
+            )
+            .join(note_model, note_fk == note_model.id)
+            .join(Product, line_model.product_id == Product.id)
+            .where(
+                note_model.status == DocumentStatus.CONFIRMED,
+                note_model.is_active.is_(True),
+                line_model.is_active.is_(True),
+            )
+            .group_by(Product.id, Product.name)
+            .order_by(amount.desc(), Product.id)
+        )
+        if since is not None:
+            stmt = stmt.where(note_model.date >= since)
+        if until is not None:
+            stmt = stmt.where(note_model.date < until)
+
+        with reporting_replica.session() as session:
+            rows = session.execute(stmt).all()
+            staleness = session.info["staleness"]
+
+        items = [
+            {
+                "product_id": product_id,
+                "product_name": name,
+                "quantity": _number(quantity, 3),
+                "amount": _number(total, 2),
+                "notes": notes,
+            }
+            for product_id, name, quantity, total, notes in rows
+        ]
+        return {
+            **staleness,
+            "since": dt_to_iso_z(since),
+            "until": dt_to_iso_z(until),
+            "items": items,
+            "totals": {
+                "quantity": _number(sum(item["quantity"] for item in items), 3),
+                "amount": _number(sum(item["amount"] for item in items), 2),
+            },
+        }
+
+    # ------------------------------------------------------------
+    # STOCK
+    # ------------------------------------------------------------
+    def stock_by_product(self) -> dict:
+        """
+        Stock total por producto y número de ubicaciones con existencias.
+        """
+        quantity = func.sum(StockProductLocation.quantity)
+        stmt = (
+            select(
+                Product.id,
+                Product.name,
+                quantity,
+                func.count(StockProductLocation.id).filter(StockProductLocation.quantity != 0),
+            )
+            .join(Product, StockProductLocation.product_id == Product.id)
+            .where(StockProductLocation.is_active.is_(True), Product.is_active.is_(True))
+            .group_by(Product.id, Product.name)
+            .order_by(Product.name)
+        )
+
+        with reporting_replica.session() as session:
+            rows = session.execute(stmt).all()
+            staleness = session.info["staleness"]
+
+        return {
+            **staleness,
+            "items": [
+                {
+                    "product_id": product_id,
+                    "product_name": name,
+                    "quantity": _number(total, 3),
+                    "locations": locations,
+                }
+                for product_id, name, total, locations in rows
+            ],
+        }
+
+    # ------------------------------------------------------------
+    # RÉPLICA
+    # ------------------------------------------------------------
+    def replica_status(self) -> dict:
+        """
+        Estado y obsolescencia de la réplica de informes.
+        """
+        return reporting_replica.status()
+
+
+# ------------------------------------------------------------
+# INSTANCIA EXPORTADA (OBLIGATORIA)
+# ------------------------------------------------------------
+reports_service = ReportsService()
+
+# /src/app/services/reports_service.py
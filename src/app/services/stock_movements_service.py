@@ -39,6 +39,9 @@ Reglas de ejecución:
 
 Auditoría:
 - updated_at = date (fecha del note que lanza el movement)
+
+Eventos:
+- Cada delta publica un evento "stock" tras el COMMIT (/api/events)
 """
 
 from datetime import datetime
@@ -52,6 +55,7 @@ from src.app.models.sales_note import SalesNote
 from src.app.models.stock_deposit_note import StockDepositNote
 
 from src.app.core import BadRequestException, settings, db_session
+from src.app.core.events import stage_event
 
 
 class StockMovementsService:
@@ -210,6 +214,14 @@ class StockMovementsService:
         
         db_session.flush()
 
+        # Notificación en tiempo real (se publica tras el COMMIT)
+        stage_event(db_session(), "stock", {
+            "product_id": product_id,
+            "stock_location_id": location_id,
+            "delta": float(delta),
+            "quantity": float(new_quantity),
+        })
+
     # ------------------------------------------------------------
     # HELPERS
     # ------------------------------------------------------------
@@ -0,0 +1,201 @@
+# /src/app/services/sync_service.py
+
+"""
+SyncService — v3.0
+
+Servicio de sincronización incremental (delta sync) para clientes
+que mantienen una réplica local de los datos.
+
+⚠️ NO es un CRUD
+⚠️ NO escribe en base de datos
+
+Cursor:
+- Es la secuencia global de change_log (contador monotónico).
+- Cada registro guarda en `change_seq` la secuencia de su última
+  escritura (create / update / soft delete / restore).
+- Un sync devuelve los registros con  since < change_seq <= cursor.
+
+Corrección sin snapshot:
+- El cursor se lee ANTES que los registros. Una escritura que confirme
+  después recibe una secuencia mayor que el cursor y llega en el
+  siguiente sync; nunca se pierde ni se salta.
+
+Reset (sync completo, `reset: true`):
+- Cursor mayor que el actual (base de datos sustituida por una copia).
+- Cursor anterior al último restore SQL / NDJSON (`RESTORE_KEY`): el
+  restore reescribe tablas enteras y no deja rastro de lo borrado.
+
+Coste:
+- Rango sobre el índice de `change_seq`: O(cambios), no O(tabla).
+"""
+
+from flask import g
+from sqlalchemy import select
+
+from src.app.core import BadRequestException, UserRole
+from src.app.core.config.database import db_session
+from src.app.core.config.settings import settings
+from src.app.models.change_log import ChangeLog
+
+from src.app.models.user import User
+from src.app.models.product import Product
+from src.app.models.customer import Customer
+from src.app.models.supplier import Supplier
+from src.app.models.stock_location import StockLocation
+from src.app.models.stock_product_location import StockProductLocation
+from src.app.models.stock_deposit_note import StockDepositNote
+from src.app.models.cash_account import CashAccount
+from src.app.models.cash_transfer_note import CashTransferNote
+from src.app.models.purchase_note import PurchaseNote
+from src.app.models.purchase_note_line import PurchaseNoteLine
+from src.app.models.sales_note import SalesNote
+from src.app.models.sales_note_line import SalesNoteLine
+
+
+class SyncService:
+    """
+    Servicio de sincronización incremental.
+    """
+
+    # Recursos sincronizables (nombre = tabla)
+    resources = {
+        model.__tablename__: model
+        for model in (
+            Product, Customer, Supplier,
+            StockLocation, StockProductLocation, StockDepositNote,
+            CashAccount, CashTransferNote,
+            PurchaseNote, PurchaseNoteLine,
+            SalesNote, SalesNoteLine,
+            User,
+        )
+    }
+
+    # Recursos visibles solo para administradores
+    admin_resources = {User.__tablename__}
+
+    # ------------------------------------------------------------
+    # HELPERS
+    # ------------------------------------------------------------
+    def _current_cursor(self) -> tuple[int, int]:
+        """
+        Secuencia global confirmada en este momento y la del último restore.
+        """
+        rows = dict(db_session.execute(
+            select(ChangeLog.table_name, ChangeLog.seq)
+            .where(ChangeLog.table_name.in_(ChangeLog.TECHNICAL_KEYS))
+        ).all())
+        return rows.get(ChangeLog.GLOBAL_KEY) or 0, rows.get(ChangeLog.RESTORE_KEY) or 0
+
+    def _allowed_resources(self, requested: list[str] | None) -> list[str]:
+        """
+        Recursos a sincronizar según la petición y el rol del usuario.
+        """
+        user = getattr(g, "current_user", None)
+        is_admin = bool(user and user.rol == UserRole.ADMIN)
+
+        allowed = [
+            name for name in self.resources
+            if is_admin or name not in self.admin_resources
+        ]
+
+        if requested is None:
+            return allowed
+
+        unknown = [name for name in requested if name not in allowed]
+        if unknown:
+            raise BadRequestException(f"Unknown sync resources: {', '.join(unknown)}")
+
+        return [name for name in allowed if name in requested]
+
+    def _changed_rows(self, model, since: int | None, cursor: int, limit: int) -> tuple[list, bool]:
+        """
+        Registros de `model` cambiados en (since, cursor], en orden de secuencia.
+
+        Si se supera `limit`, se completa el último grupo de secuencia
+        (una misma escritura puede tocar varios registros) para que el
+        cursor parcial no parta una transacción.
+
+        :return: (registros, truncado)
+        """
+        query = db_session.query(model).filter(model.change_seq <= cursor)
+
+        if since is None:
+            # Sync completo: solo el estado vigente
+            query = query.filter(model.is_active == True)
+        else:
+            query = query.filter(model.change_seq > since)
+
+        rows = query.order_by(model.change_seq, model.id).limit(limit + 1).all()
+
+        if len(rows) <= limit:
+            return rows, False
+
+        rows = rows[:limit]
+        last = rows[-1]
+        rows += (
+            query.filter(model.change_seq == last.change_seq, model.id > last.id)
+            .order_by(model.id)
+            .all()
+        )
+        return rows, True
+
+    # ------------------------------------------------------------
+    # SYNC
+    # ------------------------------------------------------------
+    def get_changes(self, since: int | None, resources: list[str] | None = None, limit: int | None = None) -> dict:
+        """
+        Devuelve los cambios posteriores a `since` y el nuevo cursor.
+
+        :param since: cursor de un sync anterior; None = sync completo.
+        :param resources: recursos a incluir (por defecto todos los permitidos).
+        :param limit: máximo de registros por recurso.
+        :return: {"cursor", "has_more", "reset", "changes": {recurso: {"upserted", "deleted"}}}
+        """
+        if since is not None and since < 0:
+            raise BadRequestException("since must be a non-negative integer")
+        if limit is None:
+            limit = settings.SYNC_MAX_ROWS
+        if limit < 1:
+            raise BadRequestException("limit must be a positive integer")
+
+        names = self._allowed_resources(resources)
+        cursor, restored = self._current_cursor()
+
+        # Cursor del futuro (copia binaria restaurada) o anterior al último
+        # restore (filas borradas sin rastro): sync completo
+        reset = since is not None and (since > cursor or since < restored)
+        if reset:
+            since = None
+
+        next_cursor = cursor
+        has_more = False
+        changes = {}
+
+        for name in names:
+            rows, truncated = self._changed_rows(self.resources[name], since, cursor, limit)
+            if truncated:
+                has_more = True
+                next_cursor = min(next_cursor, rows[-1].change_seq)
+
+            if not rows:
+                continue
+
+            changes[name] = {
+                "upserted": [row.to_dict() for row in rows if row.is_active],
+                "deleted": [row.id for row in rows if not row.is_active],
+            }
+
+        return {
+            "cursor": next_cursor,
+            "has_more": has_more,
+            "reset": reset,
+            "changes": changes,
+        }
+
+
+# ------------------------------------------------------------
+# INSTANCIA EXPORTADA (OBLIGATORIA)
+# ------------------------------------------------------------
+sync_service = SyncService()
+
+# /src/app/services/sync_service.py
@@ -3,6 +3,7 @@ import os
 import pytest
 from datetime import datetime
 
+from src.app.core.audit import audit_store
 from src.app.core.config.settings import settings
 from src.app.main import create_app
 from src.app.init_data import init_data
@@ -16,9 +17,14 @@ from src.app.core.config.database import engine, db_session, SessionLocal
 TEST_DATABASE_PATH = "/tmp/demearizoil_test.db"
 
 @pytest.fixture(scope="session", autouse=True)
-def test_settings():
+def test_settings(tmp_path_factory):
     os.environ["DATABASE_PATH"] = TEST_DATABASE_PATH
     settings.DATABASE_PATH = TEST_DATABASE_PATH
+
+    # Segmentos de auditoría fuera del árbol de código
+    audit_dir = str(tmp_path_factory.mktemp("audit"))
+    settings.AUDIT_DIR = audit_dir
+    audit_store.directory = audit_dir
     yield
     if os.path.exists(TEST_DATABASE_PATH):
         os.remove(TEST_DATABASE_PATH)
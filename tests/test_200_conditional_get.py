@@ -0,0 +1,164 @@
+# /src/app/tests/test_200_conditional_get.py
+"""
+GET condicional — v3.0
+
+Valida:
+- ETag / Last-Modified en colecciones y registros
+- 304 con If-None-Match sin cuerpo
+- El validador cambia tras escrituras (create / update / delete)
+- El validador de colección no recorre la tabla (solo índices)
+- Last-Modified es la hora real de escritura: un albarán con fecha
+  pasada no produce 304 obsoletos con If-Modified-Since, ni uno con
+  fecha futura fija Last-Modified en el futuro
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+from sqlalchemy import event
+
+from src.app.core.config.database import engine
+from src.app.core.config.settings import settings
+
+
+def _headers(admin_token: str, **extra: str) -> dict[str, str]:
+    headers = {
+        "Authorization": f"Bearer {admin_token}",
+        "Content-Type": "application/json",
+    }
+    headers.update(extra)
+    return headers
+
+
+def test_200_conditional_get_collection(client, admin_token):
+    api = settings.API_PREFIX
+
+    resp = client.get(f"{api}/products/", headers=_headers(admin_token))
+    assert resp.status_code == 200
+    etag = resp.headers["ETag"]
+    assert etag.startswith('W/"')
+
+    # Mismo estado → 304 sin cuerpo
+    resp = client.get(f"{api}/products/", headers=_headers(admin_token, **{"If-None-Match": etag}))
+    assert resp.status_code == 304
+    assert resp.data == b""
+    assert resp.headers["ETag"] == etag
+
+    # Escritura → el validador cambia
+    resp = client.post(
+        f"{api}/products/",
+        headers=_headers(admin_token),
+        data=json.dumps({"name": "Producto ETag", "unit_measure": "ud"}),
+    )
+    assert resp.status_code == 201
+    product_id = resp.get_json()["id"]
+
+    resp = client.get(f"{api}/products/", headers=_headers(admin_token, **{"If-None-Match": etag}))
+    assert resp.status_code == 200
+    new_etag = resp.headers["ETag"]
+    assert new_etag != etag
+    assert "Last-Modified" in resp.headers
+
+    # Soft delete → el validador vuelve a cambiar
+    assert client.delete(f"{api}/products/{product_id}", headers=_headers(admin_token)).status_code == 200
+    resp = client.get(f"{api}/products/", headers=_headers(admin_token, **{"If-None-Match": new_etag}))
+    assert resp.status_code == 200
+
+
+def test_200_collection_validator_uses_indexes(client, admin_token):
+    statements: list[tuple[str, tuple]] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if "max(products.created_at)" in statement:
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        assert client.get(f"{settings.API_PREFIX}/products/", headers=_headers(admin_token)).status_code == 200
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    assert len(statements) == 1
+    statement, parameters = statements[0]
+    with engine.connect() as conn:
+        plan = [row[3] for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)]
+    # Solo búsquedas por índice: ningún recorrido de tabla
+    assert not [step for step in plan if step.startswith("SCAN") and step != "SCAN CONSTANT ROW"], plan
+
+
+def test_200_conditional_get_item(client, admin_token):
+    api = settings.API_PREFIX
+
+    resp = client.post(
+        f"{api}/customers/",
+        headers=_headers(admin_token),
+        data=json.dumps({"name": "Cliente ETag"}),
+    )
+    customer_id = resp.get_json()["id"]
+
+    resp = client.get(f"{api}/customers/{customer_id}", headers=_headers(admin_token))
+    assert resp.status_code == 200
+    etag = resp.headers["ETag"]
+    last_modified = resp.headers["Last-Modified"]
+
+    resp = client.get(
+        f"{api}/customers/{customer_id}",
+        headers=_headers(admin_token, **{"If-Modified-Since": last_modified}),
+    )
+    assert resp.status_code == 304
+
+    resp = client.put(
+        f"{api}/customers/{customer_id}",
+        headers=_headers(admin_token),
+        data=json.dumps({"name": "Cliente ETag v2"}),
+    )
+    assert resp.status_code == 200
+
+    resp = client.get(f"{api}/customers/{customer_id}", headers=_headers(admin_token, **{"If-None-Match": etag}))
+    assert resp.status_code == 200
+    assert resp.get_json()["name"] == "Cliente ETag v2"
+
+    # Registro inexistente → 404 normal, sin validador
+    resp = client.get(f"{api}/customers/999999", headers=_headers(admin_token, **{"If-None-Match": etag}))
+    assert resp.status_code == 404
+
+
+def test_200_if_modified_since_ignores_business_dates(client, admin_token):
+    api = settings.API_PREFIX
+    headers = _headers(admin_token)
+
+    product_id = client.post(f"{api}/products/", headers=headers, data=json.dumps({
+        "name": "Producto Fechas", "unit_measure": "ud", "is_inventory": True,
+    })).get_json()["id"]
+    supplier_id = client.post(f"{api}/suppliers/", headers=headers, data=json.dumps({
+        "name": "Proveedor Fechas",
+    })).get_json()["id"]
+
+    def _confirm_purchase(day: str) -> None:
+        purchase_id = client.post(f"{api}/purchase_notes/", headers=headers, data=json.dumps({
+            "supplier_id": supplier_id, "date": day, "paid_amount": 0,
+        })).get_json()["id"]
+        assert client.post(f"{api}/purchase_notes/{purchase_id}/lines", headers=headers, data=json.dumps({
+            "product_id": product_id, "quantity": 1, "unit_price": 1, "total_price": 1,
+        })).status_code == 201
+        assert client.post(f"{api}/purchase_notes/{purchase_id}/confirm", headers=headers).status_code == 200
+
+    _confirm_purchase("2100-01-01")
+    resp = client.get(f"{api}/stock_product_locations/", headers=headers)
+    last_modified = resp.headers["Last-Modified"]
+    assert parsedate_to_datetime(last_modified) <= datetime.now(timezone.utc)
+
+    # HTTP-date tiene resolución de segundos
+    time.sleep(1.1)
+    _confirm_purchase("2020-01-01")
+
+    resp = client.get(
+        f"{api}/stock_product_locations/",
+        headers=_headers(admin_token, **{"If-Modified-Since": last_modified}),
+    )
+    assert resp.status_code == 200
+    assert parsedate_to_datetime(resp.headers["Last-Modified"]) > parsedate_to_datetime(last_modified)
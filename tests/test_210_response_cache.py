@@ -0,0 +1,95 @@
+# /src/app/tests/test_210_response_cache.py
+"""
+Caché de respuestas — v3.0
+
+Valida:
+- Las lecturas de datos maestros se sirven desde caché (X-Cache: HIT)
+- Create / update / delete / restore invalidan la tabla afectada
+- Los efectos de otras tablas (cliente → stock_location) también invalidan
+- El ratio de aciertos se expone en /api/admin/cache
+"""
+
+from __future__ import annotations
+
+import json
+
+from src.app.core.config.settings import settings
+
+
+def _headers(admin_token: str) -> dict[str, str]:
+    return {
+        "Authorization": f"Bearer {admin_token}",
+        "Content-Type": "application/json",
+    }
+
+
+def test_210_response_cache_hit_and_invalidation(client, admin_token):
+    api = settings.API_PREFIX
+    headers = _headers(admin_token)
+
+    resp = client.get(f"{api}/products/", headers=headers)
+    assert resp.status_code == 200
+    assert resp.headers["X-Cache"] == "MISS"
+
+    resp = client.get(f"{api}/products/", headers=headers)
+    assert resp.status_code == 200
+    assert resp.headers["X-Cache"] == "HIT"
+    assert resp.get_json() == []
+
+    # Create → invalida products
+    resp = client.post(
+        f"{api}/products/",
+        headers=headers,
+        data=json.dumps({"name": "Producto Cache", "unit_measure": "ud"}),
+    )
+    product_id = resp.get_json()["id"]
+
+    resp = client.get(f"{api}/products/", headers=headers)
+    assert resp.headers["X-Cache"] == "MISS"
+    assert [p["id"] for p in resp.get_json()] == [product_id]
+
+    # Update → invalida el detalle cacheado
+    client.get(f"{api}/products/{product_id}", headers=headers)
+    assert client.get(f"{api}/products/{product_id}", headers=headers).headers["X-Cache"] == "HIT"
+    client.put(
+        f"{api}/products/{product_id}",
+        headers=headers,
+        data=json.dumps({"name": "Producto Cache v2"}),
+    )
+    resp = client.get(f"{api}/products/{product_id}", headers=headers)
+    assert resp.headers["X-Cache"] == "MISS"
+    assert resp.get_json()["name"] == "Producto Cache v2"
+
+    # Delete / restore
+    client.get(f"{api}/products/", headers=headers)
+    client.delete(f"{api}/products/{product_id}", headers=headers)
+    assert client.get(f"{api}/products/", headers=headers).get_json() == []
+    client.post(f"{api}/products/{product_id}/restore", headers=headers)
+    assert len(client.get(f"{api}/products/", headers=headers).get_json()) == 1
+
+    # Un 304 desde caché sigue funcionando sin tocar BD
+    resp = client.get(f"{api}/products/", headers=headers)
+    etag = resp.headers["ETag"]
+    resp = client.get(f"{api}/products/", headers={**headers, "If-None-Match": etag})
+    assert resp.status_code == 304
+
+
+def test_210_response_cache_cross_table_invalidation(client, admin_token):
+    api = settings.API_PREFIX
+    headers = _headers(admin_token)
+
+    before = client.get(f"{api}/stock_locations/", headers=headers).get_json()
+    assert client.get(f"{api}/stock_locations/", headers=headers).headers["X-Cache"] == "HIT"
+
+    # Crear un cliente crea su stock_location → invalida stock_locations
+    client.post(f"{api}/customers/", headers=headers, data=json.dumps({"name": "Cliente Cache"}))
+
+    resp = client.get(f"{api}/stock_locations/", headers=headers)
+    assert resp.headers["X-Cache"] == "MISS"
+    assert len(resp.get_json()) == len(before) + 1
+
+    stats = client.get(f"{api}/admin/cache", headers=headers)
+    assert stats.status_code == 200
+    data = stats.get_json()["response_cache"]
+    assert data["hits"] >= 1
+    assert 0 < data["hit_ratio"] < 1
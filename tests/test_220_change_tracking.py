@@ -0,0 +1,79 @@
+# /src/app/tests/test_220_change_tracking.py
+"""
+Invalidación entre procesos — v3.0
+
+Valida:
+- Cada escritura incrementa la secuencia de su tabla en change_log
+- Una escritura hecha por OTRA conexión (otro worker) invalida las
+  cachés locales en el siguiente request
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+
+from src.app.core.config.database import engine
+from src.app.core.config.settings import settings
+from src.app.models.change_log import ChangeLog
+
+
+def _headers(admin_token: str) -> dict[str, str]:
+    return {
+        "Authorization": f"Bearer {admin_token}",
+        "Content-Type": "application/json",
+    }
+
+
+def _seq(session, table_name: str) -> int | None:
+    row = session.query(ChangeLog).filter_by(table_name=table_name).first()
+    return row.seq if row else None
+
+
+def test_220_change_log_bumped_on_write(client, session, admin_token):
+    api = settings.API_PREFIX
+    before = _seq(session, "suppliers")
+    before_cash = _seq(session, "cash_accounts")
+
+    resp = client.post(
+        f"{api}/suppliers/",
+        headers=_headers(admin_token),
+        data=json.dumps({"name": "Proveedor Seq"}),
+    )
+    assert resp.status_code == 201
+
+    session.expire_all()
+    after = _seq(session, "suppliers")
+    assert after is not None and after != before
+
+    # El proveedor crea su cash account → también avanza esa tabla
+    assert _seq(session, "cash_accounts") > before_cash
+
+    # El contador global es el máximo de todas las tablas
+    assert _seq(session, ChangeLog.GLOBAL_KEY) == after
+
+
+def test_220_remote_write_invalidates_local_cache(client, admin_token):
+    api = settings.API_PREFIX
+    headers = _headers(admin_token)
+
+    client.get(f"{api}/products/", headers=headers)
+    assert client.get(f"{api}/products/", headers=headers).headers["X-Cache"] == "HIT"
+
+    # Escritura desde otra conexión (simula otro worker)
+    conn = sqlite3.connect(engine.url.database)
+    conn.execute(
+        "INSERT INTO products (name, unit_measure, is_inventory, cost_average, is_active, created_at)"
+        " VALUES ('Producto Remoto', 'ud', 1, 0, 1, CURRENT_TIMESTAMP)"
+    )
+    conn.execute(
+        "INSERT INTO change_log (table_name, seq, is_active, created_at)"
+        " VALUES ('products', 1000, 1, CURRENT_TIMESTAMP)"
+        " ON CONFLICT(table_name) DO UPDATE SET seq = seq + 1000"
+    )
+    conn.commit()
+    conn.close()
+
+    resp = client.get(f"{api}/products/", headers=headers)
+    assert resp.headers["X-Cache"] == "MISS"
+    assert "Producto Remoto" in [p["name"] for p in resp.get_json()]
@@ -0,0 +1,81 @@
+# /src/app/tests/test_230_delta_sync.py
+"""
+Delta sync — v3.0
+
+Valida:
+- Sin cursor se devuelve el estado completo y un cursor
+- Con cursor solo llegan los registros creados / modificados / borrados después
+- El límite por recurso pagina con has_more sin perder cambios
+- Parámetros inválidos → 400
+"""
+
+from __future__ import annotations
+
+import json
+
+from src.app.core.config.settings import settings
+
+
+def _headers(admin_token: str) -> dict[str, str]:
+    return {
+        "Authorization": f"Bearer {admin_token}",
+        "Content-Type": "application/json",
+    }
+
+
+def test_230_delta_sync_flow(client, admin_token):
+    api = settings.API_PREFIX
+    headers = _headers(admin_token)
+
+    # Sync inicial (completo)
+    resp = client.get(f"{api}/sync", headers=headers)
+    assert resp.status_code == 200
+    data = resp.get_json()
+    cursor = data["cursor"]
+    assert data["has_more"] is False
+    assert "stock_locations" in data["changes"]
+
+    # Sin cambios → vacío
+    data = client.get(f"{api}/sync?since={cursor}", headers=headers).get_json()
+    assert data["changes"] == {}
+    assert data["cursor"] == cursor
+
+    # Create + update + delete
+    p1 = client.post(f"{api}/products/", headers=headers, data=json.dumps({"name": "Sync A", "unit_measure": "ud"})).get_json()
+    p2 = client.post(f"{api}/products/", headers=headers, data=json.dumps({"name": "Sync B", "unit_measure": "ud"})).get_json()
+    client.put(f"{api}/products/{p1['id']}", headers=headers, data=json.dumps({"name": "Sync A2"}))
+    client.delete(f"{api}/products/{p2['id']}", headers=headers)
+
+    data = client.get(f"{api}/sync?since={cursor}", headers=headers).get_json()
+    assert list(data["changes"]) == ["products"]
+    assert [p["name"] for p in data["changes"]["products"]["upserted"]] == ["Sync A2"]
+    assert data["changes"]["products"]["deleted"] == [p2["id"]]
+    assert data["cursor"] > cursor
+
+
+def test_230_delta_sync_pagination(client, admin_token):
+    api = settings.API_PREFIX
+    headers = _headers(admin_token)
+
+    cursor = client.get(f"{api}/sync?resources=products", headers=headers).get_json()["cursor"]
+    for i in range(3):
+        client.post(f"{api}/products/", headers=headers, data=json.dumps({"name": f"Page {i}", "unit_measure": "ud"}))
+
+    names = []
+    has_more = True
+    while has_more:
+        data = client.get(f"{api}/sync?since={cursor}&resources=products&limit=2", headers=headers).get_json()
+        names += [p["name"] for p in data.get("changes", {}).get("products", {}).get("upserted", [])]
+        cursor, has_more = data["cursor"], data["has_more"]
+
+    assert sorted(set(names)) == ["Page 0", "Page 1", "Page 2"]
+
+
+def test_230_delta_sync_invalid_params(client, admin_token):
+    api = settings.API_PREFIX
+    headers = _headers(admin_token)
+
+    assert client.get(f"{api}/sync?since=abc", headers=headers).status_code == 400
+    assert client.get(f"{api}/sync?since=-1", headers=headers).status_code == 400
+    assert client.get(f"{api}/sync?resources=nope", headers=headers).status_code == 400
+    assert client.get(f"{api}/sync?limit=0", headers=headers).status_code == 400
@@ -0,0 +1,97 @@
+# /src/app/tests/test_240_events_stream.py
+"""
+Eventos en tiempo real (SSE) — v3.0
+
+Valida:
+- /api/events exige autenticación
+- Confirmar una compra publica eventos stock, cash y document
+- Los filtros por tipo se aplican
+- Un buffer lleno se descarta por el principio y avisa con resync
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import date
+
+from src.app.core.config.settings import settings
+from src.app.core.events import event_bus
+
+
+def _headers(admin_token: str) -> dict[str, str]:
+    return {
+        "Authorization": f"Bearer {admin_token}",
+        "Content-Type": "application/json",
+    }
+
+
+def _parse(chunks: list[bytes]) -> list[tuple[str, dict]]:
+    events = []
+    for block in b"".join(chunks).decode().split("\n\n"):
+        fields = dict(
+            line.split(": ", 1) for line in block.splitlines() if not line.startswith(":") and ": " in line
+        )
+        if "event" in fields:
+            events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+
+def _confirmed_purchase(client, headers) -> int:
+    api = settings.API_PREFIX
+    product_id = client.post(f"{api}/products/", headers=headers, data=json.dumps({"name": "Evento", "unit_measure": "ud"})).get_json()["id"]
+    supplier_id = client.post(f"{api}/suppliers/", headers=headers, data=json.dumps({"name": "Proveedor Evento"})).get_json()["id"]
+    purchase_id = client.post(
+        f"{api}/purchase_notes/",
+        headers=headers,
+        data=json.dumps({"supplier_id": supplier_id, "date": date.today().isoformat(), "paid_amount": 0}),
+    ).get_json()["id"]
+    client.post(
+        f"{api}/purchase_notes/{purchase_id}/lines",
+        headers=headers,
+        data=json.dumps({"product_id": product_id, "quantity": 2, "unit_price": 50, "total_price": 100}),
+    )
+    client.put(f"{api}/purchase_notes/{purchase_id}", headers=headers, data=json.dumps({"paid_amount": 50}))
+    assert client.post(f"{api}/purchase_notes/{purchase_id}/confirm", headers=headers).status_code == 200
+    return purchase_id
+
+
+def test_240_events_stream(client, admin_token):
+    api = settings.API_PREFIX
+    headers = _headers(admin_token)
+
+    assert client.get(f"{api}/events").status_code == 401
+
+    resp = client.get(f"{api}/events", headers=headers, buffered=False)
+    assert resp.status_code == 200
+    assert resp.mimetype == "text/event-stream"
+
+    filtered = client.get(f"{api}/events?types=document", headers=headers, buffered=False)
+    assert event_bus.subscriber_count() == 2
+
+    purchase_id = _confirmed_purchase(client, headers)
+
+    stream = iter(resp.response)
+    events = _parse([next(stream), next(stream)])
+    types = [name for name, _ in events]
+    assert "stock" in types and "cash" in types
+    assert ("document", {"resource": "purchase_notes", "id": purchase_id, "status": "CONFIRMED"}) in events
+
+    stream = iter(filtered.response)
+    assert {name for name, _ in _parse([next(stream), next(stream)])} == {"document"}
+
+    resp.close()
+    filtered.close()
+    assert event_bus.subscriber_count() == 0
+
+
+def test_240_events_bounded_buffer():
+    subscription = event_bus.subscribe(max_queue=2)
+    try:
+        for i in range(5):
+            event_bus.publish("stock", {"n": i})
+
+        events, overflowed = subscription.get(timeout=0)
+        assert overflowed is True
+        assert [evt["data"]["n"] for evt in events] == [3, 4]
+    finally:
+        event_bus.unsubscribe(subscription)
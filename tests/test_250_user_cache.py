@@ -0,0 +1,81 @@
+# /src/app/tests/test_250_user_cache.py
+"""
+Caché de usuarios autenticados — v3.0
+
+Valida:
+- Requests repetidos no vuelven a cargar el usuario (aciertos de caché)
+- /auth/me devuelve lo mismo que User.to_dict()
+- Cambio de password y borrado revocan el acceso en el siguiente request
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import timedelta
+
+from src.app.core.config.settings import settings
+from src.app.models.user import User
+from src.app.security.jwt import create_access_token
+from src.app.security.user_cache import user_cache
+
+
+def _headers(token: str) -> dict[str, str]:
+    return {
+        "Authorization": f"Bearer {token}",
+        "Content-Type": "application/json",
+    }
+
+
+def test_250_user_cache_hits_and_snapshot(client, session, admin_user, admin_token):
+    api = settings.API_PREFIX
+
+    client.get(f"{api}/auth/me", headers=_headers(admin_token))
+    hits = user_cache.stats()["hits"]
+
+    resp = client.get(f"{api}/auth/me", headers=_headers(admin_token))
+    assert resp.status_code == 200
+    assert user_cache.stats()["hits"] == hits + 1
+
+    # Misma serialización que el modelo (salvo la actividad, que se
+    # escribe en diferido y puede volcarse entre ambas lecturas)
+    session.expire_all()
+    volatile = {"last_login", "last_seen"}
+    expected = {k: v for k, v in session.get(User, admin_user.id).to_dict().items() if k not in volatile}
+    assert {k: v for k, v in resp.get_json().items() if k not in volatile} == expected
+
+
+def test_250_user_cache_revocation(client, session, admin_token):
+    api = settings.API_PREFIX
+
+    resp = client.post(
+        f"{api}/users/",
+        headers=_headers(admin_token),
+        data=json.dumps({"username": "cache_user", "password": "secret1", "rol": "USER"}),
+    )
+    assert resp.status_code == 201
+    user_id = resp.get_json()["id"]
+
+    # password_changed_at se compara con resolución de segundos: se
+    # retrasa para que el cambio de password caiga en otro segundo
+    user = session.get(User, user_id)
+    user.password_changed_at -= timedelta(seconds=2)
+    session.commit()
+
+    token = create_access_token(user)
+    assert client.get(f"{api}/auth/me", headers=_headers(token)).status_code == 200
+
+    # Cambio de password → el token anterior deja de valer
+    resp = client.post(
+        f"{api}/users/change-password",
+        headers=_headers(token),
+        data=json.dumps({"old_password": "secret1", "new_password": "secret2"}),
+    )
+    assert resp.status_code == 200
+    assert client.get(f"{api}/auth/me", headers=_headers(token)).status_code == 401
+
+    # Borrado → el token nuevo deja de valer
+    session.expire_all()
+    token = create_access_token(session.get(User, user_id))
+    assert client.get(f"{api}/auth/me", headers=_headers(token)).status_code == 200
+    client.delete(f"{api}/users/{user_id}", headers=_headers(admin_token))
+    assert client.get(f"{api}/auth/me", headers=_headers(token)).status_code == 401
@@ -0,0 +1,49 @@
+# /src/app/tests/test_260_token_cache.py
+"""
+Caché de tokens verificados — v3.0
+
+Valida:
+- El segundo request con el mismo token es un acierto (sin re-verificar)
+- Un token cacheado que caduca se rechaza igualmente
+- Los contadores se exponen en /api/admin/cache
+"""
+
+from __future__ import annotations
+
+import time
+
+from src.app.core.config.settings import settings
+from src.app.security import token_cache as token_cache_module
+from src.app.security.token_cache import token_cache
+
+
+def _headers(token: str) -> dict[str, str]:
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_260_token_cache_hit_and_expiry(client, admin_token, monkeypatch):
+    api = settings.API_PREFIX
+
+    assert client.get(f"{api}/auth/me", headers=_headers(admin_token)).status_code == 200
+    hits = token_cache.stats()["hits"]
+    assert client.get(f"{api}/auth/me", headers=_headers(admin_token)).status_code == 200
+    assert token_cache.stats()["hits"] == hits + 1
+
+    # El reloj avanza más allá de exp → el acierto de caché no lo salva
+    future = time.time() + settings.TOKEN_EXPIRE_MINUTES * 60 + 5
+    monkeypatch.setattr(token_cache_module.time, "time", lambda: future)
+
+    resp = client.get(f"{api}/auth/me", headers=_headers(admin_token))
+    assert resp.status_code == 401
+    assert resp.get_json()["message"] == "Token has expired"
+
+
+def test_260_token_cache_stats(client, admin_token):
+    api = settings.API_PREFIX
+
+    client.get(f"{api}/auth/me", headers=_headers(admin_token))
+    data = client.get(f"{api}/admin/cache", headers=_headers(admin_token)).get_json()
+
+    assert data["token_cache"]["hit_ratio"] > 0
+    assert data["auth_middleware"]["requests"] >= 2
+    assert data["auth_middleware"]["avg_us"] > 0
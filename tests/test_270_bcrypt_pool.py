@@ -0,0 +1,60 @@
+# /src/app/tests/test_270_bcrypt_pool.py
+"""
+bcrypt fuera del hilo del request — v3.0
+
+Valida:
+- Login correcto con un hash de coste distinto → rehash transparente
+  (sin invalidar tokens: password_changed_at no cambia)
+- Pool y cola llenos → 503 inmediato sin trabajo bcrypt
+"""
+
+from __future__ import annotations
+
+import threading
+
+from src.app.core.config.settings import settings
+from src.app.models.user import User
+from src.app.security.password import BcryptPool, hash_password, hash_rounds
+from src.app.core.exceptions import ServiceUnavailableException
+
+
+def test_270_rehash_on_login(client, session, admin_user):
+    admin_user.hash_password = hash_password("admin123", rounds=4)
+    session.commit()
+    pwd_changed = admin_user.password_changed_at
+
+    resp = client.post("/api/auth/login", json={"username": "admin", "password": "admin123"})
+    assert resp.status_code == 200
+
+    session.expire_all()
+    user = session.get(User, admin_user.id)
+    assert hash_rounds(user.hash_password) == settings.BCRYPT_ROUNDS
+    assert user.password_changed_at == pwd_changed
+
+
+def test_270_pool_rejects_when_full():
+    pool = BcryptPool(workers=1, queue_limit=0)
+    started = threading.Event()
+    release = threading.Event()
+
+    def blocking():
+        started.set()
+        release.wait(5)
+        return True
+
+    worker = threading.Thread(target=pool.run, args=(blocking,))
+    worker.start()
+    started.wait(5)
+
+    try:
+        pool.run(lambda: True)
+        raised = False
+    except ServiceUnavailableException:
+        raised = True
+    finally:
+        release.set()
+        worker.join()
+
+    assert raised
+    assert pool.stats()["rejected"] == 1
+    assert pool.run(lambda: "ok") == "ok"
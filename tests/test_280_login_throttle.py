@@ -0,0 +1,56 @@
+# /src/app/tests/test_280_login_throttle.py
+"""
+Limitación de login — v3.0
+
+Valida:
+- Superada la ráfaga por username → 429 con Retry-After
+- El 429 se decide antes de bcrypt (el pool no trabaja)
+- Sin TRUSTED_PROXIES se ignora X-Forwarded-For (un valor falso por
+  intento no da un bucket nuevo)
+- Con TRUSTED_PROXIES=1 la IP es el último valor (el que añade el proxy)
+"""
+
+from __future__ import annotations
+
+from src.app.core.config.settings import settings
+from src.app.security.password import bcrypt_pool
+
+
+def _login(client, username: str, ip: str = "10.0.0.1"):
+    return client.post(
+        "/api/auth/login",
+        json={"username": username, "password": "wrong-password"},
+        headers={"X-Forwarded-For": f"198.51.100.7, {ip}"},
+    )
+
+
+def test_280_login_throttle_by_username(client):
+    for _ in range(settings.LOGIN_RATE_USER_BURST):
+        assert _login(client, "admin").status_code == 401
+
+    completed = bcrypt_pool.stats()["completed"]
+
+    # Otra IP, mismo username → sigue limitado
+    resp = _login(client, "Admin", ip="10.0.0.2")
+    assert resp.status_code == 429
+    assert int(resp.headers["Retry-After"]) >= 1
+    assert bcrypt_pool.stats()["completed"] == completed
+
+
+def test_280_login_throttle_by_ip(client, monkeypatch):
+    monkeypatch.setattr(settings, "TRUSTED_PROXIES", 1)
+    for i in range(settings.LOGIN_RATE_IP_BURST):
+        assert _login(client, f"user_{i}").status_code == 401
+
+    assert _login(client, "someone_else").status_code == 429
+
+    # La IP real es la que añadió el proxy de confianza (último valor)
+    assert _login(client, "someone_else", ip="10.0.0.9").status_code == 401
+
+
+def test_280_forwarded_for_ignored_without_trusted_proxies(client):
+    # Un X-Forwarded-For distinto en cada intento no evita el límite por IP
+    for i in range(settings.LOGIN_RATE_IP_BURST):
+        assert _login(client, f"user_{i}", ip=f"10.1.0.{i}").status_code == 401
+
+    assert _login(client, "someone_else", ip="10.1.1.1").status_code == 429
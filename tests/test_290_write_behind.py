@@ -0,0 +1,134 @@
+# /src/app/tests/test_290_write_behind.py
+"""
+Escrituras diferidas (write-behind) — v3.0
+
+Valida:
+- Login y requests autenticados encolan last_login / last_seen sin escribir
+- Un volcado escribe todo en lote y fusiona por usuario
+- Buffer acotado: las entradas más antiguas se descartan y se cuentan
+- Buffer sin pérdidas (auditoría): al llenarse vuelca en el hilo que
+  encola, y un volcado fallido no descarta nada
+- Auditoría saturada (almacenamiento caído): las escrituras responden 503
+  sin retener más entradas, y se reanudan al recuperarse
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import bindparam, text
+
+from src.app.core.audit import audit_buffer
+from src.app.core.config.database import engine
+from src.app.db.write_behind import WriteBehindBuffer, flush_all
+from src.app.models.user import User
+
+
+def test_290_last_login_and_last_seen(client, session, admin_user):
+    flush_all()
+
+    resp = client.post("/api/auth/login", json={"username": "admin", "password": "admin123"})
+    token = resp.get_json()["access_token"]
+    for _ in range(3):
+        client.get("/api/auth/me", headers={"Authorization": f"Bearer {token}"})
+
+    stats = client.get("/api/admin/cache", headers={"Authorization": f"Bearer {token}"}).get_json()["write_behind"]
+    assert stats["users.last_login"]["pending"] + stats["users.last_login"]["written"] >= 1
+
+    flush_all()
+    session.expire_all()
+    user = session.get(User, admin_user.id)
+    assert user.last_login is not None
+    assert user.last_seen is not None
+
+
+def test_290_buffer_coalesces_and_bounds(app):
+    engine_stmt = text("UPDATE users SET email = :email WHERE id = :user_id").bindparams(
+        bindparam("email"), bindparam("user_id"),
+    )
+
+    coalesced = WriteBehindBuffer(
+        name="test.coalesced", engine=engine, statement=engine_stmt,
+        flush_seconds=3600, flush_events=1000, max_pending=10,
+        key=lambda params: params["user_id"],
+    )
+    for i in range(5):
+        coalesced.add({"user_id": 1, "email": f"v{i}@example.com"})
+    assert coalesced.flush() == 1
+
+    with engine.connect() as connection:
+        email = connection.execute(text("SELECT email FROM users WHERE id = 1")).scalar()
+    assert email == "v4@example.com"
+
+    bounded = WriteBehindBuffer(
+        name="test.bounded", engine=engine, statement=engine_stmt,
+        flush_seconds=3600, flush_events=1000, max_pending=3,
+    )
+    for i in range(5):
+        bounded.add({"user_id": 999, "email": "x"})
+    assert bounded.stats()["pending"] == 3
+    assert bounded.stats()["dropped"] == 2
+    assert bounded.flush() == 3
+
+
+def test_290_lossless_buffer_applies_backpressure(app):
+    written: list[list[dict]] = []
+    failing = [True]
+
+    def _writer(rows):
+        if failing[0]:
+            raise RuntimeError("disk full")
+        written.append(rows)
+
+    lossless = WriteBehindBuffer(
+        name="test.lossless", writer=_writer,
+        flush_seconds=3600, flush_events=1000, max_pending=3, lossless=True,
+    )
+
+    # El almacenamiento falla: nada se descarta
+    for i in range(5):
+        lossless.add({"n": i})
+    stats = lossless.stats()
+    assert stats["dropped"] == 0 and stats["pending"] == 5
+    assert stats["sync_flushes"] == 2 and stats["errors"] == 2
+    assert stats["saturated"] is True
+
+    # Se recupera: el siguiente add por encima del límite vuelca todo
+    failing[0] = False
+    lossless.add({"n": 5})
+    assert [row["n"] for batch in written for row in batch] == list(range(6))
+    assert lossless.stats()["pending"] == 0
+    assert lossless.saturated is False
+
+
+def test_290_audit_buffer_never_drops(client, admin_token):
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    stats = client.get("/api/admin/cache", headers=headers).get_json()
+    assert stats["write_behind"]["audit"]["lossless"] is True
+    assert stats["alarms"] == {"audit_dropped": 0, "audit_saturated": False}
+
+
+def test_290_saturated_audit_pauses_writes(client, admin_token, monkeypatch):
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    audit_buffer.flush()
+    monkeypatch.setattr(audit_buffer, "max_pending", 1)
+
+    def _failing(rows):
+        raise RuntimeError("disk full")
+
+    monkeypatch.setattr(audit_buffer, "_writer", _failing)
+    for i in range(2):
+        client.post("/api/products/", headers=headers, json={"name": f"Auditado {i}", "unit_measure": "ud"})
+    assert audit_buffer.saturated
+    retained = audit_buffer.stats()["pending"]
+
+    # Sin auditoría posible, la escritura no se ejecuta ni se retiene
+    resp = client.post("/api/products/", headers=headers, json={"name": "Rechazado", "unit_measure": "ud"})
+    assert resp.status_code == 503
+    assert resp.headers["Retry-After"] == "5"
+    assert audit_buffer.stats()["pending"] == retained
+    assert client.get("/api/products/", headers=headers).status_code == 200
+    assert client.get("/api/admin/cache", headers=headers).get_json()["alarms"]["audit_saturated"] is True
+
+    monkeypatch.undo()
+    assert audit_buffer.flush() == retained
+    resp = client.post("/api/products/", headers=headers, json={"name": "Reanudado", "unit_measure": "ud"})
+    assert resp.status_code == 201
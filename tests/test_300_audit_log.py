@@ -0,0 +1,92 @@
+# /src/app/tests/test_300_audit_log.py
+"""
+Registro de auditoría — v3.0
+
+Valida:
+- Cada escritura (POST / PUT / DELETE) queda registrada con usuario,
+  ruta y status, incluidos los rechazos
+- La consulta filtra por ruta (prefijo), método y status
+- La retención borra los segmentos mensuales antiguos completos
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from datetime import datetime, timezone
+
+from src.app.core.audit.store import AuditStore
+from src.app.core.config.settings import settings
+
+
+def _headers(admin_token: str) -> dict[str, str]:
+    return {
+        "Authorization": f"Bearer {admin_token}",
+        "Content-Type": "application/json",
+    }
+
+
+def test_300_writes_are_audited(client, admin_token):
+    api = settings.API_PREFIX
+    headers = _headers(admin_token)
+
+    resp = client.post(
+        f"{api}/products/",
+        headers=headers,
+        data=json.dumps({"name": "Producto Auditado", "unit_measure": "ud"}),
+    )
+    assert resp.status_code == 201
+
+    # Rechazo sin token: también se registra (sin usuario)
+    resp = client.post(f"{api}/products/", data=json.dumps({"name": "X"}))
+    assert resp.status_code == 401
+
+    # Las lecturas no se auditan
+    client.get(f"{api}/products/", headers=headers)
+
+    resp = client.get(f"{api}/admin/audit?path={api}/products&limit=2", headers=headers)
+    assert resp.status_code == 200
+    rejected, created = resp.get_json()
+
+    assert created["method"] == "POST"
+    assert created["status"] == 201
+    assert created["user_id"] is not None
+    assert created["endpoint"]
+    assert created["duration_ms"] >= 0
+
+    assert rejected["status"] == 401
+    assert rejected["user_id"] is None
+
+    resp = client.get(f"{api}/admin/audit?path={api}/products&status=201&limit=1", headers=headers)
+    assert [row["id"] for row in resp.get_json()] == [created["id"]]
+
+
+def test_300_audit_query_validation(client, admin_token):
+    api = settings.API_PREFIX
+    headers = _headers(admin_token)
+
+    assert client.get(f"{api}/admin/audit?limit=0", headers=headers).status_code == 400
+    assert client.get(f"{api}/admin/audit?since=ayer", headers=headers).status_code == 400
+
+    resp = client.get(f"{api}/admin/audit?since=2000-01-01T00:00:00Z", headers=headers)
+    assert resp.status_code == 200
+
+
+def test_300_retention_drops_old_segments(tmp_path):
+    # Retención amplia al escribir (write_batch purga con la fecha real)
+    store = AuditStore(str(tmp_path), retention_months=1200)
+
+    store.write_batch([
+        {"ts": "2020-01-15T10:00:00Z", "method": "POST", "path": "/api/x", "status": 201},
+        {"ts": "2020-03-15T10:00:00Z", "method": "PUT", "path": "/api/x/1", "status": 200},
+    ])
+    assert store.segments() == ["202001", "202003"]
+
+    store.retention_months = 3
+
+    removed = store.purge(now=datetime(2020, 4, 1, tzinfo=timezone.utc))
+    assert removed == ["202001"]
+    assert not os.path.exists(tmp_path / "audit_202001.db")
+
+    rows = store.query(path="/api/x")
+    assert [row["method"] for row in rows] == ["PUT"]
@@ -0,0 +1,80 @@
+# /src/app/tests/test_310_route_policies.py
+"""
+Políticas de acceso por endpoint — v3.0
+
+Valida:
+- Los endpoints admin rechazan a un usuario sin rol ADMIN (403)
+  antes de ejecutar el controller
+- Las rutas públicas no exigen token
+- Un endpoint sin política impide el arranque
+"""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+from flask import Flask
+
+from src.app.core import RoutePolicy
+from src.app.core.config.settings import settings
+from src.app.models.user import User
+from src.app.security.jwt import create_access_token
+from src.app.security.policies import RoutePolicyTable, route_policies
+
+
+def _headers(token: str) -> dict[str, str]:
+    return {
+        "Authorization": f"Bearer {token}",
+        "Content-Type": "application/json",
+    }
+
+
+def test_310_admin_endpoints_reject_non_admin(client, session, admin_token):
+    api = settings.API_PREFIX
+
+    resp = client.post(
+        f"{api}/users/",
+        headers=_headers(admin_token),
+        data=json.dumps({"username": "policy_user", "password": "secret1", "rol": "USER"}),
+    )
+    assert resp.status_code == 201
+    token = create_access_token(session.get(User, resp.get_json()["id"]))
+
+    for method, path in (
+        ("get", f"{api}/admin/cache"),
+        ("get", f"{api}/backup"),
+        ("post", f"{api}/users/"),
+    ):
+        resp = getattr(client, method)(path, headers=_headers(token), data=json.dumps({}))
+        assert resp.status_code == 403, path
+        assert resp.get_json()["message"] == "Admin role required"
+
+    # Rutas autenticadas: accesibles para cualquier rol
+    assert client.get(f"{api}/products/", headers=_headers(token)).status_code == 200
+    assert client.get(f"{api}/admin/cache", headers=_headers(admin_token)).status_code == 200
+
+
+def test_310_public_and_unknown_routes(client):
+    api = settings.API_PREFIX
+
+    assert route_policies.get("api.auth.login") is RoutePolicy.PUBLIC
+    assert client.get("/").status_code == 200
+    assert client.get(f"{api}/products/").status_code == 401
+
+    # Sin endpoint: error de routing, sin validación JWT
+    assert client.get(f"{api}/no_existe").status_code == 404
+
+
+def test_310_unmapped_endpoint_fails_startup():
+    app = Flask(__name__)
+    app.add_url_rule("/nueva", "nueva", lambda: "ok")
+
+    with pytest.raises(RuntimeError, match="nueva"):
+        RoutePolicyTable().compile(app, {"static": "public"})
+
+    with pytest.raises(RuntimeError, match="Invalid route policy"):
+        RoutePolicyTable().compile(app, {"static": "public", "nueva": "nadie"})
+
+    compiled = RoutePolicyTable().compile(app, {"static": "public", "nueva": "admin"})
+    assert compiled["nueva"] is RoutePolicy.ADMIN
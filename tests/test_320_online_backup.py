@@ -0,0 +1,121 @@
+# /src/app/tests/test_320_online_backup.py
+"""
+Backup online — v3.0
+
+Valida:
+- La copia avanza por pasos y pasa PRAGMA integrity_check
+- Una escritura de otra conexión durante la copia la reinicia y el
+  resultado incluye esa escritura (foto consistente)
+- Con escrituras constantes, superado BACKUP_MAX_RESTARTS la copia se
+  termina en un solo paso (method = "single_step")
+- GET /api/backup descarga una copia SQLite válida y /status informa
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+
+from src.app.backups.online_backup import OnlineBackup
+from src.app.core.config.database import engine
+from src.app.core.config.settings import settings
+
+
+def _headers(admin_token: str) -> dict[str, str]:
+    return {
+        "Authorization": f"Bearer {admin_token}",
+        "Content-Type": "application/json",
+    }
+
+
+def _count(path, table: str) -> int:
+    conn = sqlite3.connect(path)
+    try:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def test_320_backup_in_steps_with_concurrent_write(client, admin_token, tmp_path):
+    api = settings.API_PREFIX
+    client.post(
+        f"{api}/products/",
+        headers=_headers(admin_token),
+        data=json.dumps({"name": "Producto Backup", "unit_measure": "ud"}),
+    )
+
+    written = []
+
+    def _write_once(progress):
+        if written or progress["steps"] < 3:
+            return
+        conn = sqlite3.connect(engine.url.database)
+        conn.execute(
+            "INSERT INTO products (name, unit_measure, is_inventory, cost_average, is_active, created_at)"
+            " VALUES ('Producto Concurrente', 'ud', 1, 0, 1, CURRENT_TIMESTAMP)"
+        )
+        conn.commit()
+        conn.close()
+        written.append(progress)
+
+    backup = OnlineBackup(engine.url.database, pages_per_step=1, step_sleep_ms=0)
+    target = tmp_path / "copy.db"
+    result = backup.run(str(target), on_step=_write_once)
+
+    assert result["state"] == "completed"
+    assert result["integrity"] == "ok"
+    assert result["steps"] > 1
+    assert result["restarts"] >= 1
+    assert result["method"] == "stepped"
+    assert result["pages_copied"] == result["pages_total"]
+    assert backup.status()["state"] == "completed"
+
+    assert _count(target, "products") == 2
+    assert not (tmp_path / "copy.db.part").exists()
+
+
+def test_320_restart_limit_falls_back_to_single_step(client, admin_token, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "BACKUP_MAX_RESTARTS", 2)
+    client.post(
+        f"{settings.API_PREFIX}/products/",
+        headers=_headers(admin_token),
+        data=json.dumps({"name": "Producto Restart", "unit_measure": "ud"}),
+    )
+    writes = []
+
+    # Escritor constante: cada paso reinicia la copia por pasos
+    def _write_every_step(progress):
+        conn = sqlite3.connect(engine.url.database)
+        conn.execute(
+            "INSERT INTO products (name, unit_measure, is_inventory, cost_average, is_active, created_at)"
+            " VALUES (?, 'ud', 1, 0, 1, CURRENT_TIMESTAMP)",
+            (f"Constante {len(writes)}",),
+        )
+        conn.commit()
+        conn.close()
+        writes.append(progress["steps"])
+
+    backup = OnlineBackup(engine.url.database, pages_per_step=1, step_sleep_ms=0)
+    target = tmp_path / "copy.db"
+    result = backup.run(str(target), on_step=_write_every_step)
+
+    assert result["state"] == "completed"
+    assert result["method"] == "single_step"
+    assert result["restarts"] == 3
+    assert result["integrity"] == "ok"
+    assert _count(target, "products") == 1 + len(writes)
+
+
+def test_320_backup_endpoint(client, admin_token, tmp_path, monkeypatch):
+    api = settings.API_PREFIX
+    monkeypatch.setattr(settings, "BACKUP_DIR", str(tmp_path))
+
+    resp = client.get(f"{api}/backup", headers=_headers(admin_token))
+    assert resp.status_code == 200
+    assert resp.data.startswith(b"SQLite format 3\x00")
+    resp.close()
+
+    status = client.get(f"{api}/backup/status", headers=_headers(admin_token)).get_json()
+    assert status["state"] == "completed"
+    assert status["integrity"] == "ok"
+    assert _count(status["target"], "users") >= 1
@@ -0,0 +1,64 @@
+# /src/app/tests/test_330_backup_dump.py
+"""
+Dump SQL en streaming — v3.0
+
+Valida:
+- GET /api/backup/dump devuelve gzip en bloques, empezando por la cabecera
+- El trailer sha256 coincide con el contenido descomprimido
+- Los valores con comillas, saltos de línea y ';' se serializan bien
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+
+from src.app.backups.sql_dump import CHECKSUM_PREFIX, DUMP_HEADER, sql_literal
+from src.app.core.config.settings import settings
+
+
+def _headers(admin_token: str) -> dict[str, str]:
+    return {
+        "Authorization": f"Bearer {admin_token}",
+        "Content-Type": "application/json",
+    }
+
+
+def test_330_streamed_dump_with_checksum(client, admin_token):
+    api = settings.API_PREFIX
+    client.post(
+        f"{api}/products/",
+        headers=_headers(admin_token),
+        data=json.dumps({"name": "Aceite 'Virgen'; extra\nlínea", "unit_measure": "l"}),
+    )
+
+    resp = client.get(f"{api}/backup/dump", headers=_headers(admin_token), buffered=False)
+    assert resp.status_code == 200
+    assert resp.mimetype == "application/gzip"
+    assert ".sql.gz" in resp.headers["Content-Disposition"]
+
+    chunks = list(resp.response)
+    assert len(chunks) >= 2
+    # El primer bloque ya es gzip válido con la cabecera
+    assert chunks[0][:2] == b"\x1f\x8b"
+
+    text = gzip.decompress(b"".join(chunks)).decode("utf-8")
+    assert text.startswith(DUMP_HEADER)
+
+    body, trailer = text.rsplit(CHECKSUM_PREFIX, 1)
+    assert trailer.strip() == hashlib.sha256(body.encode("utf-8")).hexdigest()
+
+    assert "-- TABLE users\n" in body
+    assert sql_literal("Aceite 'Virgen'; extra\nlínea") in body
+    # Orden de foreign keys: documento y producto antes que sus líneas
+    assert body.index("-- TABLE purchase_notes\n") < body.index("-- TABLE purchase_note_lines")
+    assert body.index("-- TABLE products\n") < body.index("-- TABLE purchase_note_lines")
+
+
+def test_330_sql_literals():
+    assert sql_literal(None) == "NULL"
+    assert sql_literal(3) == "3"
+    assert sql_literal(1.5) == "1.5"
+    assert sql_literal(b"\x00\xff") == "X'00ff'"
+    assert sql_literal("o'k") == "'o''k'"
@@ -0,0 +1,148 @@
+# /src/app/tests/test_340_backup_restore.py
+"""
+Restore de dump SQL — v3.0
+
+Valida:
+- dump → cambios → restore devuelve la base al estado del dump
+  (incluidos literales con ';', comillas y saltos de línea)
+- Un checksum erróneo no aplica nada (una sola transacción)
+- Los índices secundarios se reconstruyen
+- Las secuencias de change_log nunca retroceden: el restore no carga
+  las del dump y sitúa cada tabla restaurada por encima de la global
+- Un cursor de sync anterior al restore recibe reset y el estado completo
+"""
+
+from __future__ import annotations
+
+import gzip
+import io
+import json
+
+from sqlalchemy import text
+
+from src.app.core.config.database import engine
+from src.app.core.config.settings import settings
+
+
+def _headers(admin_token: str, content_type: str = "application/json") -> dict[str, str]:
+    return {
+        "Authorization": f"Bearer {admin_token}",
+        "Content-Type": content_type,
+    }
+
+
+def _product_names(client, admin_token) -> list[str]:
+    resp = client.get(f"{settings.API_PREFIX}/products/", headers=_headers(admin_token))
+    return sorted(p["name"] for p in resp.get_json())
+
+
+def _indexes() -> set[str]:
+    with engine.connect() as conn:
+        return {
+            row[0] for row in conn.execute(
+                text("SELECT name FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL")
+            )
+        }
+
+
+def _sequences() -> dict[str, int]:
+    with engine.connect() as conn:
+        return dict(conn.execute(text("SELECT table_name, seq FROM change_log")).fetchall())
+
+
+def _upload(client, admin_token, data: bytes):
+    return client.post(
+        f"{settings.API_PREFIX}/backup",
+        headers=_headers(admin_token, "multipart/form-data"),
+        data={"file": (io.BytesIO(data), "backup.sql.gz")},
+    )
+
+
+def test_340_dump_and_restore_roundtrip(client, admin_token, tmp_path, monkeypatch):
+    api = settings.API_PREFIX
+    monkeypatch.setattr(settings, "BACKUP_DIR", str(tmp_path))
+    headers = _headers(admin_token)
+
+    tricky = "Aceite; 'extra'\nVALUES (1);"
+    for name in ("Producto A", tricky):
+        client.post(f"{api}/products/", headers=headers, data=json.dumps({"name": name, "unit_measure": "l"}))
+
+    dump = client.get(f"{api}/backup/dump", headers=headers).data
+    indexes = _indexes()
+
+    # Cambios posteriores al dump
+    client.post(f"{api}/products/", headers=headers, data=json.dumps({"name": "Posterior", "unit_measure": "ud"}))
+    assert len(_product_names(client, admin_token)) == 3
+    before = _sequences()
+
+    resp = _upload(client, admin_token, dump)
+    assert resp.status_code == 200, resp.get_json()
+    result = resp.get_json()
+    assert result["rows"] > 0 and result["tables"] > 0
+
+    # Un único incremento global, asignado a todas las tablas restauradas
+    after = _sequences()
+    global_seq = after["__all__"]
+    assert global_seq == before["__all__"] + 1
+    assert after["products"] == after["users"] == global_seq
+    assert all(after[name] >= seq for name, seq in before.items())
+
+    # La caché de respuestas se invalida: se ve el estado del dump
+    assert _product_names(client, admin_token) == sorted(["Producto A", tricky])
+    assert _indexes() == indexes
+
+    # El token del admin sigue siendo válido (usuarios restaurados)
+    assert client.get(f"{api}/auth/me", headers=headers).status_code == 200
+
+
+def test_340_checksum_mismatch_applies_nothing(client, admin_token, tmp_path, monkeypatch):
+    api = settings.API_PREFIX
+    monkeypatch.setattr(settings, "BACKUP_DIR", str(tmp_path))
+    headers = _headers(admin_token)
+
+    dump = gzip.decompress(client.get(f"{api}/backup/dump", headers=headers).data).decode("utf-8")
+    indexes = _indexes()
+    client.post(f"{api}/products/", headers=headers, data=json.dumps({"name": "Sigue", "unit_measure": "ud"}))
+
+    tampered = dump.replace("-- TABLE products\n", "-- TABLE products\n" + (
+        "INSERT INTO products (name, unit_measure, is_inventory, cost_average, is_active, created_at)"
+        " VALUES ('Intruso', 'ud', 1, 0, 1, '2024-01-01');\n"
+    ))
+    resp = _upload(client, admin_token, tampered.encode("utf-8"))
+    assert resp.status_code == 400
+    assert resp.get_json()["message"] == "Backup checksum mismatch"
+
+    assert _product_names(client, admin_token) == ["Sigue"]
+    assert _indexes() == indexes
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_340_sync_after_restore_resets_old_cursors(client, admin_token, tmp_path, monkeypatch):
+    api = settings.API_PREFIX
+    monkeypatch.setattr(settings, "BACKUP_DIR", str(tmp_path))
+    headers = _headers(admin_token)
+
+    product_id = client.post(f"{api}/products/", headers=headers, data=json.dumps({
+        "name": "A", "unit_measure": "ud",
+    })).get_json()["id"]
+    dump = client.get(f"{api}/backup/dump", headers=headers).data
+
+    # El cliente ve cambios posteriores al dump
+    client.put(f"{api}/products/{product_id}", headers=headers, data=json.dumps({"name": "A-renamed"}))
+    client.post(f"{api}/products/", headers=headers, data=json.dumps({"name": "B", "unit_measure": "ud"}))
+    cursor = client.get(f"{api}/sync?resources=products", headers=headers).get_json()["cursor"]
+
+    assert _upload(client, admin_token, dump).status_code == 200
+
+    data = client.get(f"{api}/sync?since={cursor}&resources=products", headers=headers).get_json()
+    assert data["reset"] is True
+    assert [p["name"] for p in data["changes"]["products"]["upserted"]] == ["A"]
+
+    # El cursor nuevo ya es posterior al restore
+    data = client.get(f"{api}/sync?since={data['cursor']}&resources=products", headers=headers).get_json()
+    assert data["reset"] is False and data["changes"] == {}
+
+    # Las filas restauradas llevan la secuencia del restore
+    with engine.connect() as conn:
+        seqs = {row[0] for row in conn.execute(text("SELECT DISTINCT change_seq FROM products"))}
+    assert seqs == {_sequences()["products"]}
@@ -0,0 +1,149 @@
+# /src/app/tests/test_350_incremental_backup.py
+"""
+Backups incrementales — v3.0
+
+Valida:
+- La primera llamada crea la base; las siguientes, incrementos con solo
+  las filas cuyo change_seq ha avanzado
+- Base + cadena reconstruida == estado completo (verify), también con
+  borrados físicos
+- Un eslabón alterado se detecta (sha256 del fichero y digests de las
+  filas copiadas)
+- POST /backup/incremental/restore instala base + cadena en caliente y
+  corta la cadena
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+
+from src.app.core.config.database import engine
+from src.app.core.config.settings import settings
+
+
+def _headers(admin_token: str) -> dict[str, str]:
+    return {
+        "Authorization": f"Bearer {admin_token}",
+        "Content-Type": "application/json",
+    }
+
+
+def test_350_incremental_chain_roundtrip(client, admin_token, tmp_path, monkeypatch):
+    api = settings.API_PREFIX
+    monkeypatch.setattr(settings, "BACKUP_DIR", str(tmp_path))
+    headers = _headers(admin_token)
+
+    def product(name):
+        return client.post(f"{api}/products/", headers=headers, data=json.dumps({"name": name, "unit_measure": "ud"})).get_json()["id"]
+
+    first = product("Producto 1")
+    product("Producto 2")
+
+    base = client.post(f"{api}/backup/incremental", headers=headers)
+    assert base.status_code == 201
+    assert base.get_json()["type"] == "base"
+
+    # Sin cambios: no se genera eslabón
+    assert client.post(f"{api}/backup/incremental", headers=headers).get_json()["skipped"] is True
+
+    product("Producto 3")
+    client.put(f"{api}/products/{first}", headers=headers, data=json.dumps({"name": "Producto 1 v2"}))
+
+    inc = client.post(f"{api}/backup/incremental", headers=headers).get_json()
+    assert inc["type"] == "increment"
+    assert inc["tables"]["products"] == {"mode": "delta", "rows": 2}
+    assert "suppliers" not in inc["tables"]
+    # Solo se calculan digests de lo copiado: filas delta e ids
+    assert set(inc["digests"]) == set(inc["tables"]) | {
+        f"_ids_{table}" for table, info in inc["tables"].items() if info["mode"] == "delta"
+    }
+
+    client.delete(f"{api}/products/{first}", headers=headers)
+    client.post(f"{api}/suppliers/", headers=headers, data=json.dumps({"name": "Proveedor Inc"}))
+    inc = client.post(f"{api}/backup/incremental", headers=headers).get_json()
+    assert inc["tables"]["products"]["rows"] == 1
+
+    manifest = client.get(f"{api}/backup/incremental", headers=headers).get_json()
+    assert [link["type"] for link in manifest["chain"]] == ["base", "increment", "increment"]
+
+    result = client.post(f"{api}/backup/incremental/verify", headers=headers).get_json()
+    assert result["ok"] is True, result
+    assert result["links"] == 3
+
+
+def test_350_hard_delete_and_tampering(client, admin_token, tmp_path, monkeypatch):
+    api = settings.API_PREFIX
+    monkeypatch.setattr(settings, "BACKUP_DIR", str(tmp_path))
+    headers = _headers(admin_token)
+
+    pid = client.post(f"{api}/products/", headers=headers, data=json.dumps({"name": "Efímero", "unit_measure": "ud"})).get_json()["id"]
+    client.post(f"{api}/backup/incremental", headers=headers)
+
+    # Borrado físico desde otra conexión (registrado en change_log)
+    conn = sqlite3.connect(engine.url.database)
+    conn.execute("DELETE FROM products WHERE id = ?", (pid,))
+    conn.execute("UPDATE change_log SET seq = seq + 1 WHERE table_name IN ('products', '__all__')")
+    conn.commit()
+    conn.close()
+
+    inc = client.post(f"{api}/backup/incremental", headers=headers).get_json()
+    assert inc["tables"]["products"] == {"mode": "delta", "rows": 0}
+    assert client.post(f"{api}/backup/incremental/verify", headers=headers).get_json()["ok"] is True
+
+    with open(tmp_path / "incremental" / inc["file"], "ab") as handle:
+        handle.write(b"x")
+    resp = client.post(f"{api}/backup/incremental/verify", headers=headers)
+    assert resp.status_code == 400
+    assert "altered" in resp.get_json()["message"]
+
+
+def test_350_verify_detects_wrong_delta(client, admin_token, tmp_path, monkeypatch):
+    api = settings.API_PREFIX
+    monkeypatch.setattr(settings, "BACKUP_DIR", str(tmp_path))
+    headers = _headers(admin_token)
+
+    client.post(f"{api}/products/", headers=headers, data=json.dumps({"name": "Base", "unit_measure": "ud"}))
+    client.post(f"{api}/backup/incremental", headers=headers)
+    client.post(f"{api}/products/", headers=headers, data=json.dumps({"name": "Delta", "unit_measure": "ud"}))
+    inc = client.post(f"{api}/backup/incremental", headers=headers).get_json()
+
+    # Digest del incremento que no corresponde a sus filas
+    manifest_path = tmp_path / "incremental" / "manifest.json"
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    manifest["chain"][-1]["digests"]["products"] = "0" * 64
+    manifest_path.write_text(json.dumps(manifest), encoding="utf-8")
+
+    result = client.post(f"{api}/backup/incremental/verify", headers=headers).get_json()
+    assert result["ok"] is False
+    assert result["mismatched_tables"] == [f"products@{inc['file']}"]
+    assert client.post(f"{api}/backup/incremental/restore", headers=headers).status_code == 400
+
+
+def test_350_restore_chain(client, admin_token, session, tmp_path, monkeypatch):
+    api = settings.API_PREFIX
+    monkeypatch.setattr(settings, "BACKUP_DIR", str(tmp_path))
+    # La sesión de la fixture (admin_token) no debe quedar abierta: se drenaría
+    session.rollback()
+    headers = _headers(admin_token)
+
+    def names():
+        return sorted(p["name"] for p in client.get(f"{api}/products/", headers=headers).get_json())
+
+    client.post(f"{api}/products/", headers=headers, data=json.dumps({"name": "En base", "unit_measure": "ud"}))
+    client.post(f"{api}/backup/incremental", headers=headers)
+    client.post(f"{api}/products/", headers=headers, data=json.dumps({"name": "En incremento", "unit_measure": "ud"}))
+    client.post(f"{api}/backup/incremental", headers=headers)
+    client.post(f"{api}/products/", headers=headers, data=json.dumps({"name": "Posterior", "unit_measure": "ud"}))
+
+    resp = client.post(f"{api}/backup/incremental/restore", headers=headers)
+    assert resp.status_code == 200, resp.get_json()
+    body = resp.get_json()
+    assert body["links"] == 2
+    assert "unavailable_ms" in body
+
+    assert names() == ["En base", "En incremento"]
+    # Fichero reconstruido eliminado tras instalarlo
+    assert not list(tmp_path.glob("*.chain"))
+    # La cadena se corta: el siguiente eslabón es una base
+    assert client.post(f"{api}/backup/incremental", headers=headers).get_json()["type"] == "base"
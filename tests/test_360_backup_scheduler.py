@@ -0,0 +1,150 @@
+# /src/app/tests/test_360_backup_scheduler.py
+"""
+Backups programados — v3.0
+
+Valida:
+- Expresiones cron (siguiente ejecución, rangos, pasos, día de la semana)
+- Retención abuelo-padre-hijo (horas / días / semanas)
+- Ejecución: copia online + gzip en el pool de procesos + retención
+- Dos ejecuciones en el mismo segundo no se pisan; los nombres con
+  resolución de segundos siguen en la retención
+- Una expresión que nunca se cumple falla al arrancar el scheduler
+- GET /api/backup/schedule
+"""
+
+from __future__ import annotations
+
+import gzip
+import os
+import sqlite3
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.app.backups.scheduler import CronExpression, backup_scheduler, retained_backups
+from src.app.core.config.settings import settings
+
+
+def _headers(admin_token: str) -> dict[str, str]:
+    return {"Authorization": f"Bearer {admin_token}"}
+
+
+def _utc(*args) -> datetime:
+    return datetime(*args, tzinfo=timezone.utc)
+
+
+def test_360_cron_next_run():
+    assert CronExpression("0 * * * *").next_after(_utc(2025, 1, 31, 10, 0)) == _utc(2025, 1, 31, 11, 0)
+    assert CronExpression("*/15 * * * *").next_after(_utc(2025, 1, 31, 10, 7, 30)) == _utc(2025, 1, 31, 10, 15)
+    assert CronExpression("30 2 * * *").next_after(_utc(2025, 1, 31, 3, 0)) == _utc(2025, 2, 1, 2, 30)
+    # Domingo (0 y 7) a las 03:00; 2025-02-02 es domingo
+    assert CronExpression("0 3 * * 7").next_after(_utc(2025, 1, 31, 12, 0)) == _utc(2025, 2, 2, 3, 0)
+    assert CronExpression("0 0 1 1-12/6 *").next_after(_utc(2025, 1, 31)) == _utc(2025, 7, 1)
+
+    for invalid in ("* * * *", "60 * * * *", "*/0 * * * *", "a * * * *", "5-1 * * * *"):
+        with pytest.raises(ValueError):
+            CronExpression(invalid)
+    with pytest.raises(ValueError):
+        CronExpression("0 0 31 2 *").next_after(_utc(2025, 1, 1))
+
+
+def test_360_retention_keeps_hourly_daily_weekly():
+    now = _utc(2025, 1, 31, 23, 30)
+    # Una copia cada 30 minutos durante 30 días
+    created = {f"b{i}": now - timedelta(minutes=30 * i) for i in range(48 * 30)}
+
+    keep = retained_backups(created, hourly=3, daily=2, weekly=2)
+
+    kept_times = sorted((created[name] for name in keep), reverse=True)
+    assert kept_times == [
+        now,                                 # hora 23 / día 31 / semana 5
+        _utc(2025, 1, 31, 22, 30),
+        _utc(2025, 1, 31, 21, 30),
+        _utc(2025, 1, 30, 23, 30),           # día 30
+        _utc(2025, 1, 26, 23, 30),           # domingo de la semana anterior
+    ]
+    assert retained_backups(created, 0, 0, 0) == set()
+
+
+def test_360_scheduled_run_compresses_and_prunes(client, admin_token, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "BACKUP_DIR", str(tmp_path))
+    monkeypatch.setattr(settings, "BACKUP_KEEP_HOURLY", 2)
+    monkeypatch.setattr(settings, "BACKUP_KEEP_DAILY", 0)
+    monkeypatch.setattr(settings, "BACKUP_KEEP_WEEKLY", 0)
+
+    try:
+        results = [backup_scheduler.run_once(_utc(2025, 1, 31, hour, 0)) for hour in (8, 9, 10)]
+    finally:
+        backup_scheduler.stop()
+
+    last = results[-1]
+    assert last["state"] == "completed"
+    assert last["file"] == "database_20250131_100000_000000.db.gz"
+    assert 0 < last["size_gzip_bytes"] < last["size_bytes"]
+    assert last["removed"] == ["database_20250131_080000_000000.db.gz"]
+
+    directory = tmp_path / "scheduled"
+    assert sorted(os.listdir(directory)) == [
+        "database_20250131_090000_000000.db.gz",
+        "database_20250131_100000_000000.db.gz",
+    ]
+
+    restored = tmp_path / "restored.db"
+    with gzip.open(directory / last["file"]) as source:
+        restored.write_bytes(source.read())
+    conn = sqlite3.connect(restored)
+    assert conn.execute("PRAGMA integrity_check").fetchone()[0] == "ok"
+    assert conn.execute("SELECT COUNT(*) FROM users").fetchone()[0] >= 1
+    conn.close()
+
+    resp = client.get(f"{settings.API_PREFIX}/backup/schedule", headers=_headers(admin_token))
+    assert resp.status_code == 200
+    data = resp.get_json()
+    assert data["enabled"] is False
+    assert data["last_run"]["file"] == last["file"]
+    assert data["retained"] == ["database_20250131_100000_000000.db.gz", "database_20250131_090000_000000.db.gz"]
+
+
+def test_360_scheduler_thread_lifecycle(monkeypatch):
+    monkeypatch.setattr(settings, "BACKUP_SCHEDULE", "")
+    assert backup_scheduler.start() is False
+
+    monkeypatch.setattr(settings, "BACKUP_SCHEDULE", "0 0 1 1 *")
+    try:
+        assert backup_scheduler.start() is True
+        assert backup_scheduler.start() is True
+        assert backup_scheduler.status()["enabled"] is True
+    finally:
+        backup_scheduler.stop(timeout=5)
+    assert backup_scheduler.status()["enabled"] is False
+
+
+def test_360_same_second_runs_and_legacy_names(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "BACKUP_DIR", str(tmp_path))
+    monkeypatch.setattr(settings, "BACKUP_KEEP_HOURLY", 1)
+    monkeypatch.setattr(settings, "BACKUP_KEEP_DAILY", 0)
+    monkeypatch.setattr(settings, "BACKUP_KEEP_WEEKLY", 0)
+
+    directory = tmp_path / "scheduled"
+    directory.mkdir()
+    (directory / "database_20250131_080000.db.gz").write_bytes(b"")
+
+    try:
+        first = backup_scheduler.run_once(_utc(2025, 1, 31, 10, 0, 0, 100))
+        second = backup_scheduler.run_once(_utc(2025, 1, 31, 10, 0, 0, 200))
+    finally:
+        backup_scheduler.stop()
+
+    assert first["file"] != second["file"]
+    # El nombre antiguo entra en la retención; en la misma hora se
+    # conserva la copia más reciente
+    assert first["removed"] == ["database_20250131_080000.db.gz"]
+    assert second["removed"] == [first["file"]]
+    assert os.listdir(directory) == [second["file"]]
+
+
+def test_360_never_firing_schedule_fails_at_start(monkeypatch):
+    monkeypatch.setattr(settings, "BACKUP_SCHEDULE", "0 0 31 2 *")
+    with pytest.raises(ValueError):
+        backup_scheduler.start()
+    assert backup_scheduler.status()["enabled"] is False
@@ -0,0 +1,188 @@
+# /src/app/tests/test_370_hot_swap.py
+"""
+Restore binario en caliente — v3.0
+
+Valida:
+- Copia binaria → cambios → POST /api/backup con el fichero SQLite
+  sustituye la base de datos (rename atómico) con indisponibilidad
+  inferior al segundo; la app sigue leyendo y escribiendo después
+- Las conexiones de otros hilos esperan y reconectan al fichero nuevo
+- Solo lectura / mantenimiento: 503 con Retry-After
+- Si las conexiones no drenan a tiempo no se toca nada
+- Si otro proceso tiene la base de datos abierta: 409 y no se toca nada
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import sqlite3
+import subprocess
+import sys
+import threading
+
+from sqlalchemy import text
+
+from src.app.core.config.database import engine
+from src.app.core.config.settings import settings
+from src.app.db.gate import database_gate
+
+
+def _headers(admin_token: str, content_type: str = "application/json") -> dict[str, str]:
+    return {
+        "Authorization": f"Bearer {admin_token}",
+        "Content-Type": content_type,
+    }
+
+
+def _product_names(client, admin_token) -> list[str]:
+    resp = client.get(f"{settings.API_PREFIX}/products/", headers=_headers(admin_token))
+    return sorted(p["name"] for p in resp.get_json())
+
+
+def _upload(client, admin_token, data: bytes):
+    return client.post(
+        f"{settings.API_PREFIX}/backup",
+        headers=_headers(admin_token, "multipart/form-data"),
+        data={"file": (io.BytesIO(data), "backup.sqlite3")},
+    )
+
+
+def _create_product(client, admin_token, name: str):
+    return client.post(
+        f"{settings.API_PREFIX}/products/",
+        headers=_headers(admin_token),
+        data=json.dumps({"name": name, "unit_measure": "ud"}),
+    )
+
+
+def test_370_hot_swap_roundtrip(client, admin_token, session, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "BACKUP_DIR", str(tmp_path))
+    # La sesión de la fixture (admin_token) no debe quedar abierta: se drenaría
+    session.rollback()
+
+    _create_product(client, admin_token, "Antes")
+    snapshot = client.get(f"{settings.API_PREFIX}/backup", headers=_headers(admin_token)).data
+    _create_product(client, admin_token, "Después")
+    assert _product_names(client, admin_token) == ["Antes", "Después"]
+
+    # Lecturas continuas desde otro hilo durante la sustitución
+    stop = threading.Event()
+    errors: list[Exception] = []
+    reads = [0]
+
+    def reader():
+        while not stop.is_set():
+            try:
+                with engine.connect() as conn:
+                    conn.execute(text("SELECT COUNT(*) FROM products")).scalar()
+                reads[0] += 1
+            except Exception as exc:
+                errors.append(exc)
+
+    thread = threading.Thread(target=reader)
+    thread.start()
+    try:
+        resp = _upload(client, admin_token, snapshot)
+    finally:
+        stop.set()
+        thread.join()
+
+    assert resp.status_code == 200, resp.get_json()
+    result = resp.get_json()
+    assert result["mode"] == "swap"
+    assert result["unavailable_ms"] < 1000
+    assert errors == []
+    assert reads[0] > 0
+
+    # Estado de la copia, cachés invalidadas y escrituras operativas
+    assert _product_names(client, admin_token) == ["Antes"]
+    assert _create_product(client, admin_token, "Nuevo").status_code == 201
+    assert _product_names(client, admin_token) == ["Antes", "Nuevo"]
+    assert database_gate.stats()["state"] == "open"
+
+
+def test_370_read_only_and_maintenance_gate(client, admin_token):
+    api = settings.API_PREFIX
+    try:
+        database_gate.read_only()
+        assert client.get(f"{api}/products/", headers=_headers(admin_token)).status_code == 200
+        resp = _create_product(client, admin_token, "Bloqueado")
+        assert resp.status_code == 503
+        assert resp.headers["Retry-After"] == "1"
+
+        database_gate.maintenance()
+        assert client.get(f"{api}/products/", headers=_headers(admin_token)).status_code == 503
+    finally:
+        database_gate.open()
+
+    assert _create_product(client, admin_token, "Libre").status_code == 201
+
+
+def test_370_drain_timeout_and_invalid_files(client, admin_token, session, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "BACKUP_DIR", str(tmp_path))
+    session.rollback()
+    monkeypatch.setattr(settings, "BACKUP_SWAP_DRAIN_TIMEOUT_MS", 100)
+
+    _create_product(client, admin_token, "Original")
+    snapshot = client.get(f"{settings.API_PREFIX}/backup", headers=_headers(admin_token)).data
+    _create_product(client, admin_token, "Posterior")
+
+    # Una conexión que no se libera impide la sustitución
+    with engine.connect() as held:
+        held.execute(text("SELECT 1"))
+        resp = _upload(client, admin_token, snapshot)
+    assert resp.status_code == 503
+    assert "connections still in use" in resp.get_json()["message"]
+    assert _product_names(client, admin_token) == ["Original", "Posterior"]
+
+    # Fichero SQLite que no es una base de datos de la app
+    foreign = tmp_path / "foreign.db"
+    conn = sqlite3.connect(foreign)
+    conn.execute("CREATE TABLE other (id INTEGER)")
+    conn.commit()
+    conn.close()
+    resp = _upload(client, admin_token, foreign.read_bytes())
+    assert resp.status_code == 400
+    assert "missing tables" in resp.get_json()["message"]
+    assert _product_names(client, admin_token) == ["Original", "Posterior"]
+
+
+def test_370_refused_when_other_process_holds_database(client, admin_token, session, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "BACKUP_DIR", str(tmp_path))
+    session.rollback()
+
+    _create_product(client, admin_token, "Original")
+    snapshot = client.get(f"{settings.API_PREFIX}/backup", headers=_headers(admin_token)).data
+    _create_product(client, admin_token, "Posterior")
+
+    # Otro worker con una conexión abierta (sin transacción) al mismo fichero
+    worker = subprocess.Popen(
+        [sys.executable, "-c", (
+            "import sqlite3, sys\n"
+            "conn = sqlite3.connect(sys.argv[1])\n"
+            "conn.execute('SELECT COUNT(*) FROM products').fetchone()\n"
+            "print('ready', flush=True)\n"
+            "sys.stdin.read()\n"
+        ), engine.url.database],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True,
+    )
+    try:
+        assert worker.stdout.readline().strip() == "ready"
+        resp = _upload(client, admin_token, snapshot)
+    finally:
+        worker.stdin.close()
+        worker.wait()
+
+    assert resp.status_code == 409
+    assert "other processes" in resp.get_json()["message"]
+    assert database_gate.stats()["state"] == "open"
+    assert _product_names(client, admin_token) == ["Original", "Posterior"]
+    assert _create_product(client, admin_token, "Sigue").status_code == 201
+
+    with engine.connect() as conn:
+        assert conn.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+
+    # Sin el otro proceso, la sustitución procede
+    assert _upload(client, admin_token, snapshot).status_code == 200
+    assert _product_names(client, admin_token) == ["Original"]
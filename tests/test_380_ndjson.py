@@ -0,0 +1,122 @@
+# /src/app/tests/test_380_ndjson.py
+"""
+Export / import NDJSON — v3.0
+
+Valida:
+- Export de todas las tablas del modelo (un fichero por tabla, en orden
+  de FK) e import que devuelve la base al estado exportado
+- Validación de filas en el pool de procesos (línea exacta del error),
+  sin aplicar nada
+- Ficheros alterados y nombres de export no válidos
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+
+from src.app.core.config.settings import settings
+from src.app.db.base import Base
+
+
+def _headers(admin_token: str) -> dict[str, str]:
+    return {
+        "Authorization": f"Bearer {admin_token}",
+        "Content-Type": "application/json",
+    }
+
+
+def _product_names(client, admin_token) -> list[str]:
+    resp = client.get(f"{settings.API_PREFIX}/products/", headers=_headers(admin_token))
+    return sorted(p["name"] for p in resp.get_json())
+
+
+def _import(client, admin_token, name: str):
+    return client.post(
+        f"{settings.API_PREFIX}/backup/ndjson/import",
+        headers=_headers(admin_token),
+        data=json.dumps({"export": name}),
+    )
+
+
+def test_380_ndjson_roundtrip(client, admin_token, tmp_path, monkeypatch):
+    api = settings.API_PREFIX
+    monkeypatch.setattr(settings, "BACKUP_DIR", str(tmp_path))
+    headers = _headers(admin_token)
+
+    names = ["Aceite \"virgen\" ñ", "Línea\nnueva"]
+    for name in names:
+        client.post(f"{api}/products/", headers=headers, data=json.dumps({"name": name, "unit_measure": "l"}))
+
+    resp = client.post(f"{api}/backup/ndjson", headers=headers)
+    assert resp.status_code == 201
+    export = resp.get_json()
+    assert export["tables"] == len(Base.metadata.tables)
+    assert export["rows"] > 0 and export["rows_per_second"] > 0
+
+    directory = tmp_path / export["export"]
+    manifest = json.loads((directory / "manifest.json").read_text())
+    order = [entry["name"] for entry in manifest["tables"]]
+    assert order.index("purchase_notes") < order.index("purchase_note_lines")
+    lines = (directory / "products.ndjson").read_text(encoding="utf-8").splitlines()
+    assert sorted(json.loads(line)["name"] for line in lines) == sorted(names)
+
+    # Cambios posteriores al export
+    client.post(f"{api}/products/", headers=headers, data=json.dumps({"name": "Posterior", "unit_measure": "ud"}))
+
+    resp = _import(client, admin_token, export["export"])
+    assert resp.status_code == 200, resp.get_json()
+    result = resp.get_json()
+    # change_log no se carga: las secuencias vivas nunca retroceden
+    skipped = len((directory / "change_log.ndjson").read_text(encoding="utf-8").splitlines())
+    assert skipped > 0
+    assert result["rows"] == export["rows"] - skipped
+    assert result["tables"] == export["tables"] - 1
+    assert result["workers"] == settings.BACKUP_NDJSON_WORKERS
+    assert result["rows_per_second"] > 0
+
+    assert _product_names(client, admin_token) == sorted(names)
+    assert client.get(f"{api}/auth/me", headers=headers).status_code == 200
+
+
+def test_380_ndjson_invalid_rows_apply_nothing(client, admin_token, tmp_path, monkeypatch):
+    api = settings.API_PREFIX
+    monkeypatch.setattr(settings, "BACKUP_DIR", str(tmp_path))
+    monkeypatch.setattr(settings, "BACKUP_NDJSON_BATCH_ROWS", 1)
+    headers = _headers(admin_token)
+
+    for name in ("Uno", "Dos", "Tres"):
+        client.post(f"{api}/products/", headers=headers, data=json.dumps({"name": name, "unit_measure": "ud"}))
+    name = client.post(f"{api}/backup/ndjson", headers=headers).get_json()["export"]
+    client.post(f"{api}/products/", headers=headers, data=json.dumps({"name": "Cuatro", "unit_measure": "ud"}))
+
+    directory = tmp_path / name
+    path = directory / "products.ndjson"
+    original = path.read_bytes()
+
+    # Fichero alterado sin actualizar el manifest
+    path.write_bytes(original + b"\n")
+    resp = _import(client, admin_token, name)
+    assert resp.status_code == 400
+    assert "altered" in resp.get_json()["message"]
+
+    # Fila con un tipo inválido (manifest coherente): se indica la línea
+    lines = original.decode("utf-8").splitlines(keepends=True)
+    row = json.loads(lines[2])
+    row["id"] = "tres"
+    lines[2] = json.dumps(row) + "\n"
+    content = "".join(lines).encode("utf-8")
+    path.write_bytes(content)
+    manifest = json.loads((directory / "manifest.json").read_text())
+    for entry in manifest["tables"]:
+        if entry["name"] == "products":
+            entry["sha256"] = hashlib.sha256(content).hexdigest()
+    (directory / "manifest.json").write_text(json.dumps(manifest))
+
+    resp = _import(client, admin_token, name)
+    assert resp.status_code == 400
+    assert resp.get_json()["message"] == "Invalid row in products.ndjson line 3: id: integer expected"
+    assert _product_names(client, admin_token) == ["Cuatro", "Dos", "Tres", "Uno"]
+
+    assert _import(client, admin_token, "no_existe").status_code == 404
+    assert _import(client, admin_token, "../etc").status_code == 400
@@ -0,0 +1,149 @@
+# /src/app/tests/test_390_reporting_replica.py
+"""
+Réplica de informes — v3.0
+
+Valida:
+- Los informes se calculan sobre la réplica (copia online) y exponen su
+  obsolescencia
+- Las escrituras posteriores no aparecen hasta el siguiente refresco
+  (`behind` lo indica)
+- Aislamiento por snapshot: una lectura en curso conserva la copia
+  anterior mientras se refresca
+- Réplica en fichero y en memoria
+- Varios procesos: temporal por pid y adopción de una copia al día
+- reset() (restore) descarta la copia vigente
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from datetime import date
+
+import pytest
+from sqlalchemy import text
+
+from src.app.core.config.settings import settings
+from src.app.db.replica import ReportingReplica, reporting_replica
+
+
+def _headers(admin_token: str) -> dict[str, str]:
+    return {
+        "Authorization": f"Bearer {admin_token}",
+        "Content-Type": "application/json",
+    }
+
+
+def _post(client, path: str, headers: dict[str, str], payload: dict | None = None):
+    return client.post(f"{settings.API_PREFIX}{path}", headers=headers, data=json.dumps(payload or {}))
+
+
+@pytest.fixture
+def replica(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "REPORT_REPLICA_PATH", str(tmp_path / "replica.db"))
+    reporting_replica.stop()
+    yield reporting_replica
+    reporting_replica.stop()
+
+
+def _confirmed_sale(client, headers) -> int:
+    product_id = _post(client, "/products/", headers, {"name": "Aceite informe", "unit_measure": "l", "is_inventory": True}).get_json()["id"]
+    supplier_id = _post(client, "/suppliers/", headers, {"name": "Proveedor informe"}).get_json()["id"]
+    customer_id = _post(client, "/customers/", headers, {"name": "Cliente informe"}).get_json()["id"]
+
+    purchase_id = _post(client, "/purchase_notes/", headers, {"supplier_id": supplier_id, "date": date.today().isoformat(), "paid_amount": 0}).get_json()["id"]
+    _post(client, f"/purchase_notes/{purchase_id}/lines", headers, {"product_id": product_id, "quantity": 10, "unit_price": 5, "total_price": 50})
+    assert _post(client, f"/purchase_notes/{purchase_id}/confirm", headers).status_code == 200
+
+    sale_id = _post(client, "/sales_notes/", headers, {"customer_id": customer_id, "date": date.today().isoformat(), "paid_amount": 0}).get_json()["id"]
+    _post(client, f"/sales_notes/{sale_id}/lines", headers, {"product_id": product_id, "quantity": 4, "unit_price": 20, "total_price": 80})
+    assert _post(client, f"/sales_notes/{sale_id}/confirm", headers).status_code == 200
+    return product_id
+
+
+def test_390_reports_read_from_replica(client, admin_token, replica):
+    api = settings.API_PREFIX
+    headers = _headers(admin_token)
+    product_id = _confirmed_sale(client, headers)
+
+    resp = client.get(f"{api}/reports/sales", headers=headers)
+    assert resp.status_code == 200
+    report = resp.get_json()
+    assert report["items"] == [{
+        "product_id": product_id,
+        "product_name": "Aceite informe",
+        "quantity": 4.0,
+        "amount": 80.0,
+        "notes": 1,
+    }]
+    assert report["replica_seq"] > 0 and report["as_of"] is not None
+
+    purchases = client.get(f"{api}/reports/purchases", headers=headers).get_json()
+    assert purchases["totals"] == {"quantity": 10.0, "amount": 50.0}
+
+    stock = client.get(f"{api}/reports/stock", headers=headers).get_json()
+    assert [item["quantity"] for item in stock["items"] if item["product_id"] == product_id] == [6.0]
+
+    # Filtro por fecha (hasta ayer: nada)
+    empty = client.get(f"{api}/reports/sales?until={date.today().isoformat()}T00:00:00Z", headers=headers).get_json()
+    assert empty["items"] == []
+    assert client.get(f"{api}/reports/sales?since=ayer", headers=headers).status_code == 400
+
+    # Escrituras posteriores: la réplica va por detrás hasta el refresco
+    _post(client, "/products/", headers, {"name": "Posterior", "unit_measure": "ud"})
+    status = client.get(f"{api}/reports/replica", headers=headers).get_json()
+    assert status["ready"] is True and status["mode"] == "file"
+    assert status["behind"] > 0
+
+    assert replica.refresh() is True
+    assert replica.refresh() is False
+    status = client.get(f"{api}/reports/replica", headers=headers).get_json()
+    assert status["behind"] == 0
+    assert status["refreshes"] == 2 and status["skipped"] == 1
+
+
+@pytest.mark.parametrize("mode", ["file", "memory"])
+def test_390_snapshot_isolation_during_refresh(client, admin_token, replica, monkeypatch, mode):
+    if mode == "memory":
+        monkeypatch.setattr(settings, "REPORT_REPLICA_PATH", ":memory:")
+    headers = _headers(admin_token)
+    count_sql = text("SELECT COUNT(*) FROM products")
+
+    _post(client, "/products/", headers, {"name": "Uno", "unit_measure": "ud"})
+    with replica.session() as reading:
+        before = reading.execute(count_sql).scalar()
+
+        # El escritor no espera al lector de la réplica
+        assert _post(client, "/products/", headers, {"name": "Dos", "unit_measure": "ud"}).status_code == 201
+        assert replica.refresh() is True
+
+        # La lectura en curso sigue viendo su copia (y conserva su sello)
+        assert reading.execute(count_sql).scalar() == before
+        assert reading.info["staleness"]["replica_seq"] < replica.replica_seq
+
+    with replica.session() as fresh:
+        assert fresh.execute(count_sql).scalar() == before + 1
+        with pytest.raises(Exception):
+            fresh.execute(text("DELETE FROM products"))
+
+
+def test_390_shared_file_between_workers_and_reset(client, admin_token, replica, tmp_path):
+    headers = _headers(admin_token)
+    _post(client, "/products/", headers, {"name": "Compartido", "unit_measure": "ud"})
+
+    # Otro worker con la misma réplica en fichero
+    other = ReportingReplica(replica.source_path)
+    try:
+        assert replica.refresh(force=True) is True
+        assert other.refresh(force=True) is True
+        assert other.adopted == 1 and other.replica_seq == replica.replica_seq
+        assert not [name for name in os.listdir(tmp_path) if name.endswith(".next")]
+    finally:
+        other.reset()
+
+    # Restore: la copia se descarta y el siguiente informe espera a otra
+    replica.reset()
+    assert replica.status()["ready"] is False
+    resp = client.get(f"{settings.API_PREFIX}/reports/stock", headers=headers)
+    assert resp.status_code == 200
+    assert resp.get_json()["replica_seq"] == replica.live_seq()
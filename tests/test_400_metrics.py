@@ -0,0 +1,117 @@
+# /src/app/tests/test_400_metrics.py
+"""
+Métricas (/metrics) — v3.0
+
+Valida:
+- /metrics exige rol admin y responde en formato de texto de Prometheus
+- Requests, latencia, tamaño de respuesta y consultas SQL por endpoint
+- Las 404 se agrupan en endpoint="unmatched" (sin rutas como etiqueta)
+- Los contadores por franjas suman las observaciones de todos los hilos
+- Cada sentencia se mide una vez (métricas, slow log, Server-Timing); una
+  fallida no deja su inicio en la conexión del pool
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from src.app.core.config.database import engine
+from src.app.core.config.settings import settings
+from src.app.core.metrics.instrumentation import _QUERY_STARTED_KEY
+from src.app.core.metrics.server_timing import server_timing
+from src.app.core.metrics.registry import MetricsRegistry
+
+
+def _headers(token: str) -> dict[str, str]:
+    return {
+        "Authorization": f"Bearer {token}",
+        "Content-Type": "application/json",
+    }
+
+
+def _sample(text: str, name: str, **labels) -> float:
+    """
+    Valor de la primera muestra `name` que contiene las etiquetas dadas.
+    """
+    for line in text.splitlines():
+        if not line.startswith(name + "{"):
+            continue
+        if all(f'{key}="{value}"' in line for key, value in labels.items()):
+            return float(line.rsplit(" ", 1)[1])
+    raise AssertionError(f"sample not found: {name} {labels}")
+
+
+def test_400_metrics_endpoint(client, admin_token):
+    api = settings.API_PREFIX
+
+    assert client.get("/metrics").status_code == 401
+
+    for _ in range(3):
+        assert client.get(f"{api}/products/", headers=_headers(admin_token)).status_code == 200
+    assert client.get(f"{api}/no_existe").status_code == 404
+
+    resp = client.get("/metrics", headers=_headers(admin_token))
+    assert resp.status_code == 200
+    assert resp.content_type.startswith("text/plain; version=0.0.4")
+    text = resp.get_data(as_text=True)
+
+    assert "# TYPE http_request_duration_seconds histogram" in text
+    endpoint = "api.products.get_all"
+    assert _sample(text, "http_requests_total", endpoint=endpoint, method="GET", status="200") == 3
+    assert _sample(text, "http_request_duration_seconds_count", endpoint=endpoint, status="200") == 3
+    assert _sample(text, "http_request_duration_seconds_bucket", endpoint=endpoint, le="+Inf") == 3
+    assert _sample(text, "http_response_size_bytes_count", endpoint=endpoint, status="200") == 3
+    assert _sample(text, "db_queries_total", endpoint=endpoint) >= 3
+    assert _sample(text, "http_request_db_queries_count", endpoint=endpoint) == 3
+
+    # 404: sin ruta en las etiquetas
+    assert _sample(text, "http_requests_total", endpoint="unmatched", status="404") == 1
+    assert "no_existe" not in text
+
+    # El propio scrape está en curso mientras se genera
+    assert _sample(text, "http_requests_in_flight", endpoint="metrics") == 1
+
+
+def test_400_striped_counters_across_threads():
+    registry = MetricsRegistry()
+    counter = registry.counter("jobs_total", "Jobs.", ("kind",))
+    histogram = registry.histogram("job_seconds", "Job time.", ("kind",), (0.1, 1))
+
+    def _work():
+        for _ in range(1000):
+            counter.inc(("a",))
+            histogram.observe(("a",), 0.5)
+
+    threads = [threading.Thread(target=_work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    text = registry.render()
+    assert 'jobs_total{kind="a"} 8000' in text
+    assert 'job_seconds_bucket{kind="a",le="0.1"} 0' in text
+    assert 'job_seconds_bucket{kind="a",le="1"} 8000' in text
+    assert re.search(r'job_seconds_sum\{kind="a"\} 4000\b', text)
+    assert 'job_seconds_count{kind="a"} 8000' in text
+
+
+def test_400_failed_statement_timed_once(app):
+    # Una sola medición por sentencia, compartida con Server-Timing
+    server_timing.start()
+    try:
+        with engine.connect() as conn:
+            with pytest.raises(OperationalError):
+                conn.exec_driver_sql("SELECT * FROM no_existe")
+            assert not conn.info.get(_QUERY_STARTED_KEY)
+            conn.exec_driver_sql("SELECT 1")
+            assert not conn.info.get(_QUERY_STARTED_KEY)
+    finally:
+        timings = server_timing.stop()
+    assert "db" in timings
+
+# /src/app/tests/test_400_metrics.py
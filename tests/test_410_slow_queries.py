@@ -0,0 +1,86 @@
+# /src/app/tests/test_410_slow_queries.py
+"""
+Consultas lentas — v3.0
+
+Valida:
+- Con umbral 0 toda sentencia es lenta: top-N por tiempo total con
+  llamadas, método de origen y EXPLAIN QUERY PLAN
+- slow_queries.log recibe SQL, parámetros redactados y el plan una
+  sola vez por sentencia distinta
+- Con el umbral por defecto un request normal no registra nada
+"""
+
+from __future__ import annotations
+
+from src.app.core.config.settings import settings
+from src.app.core.metrics import slow_query_log
+from src.app.core.metrics.slow_queries import logger as slow_logger
+from src.app.core.metrics.slow_queries import redact_parameters
+
+
+def _headers(token: str) -> dict[str, str]:
+    return {
+        "Authorization": f"Bearer {token}",
+        "Content-Type": "application/json",
+    }
+
+
+def _log_text() -> str:
+    handler = slow_logger.handlers[0]
+    handler.flush()
+    with open(handler.baseFilename, encoding="utf-8") as f:
+        return f.read()
+
+
+def test_410_slow_query_top_and_log(client, admin_token, monkeypatch):
+    api = settings.API_PREFIX
+    log_offset = len(_log_text())
+    monkeypatch.setattr(settings, "SLOW_QUERY_THRESHOLD_MS", 0)
+
+    assert client.get(f"{api}/products/", headers=_headers(admin_token)).status_code == 200
+
+    # Parámetro de texto: no debe llegar al log
+    for _ in range(2):
+        resp = client.post(
+            f"{api}/auth/login",
+            headers={"Content-Type": "application/json"},
+            json={"username": "usuario_lento", "password": "nope"},
+        )
+        assert resp.status_code == 401
+
+    resp = client.get(f"{api}/admin/slow_queries?limit=50", headers=_headers(admin_token))
+    assert resp.status_code == 200
+    data = resp.get_json()
+    assert data["threshold_ms"] == 0
+    assert data["recorded"] >= 2
+
+    totals = [entry["total_ms"] for entry in data["statements"]]
+    assert totals == sorted(totals, reverse=True)
+
+    products = [e for e in data["statements"] if "FROM products" in e["sql"]]
+    assert products
+    assert products[0]["caller"].startswith("src.app.services.")
+    assert products[0]["plan"] and any("products" in line for line in products[0]["plan"])
+
+    users = [e for e in data["statements"] if "FROM users" in e["sql"] and "username" in e["sql"]]
+    assert users and users[0]["calls"] == 2
+
+    # Log propio: SQL con parámetros redactados, plan una vez por sentencia
+    text = _log_text()[log_offset:]
+    assert "FROM products" in text
+    assert "usuario_lento" not in text
+    assert "<str:13>" in text
+    assert 0 < text.count("QUERY PLAN") <= data["distinct"]
+
+    assert client.get(f"{api}/admin/slow_queries?limit=0", headers=_headers(admin_token)).status_code == 400
+
+
+def test_410_default_threshold_and_redaction(client, admin_token):
+    slow_query_log.clear()
+    assert client.get(f"{settings.API_PREFIX}/products/", headers=_headers(admin_token)).status_code == 200
+    assert slow_query_log.top(10)["statements"] == []
+
+    assert redact_parameters(("secreto", 7, None, 1.5, b"xy")) == ["<str:7>", 7, None, 1.5, "<bytes:2>"]
+    assert redact_parameters([("a",), ("bb",)], executemany=True) == {"rows": 2, "first": ["<str:1>"]}
+
+# /src/app/tests/test_410_slow_queries.py
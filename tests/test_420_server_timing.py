@@ -0,0 +1,99 @@
+# /src/app/tests/test_420_server_timing.py
+"""
+Server-Timing — v3.0
+
+Valida:
+- Sin activar, ninguna respuesta lleva Server-Timing
+- Un admin lo pide con X-Server-Timing: 1 y recibe el desglose por capa
+  (auth, controller, service, db, serialize, total)
+- La confirmación de una compra incluye la capa stock
+- Un usuario sin rol admin no lo recibe aunque lo pida
+- SERVER_TIMING_ENABLED lo emite en todas las respuestas
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from datetime import date
+
+from src.app.core.config.settings import settings
+from src.app.models.user import User
+from src.app.security.jwt import create_access_token
+
+
+def _headers(token: str, timing: bool = False) -> dict[str, str]:
+    headers = {
+        "Authorization": f"Bearer {token}",
+        "Content-Type": "application/json",
+    }
+    if timing:
+        headers["X-Server-Timing"] = "1"
+    return headers
+
+
+def _layers(header: str) -> dict[str, float]:
+    return {
+        name: float(duration)
+        for name, duration in re.findall(r"(\w+);dur=([\d.]+)", header)
+    }
+
+
+def test_420_admin_requested_breakdown(client, session, admin_token):
+    api = settings.API_PREFIX
+
+    resp = client.get(f"{api}/customers/", headers=_headers(admin_token))
+    assert resp.status_code == 200
+    assert "Server-Timing" not in resp.headers
+
+    # Stock por ubicación: sin caché de respuestas
+    resp = client.get(f"{api}/stock_product_locations/", headers=_headers(admin_token, timing=True))
+    assert resp.status_code == 200
+    layers = _layers(resp.headers["Server-Timing"])
+    assert {"auth", "controller", "service", "db", "serialize", "total"} <= set(layers)
+    assert layers["controller"] >= layers["service"]
+    assert layers["total"] >= layers["controller"]
+    assert re.search(r'db;dur=[\d.]+;desc="\d+ queries"', resp.headers["Server-Timing"])
+
+    # Confirmación de compra: movimientos de stock
+    headers = _headers(admin_token, timing=True)
+    product_id = client.post(f"{api}/products/", headers=headers, data=json.dumps({
+        "name": "Producto Server Timing", "unit_measure": "ud", "is_inventory": True,
+    })).get_json()["id"]
+    supplier_id = client.post(f"{api}/suppliers/", headers=headers, data=json.dumps({
+        "name": "Proveedor Server Timing",
+    })).get_json()["id"]
+    purchase_id = client.post(f"{api}/purchase_notes/", headers=headers, data=json.dumps({
+        "supplier_id": supplier_id, "date": date.today().isoformat(), "paid_amount": 0,
+    })).get_json()["id"]
+    assert client.post(f"{api}/purchase_notes/{purchase_id}/lines", headers=headers, data=json.dumps({
+        "product_id": product_id, "quantity": 2, "unit_price": 5, "total_price": 10,
+    })).status_code == 201
+
+    resp = client.post(f"{api}/purchase_notes/{purchase_id}/confirm", headers=headers)
+    assert resp.status_code == 200
+    assert "stock" in _layers(resp.headers["Server-Timing"])
+
+    # Usuario sin rol admin: se ignora la cabecera
+    resp = client.post(f"{api}/users/", headers=_headers(admin_token), data=json.dumps({
+        "username": "timing_user", "password": "secret1", "rol": "USER",
+    }))
+    assert resp.status_code == 201
+    token = create_access_token(session.get(User, resp.get_json()["id"]))
+    resp = client.get(f"{api}/products/", headers=_headers(token, timing=True))
+    assert resp.status_code == 200
+    assert "Server-Timing" not in resp.headers
+
+
+def test_420_enabled_for_all_responses(client, monkeypatch):
+    monkeypatch.setattr(settings, "SERVER_TIMING_ENABLED", True)
+
+    resp = client.get("/")
+    assert "total" in _layers(resp.headers["Server-Timing"])
+
+    # También en errores (sin token)
+    resp = client.get(f"{settings.API_PREFIX}/products/")
+    assert resp.status_code == 401
+    assert "auth" in _layers(resp.headers["Server-Timing"])
+
+# /src/app/tests/test_420_server_timing.py
@@ -0,0 +1,128 @@
+# /src/app/tests/test_430_tracing.py
+"""
+Trazas por capa — v3.0
+
+Valida:
+- Desactivado (por defecto): sin X-Trace-Id
+- La confirmación de una compra genera spans router → controller →
+  service → movement → SQL enlazados por parent_span_id
+- /api/admin/traces devuelve la traza y el JSONL recibe sus spans
+- Muestreo: TRACING_SAMPLE_RATE=0 no traza, salvo un traceparent
+  W3C entrante muestreado (se conserva su trace_id)
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import date
+
+import pytest
+
+from src.app.core.config.settings import settings
+from src.app.core.tracing.instrumentation import _jsonl_exporters
+from src.app.main import create_app
+
+
+def _headers(token: str) -> dict[str, str]:
+    return {
+        "Authorization": f"Bearer {token}",
+        "Content-Type": "application/json",
+    }
+
+
+@pytest.fixture
+def traced_client(app, monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "TRACING_ENABLED", True)
+    monkeypatch.setattr(settings, "TRACING_SAMPLE_RATE", 1.0)
+    monkeypatch.setattr(settings, "TRACING_JSONL_PATH", str(tmp_path / "traces.jsonl"))
+    return create_app(testing=True).test_client()
+
+
+def test_430_disabled_by_default(client, admin_token):
+    resp = client.get(f"{settings.API_PREFIX}/customers/", headers=_headers(admin_token))
+    assert resp.status_code == 200
+    assert "X-Trace-Id" not in resp.headers
+
+
+def test_430_confirm_spans_and_exporters(traced_client, admin_token):
+    api = settings.API_PREFIX
+    headers = _headers(admin_token)
+
+    product_id = traced_client.post(f"{api}/products/", headers=headers, data=json.dumps({
+        "name": "Producto Trazas", "unit_measure": "ud", "is_inventory": True,
+    })).get_json()["id"]
+    supplier_id = traced_client.post(f"{api}/suppliers/", headers=headers, data=json.dumps({
+        "name": "Proveedor Trazas",
+    })).get_json()["id"]
+    purchase_id = traced_client.post(f"{api}/purchase_notes/", headers=headers, data=json.dumps({
+        "supplier_id": supplier_id, "date": date.today().isoformat(), "paid_amount": 0,
+    })).get_json()["id"]
+    assert traced_client.post(f"{api}/purchase_notes/{purchase_id}/lines", headers=headers, data=json.dumps({
+        "product_id": product_id, "quantity": 3, "unit_price": 2, "total_price": 6,
+    })).status_code == 201
+
+    resp = traced_client.post(f"{api}/purchase_notes/{purchase_id}/confirm", headers=headers)
+    assert resp.status_code == 200
+    trace_id = resp.headers["X-Trace-Id"]
+
+    resp = traced_client.get(f"{api}/admin/traces?trace_id={trace_id}", headers=headers)
+    assert resp.status_code == 200
+    trace = resp.get_json()["traces"][0]
+    assert trace["name"].startswith("POST ") and "<int:" in trace["name"]
+
+    spans = {span["span_id"]: span for span in trace["spans"]}
+    root = trace["spans"][0]
+    assert root["kind"] == "SERVER" and root["parent_span_id"] is None
+    assert root["attributes"]["http.status_code"] == 200
+
+    def _layer(name):
+        return [s for s in spans.values() if s["attributes"].get("layer") == name]
+
+    def _ancestors(span):
+        chain = []
+        while span["parent_span_id"] in spans:
+            span = spans[span["parent_span_id"]]
+            chain.append(span["span_id"])
+        return chain
+
+    controller = _layer("controller")[0]
+    service = _layer("service")[0]
+    movement = _layer("movement")[0]
+    assert controller["name"].endswith(".confirm")
+    assert service["span_id"] in _ancestors(movement)
+    assert controller["span_id"] in _ancestors(service)
+
+    sql = [s for s in spans.values() if s["kind"] == "CLIENT"]
+    assert sql and all(s["attributes"]["db.system"] == "sqlite" for s in sql)
+    assert any(movement["span_id"] in _ancestors(s) for s in sql)
+
+    # JSONL: un span por línea
+    exporter = _jsonl_exporters[settings.TRACING_JSONL_PATH]
+    exporter.flush()
+    with open(settings.TRACING_JSONL_PATH, encoding="utf-8") as f:
+        lines = [json.loads(line) for line in f]
+    assert {line["span_id"] for line in lines if line["trace_id"] == trace_id} == set(spans)
+
+    assert traced_client.get(f"{api}/admin/traces?trace_id={'0' * 32}", headers=headers).status_code == 404
+
+
+def test_430_sampling_and_traceparent(traced_client, admin_token, monkeypatch):
+    api = settings.API_PREFIX
+    monkeypatch.setattr(settings, "TRACING_SAMPLE_RATE", 0.0)
+
+    resp = traced_client.get(f"{api}/customers/", headers=_headers(admin_token))
+    assert resp.status_code == 200
+    assert "X-Trace-Id" not in resp.headers
+
+    trace_id = "4bf92f3577b34da6a3ce929d0e0e4736"
+    headers = {**_headers(admin_token), "traceparent": f"00-{trace_id}-00f067aa0ba902b7-01"}
+    resp = traced_client.get(f"{api}/customers/", headers=headers)
+    assert resp.headers["X-Trace-Id"] == trace_id
+
+    traces = traced_client.get(
+        f"{api}/admin/traces?trace_id={trace_id}",
+        headers={**_headers(admin_token), "traceparent": f"00-{trace_id}-00f067aa0ba902b7-00"},
+    ).get_json()["traces"]
+    assert traces[0]["spans"][0]["parent_span_id"] == "00f067aa0ba902b7"
+
+# /src/app/tests/test_430_tracing.py
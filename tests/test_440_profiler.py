@@ -0,0 +1,98 @@
+# /src/app/tests/test_440_profiler.py
+"""
+Perfilado por request — v3.0
+
+Valida:
+- Sin X-Profile: sin perfil
+- X-Profile: 1 (admin) → .pstats legible en PROFILING_DIR, listado en
+  /api/admin/profiles y descargable
+- X-Profile: sampling → pilas colapsadas (.folded)
+- Límite de concurrencia: X-Profile-Skipped y contador rejected
+"""
+
+from __future__ import annotations
+
+import os
+import pstats
+
+import pytest
+
+from src.app.core.config.settings import settings
+
+
+def _headers(token: str, profile: str | None = None) -> dict[str, str]:
+    headers = {
+        "Authorization": f"Bearer {token}",
+        "Content-Type": "application/json",
+    }
+    if profile is not None:
+        headers["X-Profile"] = profile
+    return headers
+
+
+@pytest.fixture
+def profile_dir(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "PROFILING_DIR", str(tmp_path))
+    return tmp_path
+
+
+def test_440_cprofile_listed_and_downloadable(client, admin_token, profile_dir):
+    api = settings.API_PREFIX
+
+    resp = client.get(f"{api}/stock_product_locations/", headers=_headers(admin_token))
+    assert resp.status_code == 200
+    assert "X-Profile-Id" not in resp.headers
+
+    resp = client.get(f"{api}/stock_product_locations/", headers=_headers(admin_token, "1"))
+    assert resp.status_code == 200
+    name = resp.headers["X-Profile-Id"]
+    assert name.endswith(".pstats")
+
+    stats = pstats.Stats(str(profile_dir / name))
+    assert stats.total_calls > 0
+
+    resp = client.get(f"{api}/admin/profiles", headers=_headers(admin_token))
+    assert resp.status_code == 200
+    data = resp.get_json()
+    assert data["stored"] == 1 and data["active"] == 0
+    profile = data["profiles"][0]
+    assert profile["name"] == name
+    assert profile["mode"] == "cprofile"
+    assert profile["endpoint"].endswith("get_all")
+    assert profile["status"] == 200
+    assert profile["size_bytes"] == os.path.getsize(profile_dir / name)
+
+    resp = client.get(f"{api}/admin/profiles/{name}", headers=_headers(admin_token))
+    assert resp.status_code == 200
+    assert resp.data == (profile_dir / name).read_bytes()
+
+    assert client.get(f"{api}/admin/profiles/missing.pstats", headers=_headers(admin_token)).status_code == 404
+    assert client.get(f"{api}/admin/profiles?limit=0", headers=_headers(admin_token)).status_code == 400
+
+
+def test_440_sampling_and_concurrency_cap(client, admin_token, profile_dir, monkeypatch):
+    api = settings.API_PREFIX
+    monkeypatch.setattr(settings, "PROFILING_SAMPLE_INTERVAL_MS", 0.5)
+
+    resp = client.get(f"{api}/stock_product_locations/", headers=_headers(admin_token, "sampling"))
+    assert resp.status_code == 200
+    name = resp.headers["X-Profile-Id"]
+    assert name.endswith(".folded")
+    for line in (profile_dir / name).read_text(encoding="utf-8").splitlines():
+        stack, count = line.rsplit(" ", 1)
+        assert stack and int(count) > 0
+
+    # Sin hueco: el request se atiende sin perfilar
+    monkeypatch.setattr(settings, "PROFILING_MAX_CONCURRENT", 0)
+    before = client.get(f"{api}/admin/profiles", headers=_headers(admin_token)).get_json()["rejected"]
+
+    resp = client.get(f"{api}/stock_product_locations/", headers=_headers(admin_token, "1"))
+    assert resp.status_code == 200
+    assert "X-Profile-Id" not in resp.headers
+    assert resp.headers["X-Profile-Skipped"] == "busy"
+
+    data = client.get(f"{api}/admin/profiles", headers=_headers(admin_token)).get_json()
+    assert data["rejected"] == before + 1
+    assert data["stored"] == 1
+
+# /src/app/tests/test_440_profiler.py